@@ -1,5 +1,7 @@
 import logging
+from dataclasses import replace
 from pathlib import Path
+from typing import Final
 
 import click
 
@@ -8,20 +10,38 @@ from pyzefir.cli.logger import setup_logging, tear_down_logger
 from pyzefir.model.exception_formatter import NetworkExceptionFormatter
 from pyzefir.model.network import Network
 from pyzefir.model.network_aggregator import NetworkAggregator
+from pyzefir.model.network_reducer import NetworkReducer
+from pyzefir.model.network_snapshot import NetworkSnapshot
 from pyzefir.model.network_validator import NetworkValidator
-from pyzefir.optimization.exportable_results import ExportableResults
+from pyzefir.optimization.export_selection import ExportSelection
+from pyzefir.optimization.exportable_results import (
+    ExportableResults,
+    LazyExportableResults,
+)
+from pyzefir.optimization.fixed_investments import FixedInvestments
 from pyzefir.optimization.input_data import OptimizationInputData
+from pyzefir.optimization.linopy.dispatch import DispatchRunner
 from pyzefir.optimization.linopy.model import LinopyOptimizationModel
+from pyzefir.optimization.linopy.refinement import RefinementRunner
+from pyzefir.optimization.linopy.size_estimator import (
+    ESTIMATE_ERROR_BAND,
+    ModelSizeEstimator,
+    ModelSizeReport,
+)
+from pyzefir.optimization.model import OptimizationStatus
 from pyzefir.optimization.opt_config import OptConfig
 from pyzefir.optimization.results import Results
+from pyzefir.optimization.solution_snapshot import SolutionSnapshot
 from pyzefir.parser.csv_parser import CsvParser
 from pyzefir.parser.network_creator import NetworkCreator
+from pyzefir.parser.profile_cache import ProfileCache
 from pyzefir.postprocessing.results_exporters import (
     CsvExporter,
     FeatherExporter,
+    ParquetExporter,
     XlsxExporter,
 )
-from pyzefir.postprocessing.results_handler import ResultsHandler
+from pyzefir.postprocessing.results_handler import Exporter, ResultsHandler
 from pyzefir.structure_creator.cli.cli_wrapper import create_structure
 from pyzefir.utils.config_parser import ConfigLoader
 from pyzefir.utils.converters.xlsx_to_csv_converter import ExcelToCsvConverter
@@ -38,6 +58,9 @@ class CliRunner:
         - Managing exceptions and logging cleanup.
     """
 
+    _NETWORK_REDUCER_KEY: Final[str] = "network_reducer"
+    """ key of the network reducer in the extras of the solution snapshot """
+
     def __init__(self, config_path: Path, hash_commit_dump_flag: bool = False) -> None:
         """
         Initialize the runner object with a logger.
@@ -49,6 +72,7 @@ class CliRunner:
         self.config_params = ConfigLoader(config_path).load()
         self._logger = logging.getLogger(__name__)
         self._hash_commit_dump_flag = hash_commit_dump_flag
+        self._network_reducer: NetworkReducer | None = None
 
     def run(self) -> None:
         """
@@ -71,6 +95,83 @@ class CliRunner:
                 exit(1)
             raise
 
+    def estimate(self) -> ModelSizeReport:
+        """
+        Estimate the size of the optimization model and the memory needed to build and solve it
+        without building the model. The report is saved to model_size_estimate.csv in the output path.
+
+        Returns:
+            - ModelSizeReport: estimated size per variable group and per constraint builder
+        """
+        try:
+            return self._estimate()
+        except Exception as exc:
+            if self.config_params.format_exceptions:
+                NetworkExceptionFormatter(exc).format(self._logger)
+                exit(1)
+            raise
+
+    def postprocess(self, solution_path: Path) -> None:
+        """
+        Exports results rebuilt from a solution snapshot of a previous run (without building and
+        solving the model), using output settings of the config.
+
+        Args:
+            - solution_path (Path): path to the solution snapshot directory
+        """
+        try:
+            self._postprocess(solution_path)
+        except Exception as exc:
+            if self.config_params.format_exceptions:
+                NetworkExceptionFormatter(exc).format(self._logger)
+                exit(1)
+            raise
+
+    def _postprocess(self, solution_path: Path) -> None:
+        """Loads the solution snapshot and runs postprocessing of its results."""
+        setup_logging(
+            log_file_path=self.config_params.output_path / "cli.log",
+            level=self.config_params.log_level,
+        )
+        self._logger.info("Loading solution snapshot from %s...", solution_path)
+        snapshot = SolutionSnapshot.load(solution_path)
+        self._network_reducer = snapshot.extras.get(self._NETWORK_REDUCER_KEY)
+        if missing := set(self.config_params.dual_results) - set(snapshot.duals):
+            self._logger.warning(
+                "Duals of %s are not stored in the solution snapshot", sorted(missing)
+            )
+        exportable_results = self._to_exportable(
+            snapshot.to_results(self.config_params.dual_results)
+        )
+        self._run_postprocessing(exportable_results)
+        tear_down_logger(self._logger.name)
+
+    def _estimate(self) -> ModelSizeReport:
+        """Create the network and estimate the size of the optimization model."""
+        setup_logging(
+            log_file_path=self.config_params.output_path / "cli.log",
+            level=self.config_params.log_level,
+        )
+        self._logger.info("Starting model size estimation...")
+        self._structure_create()
+        self._convert_input_data_to_csv()
+        network = self._create_network_object()
+        opt_config = self._create_opt_config(network)
+        report = ModelSizeEstimator(
+            OptimizationInputData(network, opt_config)
+        ).estimate()
+        report.to_frame().to_csv(
+            self.config_params.output_path / "model_size_estimate.csv"
+        )
+        self._logger.info(
+            "Estimated memory: build %.2f GiB, solve %.2f GiB (+/- %d%%)",
+            report.build_memory / 2**30,
+            report.solve_memory / 2**30,
+            ESTIMATE_ERROR_BAND * 100,
+        )
+        tear_down_logger(self._logger.name)
+        return report
+
     def _run(self) -> None:
         """Define the order of running the script."""
         setup_logging(
@@ -82,8 +183,20 @@ class CliRunner:
         self._convert_input_data_to_csv()
         network = self._create_network_object()
         opt_config = self._create_opt_config(network)
-        results = self._run_optimization(network, opt_config)
-        self._run_postprocessing(results.to_exportable())
+        selection = self.config_params.export_selection
+        exportable_results: ExportableResults | LazyExportableResults
+        if opt_config.fixed_investments is not None:
+            dispatch_results = self._run_dispatch(network, opt_config)
+            if selection is not None and selection.time_aggregation is not None:
+                self._logger.warning(
+                    "Time aggregation of results is not applied in dispatch only mode"
+                )
+                selection = replace(selection, time_aggregation=None)
+            exportable_results = self._select(dispatch_results, selection)
+        else:
+            results = self._run_optimization(network, opt_config)
+            exportable_results = self._to_exportable(results)
+        self._run_postprocessing(exportable_results)
         tear_down_logger(self._logger.name)
 
     def _structure_create(self) -> None:
@@ -128,11 +241,49 @@ class CliRunner:
     def _create_network_object(self) -> Network:
         """
         Creates and returns a Network object based on CSV input data and configuration
-        parameters. The function loads, validates, and aggregates network data.
+        parameters. The function loads, validates, aggregates and (optionally) reduces network data.
+        If the network snapshot is configured and newer than the input data, validated and aggregated
+        network is loaded from the snapshot instead.
 
         Returns:
             - Network: The constructed and validated network object.
         """
+        snapshot_path = self.config_params.network_snapshot_path
+        fingerprint = self._network_fingerprint()
+        if snapshot_path is not None and NetworkSnapshot.is_fresh(
+            snapshot_path, fingerprint, self._network_inputs()
+        ):
+            self._logger.info("Loading network snapshot from %s...", snapshot_path)
+            snapshot = NetworkSnapshot.load(snapshot_path)
+            network = snapshot.network
+            self.config_params = replace(self.config_params, **snapshot.extras)
+        else:
+            network = self._build_network()
+            if snapshot_path is not None:
+                NetworkSnapshot(
+                    network=network,
+                    fingerprint=fingerprint,
+                    extras=dict(
+                        year_sample=self.config_params.year_sample,
+                        discount_rate=self.config_params.discount_rate,
+                        year_aggregates=self.config_params.year_aggregates,
+                    ),
+                ).dump(snapshot_path)
+        if (
+            self.config_params.network_reduction
+            and self.config_params.fixed_investments_path is not None
+        ):
+            self._logger.warning(
+                "Network reduction is skipped, since investments are fixed for units of the full network"
+            )
+        elif self.config_params.network_reduction:
+            self._network_reducer = NetworkReducer(network)
+            network = self._network_reducer.reduce()
+
+        return network
+
+    def _build_network(self) -> Network:
+        """Loads, validates and aggregates network data (aggregated config parameters are updated)."""
         self._logger.info(
             "Loading csv data from %s...", self.config_params.csv_dump_path
         )
@@ -143,12 +294,19 @@ class CliRunner:
             path_manager=CsvPathManager(
                 dir_path=input_csv_path,
                 scenario_name=self.config_params.scenario,
-            )
+            ),
+            profile_cache=(
+                ProfileCache(self.config_params.profile_cache_path)
+                if self.config_params.profile_cache_path is not None
+                else None
+            ),
         ).load_dfs()
         config_dict = self.config_params.network_config
         network = NetworkCreator.create(loaded_csv_data, config_dict)
         NetworkValidator(
-            network, self.config_params.network_validation_raise_exceptions
+            network,
+            self.config_params.network_validation_raise_exceptions,
+            validate_elements=False,
         ).validate()
         network_aggregator = NetworkAggregator(
             n_years=self.config_params.n_years,
@@ -160,9 +318,34 @@ class CliRunner:
         self.config_params = network_aggregator.aggregate_config_params(
             config_params=self.config_params
         )
-
         return network
 
+    def _network_inputs(self) -> list[Path]:
+        """Input files of the network (converted csv files are recreated in every run of xlsx input)."""
+        inputs = [self.config_params.input_path]
+        if (
+            self.config_params.input_format == "csv"
+            and self.config_params.csv_dump_path is not None
+        ):
+            inputs.append(self.config_params.csv_dump_path)
+        return inputs
+
+    def _network_fingerprint(self) -> str:
+        """Fingerprint of the config parameters used to create the network."""
+        config = self.config_params
+        return NetworkSnapshot.make_fingerprint(
+            str(config.input_path.resolve()),
+            config.input_format,
+            config.scenario,
+            config.network_config,
+            config.n_years,
+            config.n_years_aggregation,
+            config.aggregation_method,
+            config.network_validation_raise_exceptions,
+            None if config.year_sample is None else config.year_sample.tolist(),
+            None if config.discount_rate is None else config.discount_rate.tolist(),
+        )
+
     def _create_opt_config(self, network: Network) -> OptConfig:
         """
         Sets the parameters used by the optimizer based on network structure and
@@ -189,8 +372,40 @@ class CliRunner:
             solver_settings=self.config_params.solver_settings,
             generator_capacity_cost=network.constants.generator_capacity_cost,
             year_aggregates=self.config_params.year_aggregates,
+            auto_scaling=self.config_params.auto_scaling,
+            variable_reduction=self.config_params.variable_reduction,
+            float32_demand=self.config_params.float32_demand,
+            fixed_investments=(
+                FixedInvestments.from_csv(self.config_params.fixed_investments_path)
+                if self.config_params.fixed_investments_path is not None
+                else None
+            ),
+            warm_start=self._load_warm_start(),
+            dual_families=self.config_params.dual_results,
+            objective_breakdown=self.config_params.objective_breakdown,
+            objective_breakdown_per_unit=self.config_params.objective_breakdown_per_unit,
+            solver_process=self.config_params.solver_process,
+            solver_memory_limit=self.config_params.solver_memory_limit,
+            solver_threads=self.config_params.solver_threads,
+            solver_time_limit=self.config_params.solver_time_limit,
+            solver_race=self.config_params.solver_race,
         )
 
+    def _load_warm_start(self) -> FixedInvestments | SolutionSnapshot | None:
+        """
+        Loads the warm start of the solver, solution snapshot is loaded if warm_start_path contains one,
+        otherwise capacities and fractions are loaded from csv results.
+
+        Returns:
+            - FixedInvestments | SolutionSnapshot | None: warm start, None if warm_start_path is not given
+        """
+        if (path := self.config_params.warm_start_path) is None:
+            return None
+        if (path / SolutionSnapshot.METADATA_FILE).is_file():
+            self._logger.info("Loading warm start from solution snapshot %s...", path)
+            return SolutionSnapshot.load(path)
+        return FixedInvestments.from_csv(path)
+
     def _run_optimization(self, network: Network, opt_config: OptConfig) -> Results:
         """
         Performs the optimization of the model using the provided network and optimization
@@ -203,49 +418,203 @@ class CliRunner:
         Returns:
             - Results: The results generated by the optimization engine.
         """
-        engine = LinopyOptimizationModel()
-        self._logger.info("Building optimization model...")
-        engine.build(OptimizationInputData(network, opt_config))
-        self._logger.info(
-            f"Saving model as LP to {self.config_params.output_path / 'model.lp'}"
-        )
-        engine.model.to_file(self.config_params.output_path / "model.lp")
-        self._logger.info("Running optimization...")
-        engine.optimize()
+        if self.config_params.refinement_levels:
+            engine = self._run_refinement(network, opt_config)
+        else:
+            engine = LinopyOptimizationModel()
+            self._logger.info("Building optimization model...")
+            engine.build(OptimizationInputData(network, opt_config))
+            self._logger.info(
+                f"Saving model as LP to {self.config_params.output_path / 'model.lp'}"
+            )
+            engine.model.to_file(self.config_params.output_path / "model.lp")
+            self._logger.info("Running optimization...")
+            engine.optimize()
+        if engine.scaler is not None:
+            engine.scaler.report.to_csv(
+                self.config_params.output_path / "scaling_report.csv", index=False
+            )
+            self._logger.info(
+                "Scaling report has been saved, suggested money_scale: %s",
+                engine.scaler.suggested_money_scale,
+            )
         if self.config_params.gurobi_parameters_path:
             parameters_series = engine.gurobi_solver_params_to_series()
             parameters_series.to_csv(self.config_params.gurobi_parameters_path)
             self._logger.info("Gurobi solver parameters has been saved ...")
+        if (
+            self.config_params.solution_snapshot
+            and engine.status == OptimizationStatus.OPTIMAL
+        ):
+            SolutionSnapshot.from_model(
+                engine.model,
+                engine.variables,
+                engine.indices,
+                engine.parameters,
+                dual_families=tuple(
+                    dict.fromkeys(
+                        SolutionSnapshot.DEFAULT_DUAL_FAMILIES
+                        + opt_config.dual_families
+                    )
+                ),
+                extras={self._NETWORK_REDUCER_KEY: self._network_reducer},
+                objective_breakdown=engine.results.objective_breakdown,
+            ).dump(self.config_params.output_path / "solution")
         return engine.results
 
-    def _run_postprocessing(self, results: ExportableResults) -> None:
+    def _run_refinement(
+        self, network: Network, opt_config: OptConfig
+    ) -> LinopyOptimizationModel:
         """
-        Saves the optimization results in CSV format and optionally in XLSX or Feather
-        format based on the configuration.
+        Solves the model with progressively refined hour resolution (see RefinementRunner) and saves
+        timing and objective gap of the levels.
 
         Args:
-            - results (ExportableResults): The results of the optimization engine.
+            - network (Network): The structure of the network used in the optimization.
+            - opt_config (OptConfig): Parameters used by the optimization engine.
+
+        Returns:
+            - LinopyOptimizationModel: solved model of the hour sample
         """
-        handler = ResultsHandler(CsvExporter())
         self._logger.info(
-            "Saving *.csv results to %s...",
-            self.config_params.output_path,
+            "Running optimization with hour resolution refinement %s...",
+            self.config_params.refinement_levels,
         )
-        handler.export_results(self.config_params.output_path / "csv", results)
-        self._logger.info("Csv results saved.")
-        if self.config_params.xlsx_results:
+        refinement = RefinementRunner(
+            network, opt_config, self.config_params.refinement_levels
+        )
+        engine = refinement.run()
+        refinement.report.to_csv(
+            self.config_params.output_path / "refinement_report.csv", index=False
+        )
+        self._logger.info(
+            f"Saving model as LP to {self.config_params.output_path / 'model.lp'}"
+        )
+        engine.model.to_file(self.config_params.output_path / "model.lp")
+        return engine
+
+    def _to_exportable(
+        self, results: Results
+    ) -> ExportableResults | LazyExportableResults:
+        """
+        Converts selected groups, fields and elements of the results into exportable results. If time
+        aggregation is configured, hourly results are aggregated over periods before conversion. Fields
+        are computed lazily when they are exported, unless the network was reduced (disaggregation needs
+        all results of the reduced network).
+
+        Args:
+            - results (Results): results of the optimization
+
+        Returns:
+            - ExportableResults | LazyExportableResults: exportable results
+        """
+        selection = self.config_params.export_selection
+        if selection is not None and selection.time_aggregation is not None:
             self._logger.info(
-                "Saving *.xlsx results to %s...", self.config_params.output_path
+                "Aggregating hourly results (%s %s)...",
+                selection.time_aggregation.period,
+                selection.time_aggregation.function,
+            )
+            results = (
+                SolutionSnapshot.from_results(results)
+                .aggregated(selection.time_aggregation)
+                .to_results()
+            )
+        if self._network_reducer is None:
+            return results.to_lazy_exportable(release=True, selection=selection)
+        return self._select(
+            results.to_exportable(release=True, selection=selection), selection
+        )
+
+    def _select(
+        self, results: ExportableResults, selection: ExportSelection | None
+    ) -> ExportableResults:
+        """
+        Disaggregates results of the reduced network (if the network was reduced) and removes
+        not selected groups, fields and elements from the results.
+
+        Args:
+            - results (ExportableResults): exportable results
+            - selection (ExportSelection | None): exported results, all if None
+
+        Returns:
+            - ExportableResults: selected results
+        """
+        if self._network_reducer is not None:
+            results = self._network_reducer.disaggregate(results)
+        return selection.apply(results) if selection is not None else results
+
+    def _run_dispatch(
+        self, network: Network, opt_config: OptConfig
+    ) -> ExportableResults:
+        """
+        Optimizes dispatch of each year separately with capacities and fractions fixed to the
+        results of a previous run.
+
+        Args:
+            - network (Network): The structure of the network used in the optimization.
+            - opt_config (OptConfig): Parameters used by the optimization engine.
+
+        Returns:
+            - ExportableResults: merged results of all years
+        """
+        if self.config_params.solution_snapshot:
+            self._logger.warning(
+                "Solution snapshot is not saved in dispatch only mode, models of years are solved separately"
+            )
+        self._logger.info(
+            "Running dispatch optimization with investments fixed to %s...",
+            self.config_params.fixed_investments_path,
+        )
+        return DispatchRunner(
+            network, opt_config, max_workers=self.config_params.dispatch_workers
+        ).run()
+
+    def _run_postprocessing(
+        self, results: ExportableResults | LazyExportableResults
+    ) -> None:
+        """
+        Saves the optimization results in CSV format and optionally in XLSX or Feather
+        format and as a Parquet dataset based on the configuration.
+
+        Args:
+            - results (ExportableResults | LazyExportableResults): The results of the optimization engine.
+        """
+        output_path = self.config_params.output_path
+        targets: list[tuple[Exporter, Path]] = [(CsvExporter(), output_path / "csv")]
+        if self.config_params.xlsx_results:
+            targets.append(
+                (
+                    XlsxExporter(
+                        streaming=self.config_params.xlsx_streaming,
+                        annual_sums=self.config_params.xlsx_annual_sums,
+                    ),
+                    output_path / "xlsx",
+                )
             )
-            handler.exporter = XlsxExporter()
-            handler.export_results(self.config_params.output_path / "xlsx", results)
-            self._logger.info("Xlsx results saved.")
         elif self.config_params.feather_results:
-            self._logger.info(
-                "Saving *feather results to %s...", self.config_params.output_path
+            targets.append((FeatherExporter(), output_path / "feather"))
+        if self.config_params.parquet_results:
+            targets.append(
+                (
+                    ParquetExporter(
+                        partition_by_year=self.config_params.parquet_partition_by_year
+                    ),
+                    output_path / "parquet",
+                )
             )
-            handler.exporter = FeatherExporter()
-            handler.export_results(self.config_params.output_path / "feather", results)
+        self._logger.info(
+            "Saving results (%s) to %s...",
+            ", ".join(path.name for _, path in targets),
+            output_path,
+        )
+        handler = ResultsHandler(max_workers=self.config_params.export_workers)
+        handler.export_results_to_many(
+            targets,
+            results,
+            skip_empty_fields=self.config_params.export_selection is not None,
+        )
+        self._logger.info("Results saved.")
         self._logger.info("Writing file with git information...")
         if self._hash_commit_dump_flag:
             GitInfoDumper(ROOT_DIR.parent.parent).dump_git_info(
@@ -253,7 +622,25 @@ class CliRunner:
             )
 
 
-@click.command()
+class _DefaultCommandGroup(click.Group):
+    """Group of commands running the default command if no command is given (pyzefir -c <config>)."""
+
+    default_command: str = "run"
+
+    def parse_args(self, ctx: click.Context, args: list[str]) -> list[str]:
+        if not args or (
+            args[0] not in self.commands and args[0] not in ctx.help_option_names
+        ):
+            args = [self.default_command, *args]
+        return super().parse_args(ctx, args)
+
+
+@click.group(cls=_DefaultCommandGroup)
+def cli_run() -> None:
+    """PyZefir command line interface, the model is run if no command is given."""
+
+
+@cli_run.command()
 @click.option(
     "-c",
     "--config",
@@ -268,7 +655,7 @@ class CliRunner:
     default=False,
     help="Flag to include hash commit information. (only in development mode)",
 )
-def cli_run(config: str, hash_commit_dump: bool) -> None:
+def run(config: str, hash_commit_dump: bool) -> None:
     """
     Runs the script using the provided configuration file.
 
@@ -277,3 +664,53 @@ def cli_run(config: str, hash_commit_dump: bool) -> None:
         - hash_commit_dump (bool): Flag to include hash commit information.
     """
     CliRunner(Path(config), hash_commit_dump).run()
+
+
+@cli_run.command()
+@click.option(
+    "-c",
+    "--config",
+    type=click.Path(exists=True),
+    required=True,
+    help="Path to *.ini file.",
+)
+def estimate(config: str) -> None:
+    """
+    Estimates the model size and memory usage without building the model.
+
+    Args:
+        - config (str): Path to the *.ini file.
+    """
+    report = CliRunner(Path(config)).estimate()
+    click.echo(report.to_frame().to_string())
+    click.echo(
+        f"Build memory: {report.build_memory / 2**30:.2f} GiB, "
+        f"solve memory: {report.solve_memory / 2**30:.2f} GiB "
+        f"(+/- {ESTIMATE_ERROR_BAND:.0%})"
+    )
+
+
+@cli_run.command()
+@click.option(
+    "-c",
+    "--config",
+    type=click.Path(exists=True),
+    required=True,
+    help="Path to *.ini file.",
+)
+@click.option(
+    "-s",
+    "--solution",
+    type=click.Path(exists=True, file_okay=False),
+    required=True,
+    help="Path to the solution snapshot directory of a previous run.",
+)
+def postprocess(config: str, solution: str) -> None:
+    """
+    Exports results of a previous run from its solution snapshot without solving the model.
+
+    Args:
+        - config (str): Path to the *.ini file.
+        - solution (str): Path to the solution snapshot directory.
+    """
+    CliRunner(Path(config)).postprocess(Path(solution))
@@ -14,7 +14,6 @@ from pyzefir.model.exceptions import (
 )
 from pyzefir.model.network_elements import EnergySourceType
 from pyzefir.model.utils import validate_series
-from pyzefir.utils.functions import is_flow_int
 
 _logger = logging.getLogger(__name__)
 
@@ -125,12 +124,6 @@ class GeneratorType(EnergySourceType):
                 )
             )
 
-        for name, gen_type in network.generator_types.items():
-            curtailment_cost = gen_type.energy_curtailment_cost
-            if curtailment_cost is not None:
-                self.validate_curtailment_cost(
-                    network, name, curtailment_cost, exception_list
-                )
         self._validate_fuels(exception_list, network)
         self._validate_capacity_factor(exception_list, network)
         self._validate_efficiency(exception_list, network)
@@ -376,87 +369,6 @@ class GeneratorType(EnergySourceType):
             )
         _logger.debug("Validate emission reduction: OK")
 
-    @staticmethod
-    def _validate_curtailment_idx(
-        network: Network,
-        name: GeneratorType,
-        curtailment_cost: pd.Series,
-        exception_list: list[NetworkValidatorException],
-    ) -> None:
-        """
-        Validation procedure checking:
-        - curtailment cost has any length
-        - curtailment cost length matches number of years
-
-        Args:
-            - network (Network): network to which self is to be added
-            - name (GeneratorType): name of the generator
-            - curtailment_cost (pd.Series): curtailment cost for each year
-            - exception_list (list[NetworkValidatorException]): list of exceptions
-        """
-        if (
-            len(curtailment_cost)
-            and len(set(curtailment_cost.index)) != network.constants.n_years
-        ):
-            exception_list.append(
-                NetworkValidatorException(
-                    f"Incorrect year indices for energy curtailment cost of generator type "
-                    f"<{str(name)}> The number of indexes should match the number of years"
-                )
-            )
-
-    @staticmethod
-    def _validate_curtailment_val(
-        network: Network,
-        name: GeneratorType,
-        curtailment_cost: pd.Series,
-        exception_list: list[NetworkValidatorException],
-    ) -> None:
-        """
-        Validation procedure checking:
-        - curtailment cost is greater than 0
-        - length of curtailment cost matches number of years
-
-        Args:
-            - network (Network): network to which self is to be added
-            - name (GeneratorType): name of the generator
-            - curtailment_cost (pd.Series): curtailment cost for each year
-            - exception_list (list[GeneratorValidatorException]): list of exceptions
-        """
-        curtailment_cost_vals = curtailment_cost.values if len(curtailment_cost) else []
-        vals = [el for el in curtailment_cost_vals if is_flow_int(el)]
-        if len(vals) > 0 and len(vals) != network.constants.n_years:
-            exception_list.append(
-                NetworkValidatorException(
-                    f"Incorrect values for energy curtailment cost of generator type <{str(name)}>"
-                )
-            )
-
-    def validate_curtailment_cost(
-        self,
-        network: Network,
-        name: GeneratorType,
-        curtailment_cost: pd.Series,
-        exception_list: list[NetworkValidatorException],
-    ) -> None:
-        """
-        Validation procedure checking:
-        - validates curtailment cost indices
-        - validates curtailment cost values
-
-        Args:
-            - network (Network): network to which self is to be added
-            - name (GeneratorType): name of the generator
-            - curtailment_cost (pd.Series): curtailment cost for each year
-            - exception_list (list[GeneratorValidatorException]): list of exceptions
-        """
-        GeneratorType._validate_curtailment_idx(
-            network, name, curtailment_cost, exception_list
-        )
-        GeneratorType._validate_curtailment_val(
-            network, name, curtailment_cost, exception_list
-        )
-
     def _validate_power_utilization_boundaries(
         self,
         network: Network,
@@ -0,0 +1,423 @@
+import logging
+from dataclasses import replace
+from typing import Any, Callable, Hashable, Iterable, TypedDict, TypeVar
+
+import networkx as nx
+import numpy as np
+import pandas as pd
+
+from pyzefir.graph.network_diagram import NetworkGraph
+from pyzefir.model.network import Network
+from pyzefir.model.network_elements import Generator, Line, Storage
+from pyzefir.optimization.exportable_results import (
+    ExportableBusResults,
+    ExportableGeneratorsResults,
+    ExportableLinesResults,
+    ExportableResults,
+    ExportableStorageResults,
+)
+
+_logger = logging.getLogger(__name__)
+
+TUnit = TypeVar("TUnit", Generator, Storage)
+
+
+class _Capacities(TypedDict):
+    """Capacity attributes of a unit (summed when identical units are aggregated)."""
+
+    unit_base_cap: float
+    unit_min_capacity: pd.Series
+    unit_max_capacity: pd.Series
+    unit_min_capacity_increase: pd.Series
+    unit_max_capacity_increase: pd.Series
+
+
+def _series_key(series: pd.Series) -> tuple:
+    """Hashable representation of given series (nan values are comparable)."""
+    return tuple(
+        (index, None if pd.isna(value) else float(value))
+        for index, value in series.items()
+    )
+
+
+def _is_free_line(line: Line) -> bool:
+    """Line without losses, without transmission fee and without capacity limit."""
+    return (
+        line.transmission_loss == 0
+        and line.transmission_fee is None
+        and (np.isnan(line.max_capacity) or np.isinf(line.max_capacity))
+    )
+
+
+class NetworkReducer:
+    """
+    Reduces the network structure before the optimization model is built.
+
+    Buses connected by lines without losses, fees and capacity limits in both directions are merged
+    into a single bus (only buses without DSR belonging to the same local balancing stacks are merged).
+    Lines inside the merged buses are removed. Then identical generators and storages (same type, buses,
+    tags, base capacity, capacity bounds and emission fees) are aggregated into a single representative
+    unit with summed capacities. Units used in capacity bounds, generator bindings or with device nominal
+    power are never aggregated. Representative elements take the name of the first element of the group.
+
+    After the optimization, results of the reduced network can be disaggregated back to the original
+    elements: results of aggregated units are split equally, merged buses get zero results (all results
+    are reported on the representative bus) and removed lines get zero flows.
+    """
+
+    def __init__(self, network: Network) -> None:
+        """
+        Initializes a new instance of the class.
+
+        Args:
+            - network (Network): network structure to reduce
+        """
+        self._network = network
+        self.bus_mapping: dict[str, str] = {}
+        """ original bus name -> representative bus name """
+        self.removed_lines: list[str] = []
+        """ lines connecting merged buses """
+        self.generator_groups: dict[str, list[str]] = {}
+        """ representative generator name -> names of all aggregated generators """
+        self.storage_groups: dict[str, list[str]] = {}
+        """ representative storage name -> names of all aggregated storages """
+
+    def reduce(self) -> Network:
+        """
+        Creates the reduced network. Given network is not changed.
+
+        Returns:
+            - Network: reduced network
+        """
+        _logger.info("Reducing network structure...")
+        self.bus_mapping = self._merge_buses()
+        self.removed_lines = [
+            line.name
+            for line in self._network.lines.values()
+            if self.bus_mapping[line.fr] == self.bus_mapping[line.to]
+        ]
+        self.generator_groups = self._cluster_units(
+            self._network.generators.values(),
+            lambda gen: frozenset(self.bus_mapping[bus] for bus in gen.buses),
+        )
+        self.storage_groups = self._cluster_units(
+            self._network.storages.values(),
+            lambda storage: self.bus_mapping[storage.bus],
+        )
+        reduced = self._create_reduced_network()
+        _logger.info(
+            "Network structure reduction: Done. Buses %d -> %d, lines %d -> %d, "
+            "generators %d -> %d, storages %d -> %d",
+            len(self._network.buses),
+            len(reduced.buses),
+            len(self._network.lines),
+            len(reduced.lines),
+            len(self._network.generators),
+            len(reduced.generators),
+            len(self._network.storages),
+            len(reduced.storages),
+        )
+        return reduced
+
+    def disaggregate(self, results: ExportableResults) -> ExportableResults:
+        """
+        Disaggregates results of the reduced network to the elements of the original network.
+
+        Args:
+            - results (ExportableResults): results of the reduced network
+
+        Returns:
+            - ExportableResults: results of the original network
+        """
+        gen_results, stor_results = results.generators_results, results.storages_results
+        generators_results = ExportableGeneratorsResults(
+            generation=self._split_dict(gen_results.generation, self.generator_groups),
+            capacity=self._split_columns(gen_results.capacity, self.generator_groups),
+            generation_per_energy_type=self._split_dict(
+                gen_results.generation_per_energy_type, self.generator_groups
+            ),
+            dump_energy_per_energy_type=self._split_dict(
+                gen_results.dump_energy_per_energy_type, self.generator_groups
+            ),
+            global_capex=self._split_columns(
+                gen_results.global_capex, self.generator_groups
+            ),
+            local_capex=gen_results.local_capex,
+        )
+        storages_results = ExportableStorageResults(
+            generation=self._split_dict(stor_results.generation, self.storage_groups),
+            load=self._split_dict(stor_results.load, self.storage_groups),
+            state_of_charge=self._split_dict(
+                stor_results.state_of_charge, self.storage_groups
+            ),
+            capacity=self._split_columns(stor_results.capacity, self.storage_groups),
+            global_capex=self._split_columns(
+                stor_results.global_capex, self.storage_groups
+            ),
+            local_capex=stor_results.local_capex,
+        )
+        bus_results = ExportableBusResults(
+            generation_ens=self._expand_buses(results.bus_results.generation_ens),
+            shift_minus=self._expand_buses(results.bus_results.shift_minus),
+            shift_plus=self._expand_buses(results.bus_results.shift_plus),
+        )
+        lines_results = ExportableLinesResults(
+            flow=self._expand_lines(
+                results.lines_results.flow, results.bus_results.generation_ens
+            )
+        )
+        dual_results = replace(
+            results.dual_results,
+            marginal_price={
+                bus_name: results.dual_results.marginal_price[representative]
+                for bus_name, representative in sorted(self.bus_mapping.items())
+                if representative in results.dual_results.marginal_price
+            },
+        )
+        objective_results = replace(
+            results.objective_results,
+            cost_per_unit={
+                name: self._split_columns(
+                    df, self.generator_groups | self.storage_groups
+                )
+                for name, df in results.objective_results.cost_per_unit.items()
+            },
+        )
+        return replace(
+            results,
+            generators_results=generators_results,
+            storages_results=storages_results,
+            lines_results=lines_results,
+            bus_results=bus_results,
+            dual_results=dual_results,
+            objective_results=objective_results,
+        )
+
+    def _merge_buses(self) -> dict[str, str]:
+        """
+        Finds groups of buses connected by free lines in both directions.
+
+        Returns:
+            - dict[str, str]: original bus name -> representative bus name
+        """
+        bus_lbs: dict[str, set[str]] = {}
+        for lbs in self._network.local_balancing_stacks.values():
+            for buses in lbs.buses.values():
+                for bus_name in buses:
+                    bus_lbs.setdefault(bus_name, set()).add(lbs.name)
+
+        def _can_merge(fr: str, to: str) -> bool:
+            return (
+                self._network.buses[fr].dsr_type is None
+                and self._network.buses[to].dsr_type is None
+                and bus_lbs.get(fr, set()) == bus_lbs.get(to, set())
+            )
+
+        graph = NetworkGraph(self._network)
+        graph.add_buses_to_graph()
+        for line in self._network.lines.values():
+            if _is_free_line(line) and _can_merge(line.fr, line.to):
+                graph.add_edge(
+                    line.fr, line.to, line_id=line.name, energy_type=line.energy_type
+                )
+        bus_order = {bus_name: idx for idx, bus_name in enumerate(self._network.buses)}
+        bus_mapping: dict[str, str] = {}
+        for component in nx.connected_components(graph.to_undirected(reciprocal=True)):
+            buses = sorted(component, key=bus_order.__getitem__)
+            bus_mapping.update({bus_name: buses[0] for bus_name in buses})
+        return {bus_name: bus_mapping[bus_name] for bus_name in self._network.buses}
+
+    def _cluster_units(
+        self, units: Iterable[TUnit], buses_key: Callable[[TUnit], Hashable]
+    ) -> dict[str, list[str]]:
+        """
+        Groups identical units (after buses are merged).
+
+        Args:
+            - units (Iterable[TUnit]): generators or storages
+            - buses_key (Callable[[TUnit], Hashable]): buses of the unit in the reduced network
+
+        Returns:
+            - dict[str, list[str]]: representative unit name -> names of all units in the group
+        """
+        bounded_units = {
+            technology
+            for bound in self._network.capacity_bounds.values()
+            for technology in (bound.left_technology, bound.right_technology)
+        }
+        groups: dict[Hashable, list[str]] = {}
+        for unit in units:
+            if (
+                unit.name in bounded_units
+                or unit.min_device_nom_power is not None
+                or unit.max_device_nom_power is not None
+                or getattr(unit, "generator_binding", None) is not None
+            ):
+                key: Hashable = unit.name
+            else:
+                key = (
+                    unit.energy_source_type,
+                    buses_key(unit),
+                    tuple(sorted(unit.tags)),
+                    unit.unit_base_cap,
+                    frozenset(getattr(unit, "emission_fee", set())),
+                    _series_key(unit.unit_min_capacity),
+                    _series_key(unit.unit_max_capacity),
+                    _series_key(unit.unit_min_capacity_increase),
+                    _series_key(unit.unit_max_capacity_increase),
+                )
+            groups.setdefault(key, []).append(unit.name)
+        return {names[0]: names for names in groups.values()}
+
+    def _create_reduced_network(self) -> Network:
+        """Creates the network with merged buses and aggregated units."""
+        network = self._network
+        reduced = Network(
+            network_constants=network.constants,
+            energy_types=network.energy_types,
+            emission_types=network.emission_types,
+        )
+        buses = [
+            replace(bus)
+            for bus in network.buses.values()
+            if self.bus_mapping[bus.name] == bus.name
+        ]
+        generators = [
+            replace(
+                network.generators[name],
+                bus={
+                    self.bus_mapping[bus_name]
+                    for bus_name in network.generators[name].buses
+                },
+                emission_fee=set(network.generators[name].emission_fee),
+                **self._aggregated_capacities(network.generators[name], len(names)),
+            )
+            for name, names in self.generator_groups.items()
+        ]
+        storages = [
+            replace(
+                network.storages[name],
+                bus=self.bus_mapping[network.storages[name].bus],
+                **self._aggregated_capacities(network.storages[name], len(names)),
+            )
+            for name, names in self.storage_groups.items()
+        ]
+        removed_lines = set(self.removed_lines)
+        lines = [
+            replace(line, fr=self.bus_mapping[line.fr], to=self.bus_mapping[line.to])
+            for line in network.lines.values()
+            if line.name not in removed_lines
+        ]
+        local_balancing_stacks = [
+            replace(
+                lbs,
+                buses_out={
+                    energy_type: self.bus_mapping[bus_name]
+                    for energy_type, bus_name in lbs.buses_out.items()
+                },
+                buses={
+                    energy_type: {self.bus_mapping[bus_name] for bus_name in buses}
+                    for energy_type, buses in lbs.buses.items()
+                },
+            )
+            for lbs in network.local_balancing_stacks.values()
+        ]
+        objects_and_methods_list: list[tuple[Iterable[Any], Callable[[Any], None]]] = [
+            (network.emission_fees.values(), reduced.add_emission_fee),
+            (network.dsr.values(), reduced.add_dsr),
+            (buses, reduced.add_bus),
+            (network.fuels.values(), reduced.add_fuel),
+            (network.capacity_factors.values(), reduced.add_capacity_factor),
+            (network.generator_types.values(), reduced.add_generator_type),
+            (network.storage_types.values(), reduced.add_storage_type),
+            (generators, reduced.add_generator),
+            (storages, reduced.add_storage),
+            (network.transmission_fees.values(), reduced.add_transmission_fee),
+            (lines, reduced.add_line),
+            (local_balancing_stacks, reduced.add_local_balancing_stack),
+            (network.demand_profiles.values(), reduced.add_demand_profile),
+            (network.aggregated_consumers.values(), reduced.add_aggregated_consumer),
+            (network.demand_chunks.values(), reduced.add_demand_chunk),
+            (network.capacity_bounds.values(), reduced.add_capacity_bound),
+            (network.generation_fractions.values(), reduced.add_generation_fraction),
+        ]
+        for elements, add_method in objects_and_methods_list:
+            for element in elements:
+                add_method(element)
+        return reduced
+
+    @staticmethod
+    def _aggregated_capacities(unit: Generator | Storage, n_units: int) -> _Capacities:
+        """Capacities of representative unit of n_units identical units."""
+        return _Capacities(
+            unit_base_cap=unit.unit_base_cap * n_units,
+            unit_min_capacity=unit.unit_min_capacity * n_units,
+            unit_max_capacity=unit.unit_max_capacity * n_units,
+            unit_min_capacity_increase=unit.unit_min_capacity_increase * n_units,
+            unit_max_capacity_increase=unit.unit_max_capacity_increase * n_units,
+        )
+
+    @staticmethod
+    def _split_frame(df: pd.DataFrame, n_units: int) -> pd.DataFrame:
+        """Divides numeric columns of given frame by the number of units."""
+        if n_units == 1:
+            return df
+        df = df.copy()
+        numeric_columns = df.select_dtypes("number").columns
+        df[numeric_columns] = df[numeric_columns] / n_units
+        return df
+
+    def _split_dict(
+        self, data: dict[str, pd.DataFrame], groups: dict[str, list[str]]
+    ) -> dict[str, pd.DataFrame]:
+        """Splits results of representative units (dict unit name -> frame)."""
+        result = {
+            name: self._split_frame(df, len(groups.get(unit_name, [unit_name])))
+            for unit_name, df in data.items()
+            for name in groups.get(unit_name, [unit_name])
+        }
+        return dict(sorted(result.items()))
+
+    @staticmethod
+    def _split_columns(df: pd.DataFrame, groups: dict[str, list[str]]) -> pd.DataFrame:
+        """Splits results of representative units (frame with unit names as columns)."""
+        if df.empty:
+            return df
+        columns = {
+            name: df[unit_name] / len(groups.get(unit_name, [unit_name]))
+            for unit_name in df.columns
+            for name in groups.get(unit_name, [unit_name])
+        }
+        result = pd.DataFrame(columns, index=df.index)[sorted(columns)]
+        result.columns.name = df.columns.name
+        return result
+
+    def _expand_buses(self, data: dict[str, pd.DataFrame]) -> dict[str, pd.DataFrame]:
+        """Results of merged buses are reported on the representative bus, others get zeros."""
+        result = {}
+        for bus_name, representative in self.bus_mapping.items():
+            if representative not in data:
+                continue
+            df = data[representative]
+            result[bus_name] = (
+                df
+                if bus_name == representative
+                else pd.DataFrame(0.0, index=df.index, columns=df.columns)
+            )
+        return dict(sorted(result.items()))
+
+    def _expand_lines(
+        self, flow: dict[str, pd.DataFrame], bus_ens: dict[str, pd.DataFrame]
+    ) -> dict[str, pd.DataFrame]:
+        """Removed lines get zero flows (flows inside merged buses are not known)."""
+        template = next(iter(flow.values()), next(iter(bus_ens.values()), None))
+        removed_lines = set(self.removed_lines)
+        result = {}
+        for line_name in self._network.lines:
+            if line_name in flow:
+                result[line_name] = flow[line_name]
+            elif line_name in removed_lines and template is not None:
+                result[line_name] = pd.DataFrame(
+                    0.0, index=template.index, columns=template.columns
+                )
+        return dict(sorted(result.items()))
@@ -0,0 +1,220 @@
+import hashlib
+import io
+import logging
+import pickle
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, ClassVar, Iterable
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+
+from pyzefir.model.network import Network
+
+_logger = logging.getLogger(__name__)
+
+
+class NetworkSnapshotError(Exception):
+    pass
+
+
+class _ColumnarPickler(pickle.Pickler):
+    """
+    Pickler storing values of float Series and DataFrames outside of the pickle stream
+    (in a list of flat arrays), only their index, columns and position are pickled.
+    """
+
+    def __init__(self, file: io.BytesIO) -> None:
+        super().__init__(file, protocol=pickle.HIGHEST_PROTOCOL)
+        self.arrays: list[np.ndarray] = []
+        self._offset = 0
+
+    def persistent_id(self, obj: Any) -> tuple | None:
+        if isinstance(obj, pd.Series) and obj.dtype == np.float64:
+            return "series", self._store(obj.to_numpy()), len(obj), obj.index, obj.name
+        if (
+            isinstance(obj, pd.DataFrame)
+            and len(obj.columns)
+            and (obj.dtypes == np.float64).all()
+        ):
+            return (
+                "frame",
+                self._store(obj.to_numpy()),
+                obj.shape,
+                obj.index,
+                obj.columns,
+            )
+        return None
+
+    def _store(self, values: np.ndarray) -> int:
+        offset = self._offset
+        self.arrays.append(np.ascontiguousarray(values, dtype=np.float64).reshape(-1))
+        self._offset += values.size
+        return offset
+
+
+class _ColumnarUnpickler(pickle.Unpickler):
+    """Unpickler restoring Series and DataFrames from the flat values column."""
+
+    def __init__(self, file: io.BytesIO, values: np.ndarray) -> None:
+        super().__init__(file)
+        self._values = values
+
+    def persistent_load(self, pid: tuple) -> pd.Series | pd.DataFrame:
+        kind, offset, shape, index, labels = pid
+        stop = offset + int(np.prod(shape, dtype=int))
+        if kind == "series":
+            return pd.Series(self._values[offset:stop], index=index, name=labels)
+        return pd.DataFrame(
+            self._values[offset:stop].reshape(shape), index=index, columns=labels
+        )
+
+
+@dataclass
+class NetworkSnapshot:
+    """
+    Validated (and aggregated) network saved in a binary format, so it can be loaded without parsing
+    and validating the input data again.
+
+    The snapshot directory contains values of all float Series and DataFrames of the network stored
+    in a single Arrow IPC column (network.arrow, read with memory mapping) and pickled metadata
+    (network.pkl) - format version, fingerprint of the settings used to create the network,
+    the network with its data replaced by positions in the values column and extras.
+    """
+
+    FORMAT_VERSION: ClassVar[int] = 1
+    """ version of the snapshot format, snapshots of other versions are not loaded """
+    VALUES_FILE: ClassVar[str] = "network.arrow"
+    """ file with values of all Series and DataFrames """
+    METADATA_FILE: ClassVar[str] = "network.pkl"
+    """ file with pickled metadata """
+
+    network: Network
+    """ validated (and aggregated) network """
+    fingerprint: str
+    """ fingerprint of the settings used to create the network """
+    extras: dict[str, Any] = field(default_factory=dict)
+    """ additional picklable objects created together with the network (e.g. aggregated config values) """
+
+    @staticmethod
+    def make_fingerprint(*settings: Any) -> str:
+        """
+        Fingerprint of given picklable settings used to create the network.
+
+        Args:
+            - settings (Any): settings (e.g. scenario, network config, year sample)
+
+        Returns:
+            - str: hex digest of the pickled settings
+        """
+        return hashlib.sha256(
+            pickle.dumps(settings, protocol=pickle.HIGHEST_PROTOCOL)
+        ).hexdigest()
+
+    def dump(self, path: Path) -> None:
+        """
+        Saves the snapshot into given directory.
+
+        Args:
+            - path (Path): snapshot directory (created if it does not exist)
+        """
+        path.mkdir(parents=True, exist_ok=True)
+        stream = io.BytesIO()
+        pickler = _ColumnarPickler(stream)
+        pickler.dump(self.network)
+        values = np.concatenate(pickler.arrays) if pickler.arrays else np.zeros(0)
+        table = pa.table({"value": values})
+        with pa.OSFile(str(path / self.VALUES_FILE), "wb") as sink:
+            with pa.ipc.new_file(sink, table.schema) as writer:
+                writer.write_table(table)
+        metadata = {
+            "version": self.FORMAT_VERSION,
+            "fingerprint": self.fingerprint,
+            "network": stream.getvalue(),
+            "extras": self.extras,
+        }
+        with open(path / self.METADATA_FILE, "wb") as file:
+            pickle.dump(metadata, file, protocol=pickle.HIGHEST_PROTOCOL)
+        _logger.info("Network snapshot saved to %s", path)
+
+    @classmethod
+    def load(cls, path: Path) -> "NetworkSnapshot":
+        """
+        Loads the snapshot from given directory, values are memory mapped (read only).
+
+        Args:
+            - path (Path): snapshot directory
+
+        Returns:
+            - NetworkSnapshot: loaded snapshot
+
+        Raises:
+            - NetworkSnapshotError: if the directory does not contain a snapshot of the current version
+        """
+        metadata = cls._read_metadata(path)
+        if metadata is None:
+            raise NetworkSnapshotError(f"Network snapshot not found in {path}")
+        if metadata["version"] != cls.FORMAT_VERSION:
+            raise NetworkSnapshotError(
+                f"Network snapshot in {path} has version {metadata['version']}, "
+                f"expected version {cls.FORMAT_VERSION}"
+            )
+        reader = pa.ipc.open_file(pa.memory_map(str(path / cls.VALUES_FILE)))
+        values = (
+            reader.get_batch(0).column(0).to_numpy()
+            if reader.num_record_batches
+            else np.zeros(0)
+        )
+        network = _ColumnarUnpickler(io.BytesIO(metadata["network"]), values).load()
+        return cls(
+            network=network,
+            fingerprint=metadata["fingerprint"],
+            extras=metadata["extras"],
+        )
+
+    @classmethod
+    def is_fresh(cls, path: Path, fingerprint: str, inputs: Iterable[Path]) -> bool:
+        """
+        Checks if the directory contains a snapshot of the current version, created with given
+        settings and newer than all given input files (files of the snapshot are skipped).
+
+        Args:
+            - path (Path): snapshot directory
+            - fingerprint (str): fingerprint of the current settings (see make_fingerprint)
+            - inputs (Iterable[Path]): input files or directories (searched recursively)
+
+        Returns:
+            - bool: True if the snapshot can be loaded instead of creating the network
+        """
+        metadata = cls._read_metadata(path)
+        if (
+            metadata is None
+            or metadata.get("version") != cls.FORMAT_VERSION
+            or metadata.get("fingerprint") != fingerprint
+        ):
+            return False
+        created = min(
+            (path / cls.VALUES_FILE).stat().st_mtime,
+            (path / cls.METADATA_FILE).stat().st_mtime,
+        )
+        snapshot_dir = path.resolve()
+        return all(
+            file_path.stat().st_mtime < created
+            for input_path in inputs
+            for file_path in (
+                [input_path] if input_path.is_file() else input_path.rglob("*")
+            )
+            if file_path.is_file() and snapshot_dir not in file_path.resolve().parents
+        )
+
+    @classmethod
+    def _read_metadata(cls, path: Path) -> dict[str, Any] | None:
+        """Metadata of the snapshot, None if the directory does not contain a snapshot."""
+        if (
+            not (path / cls.VALUES_FILE).is_file()
+            or not (path / cls.METADATA_FILE).is_file()
+        ):
+            return None
+        with open(path / cls.METADATA_FILE, "rb") as file:
+            return pickle.load(file)
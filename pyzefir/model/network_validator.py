@@ -11,6 +11,7 @@ from pyzefir.model.exceptions import (
 )
 from pyzefir.model.network import Network, NetworkElementsDict
 from pyzefir.model.network_elements import AggregatedConsumer, Bus, Generator, Storage
+from pyzefir.utils.functions import is_flow_int
 
 _logger = logging.getLogger(__name__)
 
@@ -26,20 +27,37 @@ class BasicValidator(ABC):
 
 class NetworkValidator:
 
-    def __init__(self, network: Network, raise_exceptions: bool = True) -> None:
+    def __init__(
+        self,
+        network: Network,
+        raise_exceptions: bool = True,
+        validate_elements: bool = True,
+    ) -> None:
+        """
+        Args:
+            - network (Network): network to validate
+            - raise_exceptions (bool): if True, errors are raised, otherwise only logged
+            - validate_elements (bool): if False, elements are not validated again (e.g. network created
+                by NetworkCreator, where every element is validated when added to the network)
+        """
         self.network = network
         self.raise_exceptions = raise_exceptions
+        self.validate_elements = validate_elements
 
     def validate(self) -> None:
         _logger.info("Validating network structure...")
-        self._validate(
+        validators: list[Type[BasicValidator]] = [
             RelativeEmissionLimitsValidation,
             BaseTotalEmissionValidation,
             BaseCapacityValidator,
             NetworkElementsValidation,
             PowerReserveValidation,
             DsrBusesOutValidation,
-        )
+            CurtailmentCostValidator,
+        ]
+        if not self.validate_elements:
+            validators.remove(NetworkElementsValidation)
+        self._validate(*validators)
         _logger.info("Network structure validation: Done.")
 
     def _validate(self, *validators: Type[BasicValidator]) -> None:
@@ -516,3 +534,51 @@ class GeneratorCapacityCostValidator(BasicValidator):
                             "to 'brutto'"
                         )
                     )
+
+
+class CurtailmentCostValidator(BasicValidator):
+    @staticmethod
+    def validate(
+        network: Network, exception_list: list[NetworkValidatorException]
+    ) -> None:
+        """
+        Curtailment costs of all generator types are checked at once: for each generator type with
+        curtailment cost given, the number of distinct year indices and the number of numeric (not nan)
+        values must match the number of years.
+        """
+        curtailment_costs = {
+            name: generator_type.energy_curtailment_cost
+            for name, generator_type in network.generator_types.items()
+            if generator_type.energy_curtailment_cost is not None
+            and len(generator_type.energy_curtailment_cost)
+        }
+        if not curtailment_costs:
+            return
+        costs = pd.concat(curtailment_costs, names=["generator_type", "year"])
+        n_years = network.constants.n_years
+        n_indices = (
+            costs.index.to_frame(index=False)
+            .groupby("generator_type", sort=False)["year"]
+            .nunique(dropna=False)
+        )
+        is_value = (
+            costs.notna()
+            if pd.api.types.is_numeric_dtype(costs)
+            else costs.map(is_flow_int).astype(bool)
+        )
+        n_values = is_value.groupby(level="generator_type", sort=False).sum()
+        for name in curtailment_costs:
+            if n_indices[name] != n_years:
+                exception_list.append(
+                    NetworkValidatorException(
+                        f"Incorrect year indices for energy curtailment cost of generator type "
+                        f"<{str(name)}> The number of indexes should match the number of years"
+                    )
+                )
+            if n_values[name] > 0 and n_values[name] != n_years:
+                exception_list.append(
+                    NetworkValidatorException(
+                        f"Incorrect values for energy curtailment cost of generator type <{str(name)}>"
+                    )
+                )
+        _logger.debug("Curtailment costs are OK.")
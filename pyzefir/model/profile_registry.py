@@ -0,0 +1,82 @@
+import hashlib
+from typing import Iterable
+
+import numpy as np
+
+
+class ProfileRegistry:
+    """
+    Registry of distinct profiles (float vectors of the same length, e.g. hourly capacity factors
+    or power utilization of generator types). Profiles are hashed when registered, so every distinct
+    profile is stored once and elements reference it by profile id.
+    """
+
+    def __init__(self) -> None:
+        self._profiles: list[np.ndarray] = []
+        self._ids: dict[bytes, list[int]] = {}
+        self._values: np.ndarray | None = None
+
+    def __len__(self) -> int:
+        return len(self._profiles)
+
+    def register(self, values: np.ndarray) -> int:
+        """
+        Registers given profile, if the same profile has already been registered, its id is returned
+        and the profile is not stored again.
+
+        Args:
+            - values (np.ndarray): profile values
+
+        Returns:
+            - int: id of the profile
+        """
+        values = np.ascontiguousarray(values, dtype=np.float64)
+        key = hashlib.blake2b(values.tobytes(), digest_size=16).digest()
+        candidates = self._ids.setdefault(key, [])
+        for profile_id in candidates:
+            if np.array_equal(self._profiles[profile_id], values, equal_nan=True):
+                return profile_id
+        if self._profiles and values.shape != self._profiles[0].shape:
+            raise ValueError(
+                f"profile of shape {values.shape} cannot be registered, "
+                f"registered profiles have shape {self._profiles[0].shape}"
+            )
+        candidates.append(len(self._profiles))
+        self._profiles.append(values)
+        self._values = None
+        return candidates[-1]
+
+    def register_all(self, profiles: Iterable[np.ndarray]) -> np.ndarray:
+        """
+        Registers given profiles (see register).
+
+        Args:
+            - profiles (Iterable[np.ndarray]): profiles values
+
+        Returns:
+            - np.ndarray: ids of the profiles
+        """
+        return np.array([self.register(values) for values in profiles], dtype=int)
+
+    @property
+    def values(self) -> np.ndarray:
+        """Distinct profiles stacked into array with shape (profiles, length of the profile)."""
+        if self._values is None:
+            self._values = (
+                np.vstack(self._profiles) if self._profiles else np.zeros((0, 0))
+            )
+            self._profiles = list(self._values)
+        return self._values
+
+    def constants(self) -> np.ndarray:
+        """
+        Values of constant profiles (all entries equal), nan for profiles which are not constant.
+
+        Returns:
+            - np.ndarray: constant value of every profile
+        """
+        values = self.values
+        if not values.size:
+            return np.full(len(values), np.nan)
+        is_constant = (values == values[:, :1]).all(axis=1)
+        return np.where(is_constant, values[:, 0], np.nan)
@@ -0,0 +1,228 @@
+import fnmatch
+from dataclasses import dataclass, fields, replace
+from typing import Any, ClassVar, Final, get_origin, get_type_hints
+
+import numpy as np
+import pandas as pd
+import xarray as xr
+
+from pyzefir.optimization.exportable_results import (
+    ExportableResults,
+    TExportableResultsGroup,
+)
+
+HOUR_LABEL: Final[str] = "Hour"
+PERIOD_LABEL: Final[str] = "Period"
+HOUR_DIM: Final[str] = "hour"
+
+
+@dataclass(frozen=True)
+class TimeAggregation:
+    """
+    Aggregation of hourly results over periods (whole year, months or periods of given length),
+    computed on the solution arrays before results of single units are created.
+    Hours are the hours of the year, so for a sampled run only the sampled hours are aggregated.
+    """
+
+    PERIODS: ClassVar[tuple[str, ...]] = ("annual", "monthly", "period")
+    FUNCTIONS: ClassVar[tuple[str, ...]] = ("sum", "mean")
+    _MONTH_OF_HOUR: ClassVar[np.ndarray] = pd.date_range(
+        "2019-01-01", periods=8760, freq="h"
+    ).month.to_numpy()
+
+    period: str = "annual"
+    """ annual (single period), monthly (periods 1-12) or period (periods of period_length hours) """
+    function: str = "sum"
+    """ sum or mean of the hourly values in a period """
+    period_length: int = 24
+    """ number of hours in a period (used only by period aggregation) """
+
+    def __post_init__(self) -> None:
+        if self.period not in self.PERIODS:
+            raise ValueError(
+                f"time aggregation period must be one of {self.PERIODS}, given {self.period}"
+            )
+        if self.function not in self.FUNCTIONS:
+            raise ValueError(
+                f"time aggregation function must be one of {self.FUNCTIONS}, given {self.function}"
+            )
+        if self.period_length < 1:
+            raise ValueError(
+                f"time aggregation period length must be positive, given {self.period_length}"
+            )
+
+    def periods(self, hours: np.ndarray) -> np.ndarray:
+        """
+        Periods of given hours of the year.
+
+        Args:
+            - hours (np.ndarray): hours of the year
+
+        Returns:
+            - np.ndarray: period of each hour
+        """
+        hours = np.asarray(hours, dtype=int)
+        match self.period:
+            case "annual":
+                return np.zeros(hours.shape, dtype=int)
+            case "monthly":
+                return self._MONTH_OF_HOUR[hours % len(self._MONTH_OF_HOUR)]
+            case _:
+                return hours // self.period_length
+
+    def aggregate(self, values: xr.DataArray) -> xr.DataArray:
+        """
+        Aggregates array over the hour dimension (array without hour dimension is returned unchanged).
+        Periods replace hours as coordinates of the hour dimension.
+
+        Args:
+            - values (xr.DataArray): array to aggregate
+
+        Returns:
+            - xr.DataArray: aggregated array
+        """
+        if HOUR_DIM not in values.dims:
+            return values
+        periods = xr.DataArray(
+            self.periods(values[HOUR_DIM].values),
+            dims=HOUR_DIM,
+            coords={HOUR_DIM: values[HOUR_DIM]},
+            name=PERIOD_LABEL,
+        )
+        grouped = values.groupby(periods)
+        aggregated = grouped.sum() if self.function == "sum" else grouped.mean()
+        return aggregated.rename({PERIOD_LABEL: HOUR_DIM}).transpose(*values.dims)
+
+
+@dataclass(frozen=True)
+class ExportSelection:
+    """
+    Selection of exported results: result groups, fields of the groups, names of elements
+    (shell-style patterns matched against keys of dictionaries and columns of yearly frames)
+    and optional time aggregation of hourly results.
+    """
+
+    groups: tuple[str, ...] | None = None
+    """ names of exported result groups (e.g. generators_results), all if None """
+    fields: tuple[str, ...] | None = None
+    """ names of exported fields (e.g. generation, capacity), all if None """
+    elements: tuple[str, ...] | None = None
+    """ patterns of names of exported elements (e.g. pp_coal_*), all if None """
+    time_aggregation: TimeAggregation | None = None
+    """ aggregation of hourly results, no aggregation if None """
+
+    def __post_init__(self) -> None:
+        group_types = get_type_hints(ExportableResults)
+        del group_types["objective_value"]
+        group_names = set(group_types)
+        field_names = {
+            field.name
+            for group_type in group_types.values()
+            for field in fields(group_type)
+        }
+        if self.groups is not None and (unknown := set(self.groups) - group_names):
+            raise ValueError(f"unknown result groups: {sorted(unknown)}")
+        if self.fields is not None and (unknown := set(self.fields) - field_names):
+            raise ValueError(f"unknown result fields: {sorted(unknown)}")
+
+    @property
+    def is_empty(self) -> bool:
+        """True if all results are exported without aggregation."""
+        return self == ExportSelection()
+
+    def includes_group(self, group_name: str) -> bool:
+        """True if given result group is exported."""
+        return self.groups is None or group_name in self.groups
+
+    def includes_field(self, field_name: str) -> bool:
+        """True if given field of result groups is exported."""
+        return self.fields is None or field_name in self.fields
+
+    def includes_element(self, element_name: Any) -> bool:
+        """True if given element (unit, line, bus, aggregated consumer) is exported."""
+        return self.elements is None or any(
+            fnmatch.fnmatchcase(str(element_name), pattern) for pattern in self.elements
+        )
+
+    def apply(self, results: ExportableResults) -> ExportableResults:
+        """
+        Removes not selected groups, fields and elements from the results and renames hour index
+        of aggregated hourly results to period.
+
+        Args:
+            - results (ExportableResults): results to filter
+
+        Returns:
+            - ExportableResults: selected results
+        """
+        return replace(
+            results,
+            generators_results=self._select_group(
+                "generators_results", results.generators_results
+            ),
+            storages_results=self._select_group(
+                "storages_results", results.storages_results
+            ),
+            lines_results=self._select_group("lines_results", results.lines_results),
+            fractions_results=self._select_group(
+                "fractions_results", results.fractions_results
+            ),
+            bus_results=self._select_group("bus_results", results.bus_results),
+            dual_results=self._select_group("dual_results", results.dual_results),
+            objective_results=self._select_group(
+                "objective_results", results.objective_results
+            ),
+        )
+
+    def _select_group(
+        self, group_name: str, group: TExportableResultsGroup
+    ) -> TExportableResultsGroup:
+        """Selected fields and elements of the results group (empty group if it is not selected)."""
+        if not self.includes_group(group_name):
+            return empty_exportable_group(type(group))
+        return replace(
+            group,
+            **{
+                field.name: (
+                    self.select_elements(getattr(group, field.name))
+                    if self.includes_field(field.name)
+                    else empty_exportable_value(field.type)
+                )
+                for field in fields(group)
+            },
+        )
+
+    def select_elements(self, value: pd.DataFrame | dict) -> pd.DataFrame | dict:
+        """Selected elements of the field value (keys of dictionary or columns of yearly frame)."""
+        if isinstance(value, dict):
+            return {
+                name: self._rename_hours(df)
+                for name, df in value.items()
+                if self.includes_element(name)
+            }
+        if self.elements is None:
+            return value
+        return value.loc[:, [self.includes_element(column) for column in value.columns]]
+
+    def _rename_hours(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Renames hour index of aggregated hourly frame to period."""
+        if self.time_aggregation is None or df.index.name != HOUR_LABEL:
+            return df
+        return df.rename_axis(index=PERIOD_LABEL)
+
+
+def empty_exportable_value(field_type: Any) -> pd.DataFrame | dict:
+    """Empty value of the field of exportable results group with given type."""
+    return {} if get_origin(field_type) is dict else pd.DataFrame()
+
+
+def empty_exportable_group(
+    group_type: type[TExportableResultsGroup],
+) -> TExportableResultsGroup:
+    """Exportable results group without any results (skipped by exporters)."""
+    return group_type(
+        **{
+            field.name: empty_exportable_value(field.type)
+            for field in fields(group_type)
+        }
+    )
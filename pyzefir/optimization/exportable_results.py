@@ -1,5 +1,7 @@
 from abc import ABC
-from dataclasses import dataclass
+from dataclasses import dataclass, field, fields
+from functools import partial
+from typing import Callable, TypeVar
 
 import pandas as pd
 
@@ -9,6 +11,14 @@ class ExportableResultsGroup(ABC):
     pass
 
 
+TExportableResultsGroup = TypeVar(
+    "TExportableResultsGroup", bound=ExportableResultsGroup
+)
+
+ExportableFieldGetters = dict[str, dict[str, Callable[[], pd.DataFrame | dict]]]
+""" result group name -> field name -> function returning the field value """
+
+
 @dataclass
 class ExportableGeneratorsResults(ExportableResultsGroup):
     generation: dict[str, pd.DataFrame]
@@ -46,6 +56,18 @@ class ExportableBusResults(ExportableResultsGroup):
     shift_plus: dict[str, pd.DataFrame]
 
 
+@dataclass
+class ExportableDualResults(ExportableResultsGroup):
+    marginal_price: dict[str, pd.DataFrame] = field(default_factory=dict)
+    emission_price: pd.DataFrame = field(default_factory=pd.DataFrame)
+
+
+@dataclass
+class ExportableObjectiveResults(ExportableResultsGroup):
+    cost_per_year: pd.DataFrame = field(default_factory=pd.DataFrame)
+    cost_per_unit: dict[str, pd.DataFrame] = field(default_factory=dict)
+
+
 @dataclass
 class ExportableResults:
     objective_value: pd.Series
@@ -54,3 +76,32 @@ class ExportableResults:
     lines_results: ExportableLinesResults
     fractions_results: ExportableFractionsResults
     bus_results: ExportableBusResults
+    dual_results: ExportableDualResults = field(default_factory=ExportableDualResults)
+    objective_results: ExportableObjectiveResults = field(
+        default_factory=ExportableObjectiveResults
+    )
+
+    @property
+    def field_getters(self) -> ExportableFieldGetters:
+        """Functions returning fields of the result groups (see LazyExportableResults)."""
+        return {
+            group_field.name: {
+                value_field.name: partial(getattr, group, value_field.name)
+                for value_field in fields(group)
+            }
+            for group_field in fields(self)
+            if isinstance(
+                group := getattr(self, group_field.name), ExportableResultsGroup
+            )
+        }
+
+
+@dataclass
+class LazyExportableResults:
+    """
+    Exportable results with fields computed one by one when they are exported (a field is not
+    kept after it is written). Groups and fields without getters are not exported.
+    """
+
+    objective_value: pd.Series
+    field_getters: ExportableFieldGetters
@@ -0,0 +1,189 @@
+import logging
+from dataclasses import dataclass, field
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from pyzefir.optimization.exportable_results import ExportableResults
+
+_logger = logging.getLogger(__name__)
+
+
+class FixedInvestmentsError(Exception):
+    pass
+
+
+@dataclass
+class FixedInvestments:
+    """
+    Investment decisions (capacities of units and fractions of local balancing stacks in aggregated
+    consumers) of a previous run, used to solve the model in dispatch only mode.
+    """
+
+    generator_capacity: pd.DataFrame
+    """ capacity of generators (index - years, columns - generator names) """
+    storage_capacity: pd.DataFrame
+    """ capacity of storages (index - years, columns - storage names) """
+    fractions: dict[str, pd.DataFrame] = field(default_factory=dict)
+    """ aggregated consumer name -> fractions (index - years, columns - local balancing stack names) """
+
+    @classmethod
+    def from_exportable(cls, results: ExportableResults) -> "FixedInvestments":
+        """
+        Creates fixed investments from the results of a previous run.
+
+        Args:
+            - results (ExportableResults): results of a previous run
+
+        Returns:
+            - FixedInvestments: capacities and fractions of given results
+        """
+        return cls(
+            generator_capacity=results.generators_results.capacity,
+            storage_capacity=results.storages_results.capacity,
+            fractions=results.fractions_results.fraction,
+        )
+
+    @classmethod
+    def from_csv(cls, results_path: Path) -> "FixedInvestments":
+        """
+        Loads fixed investments from csv results of a previous run.
+
+        Args:
+            - results_path (Path): path to the csv results directory of a previous run
+
+        Returns:
+            - FixedInvestments: capacities and fractions loaded from csv files
+        """
+        _logger.info("Loading fixed investments from %s...", results_path)
+        fractions_path = results_path / "fractions_results" / "fraction"
+        return cls(
+            generator_capacity=cls._read_frame(
+                results_path / "generators_results" / "capacity" / "capacity.csv"
+            ),
+            storage_capacity=cls._read_frame(
+                results_path / "storages_results" / "capacity" / "capacity.csv"
+            ),
+            fractions={
+                path.stem: cls._read_frame(path)
+                for path in sorted(fractions_path.glob("*.csv"))
+            },
+        )
+
+    def for_year(self, year: int) -> "FixedInvestments":
+        """
+        Fixed investments of a single year, relabelled as year 0 (used to solve a single year model).
+
+        Args:
+            - year (int): year of the investments
+
+        Returns:
+            - FixedInvestments: investments of given year
+        """
+        return FixedInvestments(
+            generator_capacity=self._year_frame(self.generator_capacity, year),
+            storage_capacity=self._year_frame(self.storage_capacity, year),
+            fractions={
+                name: self._year_frame(df, year) for name, df in self.fractions.items()
+            },
+        )
+
+    @staticmethod
+    def _year_frame(df: pd.DataFrame, year: int) -> pd.DataFrame:
+        """Row of given year relabelled as year 0."""
+        if df.empty:
+            return df
+        if year not in df.index:
+            raise FixedInvestmentsError(f"Fixed investments not found in year {year}")
+        return df.loc[[year]].set_axis([0], axis=0)
+
+    @staticmethod
+    def _read_frame(path: Path) -> pd.DataFrame:
+        """Reads frame with years as index, empty frame is returned if file does not exist."""
+        if not path.is_file():
+            return pd.DataFrame()
+        return pd.read_csv(path, index_col=0)
+
+    @staticmethod
+    def _select(
+        df: pd.DataFrame, years: np.ndarray, names: np.ndarray, label: str
+    ) -> np.ndarray:
+        """
+        Returns array (names x years) of values of given frame.
+
+        Raises:
+            - FixedInvestmentsError: if some years or names are missing
+        """
+        if not len(names):
+            return np.zeros((0, len(years)))
+        missing_names = set(names) - set(df.columns)
+        missing_years = set(years) - set(df.index)
+        if missing_names:
+            raise FixedInvestmentsError(
+                f"Fixed {label} not found for {sorted(missing_names)}"
+            )
+        if missing_years:
+            raise FixedInvestmentsError(
+                f"Fixed {label} not found in years {sorted(missing_years)}"
+            )
+        return df.loc[years, names].to_numpy(dtype=float).T
+
+    def generator_capacity_array(
+        self, years: np.ndarray, generators: np.ndarray
+    ) -> np.ndarray:
+        """
+        Capacity of given generators in given years.
+
+        Args:
+            - years (np.ndarray): years
+            - generators (np.ndarray): generator names
+
+        Returns:
+            - np.ndarray: capacity array (generators x years)
+        """
+        return self._select(
+            self.generator_capacity, years, generators, "generator capacity"
+        )
+
+    def storage_capacity_array(
+        self, years: np.ndarray, storages: np.ndarray
+    ) -> np.ndarray:
+        """
+        Capacity of given storages in given years.
+
+        Args:
+            - years (np.ndarray): years
+            - storages (np.ndarray): storage names
+
+        Returns:
+            - np.ndarray: capacity array (storages x years)
+        """
+        return self._select(self.storage_capacity, years, storages, "storage capacity")
+
+    def fraction_array(
+        self, years: np.ndarray, aggregates: np.ndarray, stacks: np.ndarray
+    ) -> np.ndarray:
+        """
+        Fractions of given local balancing stacks in given aggregated consumers in given years.
+        Fractions of stacks not present in the results of aggregated consumer are equal to 0.
+
+        Args:
+            - years (np.ndarray): years
+            - aggregates (np.ndarray): aggregated consumer names
+            - stacks (np.ndarray): local balancing stack names
+
+        Returns:
+            - np.ndarray: fractions array (aggregates x stacks x years)
+        """
+        result = np.zeros((len(aggregates), len(stacks), len(years)))
+        for aggr_idx, aggr_name in enumerate(aggregates):
+            if aggr_name not in self.fractions:
+                raise FixedInvestmentsError(
+                    f"Fixed fractions not found for aggregated consumer {aggr_name}"
+                )
+            df = self.fractions[aggr_name].reindex(columns=stacks, fill_value=0.0)
+            result[aggr_idx] = self._select(
+                df.fillna(0.0), years, stacks, f"fractions of {aggr_name}"
+            )
+        return result
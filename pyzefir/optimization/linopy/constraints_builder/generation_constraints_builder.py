@@ -14,6 +14,7 @@
 # You should have received a copy of the GNU Affero General Public License
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 import logging
+from typing import Hashable
 
 import xarray as xr
 from linopy import LinearExpression
@@ -57,32 +58,38 @@ class GenerationConstraintsBuilder(PartialConstraintsBuilder):
         generation must be lower than capacity times power utilization and
         greater than or equal to capacity times minimal power utilization.
         """
+        ds = self.parameters.dataset
+        tgen_params, cf_params = self.parameters.tgen, self.parameters.cf
+        profiles: dict[tuple[Hashable, int], xr.DataArray | float] = {}
         for gen_idx, gen_name in self.indices.GEN.mapping.items():
             generation_brutto = self.variables.gen.gen.isel(gen=gen_idx)
             capacity = self.variables.gen.cap.isel(gen=gen_idx)
             capacity_factor_id = self.parameters.gen.capacity_factors[gen_idx]
-            gen_to_tgen = self.parameters.gen.tgen
-            power_utilization = xr.DataArray(
-                self.parameters.tgen.power_utilization[gen_to_tgen[gen_idx]],
-                dims=["hour"],
-                coords={"hour": self.indices.H.ii},
-            )
-            minimal_power_utilization = xr.DataArray(
-                self.parameters.tgen.minimal_power_utilization[gen_to_tgen[gen_idx]],
-                dims=["hour"],
-                coords={"hour": self.indices.H.ii},
+            tgen_idx = self.parameters.gen.tgen[gen_idx]
+            power_utilization = self._shared_profile(
+                profiles,
+                ds.tgen_power_utilization,
+                tgen_params.power_utilization_profile[tgen_idx],
+                tgen=tgen_idx,
             )
             if capacity_factor_id is not None:
-                capacity_factor = xr.DataArray(
-                    self.parameters.cf.profile[capacity_factor_id],
-                    dims=["hour"],
-                    coords={"hour": self.indices.H.ii},
+                capacity_factor = self._shared_profile(
+                    profiles,
+                    ds.cf_profile,
+                    cf_params.profile_id[capacity_factor_id],
+                    cf=capacity_factor_id,
                 )
                 self.model.add_constraints(
                     generation_brutto == capacity_factor * capacity * power_utilization,
                     name=f"{gen_name}_NON_DISPATCHABLE_GEN_CAP_CONSTRAINT",
                 )
             else:
+                minimal_power_utilization = self._shared_profile(
+                    profiles,
+                    ds.tgen_minimal_power_utilization,
+                    tgen_params.minimal_power_utilization_profile[tgen_idx],
+                    tgen=tgen_idx,
+                )
                 self.model.add_constraints(
                     generation_brutto <= capacity * power_utilization,
                     name=f"{gen_name}_DISPATCHABLE_GEN_CAP_CONSTRAINT",
@@ -102,6 +109,8 @@ class GenerationConstraintsBuilder(PartialConstraintsBuilder):
         It ensures that the relationship between generated energy, dumped energy, and
         demand chunk energy is maintained.
         """
+        ds = self.parameters.dataset
+        efficiency: dict[tuple[int, str], xr.DataArray | float] = {}
         for gen_idx, gen_name in self.indices.GEN.mapping.items():
             for et in self.parameters.gen.ett[gen_idx]:
                 gen_et = self.variables.gen.gen_et[gen_idx][et]
@@ -112,11 +121,12 @@ class GenerationConstraintsBuilder(PartialConstraintsBuilder):
                     self.variables.gen.dump_et[gen_idx][et] if not disable_dump else 0.0
                 )
                 gen = self.variables.gen.gen.isel(gen=gen_idx)
-                eff = xr.DataArray(
-                    self.parameters.tgen.eff[self.parameters.gen.tgen[gen_idx]][et],
-                    dims=["hour"],
-                    coords={"hour": self.indices.H.ii},
-                )
+                tgen_idx = self.parameters.gen.tgen[gen_idx]
+                if (tgen_idx, et) not in efficiency:
+                    efficiency[tgen_idx, et] = self._profile(
+                        ds.tgen_eff.isel(tgen=tgen_idx, drop=True).sel(et=et, drop=True)
+                    )
+                eff = efficiency[tgen_idx, et]
                 dch_gen = self.generator_demand_chunk_expr(gen_idx, et)
                 gen_reserve_et = self.reserve_expr(gen_idx, et)
                 self.model.add_constraints(
@@ -126,6 +136,30 @@ class GenerationConstraintsBuilder(PartialConstraintsBuilder):
 
         _logger.debug("Build generation and dump energy constraints: Done")
 
+    @staticmethod
+    def _shared_profile(
+        profiles: dict[tuple[Hashable, int], xr.DataArray | float],
+        values: xr.DataArray,
+        profile_id: int,
+        **selection: int,
+    ) -> xr.DataArray | float:
+        """
+        Hourly profile with given profile id, selected from values once for all generators sharing it
+        (see ModelParameters.fetch_element_profiles) and stored in profiles.
+        """
+        key = (values.name, profile_id)
+        if key not in profiles:
+            profiles[key] = GenerationConstraintsBuilder._profile(
+                values.isel(selection, drop=True)
+            )
+        return profiles[key]
+
+    @staticmethod
+    def _profile(profile: xr.DataArray) -> xr.DataArray | float:
+        """Hourly profile of the generator, flat profiles are collapsed to scalars."""
+        values = profile.values
+        return float(values[0]) if (values == values[0]).all() else profile
+
     def generator_demand_chunk_expr(
         self, gen_idx: int, et: str
     ) -> LinearExpression | float:
@@ -528,3 +528,23 @@ class ScenarioConstraintsBuilder(PartialConstraintsBuilder):
                     )
             _logger.debug("Build power reserve constraints: Done")
         _logger.debug("Build power reserve constraints: Done")
+
+
+class DispatchScenarioConstraintsBuilder(ScenarioConstraintsBuilder):
+    """
+    Scenario constraints used in dispatch only mode (capacities and fractions are fixed),
+    constraints on fractions and capacities are not built.
+    """
+
+    def build_constraints(self) -> None:
+        """
+        Builds constraints including:
+        - maximum fuel consumption constraints
+        - emission constraints
+        - power reserve constraints
+        """
+        _logger.info("Dispatch scenario constraints builder is working...")
+        self.max_fuel_consumption_constraints()
+        self.emission_constraints()
+        self.power_reserve_constraint()
+        _logger.info("Dispatch scenario constraints builder is finished!")
@@ -0,0 +1,300 @@
+# PyZefir
+# Copyright (C) 2024 Narodowe Centrum Badań Jądrowych
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import copy
+import logging
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import fields, replace
+from pathlib import Path
+from typing import Callable
+
+import numpy as np
+import pandas as pd
+from pandas.api.types import is_numeric_dtype
+
+from pyzefir.model.network import Network
+from pyzefir.model.network_aggregator.aggregation_schemas import COMBINED
+from pyzefir.model.utils import NetworkConstants
+from pyzefir.optimization.exportable_results import (
+    ExportableResults,
+    TExportableResultsGroup,
+)
+from pyzefir.optimization.input_data import OptimizationInputData
+from pyzefir.optimization.linopy.model import LinopyOptimizationModel
+from pyzefir.optimization.model import OptimizationStatus
+from pyzefir.optimization.opt_config import OptConfig
+from pyzefir.optimization.results import YEAR_LABEL
+
+_logger = logging.getLogger(__name__)
+
+
+class DispatchError(Exception):
+    pass
+
+
+def year_network(network: Network, year: int) -> Network:
+    """
+    Copy of the network with yearly data restricted to given year (year 0 of the returned network).
+    Yearly properties are the ones aggregated by NetworkAggregator.
+
+    Args:
+        - network (Network): network with data of all years
+        - year (int): year to keep
+
+    Returns:
+        - Network: network with a single year
+    """
+    result = copy.deepcopy(network)
+    for item in COMBINED:
+        for data_property in item.iterate_over(result):
+            if data_property.value is not None:
+                value = pd.Series(data_property.value)
+                data_property.value = pd.Series([value.iloc[year]])
+    result.constants = NetworkConstants(**network.constants.__dict__ | dict(n_years=1))
+    return result
+
+
+def _relabel_year(df: pd.DataFrame, year: int) -> pd.DataFrame:
+    """Relabels year 0 of a single year model to given year."""
+    if df.columns.name == YEAR_LABEL:
+        return df.rename(columns={0: year})
+    return df.rename(index={0: year})
+
+
+def _solve_dispatch_year(
+    network: Network, opt_config: OptConfig, year: int
+) -> ExportableResults:
+    """
+    Builds and solves dispatch model of a single year (module level function, so it can be
+    executed in a separate process).
+
+    Raises:
+        - DispatchError: if the model of given year is not solved to optimality
+    """
+    engine = LinopyOptimizationModel()
+    engine.build(OptimizationInputData(year_network(network, year), opt_config))
+    engine.optimize()
+    if engine.status != OptimizationStatus.OPTIMAL:
+        raise DispatchError(
+            f"Dispatch model of year {year} cannot be solved, "
+            f"optimization status is {engine.status.name}"
+        )
+    results = engine.results.to_exportable(release=True)
+    return _map_frames(results, lambda df: _relabel_year(df, year))
+
+
+def _year_path(path: Path | None, year: int) -> Path | None:
+    """Path with year suffix added to the file name, so years do not overwrite each other."""
+    if path is None:
+        return None
+    return path.with_name(f"{path.stem}_{year}{path.suffix}")
+
+
+def _merge_frames(frames: list[pd.DataFrame]) -> pd.DataFrame:
+    """
+    Merges frames of subsequent years. Hourly frames (years in columns) are concatenated
+    horizontally, yearly frames (years in index) vertically. Non-numeric columns (e.g. energy type)
+    are treated as a part of the index.
+    """
+    frames = [df for df in frames if not df.empty]
+    if not frames:
+        return pd.DataFrame()
+    if frames[0].columns.name != YEAR_LABEL:
+        return pd.concat(frames).sort_index()
+    key_columns = [
+        column
+        for column in frames[0].columns
+        if not is_numeric_dtype(frames[0][column])
+    ]
+    if not key_columns:
+        return pd.concat(frames, axis=1)
+    index_name = frames[0].index.name
+    df = pd.concat(
+        [frame.set_index(key_columns, append=True) for frame in frames], axis=1
+    )
+    df = df.reset_index(level=key_columns)
+    df.index.name = index_name
+    return df
+
+
+def _merge_values(values: list) -> pd.DataFrame | dict:
+    """Merges values of a single field of the results of subsequent years."""
+    if isinstance(values[0], dict):
+        keys = sorted({key for value in values for key in value})
+        return {
+            key: _merge_frames([value[key] for value in values if key in value])
+            for key in keys
+        }
+    return _merge_frames(values)
+
+
+def _map_group_frames(
+    group: TExportableResultsGroup, func: Callable[[pd.DataFrame], pd.DataFrame]
+) -> TExportableResultsGroup:
+    """Applies given function to every frame of the results group."""
+    return replace(
+        group,
+        **{
+            group_field.name: (
+                {key: func(df) for key, df in value.items()}
+                if isinstance(value := getattr(group, group_field.name), dict)
+                else func(value)
+            )
+            for group_field in fields(group)
+        },
+    )
+
+
+def _map_frames(
+    results: ExportableResults, func: Callable[[pd.DataFrame], pd.DataFrame]
+) -> ExportableResults:
+    """Applies given function to every frame of the results (objective value is not changed)."""
+    return replace(
+        results,
+        generators_results=_map_group_frames(results.generators_results, func),
+        storages_results=_map_group_frames(results.storages_results, func),
+        lines_results=_map_group_frames(results.lines_results, func),
+        fractions_results=_map_group_frames(results.fractions_results, func),
+        bus_results=_map_group_frames(results.bus_results, func),
+        dual_results=_map_group_frames(results.dual_results, func),
+        objective_results=_map_group_frames(results.objective_results, func),
+    )
+
+
+def _merge_groups(groups: list[TExportableResultsGroup]) -> TExportableResultsGroup:
+    """Merges results groups of subsequent years."""
+    return replace(
+        groups[0],
+        **{
+            group_field.name: _merge_values(
+                [getattr(group, group_field.name) for group in groups]
+            )
+            for group_field in fields(groups[0])
+        },
+    )
+
+
+def merge_exportable_results(results: list[ExportableResults]) -> ExportableResults:
+    """
+    Merges results of dispatch models of subsequent years into a single results object.
+    Objective values of all years are summed.
+
+    Args:
+        - results (list[ExportableResults]): results of subsequent years
+
+    Returns:
+        - ExportableResults: merged results
+    """
+    return ExportableResults(
+        objective_value=pd.Series(
+            sum(result.objective_value.sum() for result in results),
+            name=results[0].objective_value.name,
+        ),
+        generators_results=_merge_groups(
+            [result.generators_results for result in results]
+        ),
+        storages_results=_merge_groups([result.storages_results for result in results]),
+        lines_results=_merge_groups([result.lines_results for result in results]),
+        fractions_results=_merge_groups(
+            [result.fractions_results for result in results]
+        ),
+        bus_results=_merge_groups([result.bus_results for result in results]),
+        dual_results=_merge_groups([result.dual_results for result in results]),
+        objective_results=_merge_groups(
+            [result.objective_results for result in results]
+        ),
+    )
+
+
+class DispatchRunner:
+    """
+    Solves the model in dispatch only mode. Capacities of units and fractions are fixed to the
+    values of a previous run (OptConfig.fixed_investments), so the years are independent and
+    a separate model is solved for each sampled year. Models of different years are solved in
+    parallel processes and their results are merged. Capex is not a part of the objective.
+    """
+
+    def __init__(
+        self,
+        network: Network,
+        opt_config: OptConfig,
+        max_workers: int | None = None,
+    ) -> None:
+        """
+        Initializes a new instance of the class.
+
+        Args:
+            - network (Network): network to optimize
+            - opt_config (OptConfig): optimization config with fixed_investments given
+            - max_workers (int | None): maximal number of parallel processes, if None number of
+                processors is used, if 1 years are solved sequentially in the current process
+        """
+        if opt_config.fixed_investments is None:
+            raise DispatchError("fixed investments are required in dispatch only mode")
+        self._fixed_investments = opt_config.fixed_investments
+        self._network = network
+        self._opt_config = opt_config
+        self._max_workers = max_workers
+
+    def year_configs(self) -> dict[int, OptConfig]:
+        """
+        Optimization configs of single year models.
+
+        Returns:
+            - dict[int, OptConfig]: year -> config of the model of given year
+        """
+        configs = {}
+        for pos, year in enumerate(self._opt_config.year_sample):
+            config = copy.copy(self._opt_config)
+            config.years = np.arange(1)
+            config.year_sample = np.arange(1)
+            config.discount_rate = self._opt_config.discount_rate[[year]]
+            if self._opt_config.year_aggregates is not None:
+                config.year_aggregates = self._opt_config.year_aggregates[[pos]]
+            config.fixed_investments = self._fixed_investments.for_year(year)
+            config.sol_dump_path = _year_path(self._opt_config.sol_dump_path, year)
+            config.opt_logs_dump_path = _year_path(
+                self._opt_config.opt_logs_dump_path, year
+            )
+            configs[int(year)] = config
+        return configs
+
+    def run(self) -> ExportableResults:
+        """
+        Solves dispatch models of all sampled years and merges their results.
+
+        Returns:
+            - ExportableResults: merged results of all years
+        """
+        configs = self.year_configs()
+        _logger.info("Solving dispatch models of %d years...", len(configs))
+        if self._max_workers == 1 or len(configs) == 1:
+            results = [
+                _solve_dispatch_year(self._network, config, year)
+                for year, config in configs.items()
+            ]
+        else:
+            with ProcessPoolExecutor(max_workers=self._max_workers) as executor:
+                results = list(
+                    executor.map(
+                        _solve_dispatch_year,
+                        [self._network] * len(configs),
+                        configs.values(),
+                        configs.keys(),
+                    )
+                )
+        _logger.info("Dispatch models solved.")
+        return merge_exportable_results(results)
@@ -0,0 +1,115 @@
+import logging
+import re
+from typing import Callable, Final
+
+import numpy as np
+import xarray as xr
+from linopy import Model
+
+from pyzefir.optimization.linopy.preprocessing.indices import Indices
+
+_logger = logging.getLogger(__name__)
+
+BALANCING_FAMILY: Final[str] = "balancing"
+EMISSIONS_FAMILY: Final[str] = "emissions"
+_BALANCING_SUFFIX: Final[str] = "_BALANCING_CONSTRAINT"
+_EMISSIONS_PATTERN: Final = re.compile(
+    r"^(?P<emission_type>.+)_(?P<year>\d+)_EMISSIONS_CONSTRAINT$"
+)
+
+
+def balancing_duals(model: Model, indices: Indices) -> xr.DataArray:
+    """
+    Duals of bus balancing constraints (marginal prices of energy) stacked into a single array.
+    Buses without balancing constraint (e.g. removed as trivial) get nan. Balancing constraints
+    are added per bus (named after the bus) by BalancingConstraintsBuilder, so they are looked up
+    by name bus by bus and stacked at once.
+
+    Args:
+        - model (Model): solved linopy model
+        - indices (Indices): indices of the model
+
+    Returns:
+        - xr.DataArray: duals with dimensions (bus, hour, year)
+    """
+    constraints = model.constraints
+    names = {
+        bus_idx: name
+        for bus_idx, bus_name in indices.BUS.mapping.items()
+        if (name := f"{bus_name}{_BALANCING_SUFFIX}") in constraints
+    }
+    values = np.full((len(indices.BUS), len(indices.H), len(indices.Y)), np.nan)
+    if names:
+        values[list(names)] = np.stack(
+            [
+                constraints[name].data["dual"].transpose("hour", "year").values
+                for name in names.values()
+            ]
+        )
+    return xr.DataArray(
+        values,
+        dims=("bus", "hour", "year"),
+        coords={"bus": indices.BUS.ii, "hour": indices.H.ii, "year": indices.Y.ii},
+        name=BALANCING_FAMILY,
+    )
+
+
+def emission_duals(model: Model, indices: Indices) -> xr.DataArray:
+    """
+    Duals of relative emission limits stacked into a single array. Years without emission limit
+    of given type get nan.
+
+    Args:
+        - model (Model): solved linopy model
+        - indices (Indices): indices of the model
+
+    Returns:
+        - xr.DataArray: duals with dimensions (emission_type, year)
+    """
+    matches = [
+        (match["emission_type"], int(match["year"]), name)
+        for name in model.constraints
+        if (match := _EMISSIONS_PATTERN.match(name)) is not None
+    ]
+    emission_types = sorted({emission_type for emission_type, _, _ in matches})
+    values = np.full((len(emission_types), len(indices.Y)), np.nan)
+    for emission_type, y_idx, name in matches:
+        values[emission_types.index(emission_type), y_idx] = model.constraints[
+            name
+        ].data["dual"]
+    return xr.DataArray(
+        values,
+        dims=("emission_type", "year"),
+        coords={"emission_type": emission_types, "year": indices.Y.ii},
+        name=EMISSIONS_FAMILY,
+    )
+
+
+DUAL_FAMILIES: Final[dict[str, Callable[[Model, Indices], xr.DataArray]]] = {
+    BALANCING_FAMILY: balancing_duals,
+    EMISSIONS_FAMILY: emission_duals,
+}
+""" constraint family name -> function extracting duals of the family """
+
+
+def extract_duals(
+    model: Model, indices: Indices, families: tuple[str, ...]
+) -> dict[str, xr.DataArray]:
+    """
+    Extracts duals of given constraint families from the solved model. If the solver did not
+    provide duals (e.g. for mixed integer models), no duals are returned.
+
+    Args:
+        - model (Model): solved linopy model
+        - indices (Indices): indices of the model
+        - families (tuple[str, ...]): names of constraint families (keys of DUAL_FAMILIES)
+
+    Returns:
+        - dict[str, xr.DataArray]: family name -> duals of the family
+    """
+    if not families:
+        return {}
+    if not any("dual" in model.constraints[name].data for name in model.constraints):
+        _logger.warning("Solver did not provide duals, dual results are not available")
+        return {}
+    return {family: DUAL_FAMILIES[family](model, indices) for family in families}
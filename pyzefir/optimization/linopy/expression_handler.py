@@ -25,6 +25,9 @@ from pyzefir.optimization.linopy.preprocessing.opt_parameters import (
 from pyzefir.optimization.linopy.preprocessing.opt_variables import (
     OptimizationVariables,
 )
+from pyzefir.optimization.linopy.preprocessing.parameters.parameters_dataset import (
+    select_by_ords,
+)
 
 
 class ExpressionHandler:
@@ -55,15 +58,15 @@ class ExpressionHandler:
         self.indices = indices
         self.parameters = parameters
         self.variables = variables
+        self._fraction_dem: LinearExpression | None = None
 
     def fraction_dem(self, bus_idx: int) -> LinearExpression | float:
         """
         Calculates the demand in a specified bus related to fractions of local technology stacks
         in consumer aggregates.
 
-        This method looks up the local balancing stack (LBS) mapping for the provided bus index,
-        retrieves the associated demand and fraction for that LBS, and computes the overall demand
-        for that bus by multiplying the demand by the fraction.
+        Demand of all buses connected to local balancing stacks is computed once (see
+        buses_fraction_dem), this method selects the demand of given bus.
 
         Args:
             - bus_idx (int): The index of the bus for which to calculate the demand.
@@ -74,20 +77,38 @@ class ExpressionHandler:
                   the fraction demand based on the local technology stacks.
                 - If the bus index is not found, returns 0.0.
         """
-        if bus_idx not in self.parameters.bus.lbs_mapping:
+        if self._fraction_dem is None:
+            self._fraction_dem = self.buses_fraction_dem()
+        bus_name = self.indices.BUS.mapping[bus_idx]
+        if bus_name not in self._fraction_dem.indexes["bus"]:
             return 0.0
+        return self._fraction_dem.sel(bus=bus_name, drop=True)
 
-        lbs_idx, energy_type = (
-            self.parameters.bus.lbs_mapping[bus_idx],
-            self.parameters.bus.et[bus_idx],
-        )
-        aggr_idx = self.parameters.lbs.aggr_idx[lbs_idx]
-        dem, frac = (
-            self.parameters.aggr.dem[aggr_idx][energy_type],
-            self.variables.frac.fraction.isel(aggr=aggr_idx, lbs=lbs_idx),
-        )
+    def buses_fraction_dem(self) -> LinearExpression:
+        """
+        Calculates the demand related to fractions of local technology stacks in consumer aggregates
+        for all buses connected to local balancing stacks at once, by multiplying demand of the
+        aggregated consumer in the energy type of the bus with the fraction of the local balancing
+        stack of the bus.
 
-        return xr.DataArray(dem, dims=["hour", "year"]) * frac
+        Returns:
+            - LinearExpression: demand with dimensions (bus, hour, year), only buses connected to local
+                balancing stacks (of aggregated consumers) are included
+        """
+        ds = self.parameters.dataset
+        bus_aggr = select_by_ords(ds.lbs_aggr, "lbs", ds.bus_lbs, fill_value=-1)
+        connected = (bus_aggr >= 0).values
+        bus_lbs, bus_aggr = ds.bus_lbs[connected], bus_aggr[connected]
+        dem = ds.aggr_dem.isel(
+            aggr=bus_aggr,
+            et=xr.DataArray(
+                self.indices.ET.get_ords(ds.bus_et[connected].values),
+                dims="bus",
+                coords={"bus": bus_lbs.bus},
+            ),
+        ).drop_vars(["aggr", "et"])
+        frac = self.variables.frac.fraction.isel(aggr=bus_aggr, lbs=bus_lbs)
+        return dem.transpose("bus", "hour", "year") * frac
 
     def gen_netto_g(self, gen_idx: int, energy_type: str) -> LinearExpression:
         """
@@ -16,14 +16,23 @@
 
 
 import logging
+import tempfile
+from pathlib import Path
+from typing import Any
 
+import numpy as np
 import pandas as pd
-from linopy import Model, solvers
+import xarray as xr
+from linopy import LinearExpression, Model, Variable, solvers
 
+from pyzefir.optimization.fixed_investments import FixedInvestments
 from pyzefir.optimization.input_data import OptimizationInputData
 from pyzefir.optimization.linopy.constraints_builder.balancing_constraints_builder import (
     BalancingConstraintsBuilder,
 )
+from pyzefir.optimization.linopy.constraints_builder.builder import (
+    PartialConstraintsBuilder,
+)
 from pyzefir.optimization.linopy.constraints_builder.capacity_binding_builder import (
     CapacityBindingBuilder,
 )
@@ -49,11 +58,17 @@ from pyzefir.optimization.linopy.constraints_builder.line_flow_constraints_build
     LineFlowConstraintsBuilder,
 )
 from pyzefir.optimization.linopy.constraints_builder.scenario_constraints_builder import (
+    DispatchScenarioConstraintsBuilder,
     ScenarioConstraintsBuilder,
 )
 from pyzefir.optimization.linopy.constraints_builder.storage_constraints_builder import (
     StorageConstraintsBuilder,
 )
+from pyzefir.optimization.linopy.duals import extract_duals
+from pyzefir.optimization.linopy.objective_breakdown import (
+    component_name,
+    evaluate_components,
+)
 from pyzefir.optimization.linopy.objective_builder.capex_objective_builder import (
     CapexObjectiveBuilder,
 )
@@ -88,12 +103,31 @@ from pyzefir.optimization.linopy.preprocessing.opt_parameters import (
 from pyzefir.optimization.linopy.preprocessing.opt_variables import (
     OptimizationVariables,
 )
+from pyzefir.optimization.linopy.reduction import (
+    VariableReduction,
+    drop_trivial_constraints,
+    reinstate_zeros,
+)
+from pyzefir.optimization.linopy.scaling import ModelScaler
+from pyzefir.optimization.linopy.solver_process import (
+    SolverProcessRunner,
+    SolverRun,
+    limit_options,
+    run_path,
+)
+from pyzefir.optimization.linopy.warm_start import (
+    investments_start_values,
+    snapshot_start_values,
+    start_vector,
+    write_warm_start,
+)
 from pyzefir.optimization.model import (
     OptimizationError,
     OptimizationModel,
     OptimizationStatus,
 )
 from pyzefir.optimization.results import Results
+from pyzefir.optimization.solution_snapshot import SolutionSnapshot
 
 
 class LinopyOptimizationModel(OptimizationModel):
@@ -106,7 +140,7 @@ class LinopyOptimizationModel(OptimizationModel):
     and handle results after optimization.
     """
 
-    _constraint_builders = [
+    _constraint_builders: list[type[PartialConstraintsBuilder]] = [
         ScenarioConstraintsBuilder,
         BalancingConstraintsBuilder,
         FractionConstraintsBuilder,
@@ -130,6 +164,20 @@ class LinopyOptimizationModel(OptimizationModel):
         CurtailedEnergyCostObjectiveBuilder,
         GenerationCompensationObjectiveBuilder,
     ]
+    _dispatch_constraint_builders: list[type[PartialConstraintsBuilder]] = [
+        DispatchScenarioConstraintsBuilder,
+        BalancingConstraintsBuilder,
+        LineFlowConstraintsBuilder,
+        GenerationConstraintsBuilder,
+        StorageConstraintsBuilder,
+        RampConstraintsBuilder,
+        GenerationFractionConstraintsBuilder,
+    ]
+    _dispatch_objective_builders = [
+        builder
+        for builder in _objective_builders
+        if builder is not CapexObjectiveBuilder
+    ]
     _direct_solvers = ["gurobi", "highs"]
 
     def __init__(self) -> None:
@@ -145,6 +193,10 @@ class LinopyOptimizationModel(OptimizationModel):
         self._parameters: OptimizationParameters | None = None
         self._variables: OptimizationVariables | None = None
 
+        self._constraint_names: dict[str, list[str]] = {}
+        self._objective_components: dict[str, LinearExpression | float] = {}
+        self._scaler: ModelScaler | None = None
+
         self._results: Results | None = None
         self._status = OptimizationStatus.NOT_COMPUTED
 
@@ -168,26 +220,121 @@ class LinopyOptimizationModel(OptimizationModel):
         self._parameters = OptimizationParameters(
             self.input_data.network, self.indices, self.input_data.config
         )
+        reduction = (
+            VariableReduction.from_parameters(
+                self.indices, self.parameters, fixed_capacity=self.dispatch_only
+            )
+            if self.input_data.config.variable_reduction
+            else None
+        )
         self._variables = OptimizationVariables(
-            self.model, self._input_data.network, self.indices, self.input_data.config
+            self.model,
+            self._input_data.network,
+            self.indices,
+            self.input_data.config,
+            reduction,
         )
+        if self.dispatch_only:
+            self._fix_investments()
         self._set_constraints()
         self._set_objective_function()
+        if reduction is not None:
+            drop_trivial_constraints(self.model, self._constraint_names)
+        if self.input_data.config.auto_scaling:
+            self._scaler = ModelScaler(
+                self.model, self._constraint_names, self.input_data.config.money_scale
+            )
+            self._scaler.scale()
+
+    @property
+    def dispatch_only(self) -> bool:
+        """Capacities and fractions are fixed (only dispatch is optimized)."""
+        return self.input_data.config.fixed_investments is not None
+
+    def _fix_investments(self) -> None:
+        """
+        Fixes capacities of units and fractions to the values given in the config. Variables of
+        capacity changes (which appear only in capacity evolution constraints and capex) are masked.
+        """
+        investments = self.input_data.config.fixed_investments
+        if investments is None:
+            raise ValueError("fixed investments are not given in the config")
+        years = self.indices.Y.ii
+        self._fix_variable(
+            self.variables.gen.cap,
+            investments.generator_capacity_array(years, self.indices.GEN.ii),
+        )
+        self._fix_variable(
+            self.variables.stor.cap,
+            investments.storage_capacity_array(years, self.indices.STOR.ii),
+        )
+        self._fix_variable(
+            self.variables.frac.fraction,
+            investments.fraction_array(
+                years, self.indices.AGGR.ii, self.indices.LBS.ii
+            ),
+        )
+        for variable in [
+            self.variables.gen.cap_plus,
+            self.variables.gen.cap_minus,
+            self.variables.gen.cap_base_minus,
+            self.variables.stor.cap_plus,
+            self.variables.stor.cap_minus,
+            self.variables.stor.cap_base_minus,
+            self.variables.tgen.tcap,
+            self.variables.tgen.tcap_plus,
+            self.variables.tgen.tcap_minus,
+            self.variables.tgen.tcap_base_minus,
+            self.variables.tstor.tcap,
+            self.variables.tstor.tcap_plus,
+            self.variables.tstor.tcap_minus,
+            self.variables.tstor.tcap_base_minus,
+        ]:
+            variable.data["labels"] = xr.full_like(variable.labels, -1)
+
+    @staticmethod
+    def _fix_variable(variable: Variable, values: np.ndarray) -> None:
+        """Sets lower and upper bound of given variable to given values."""
+        bound = variable.lower.copy(data=values.reshape(variable.shape))
+        variable.lower = bound
+        variable.upper = bound
 
     def _set_constraints(self) -> None:
         """Sets the constraints for the optimization model."""
-        for builder in self._constraint_builders:
+        self._constraint_names = {}
+        constraint_builders = (
+            self._dispatch_constraint_builders
+            if self.dispatch_only
+            else self._constraint_builders
+        )
+        for builder in constraint_builders:
+            existing_names = set(self.model.constraints)
             builder(
                 self.indices, self.parameters, self.variables, self.model
             ).build_constraints()
+            self._constraint_names[builder.__name__] = [
+                name for name in self.model.constraints if name not in existing_names
+            ]
 
     def _set_objective_function(self) -> None:
-        """Defines the objective function for the optimization model."""
+        """
+        Defines the objective function for the optimization model. If objective breakdown is enabled,
+        expressions of the components are kept until they are evaluated after the solve.
+        """
         obj_expression = 0.0
-        for builder in self._objective_builders:
-            obj_expression += builder(
+        self._objective_components = {}
+        objective_builders = (
+            self._dispatch_objective_builders
+            if self.dispatch_only
+            else self._objective_builders
+        )
+        for builder in objective_builders:
+            expression = builder(
                 self.indices, self.parameters, self.variables, self.model
             ).build_expression()
+            if self.input_data.config.objective_breakdown:
+                self._objective_components[component_name(builder)] = expression
+            obj_expression += expression
 
         self.model.add_objective(obj_expression, sense="min")
 
@@ -221,29 +368,108 @@ class LinopyOptimizationModel(OptimizationModel):
         """
         config = self.input_data.config
         solver = config.solver_name or solvers.available_solvers[0]
-        solver_settings = config.solver_settings.get(solver, {})
-        self.model.solve(
-            solver_name=solver,
-            io_api="direct" if solver in self._direct_solvers else "lp",
-            log_fn=config.opt_logs_dump_path,
-            solution_fn=config.sol_dump_path,
-            keep_files=True,
-            **solver_settings,
-        )
+        with tempfile.TemporaryDirectory(dir=self.model.solver_dir) as tmp_dir:
+            if config.solver_process:
+                self._solve_in_child_process(solver, Path(tmp_dir))
+            else:
+                self.model.solve(
+                    solver_name=solver,
+                    io_api="direct" if solver in self._direct_solvers else "lp",
+                    log_fn=config.opt_logs_dump_path,
+                    solution_fn=config.sol_dump_path,
+                    warmstart_fn=(
+                        self._write_warm_start(solver, Path(tmp_dir) / "warm_start")
+                        if config.warm_start is not None
+                        else None
+                    ),
+                    keep_files=True,
+                    **self._solver_options(solver),
+                )
         self.update_model_status()
         if self.status == OptimizationStatus.OPTIMAL:
+            if self._scaler is not None:
+                self._scaler.unscale_solution()
+            if self.input_data.config.variable_reduction or self.dispatch_only:
+                reinstate_zeros(self.model)
             self._results = Results(
                 objective_value=self.model.objective.value,
                 variables=self.variables,
                 indices=self.indices,
                 parameters=self.parameters,
+                duals=extract_duals(
+                    self.model, self.indices, self.input_data.config.dual_families
+                ),
+                objective_breakdown=evaluate_components(
+                    self.model,
+                    self.indices,
+                    self._objective_components,
+                    per_element=self.input_data.config.objective_breakdown_per_unit,
+                ),
             )
+            self._objective_components = {}
         else:
-            self.model.print_infeasibilities()
+            if self.model.solver_model is not None:
+                self.model.print_infeasibilities()
             logging.getLogger(__name__).warning(
                 "Model cannot be solved, optimization status is %s", self.status.name
             )
 
+    def _write_warm_start(self, solver: str, path: Path) -> Path | None:
+        """
+        Writes the warm start given in the config (capacities and fractions or solution snapshot
+        of a previous run) as starting values of the variables (see write_warm_start).
+        None is returned if no warm start is given.
+        """
+        warm_start = self.input_data.config.warm_start
+        if warm_start is None:
+            return None
+        values = (
+            snapshot_start_values(warm_start, self.variables)
+            if isinstance(warm_start, SolutionSnapshot)
+            else investments_start_values(warm_start, self.indices, self.variables)
+        )
+        start = start_vector(
+            self.model,
+            values,
+            self._scaler.column_factors if self._scaler is not None else None,
+        )
+        return write_warm_start(self.model, start, solver, path)
+
+    def investments(self) -> FixedInvestments:
+        """
+        Capacities of units and fractions of the solution (used e.g. as a warm start of another model).
+
+        Returns:
+            - FixedInvestments: capacities and fractions of the solution
+
+        Raises:
+            - OptimizationError: If the optimization status is not optimal.
+        """
+        if self.status != OptimizationStatus.OPTIMAL:
+            raise OptimizationError(
+                f"Investments cannot be retrieved, optimization status is {self.status.name}"
+            )
+        years = self.indices.Y.ii
+        fractions = self.variables.frac.fraction.solution.values
+        return FixedInvestments(
+            generator_capacity=pd.DataFrame(
+                self.variables.gen.cap.solution.values.T,
+                index=years,
+                columns=self.indices.GEN.ii,
+            ),
+            storage_capacity=pd.DataFrame(
+                self.variables.stor.cap.solution.values.T,
+                index=years,
+                columns=self.indices.STOR.ii,
+            ),
+            fractions={
+                aggr_name: pd.DataFrame(
+                    fractions[aggr_idx].T, index=years, columns=self.indices.LBS.ii
+                )
+                for aggr_idx, aggr_name in enumerate(self.indices.AGGR.ii)
+            },
+        )
+
     @property
     def results(self) -> Results:
         """
@@ -273,6 +499,16 @@ class LinopyOptimizationModel(OptimizationModel):
                     f"{self._status.name}. "
                 )
 
+    @property
+    def scaler(self) -> ModelScaler | None:
+        """
+        Retrieves the scaler applied to the model (only if auto_scaling is enabled).
+
+        Returns:
+            - ModelScaler | None: scaler with scaling factors and coefficient ranges report
+        """
+        return self._scaler
+
     @property
     def status(self) -> OptimizationStatus:
         """
@@ -351,6 +587,60 @@ class LinopyOptimizationModel(OptimizationModel):
             )
         return self._model
 
+    def _solver_options(self, solver_settings_name: str) -> dict[str, Any]:
+        """
+        Options of the solver given by solver settings (solver or solver.variant) and solver limits, settings of
+        the variant extend settings of the solver and settings given explicitly take precedence over limits.
+        """
+        config = self.input_data.config
+        solver = solver_settings_name.split(".")[0]
+        return (
+            limit_options(solver, config.solver_threads, config.solver_time_limit)
+            | config.solver_settings.get(solver, {})
+            | config.solver_settings.get(solver_settings_name, {})
+        )
+
+    def _solve_in_child_process(self, solver: str, tmp_dir: Path) -> None:
+        """
+        Solves the model in child processes (see SolverProcessRunner), concurrently with each solver settings
+        of the solver race (or with given solver, if no race is configured).
+        """
+        config = self.input_data.config
+        names = config.solver_race or (solver,)
+        runs = []
+        for number, name in enumerate(names):
+            run_solver = name.split(".")[0]
+            log_fn, solution_fn = config.opt_logs_dump_path, config.sol_dump_path
+            if len(names) > 1:
+                log_fn = run_path(log_fn, name)
+                solution_fn = run_path(solution_fn, name)
+            runs.append(
+                SolverRun(
+                    name=name,
+                    solver_name=run_solver,
+                    options=self._solver_options(name),
+                    log_fn=log_fn,
+                    solution_fn=solution_fn,
+                    warmstart_fn=(
+                        self._write_warm_start(
+                            run_solver, tmp_dir / f"warm_start_{number}"
+                        )
+                        if config.warm_start is not None
+                        else None
+                    ),
+                )
+            )
+        run = SolverProcessRunner(
+            self.model,
+            tmp_dir,
+            memory_limit=config.solver_memory_limit,
+            time_limit=config.solver_time_limit,
+        ).solve(runs)
+        if run is not None and len(runs) > 1:
+            logging.getLogger(__name__).info(
+                "Result of solver run %s is kept", run.name
+            )
+
     def update_model_status(self) -> None:
         """
         Updates the optimization status based on the model's current state.
@@ -0,0 +1,195 @@
+import re
+from typing import Final
+
+import numpy as np
+import xarray as xr
+from linopy import LinearExpression, Model, Variable
+
+from pyzefir.optimization.linopy.preprocessing.indices import Indices
+
+ELEMENT_DIM: Final[str] = "element"
+YEAR_DIM: Final[str] = "year"
+_ELEMENT_DIMS: Final[tuple[str, ...]] = ("gen", "stor", "line", "bus", "aggr")
+_INDEXED_VARIABLE_PREFIXES: Final[tuple[tuple[str, str], ...]] = (
+    ("GEN_TYPE_", "AGGR"),
+    ("STOR_TYPE_", "AGGR"),
+    ("G_", "GEN"),
+    ("S_", "STOR"),
+)
+""" prefix of the name of a variable indexed by tuples -> indexing set of the first field """
+
+
+def _records(variable: Variable) -> np.ndarray | None:
+    """Structured coordinate of a variable indexed by tuples (e.g. (unit, year)), None otherwise."""
+    labels = variable.labels
+    if labels.ndim != 1:
+        return None
+    coord = labels[labels.dims[0]].values
+    return coord if coord.dtype.names else None
+
+
+def component_name(builder: type) -> str:
+    """
+    Name of the objective component built by given objective builder
+    (e.g. EnsPenaltyCostObjectiveBuilder -> ens_penalty_cost).
+    """
+    name = re.sub(r"(Objective)?Builder$", "", builder.__name__)
+    return re.sub(r"(?<!^)(?=[A-Z])", "_", name).lower()
+
+
+class SolutionIndex:
+    """
+    Optimal values, years and elements (units, lines, buses, aggregated consumers) of all variable
+    labels of the solved model, used to evaluate linear expressions without building them again.
+
+    Elements of variables with element name in the variable name (e.g. GEN_ET_<gen>_<et>) are found
+    by the longest generator or storage name enclosed in underscores. Labels of variables without
+    element are attributed to the empty element name.
+    """
+
+    def __init__(self, model: Model, indices: Indices, per_element: bool) -> None:
+        """
+        Args:
+            - model (Model): solved linopy model (solution of masked entries reinstated to zero)
+            - indices (Indices): indices of the model
+            - per_element (bool): if True, elements of the labels are resolved
+        """
+        n_labels = model.shape[1]
+        self.years = np.full(n_labels, -1, dtype=int)
+        self.values = np.zeros(n_labels)
+        self.element_names: list[str] = [""]
+        self.elements = np.zeros(n_labels, dtype=int)
+        self._element_codes: dict[str, int] = {"": 0}
+        self._indices = indices
+        for name in model.variables:
+            variable = model.variables[name]
+            labels = variable.labels.values
+            mask = labels != -1
+            if not mask.any():
+                continue
+            flat_labels = labels[mask]
+            self.values[flat_labels] = np.nan_to_num(variable.solution.values[mask])
+            self.years[flat_labels] = self._years(variable)[mask]
+            if per_element:
+                self.elements[flat_labels] = self._elements(name, variable)[mask]
+
+    @property
+    def n_years(self) -> int:
+        return len(self._indices.Y)
+
+    def evaluate(self, expression: LinearExpression | float) -> xr.DataArray:
+        """
+        Value of the expression at the solution split into years and elements.
+        Constant of the expression and terms of variables without year are not included.
+
+        Args:
+            - expression (LinearExpression | float): expression of the solved model
+
+        Returns:
+            - xr.DataArray: value of the expression with dimensions (element, year)
+        """
+        n_elements = len(self.element_names)
+        values: np.ndarray = np.zeros(n_elements * self.n_years)
+        if isinstance(expression, LinearExpression):
+            labels = expression.vars.values.reshape(-1)
+            coeffs = expression.coeffs.values.reshape(-1)
+            valid = (labels != -1) & np.isfinite(coeffs)
+            labels, coeffs = labels[valid], coeffs[valid]
+            valid = self.years[labels] != -1
+            labels, coeffs = labels[valid], coeffs[valid]
+            values = np.bincount(
+                self.elements[labels] * self.n_years + self.years[labels],
+                weights=coeffs * self.values[labels],
+                minlength=n_elements * self.n_years,
+            )
+        return xr.DataArray(
+            values.reshape(n_elements, self.n_years),
+            dims=(ELEMENT_DIM, YEAR_DIM),
+            coords={ELEMENT_DIM: self.element_names, YEAR_DIM: self._indices.Y.ii},
+        )
+
+    def _years(self, variable: Variable) -> np.ndarray:
+        """Year position of every entry of the variable (-1 if unknown)."""
+        labels = variable.labels
+        if YEAR_DIM in labels.dims:
+            positions = np.searchsorted(self._indices.Y.ii, labels[YEAR_DIM].values)
+            return (
+                xr.DataArray(positions, dims=YEAR_DIM)
+                .broadcast_like(labels)
+                .transpose(*labels.dims)
+                .values
+            )
+        if (records := _records(variable)) is not None:
+            years = records[records.dtype.names[-1]].astype(int)
+            return np.searchsorted(self._indices.Y.ii, years)
+        return np.full(labels.shape, -1, dtype=int)
+
+    def _elements(self, name: str, variable: Variable) -> np.ndarray:
+        """Element code of every entry of the variable."""
+        labels = variable.labels
+        for dim in _ELEMENT_DIMS:
+            if dim in labels.dims:
+                codes = [self._code(element) for element in labels[dim].values]
+                return (
+                    xr.DataArray(codes, dims=dim)
+                    .broadcast_like(labels)
+                    .transpose(*labels.dims)
+                    .values
+                )
+        if (records := _records(variable)) is not None:
+            for prefix, set_name in _INDEXED_VARIABLE_PREFIXES:
+                if name.startswith(prefix):
+                    mapping = getattr(self._indices, set_name).mapping
+                    return np.array(
+                        [
+                            self._code(mapping[idx])
+                            for idx in records[records.dtype.names[0]]
+                        ],
+                        dtype=int,
+                    )
+        return np.full(labels.shape, self._code(self._named_element(name)))
+
+    def _named_element(self, name: str) -> str:
+        """Longest generator or storage name enclosed in underscores in the variable name."""
+        candidates = [
+            str(element)
+            for element in (*self._indices.GEN.ii, *self._indices.STOR.ii)
+            if f"_{element}_" in f"{name}_"
+        ]
+        return max(candidates, key=len, default="")
+
+    def _code(self, element: object) -> int:
+        element = str(element)
+        if element not in self._element_codes:
+            self._element_codes[element] = len(self.element_names)
+            self.element_names.append(element)
+        return self._element_codes[element]
+
+
+def evaluate_components(
+    model: Model,
+    indices: Indices,
+    components: dict[str, LinearExpression | float],
+    per_element: bool = False,
+) -> dict[str, xr.DataArray]:
+    """
+    Evaluates components of the objective function at the solution of the model.
+
+    Args:
+        - model (Model): solved linopy model
+        - indices (Indices): indices of the model
+        - components (dict[str, LinearExpression | float]): component name -> expression
+        - per_element (bool): if True, values are split into elements, otherwise only into years
+
+    Returns:
+        - dict[str, xr.DataArray]: component name -> value with dimensions (element, year)
+            if per_element is True, (year) otherwise
+    """
+    solution_index = SolutionIndex(model, indices, per_element)
+    breakdown = {}
+    for name, expression in components.items():
+        value = solution_index.evaluate(expression)
+        breakdown[name] = (
+            value.rename(name) if per_element else value.sum(ELEMENT_DIM).rename(name)
+        )
+    return breakdown
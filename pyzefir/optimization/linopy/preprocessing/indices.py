@@ -15,12 +15,14 @@
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
 from dataclasses import dataclass
-from typing import Self
+from typing import Any, Iterable, Self
 
 import numpy as np
+import pandas as pd
 import xarray as xr
 from bidict import bidict
 from numpy import array
+from scipy.sparse import csr_array
 
 from pyzefir.model.network import Network, NetworkElementsDict
 from pyzefir.optimization.linopy.preprocessing.utils import create_unique_array_of_tags
@@ -35,7 +37,8 @@ class IndexingSet:
     IndexingSet(ord=[0, 1, 2], mapping={0: 'a', 1: 'b', 2: 'c'})
 
     This class provides an efficient way to manage and retrieve indices
-    associated with a collection of unique elements.
+    associated with a collection of unique elements. Besides scalar lookups (mapping, inverse),
+    elements and ords of many elements can be looked up at once (get_ords, get_elements).
     """
 
     def __init__(self, iis: np.ndarray, name: str | None = None) -> None:
@@ -51,6 +54,14 @@ class IndexingSet:
         self._ii = iis
         self._mapping = bidict({idx: ii for idx, ii in enumerate(iis)})
         self._name = name or ""
+        self._index: pd.Index | None = None
+
+    def __getstate__(self) -> dict[str, Any]:
+        """Lookup index is not pickled (it is built again when needed)."""
+        return self.__dict__ | {"_index": None}
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        self.__dict__.update({"_index": None} | state)
 
     @staticmethod
     def validate_input(iis: np.ndarray) -> None:
@@ -121,6 +132,93 @@ class IndexingSet:
         """
         return self._mapping.inverse
 
+    @property
+    def index(self) -> pd.Index:
+        """
+        Elements as pandas Index (position in the index is the position in ii), used for batch lookups.
+
+        Returns:
+            - pd.Index: index of the elements
+        """
+        if self._index is None:
+            self._index = pd.Index(self._ii)
+        return self._index
+
+    def get_ords(self, elements: Iterable, strict: bool = True) -> np.ndarray:
+        """
+        Vectorized inverse mapping element -> ord[element].
+
+        Args:
+            - elements (Iterable): elements to look up
+            - strict (bool): if True, KeyError is raised for elements not in the indexing set,
+                otherwise their ord is -1
+
+        Returns:
+            - np.ndarray: ords of the elements
+
+        Raises:
+            - KeyError: if strict and some element is not in the indexing set
+        """
+        elements = elements if isinstance(elements, np.ndarray) else list(elements)
+        if not len(elements):
+            return np.zeros(0, dtype=int)
+        positions = self.index.get_indexer(elements)
+        missing = positions == -1
+        if strict and missing.any():
+            raise KeyError(elements[int(np.argmax(missing))])
+        return np.where(missing, -1, self._ord[positions])
+
+    def get_elements(self, ords: Iterable[int]) -> np.ndarray:
+        """
+        Vectorized mapping ord -> element.
+
+        Args:
+            - ords (Iterable[int]): ords to look up
+
+        Returns:
+            - np.ndarray: elements with given ords
+
+        Raises:
+            - KeyError: if some ord is not in the indexing set
+        """
+        ords = np.asarray(
+            ords if isinstance(ords, np.ndarray) else list(ords), dtype=int
+        )
+        positions = pd.Index(self._ord).get_indexer(ords)
+        if (missing := positions == -1).any():
+            raise KeyError(int(ords[np.argmax(missing)]))
+        return self._ii[positions]
+
+    def membership(
+        self, other: "IndexingSet", relation: dict[Any, Iterable]
+    ) -> csr_array:
+        """
+        Sparse membership matrix between elements of this and the other indexing set
+        (entry [ord[a], ord[b]] is 1 if b is in relation[a]).
+
+        Args:
+            - other (IndexingSet): indexing set of related elements
+            - relation (dict[Any, Iterable]): element -> related elements of the other set
+                (elements missing in the relation have no related elements)
+
+        Returns:
+            - csr_array: matrix with shape (max ord + 1, other max ord + 1)
+
+        Raises:
+            - KeyError: if an element is not in its indexing set
+        """
+        rows = list(relation)
+        related = [list(relation[row]) for row in rows]
+        row_ords = np.repeat(self.get_ords(rows), [len(items) for items in related])
+        col_ords = other.get_ords([item for items in related for item in items])
+        shape = (
+            int(self._ord.max(initial=-1)) + 1,
+            int(other.ord.max(initial=-1)) + 1,
+        )
+        return csr_array(
+            (np.ones(len(row_ords), dtype=bool), (row_ords, col_ords)), shape=shape
+        )
+
     def __len__(self) -> int:
         """
         Size (len) of the indexing set
@@ -144,8 +242,10 @@ class IndexingSet:
             raise ValueError(f"Element '{element}' nie istnieje w indeksie.")
         idx_to_remove = self._mapping.inverse[element]
         del self._mapping[idx_to_remove]
-        self._ii = np.delete(self._ii, idx_to_remove)
+        position = int(np.flatnonzero(self._ord == idx_to_remove)[0])
+        self._ii = np.delete(self._ii, position)
         self._ord = self._ord[self._ord != idx_to_remove]
+        self._index = None
 
     @classmethod
     def create_from_network_elements_dict(
@@ -14,6 +14,11 @@
 # You should have received a copy of the GNU Affero General Public License
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
+from typing import Any
+
+import numpy as np
+import xarray as xr
+
 from pyzefir.model.network import Network
 from pyzefir.optimization.linopy.preprocessing.indices import Indices
 from pyzefir.optimization.linopy.preprocessing.parameters.aggregated_consumer_parameters import (
@@ -55,6 +60,9 @@ from pyzefir.optimization.linopy.preprocessing.parameters.line_parameters import
 from pyzefir.optimization.linopy.preprocessing.parameters.local_balancing_stack_parameters import (
     LBSParameters,
 )
+from pyzefir.optimization.linopy.preprocessing.parameters.parameters_dataset import (
+    create_parameters_dataset,
+)
 from pyzefir.optimization.linopy.preprocessing.parameters.scenario_parameters import (
     ScenarioParameters,
 )
@@ -134,7 +142,10 @@ class OptimizationParameters:
         )
         """ buses parameters """
         self.aggr: AggregatedConsumerParameters = AggregatedConsumerParameters(
-            network.aggregated_consumers, network.demand_profiles, indices
+            network.aggregated_consumers,
+            network.demand_profiles,
+            indices,
+            dtype=np.float32 if opt_config.float32_demand else np.float64,
         )
         """ aggregated consumers parameters """
         self.lbs: LBSParameters = LBSParameters(
@@ -171,3 +182,22 @@ class OptimizationParameters:
         """capacity bound parameters"""
         self.gf = GenerationFractionParameters(network.generation_fractions, indices)
         """ Generation fractions parameters"""
+        self._indices = indices
+        self._dataset: xr.Dataset | None = create_parameters_dataset(self, indices)
+
+    def __getstate__(self) -> dict[str, Any]:
+        """Parameters dataset is not pickled (it is created again when needed)."""
+        return self.__dict__ | {"_dataset": None}
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        self.__dict__.update({"_dataset": None} | state)
+
+    @property
+    def dataset(self) -> xr.Dataset:
+        """
+        Parameters as a dense xarray Dataset with dimensions labelled as dimensions of the variables
+        (see create_parameters_dataset).
+        """
+        if self._dataset is None:
+            self._dataset = create_parameters_dataset(self, self._indices)
+        return self._dataset
@@ -39,6 +39,7 @@ from pyzefir.optimization.linopy.preprocessing.variables.storage_type_variables
 from pyzefir.optimization.linopy.preprocessing.variables.storage_variables import (
     StorageVariables,
 )
+from pyzefir.optimization.linopy.reduction import VariableReduction
 from pyzefir.optimization.opt_config import OptConfig
 
 
@@ -59,6 +60,8 @@ class OptimizationVariables:
           model.
         - opt_config (OptConfig): The optimization configuration that includes various parameters
           relevant to the optimization process.
+        - reduction (VariableReduction | None): Provably zero variables which entries are masked.
+          Defaults to None (no reduction).
     """
 
     def __init__(
@@ -67,14 +70,15 @@ class OptimizationVariables:
         network: Network,
         indices: Indices,
         opt_config: OptConfig,
+        reduction: VariableReduction | None = None,
     ) -> None:
         self.bus = BusVariables(model, network, indices, opt_config)
         """ bus variables """
-        self.frac = FractionVariables(model, indices)
+        self.frac = FractionVariables(model, indices, reduction=reduction)
         """ fraction variables """
         self.tgen = GeneratorTypeVariables(model, indices)
         """ generator type variables """
-        self.gen = GeneratorVariables(model, indices, network)
+        self.gen = GeneratorVariables(model, indices, network, reduction)
         """ generators variables """
         self.stor = StorageVariables(model, indices, network)
         """ storage variables """
@@ -8,6 +8,7 @@ from pandas import Series
 from pyzefir.model.network import NetworkElementsDict
 from pyzefir.model.network_element import NetworkElement
 from pyzefir.model.network_elements import EnergySource, EnergySourceType
+from pyzefir.model.profile_registry import ProfileRegistry
 from pyzefir.optimization.linopy.preprocessing.indices import IndexingSet, Indices
 from pyzefir.utils.functions import is_none_general
 
@@ -43,6 +44,38 @@ class ModelParameters(ABC):
             if not is_none_general(getattr(d[name], prop))
         }
 
+    @staticmethod
+    def fetch_element_profiles(
+        d: NetworkElementsDict[NetworkElement],
+        II: IndexingSet,
+        prop: str,
+        sample: ndarray | None = None,
+    ) -> tuple[dict[int, ndarray], dict[int, int]]:
+        """
+        Sampled float series attribute of the elements, every distinct profile is stored once
+        (see ProfileRegistry) and elements with identical profiles share its row.
+
+        Args:
+            - d (NetworkElementsDict[NetworkElement]): elements
+            - II (IndexingSet): index of the elements
+            - prop (str): name of the attribute
+            - sample (ndarray | None): sample of the series, if None whole series is used
+
+        Returns:
+            - tuple[dict[int, ndarray], dict[int, int]]: sampled profile and profile id of every element
+        """
+        registry = ProfileRegistry()
+        profile_ids = {
+            ii: registry.register(
+                ModelParameters.sample_series(getattr(d[name], prop), sample)
+            )
+            for ii, name in II.mapping.items()
+        }
+        profiles = registry.values
+        return {
+            ii: profiles[profile_id] for ii, profile_id in profile_ids.items()
+        }, profile_ids
+
     @staticmethod
     def get_frame_data_prop_from_element_type(
         d: NetworkElementsDict[NetworkElement],
@@ -76,10 +109,12 @@ class ModelParameters(ABC):
         idx_to_get: IndexingSet,
         prop: str,
     ) -> dict[int, int]:
-        return {
-            ii: idx_to_get.inverse[getattr(elements[name], prop)]
-            for ii, name in element_idx.mapping.items()
-        }
+        values = [
+            getattr(elements[name], prop) for name in element_idx.mapping.values()
+        ]
+        return dict(
+            zip(element_idx.mapping.keys(), idx_to_get.get_ords(values).tolist())
+        )
 
     @staticmethod
     def get_index_from_prop_if_not_none(
@@ -88,11 +123,12 @@ class ModelParameters(ABC):
         idx_to_get: IndexingSet,
         prop: str,
     ) -> dict[int, int]:
-        return {
-            ii: idx_to_get.inverse[getattr(elements[name], prop)]
+        values = {
+            ii: value
             for ii, name in element_idx.mapping.items()
-            if getattr(elements[name], prop) is not None
+            if (value := getattr(elements[name], prop)) is not None
         }
+        return dict(zip(values, idx_to_get.get_ords(values.values()).tolist()))
 
     @staticmethod
     def get_index_from_type_prop(
@@ -102,14 +138,16 @@ class ModelParameters(ABC):
         idx: IndexingSet,
         prop_name: str,
     ) -> dict[int, int | None]:
-        result = dict()
-        for _element_idx, element_name in element_idx.mapping.items():
-            element = elements[str(element_name)]
-            element_type = types[element.energy_source_type]
-            prop = getattr(element_type, prop_name)
-            result[_element_idx] = idx.inverse[prop] if prop is not None else None
-
-        return result
+        props = [
+            getattr(types[elements[str(name)].energy_source_type], prop_name)
+            for name in element_idx.mapping.values()
+        ]
+        ords = idx.get_ords([prop for prop in props if prop is not None]).tolist()
+        ords_iter = iter(ords)
+        return {
+            _element_idx: next(ords_iter) if prop is not None else None
+            for _element_idx, prop in zip(element_idx.mapping.keys(), props)
+        }
 
     @staticmethod
     def scale(values: dict[T, ndarray], scale: float) -> dict[T, ndarray]:
@@ -134,10 +172,15 @@ class ModelParameters(ABC):
         element_idx: IndexingSet,
         prop_idx: IndexingSet,
     ) -> dict[int, set[int]]:
-        return {
-            ii: {prop_idx.inverse[el_name] for el_name in getattr(elements[name], prop)}
-            for ii, name in element_idx.mapping.items()
-        }
+        membership = element_idx.membership(
+            prop_idx,
+            {
+                name: getattr(elements[name], prop)
+                for name in element_idx.mapping.values()
+            },
+        )
+        rows = np.split(membership.indices, membership.indptr[1:-1])
+        return {ii: set(rows[ii].tolist()) for ii in element_idx.mapping.keys()}
 
     @staticmethod
     def get_balancing_periods(
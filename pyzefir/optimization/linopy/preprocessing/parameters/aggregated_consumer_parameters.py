@@ -16,7 +16,9 @@
 
 from dataclasses import dataclass
 
+import numpy as np
 from numpy import array, ndarray
+from numpy.typing import DTypeLike
 
 from pyzefir.model.network import NetworkElementsDict
 from pyzefir.model.network_elements import AggregatedConsumer, DemandProfile
@@ -39,6 +41,7 @@ class AggregatedConsumerParameters(ModelParameters):
         aggregated_consumers: NetworkElementsDict,
         demand_profiles: NetworkElementsDict,
         indices: Indices,
+        dtype: DTypeLike = np.float64,
     ) -> None:
         """
         Initializes a new instance of the class.
@@ -49,11 +52,27 @@ class AggregatedConsumerParameters(ModelParameters):
             - demand_profiles (NetworkElementsDict): A dictionary mapping demand profile names to their respective
                 DemandProfile objects.
             - indices (Indices): An object containing indices for aggregators, hours, and years.
+            - dtype (DTypeLike): type of the demand values (e.g. float32 to halve the memory of the demand).
+                Defaults to float64.
         """
-        self.dem = self.get_dem(
-            aggregated_consumers, demand_profiles, indices.AGGR, indices.H, indices.Y
+        self.dem_tensor = self.get_dem_tensor(
+            aggregated_consumers,
+            demand_profiles,
+            indices.AGGR,
+            indices.ET,
+            indices.H,
+            indices.Y,
+            dtype,
+        )
+        """ aggregated demand for all energy types; shape = (aggr_idx, et_idx, h, y), zero if not defined """
+        self.dem = self._dem_views(
+            self.dem_tensor,
+            aggregated_consumers,
+            demand_profiles,
+            indices.AGGR,
+            indices.ET,
         )
-        """ aggregated demand for all energy types """
+        """ aggregated demand for all energy types (views of dem_tensor); aggr -> (et -> dem[h, y]) """
         self.fr_base = self.get_fr_base(aggregated_consumers, indices.AGGR, indices.LBS)
         """ base fractions of local balancing stacks in given aggregated consumer; shape = (aggr_idx, lbs_idx) """
         self.lbs_indicator = self.get_lbs_indicator(
@@ -139,7 +158,7 @@ class AggregatedConsumerParameters(ModelParameters):
 
         The method computes the demand for each energy type based on the
         corresponding demand profile and the number of consumers in each
-        aggregated consumer.
+        aggregated consumer, only in given hours and years.
 
         Args:
             - aggregated_consumers (NetworkElementsDict[AggregatedConsumer]): aggregated consumers
@@ -151,25 +170,106 @@ class AggregatedConsumerParameters(ModelParameters):
         Returns:
             - dict[int, dict[str, ndarray]]: demand for every energy type for every aggregator
         """
-        result: dict[int, dict[str, ndarray]] = dict()
+        et_idx = IndexingSet(
+            np.array(
+                sorted(
+                    {
+                        energy_type
+                        for name in aggr_idx.ii
+                        for energy_type in demand_profiles[
+                            aggregated_consumers[name].demand_profile
+                        ].normalized_profile
+                    }
+                )
+            )
+        )
+        return AggregatedConsumerParameters._dem_views(
+            AggregatedConsumerParameters.get_dem_tensor(
+                aggregated_consumers,
+                demand_profiles,
+                aggr_idx,
+                et_idx,
+                hour_idx,
+                year_idx,
+            ),
+            aggregated_consumers,
+            demand_profiles,
+            aggr_idx,
+            et_idx,
+        )
+
+    @staticmethod
+    def get_dem_tensor(
+        aggregated_consumers: NetworkElementsDict[AggregatedConsumer],
+        demand_profiles: NetworkElementsDict[DemandProfile],
+        aggr_idx: IndexingSet,
+        et_idx: IndexingSet,
+        hour_idx: IndexingSet,
+        year_idx: IndexingSet,
+        dtype: DTypeLike = np.float64,
+    ) -> ndarray:
+        """
+        Returns demand of all aggregators for all energy types as a single array.
+
+        Demand profile is taken only in given hours, yearly energy usage and number of consumers
+        only in given years, so the demand is not computed for hours and years out of the sample.
+
+        Args:
+            - aggregated_consumers (NetworkElementsDict[AggregatedConsumer]): aggregated consumers
+            - demand_profiles (NetworkElementsDict[DemandProfile]): demand profiles
+            - aggr_idx (IndexingSet): index of aggregator
+            - et_idx (IndexingSet): index of energy type
+            - hour_idx (IndexingSet): index of hour
+            - year_idx (IndexingSet): index of year
+            - dtype (DTypeLike): type of the demand values, defaults to float64
+
+        Returns:
+            - ndarray: demand of shape (aggr, et, hour, year), zero for energy types not in the
+                demand profile of the aggregator
+        """
+        result = np.zeros(
+            (len(aggr_idx), len(et_idx), len(hour_idx), len(year_idx)), dtype=dtype
+        )
         for aggr_id, name in aggr_idx.mapping.items():
             aggr = aggregated_consumers[name]
-            result[aggr_id] = dict()
             demand_profile = demand_profiles[aggr.demand_profile]
-            n_consumers = aggr.n_consumers.values.reshape(1, -1)
+            n_consumers = aggr.n_consumers.values[year_idx.ii]
             for (
                 energy_type,
                 profile_vector,
             ) in demand_profile.normalized_profile.items():
-                base_profile = profile_vector.values.reshape(-1, 1)
-                yearly_usage = aggr.yearly_energy_usage[energy_type].values.reshape(
-                    1, -1
+                yearly_demand = (
+                    aggr.yearly_energy_usage[energy_type].values[year_idx.ii]
+                    * n_consumers
+                )
+                np.multiply.outer(
+                    profile_vector.values[hour_idx.ii],
+                    yearly_demand,
+                    out=result[aggr_id, et_idx.inverse[energy_type]],
+                    casting="same_kind",
                 )
-                demand = base_profile * yearly_usage * n_consumers
-                result[aggr_id][energy_type] = demand[hour_idx.ii, :][:, year_idx.ii]
 
         return result
 
+    @staticmethod
+    def _dem_views(
+        dem_tensor: ndarray,
+        aggregated_consumers: NetworkElementsDict[AggregatedConsumer],
+        demand_profiles: NetworkElementsDict[DemandProfile],
+        aggr_idx: IndexingSet,
+        et_idx: IndexingSet,
+    ) -> dict[int, dict[str, ndarray]]:
+        """Demand of energy types in demand profiles of the aggregators as views of the demand tensor."""
+        return {
+            aggr_id: {
+                energy_type: dem_tensor[aggr_id, et_idx.inverse[energy_type]]
+                for energy_type in demand_profiles[
+                    aggregated_consumers[str(name)].demand_profile
+                ].normalized_profile
+            }
+            for aggr_id, name in aggr_idx.mapping.items()
+        }
+
     @staticmethod
     def get_fr_base(
         aggregated_consumers: NetworkElementsDict[AggregatedConsumer],
@@ -39,7 +39,8 @@ class CapacityFactorParameters(ModelParameters):
             - capacity_factors (NetworkElementsDict): Dictionary containing capacity factor elements.
             - indices (Indices): Indices for the capacity factors.
         """
-        self.profile = self.fetch_element_prop(
+        self.profile, self.profile_id = self.fetch_element_profiles(
             capacity_factors, indices.CF, "profile", sample=indices.H.ii
         )
-        """ capacity factor hourly profile; capacity_factor -> (h -> cf_profile[y]) """
+        """ capacity factor hourly profile; capacity_factor -> (h -> cf_profile[y]) and its profile id
+        (shared by capacity factors with identical profiles) """
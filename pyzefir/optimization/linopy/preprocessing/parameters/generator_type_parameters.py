@@ -119,16 +119,21 @@ class GeneratorTypeParameters(ModelParameters):
             ),
             scale,
         )
-        self.power_utilization = self.fetch_element_prop(
-            generator_types, indices.TGEN, "power_utilization", sample=indices.H.ii
-        )
-        self.minimal_power_utilization = self.fetch_element_prop(
-            generator_types,
-            indices.TGEN,
-            "minimal_power_utilization",
-            sample=indices.H.ii,
+        self.power_utilization, self.power_utilization_profile = (
+            self.fetch_element_profiles(
+                generator_types, indices.TGEN, "power_utilization", sample=indices.H.ii
+            )
+        )
+        """ power utilization factor and its profile id (shared by types with identical profiles) """
+        self.minimal_power_utilization, self.minimal_power_utilization_profile = (
+            self.fetch_element_profiles(
+                generator_types,
+                indices.TGEN,
+                "minimal_power_utilization",
+                sample=indices.H.ii,
+            )
         )
-        """ minimal power utilization factor """
+        """ minimal power utilization factor and its profile id (shared by types with identical profiles) """
         self.eff = self.get_frame_data_prop_from_element_type(
             generator_types, indices.TGEN, "efficiency", sample=indices.H.ii
         )
@@ -0,0 +1,184 @@
+# PyZefir
+# Copyright (C) 2024 Narodowe Centrum Badań Jądrowych
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, Mapping
+
+import numpy as np
+import xarray as xr
+
+from pyzefir.optimization.linopy.preprocessing.indices import IndexingSet, Indices
+
+if TYPE_CHECKING:
+    from pyzefir.optimization.linopy.preprocessing.opt_parameters import (
+        OptimizationParameters,
+    )
+
+
+def _ords(mapping: Mapping[int, Any], index: IndexingSet) -> np.ndarray:
+    """Vector of mapped ords for all elements of the index (-1 if element is not mapped or mapped to None)."""
+    return np.array(
+        [
+            -1 if (value := mapping.get(idx)) is None else value
+            for idx in index.mapping.keys()
+        ],
+        dtype=int,
+    )
+
+
+def _stacked(
+    mapping: Mapping[int, Any], index: IndexingSet, shape: tuple[int, ...]
+) -> np.ndarray:
+    """Per-element arrays of given shape stacked along the first axis."""
+    result = np.zeros((len(index), *shape))
+    for idx in index.mapping.keys():
+        result[idx] = mapping[idx]
+    return result
+
+
+def _per_energy_type(
+    mapping: Mapping[int, Mapping[str, Any]],
+    index: IndexingSet,
+    energy_types: IndexingSet,
+    shape: tuple[int, ...],
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Per-element dictionaries energy type -> array of given shape stacked into a dense array
+    (element, et, *shape) filled with nan where energy type is not defined, and its validity mask.
+    """
+    values = np.full((len(index), len(energy_types), *shape), np.nan)
+    mask = np.zeros((len(index), len(energy_types)), dtype=bool)
+    for idx in index.mapping.keys():
+        for et, value in mapping[idx].items():
+            if et in energy_types.inverse:
+                et_idx = energy_types.inverse[et]
+                values[idx, et_idx] = value
+                mask[idx, et_idx] = True
+    return values, mask
+
+
+def create_parameters_dataset(
+    parameters: OptimizationParameters, indices: Indices
+) -> xr.Dataset:
+    """
+    Dense, dimension-labelled view of the parameters used by the builders, so per-element values
+    can be selected and broadcast against variables instead of being wrapped in DataArrays one by one.
+
+    Coordinates of the dimensions are the same as coordinates of the variables (gen, stor, tgen, cf,
+    bus, aggr, lbs, et, hour, year). References between elements (e.g. gen_tgen, lbs_aggr) are stored
+    as ords, -1 if the reference is not defined. Efficiencies not defined for given energy type are nan
+    and demand not defined for given energy type is zero, validity of such values is given by the
+    corresponding *_mask variable. Demand is not copied (aggr_dem is the demand tensor of aggregated
+    consumers parameters).
+
+    Args:
+        - parameters (OptimizationParameters): parameters of the model
+        - indices (Indices): indices of the model
+
+    Returns:
+        - xr.Dataset: parameters dataset
+    """
+    n_hours, n_years = len(indices.H), len(indices.Y)
+    tgen_eff, tgen_eff_mask = _per_energy_type(
+        parameters.tgen.eff, indices.TGEN, indices.ET, (n_hours,)
+    )
+    aggr_dem_mask = np.zeros((len(indices.AGGR), len(indices.ET)), dtype=bool)
+    for aggr_idx, dem in parameters.aggr.dem.items():
+        aggr_dem_mask[aggr_idx, indices.ET.get_ords(list(dem))] = True
+    return xr.Dataset(
+        {
+            "gen_tgen": ("gen", _ords(parameters.gen.tgen, indices.GEN)),
+            "gen_cf": ("gen", _ords(parameters.gen.capacity_factors, indices.GEN)),
+            "gen_base_cap": ("gen", _stacked(parameters.gen.base_cap, indices.GEN, ())),
+            "stor_tstor": ("stor", _ords(parameters.stor.tstor, indices.STOR)),
+            "stor_base_cap": (
+                "stor",
+                _stacked(parameters.stor.base_cap, indices.STOR, ()),
+            ),
+            "tgen_power_utilization": (
+                ("tgen", "hour"),
+                _stacked(parameters.tgen.power_utilization, indices.TGEN, (n_hours,)),
+            ),
+            "tgen_minimal_power_utilization": (
+                ("tgen", "hour"),
+                _stacked(
+                    parameters.tgen.minimal_power_utilization,
+                    indices.TGEN,
+                    (n_hours,),
+                ),
+            ),
+            "tgen_eff": (("tgen", "et", "hour"), tgen_eff),
+            "tgen_eff_mask": (("tgen", "et"), tgen_eff_mask),
+            "cf_profile": (
+                ("cf", "hour"),
+                _stacked(parameters.cf.profile, indices.CF, (n_hours,)),
+            ),
+            "bus_lbs": ("bus", _ords(parameters.bus.lbs_mapping, indices.BUS)),
+            "bus_et": (
+                "bus",
+                np.array(
+                    [parameters.bus.et[idx] for idx in indices.BUS.mapping.keys()],
+                    dtype=object,
+                ),
+            ),
+            "lbs_aggr": ("lbs", _ords(parameters.lbs.aggr_idx, indices.LBS)),
+            "aggr_n_consumers": (
+                ("aggr", "year"),
+                _stacked(parameters.aggr.n_consumers, indices.AGGR, (n_years,)),
+            ),
+            "aggr_dem": (("aggr", "et", "hour", "year"), parameters.aggr.dem_tensor),
+            "aggr_dem_mask": (("aggr", "et"), aggr_dem_mask),
+        },
+        coords={
+            "gen": indices.GEN.ii,
+            "stor": indices.STOR.ii,
+            "tgen": indices.TGEN.ii,
+            "cf": indices.CF.ii,
+            "bus": indices.BUS.ii,
+            "aggr": indices.AGGR.ii,
+            "lbs": indices.LBS.ii,
+            "et": indices.ET.ii,
+            "hour": indices.H.ii,
+            "year": indices.Y.ii,
+        },
+    )
+
+
+def select_by_ords(
+    array: xr.DataArray, dim: str, ords: xr.DataArray, fill_value: float = np.nan
+) -> xr.DataArray:
+    """
+    Selects entries of the array along given dimension by ords, entries with ord -1 are filled
+    with given value (e.g. tgen_power_utilization selected by gen_tgen gives (gen, hour) array).
+
+    Args:
+        - array (xr.DataArray): array to select from
+        - dim (str): dimension of the array indexed by ords
+        - ords (xr.DataArray): ords of the entries (-1 if not defined)
+        - fill_value (float): value of not defined entries, defaults to nan
+
+    Returns:
+        - xr.DataArray: selected array, dimension dim is replaced with dimensions of ords
+    """
+    if not array.sizes[dim]:
+        array = array.pad({dim: (0, 1)}, constant_values=fill_value)
+    selected = array.isel({dim: ords.clip(min=0)}).drop_vars(dim)
+    if not (ords < 0).any():
+        return selected
+    return selected.where(ords >= 0, fill_value).astype(
+        np.result_type(array.dtype, type(fill_value))
+    )
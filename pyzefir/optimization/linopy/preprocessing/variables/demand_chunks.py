@@ -14,6 +14,8 @@
 # You should have received a copy of the GNU Affero General Public License
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
+from collections import defaultdict
+
 from linopy import Model, Variable
 
 from pyzefir.model.network import NetworkElementsDict
@@ -29,6 +31,7 @@ def create_dch_vars(
     model: Model,
     energy_source_ii: IndexingSet,
     var_name: str,
+    inactive_sources: set[int] | None = None,
 ) -> dict[int, dict[int, Variable]]:
     """
     Creates a dictionary of demand chunk variables.
@@ -44,21 +47,34 @@ def create_dch_vars(
         - model (Model): The optimization model to which the variables will be added.
         - energy_source_ii (IndexingSet): An indexing set for energy sources.
         - var_name (str): Base name for the variable, which will be used to create unique variable names.
+        - inactive_sources (set[int] | None): Indices of energy sources which variables are provably zero
+          (they are created with all entries masked). Defaults to None.
 
     Returns:
         - dict[int, dict[int, Variable]]: A dictionary mapping each demand chunk index to another dictionary,
           which maps energy source indices to the created variables for each hour and year.
     """
     result: dict[int, dict[int, Variable]] = dict()
-    for demand_chunk in demand_chunks.values():
-        dch_idx = indices.DEMCH.inverse[demand_chunk.name]
+    energy_source_ords = dict(
+        zip(
+            energy_sources,
+            energy_source_ii.get_ords(energy_sources.keys(), strict=False).tolist(),
+        )
+    )
+    tagged_sources: dict[str, list[str]] = defaultdict(list)
+    for energy_source in energy_sources.values():
+        for tag in set(energy_source.tags):
+            tagged_sources[tag].append(energy_source.name)
+    dch_ords = indices.DEMCH.get_ords(demand_chunks.keys()).tolist()
+    for dch_idx, demand_chunk in zip(dch_ords, demand_chunks.values()):
         result[dch_idx] = dict()
-        for energy_source in energy_sources.values():
-            if demand_chunk.tag in energy_source.tags:
-                energy_source_idx = energy_source_ii.inverse[energy_source.name]
-                result[dch_idx][energy_source_idx] = add_h_y_variable(
-                    model,
-                    indices,
-                    var_name=f"{var_name}_{demand_chunk.name}_{energy_source.name}",
-                )
+        for energy_source_name in tagged_sources.get(demand_chunk.tag, []):
+            energy_source_idx = energy_source_ords[energy_source_name]
+            result[dch_idx][energy_source_idx] = add_h_y_variable(
+                model,
+                indices,
+                var_name=f"{var_name}_{demand_chunk.name}_{energy_source_name}",
+                active=inactive_sources is None
+                or energy_source_idx not in inactive_sources,
+            )
     return result
@@ -20,6 +20,7 @@ from linopy import Model
 
 from pyzefir.optimization.linopy.preprocessing.indices import Indices
 from pyzefir.optimization.linopy.preprocessing.variables import VariableGroup
+from pyzefir.optimization.linopy.reduction import VariableReduction
 
 
 class FractionVariables(VariableGroup):
@@ -32,7 +33,13 @@ class FractionVariables(VariableGroup):
     specified parameters.
     """
 
-    def __init__(self, model: Model, indices: Indices, binary_fraction: bool = False):
+    def __init__(
+        self,
+        model: Model,
+        indices: Indices,
+        binary_fraction: bool = False,
+        reduction: VariableReduction | None = None,
+    ):
         """
         Initializes a new instance of the class.
 
@@ -42,13 +49,17 @@ class FractionVariables(VariableGroup):
               local balancing stacks, and years.
             - binary_fraction (bool, optional): A flag indicating whether the fraction
               variables should be binary. Defaults to False (continuous variables).
+            - reduction (VariableReduction | None): provably zero variables, fractions of local
+              balancing stacks unavailable in aggregated consumers are masked. Defaults to None.
         """
+        mask = reduction.fraction_mask(indices) if reduction is not None else None
         if binary_fraction:
             self.fraction = model.add_variables(
                 coords=[indices.AGGR.ii, indices.LBS.ii, indices.Y.ii],
                 dims=["aggr", "lbs", "year"],
                 name="FRACTION",
                 binary=binary_fraction,
+                mask=mask,
             )
         else:
             self.fraction = model.add_variables(
@@ -60,5 +71,6 @@ class FractionVariables(VariableGroup):
                 ),
                 name="FRACTION",
                 binary=binary_fraction,
+                mask=mask,
             )
         """ fraction of local balancing stack in a given aggregated consumer """
@@ -28,6 +28,7 @@ from pyzefir.optimization.linopy.preprocessing.variables.demand_chunks import (
     create_dch_vars,
 )
 from pyzefir.optimization.linopy.preprocessing.variables.utils import add_h_y_variable
+from pyzefir.optimization.linopy.reduction import VariableReduction
 
 
 class GeneratorVariables(VariableGroup):
@@ -45,6 +46,7 @@ class GeneratorVariables(VariableGroup):
         model: Model,
         indices: Indices,
         network: Network,
+        reduction: VariableReduction | None = None,
     ) -> None:
         """
         Initializes a new instance of the class.
@@ -54,7 +56,10 @@ class GeneratorVariables(VariableGroup):
             - indices (Indices): The indices used for mapping generator and year parameters.
             - network (Network): The network representation that includes generator details
               and relationships with demand chunks.
+            - reduction (VariableReduction | None): provably zero variables, their entries are masked.
+              Defaults to None (no reduction).
         """
+        zero_generators = reduction.zero_generators if reduction is not None else set()
         self.gen = model.add_variables(
             lower=xr.DataArray(
                 np.full((len(indices.GEN), len(indices.H), len(indices.Y)), 0),
@@ -63,13 +68,16 @@ class GeneratorVariables(VariableGroup):
                 name="gen",
             ),
             name="G_GEN",
+            mask=reduction.generator_mask(indices) if reduction is not None else None,
         )
         """ generation """
         self.gen_et = self._create_generation_variable(
-            network, indices, model, "GEN_ET"
+            network, indices, model, "GEN_ET", inactive=zero_generators
         )
 
-        self.gen_reserve_et = self._create_gen_et_reserve(network, indices, model)
+        self.gen_reserve_et = self._create_gen_et_reserve(
+            network, indices, model, inactive=zero_generators
+        )
         """ frozen part of generation associated with power reserve"""
 
         """ generation to cover demand chunks """
@@ -80,6 +88,7 @@ class GeneratorVariables(VariableGroup):
             indices=indices,
             energy_source_ii=indices.GEN,
             var_name="G_DEM_CH",
+            inactive_sources=zero_generators,
         )
         """ energy_type -> dump[energy_type] """
         disabled_dump_idxs = {
@@ -90,7 +99,7 @@ class GeneratorVariables(VariableGroup):
             ].disable_dump_energy
         }
         self.dump_et = self._create_generation_variable(
-            network, indices, model, "DUMP_ET", disabled_dump_idxs
+            network, indices, model, "DUMP_ET", disabled_dump_idxs, zero_generators
         )
         """ capacity """
         self.cap = model.add_variables(
@@ -149,6 +158,7 @@ class GeneratorVariables(VariableGroup):
         model: Model,
         var_name: str,
         exception: Iterable | None = None,
+        inactive: set[int] | None = None,
     ) -> dict[int, dict[str, Variable]]:
         """
         Create generation variable. (gen_idx -> energy_type -> Var[h, y])
@@ -158,6 +168,8 @@ class GeneratorVariables(VariableGroup):
             - indices (Indices): indices of the new variable
             - model (Model): model
             - var_name (str): name of the variable
+            - exception (Iterable | None): names of generators for which variable is not created
+            - inactive (set[int] | None): indices of generators for which variable is provably zero
 
         Returns:
             - dict[int, dict[str, Variable]]: dict of created variables
@@ -170,7 +182,10 @@ class GeneratorVariables(VariableGroup):
                     gen_obj.energy_source_type
                 ].energy_types:
                     result[gen_idx][et] = add_h_y_variable(
-                        model, indices, var_name=f"{var_name}_{gen_obj.name}_{et}"
+                        model,
+                        indices,
+                        var_name=f"{var_name}_{gen_obj.name}_{et}",
+                        active=inactive is None or gen_idx not in inactive,
                     )
         return dict(result)
 
@@ -179,6 +194,7 @@ class GeneratorVariables(VariableGroup):
         network: Network,
         indices: Indices,
         model: Model,
+        inactive: set[int] | None = None,
     ) -> dict[int, dict[int, dict[str, Variable]]]:
         """
         Create generation variable for reserves, which maps tag_idx to gen_idx to energy_type to Var[h, y].
@@ -189,6 +205,7 @@ class GeneratorVariables(VariableGroup):
             - network (Network): network representation of the model
             - indices (Indices): indices of the new variable
             - model (Model): model
+            - inactive (set[int] | None): indices of generators for which variable is provably zero
 
         Returns:
             - dict[int, dict[int, dict[str, Variable]]]: dict of created variables
@@ -196,16 +213,25 @@ class GeneratorVariables(VariableGroup):
         result: dict[int, dict[int, dict[str, Variable]]] = defaultdict(
             lambda: defaultdict(dict)
         )
-        for gen_name, gen_obj in network.generators.items():
-            gen_idx = indices.GEN.inverse[gen_name]
+        reserve_tags = {
+            tag
+            for power_reserve_data in network.constants.power_reserves.values()
+            for tag in power_reserve_data
+        }
+        tag_ords = dict(
+            zip(
+                reserve_tags, indices.TAGS.get_ords(reserve_tags, strict=False).tolist()
+            )
+        )
+        gen_ords = indices.GEN.get_ords(network.generators.keys()).tolist()
+        for gen_idx, gen_obj in zip(gen_ords, network.generators.values()):
             for et, power_reserve_data in network.constants.power_reserves.items():
                 for tag in power_reserve_data:
                     if tag in gen_obj.tags:
-                        result[indices.TAGS.inverse[tag]][gen_idx][et] = (
-                            add_h_y_variable(
-                                model,
-                                indices,
-                                var_name=f"GEN_RESERVE_ET_{tag}_{gen_obj.name}_{et}",
-                            )
+                        result[tag_ords[tag]][gen_idx][et] = add_h_y_variable(
+                            model,
+                            indices,
+                            var_name=f"GEN_RESERVE_ET_{tag}_{gen_obj.name}_{et}",
+                            active=inactive is None or gen_idx not in inactive,
                         )
         return result
@@ -22,7 +22,11 @@ from pyzefir.optimization.linopy.preprocessing.indices import Indices
 
 
 def add_h_y_variable(
-    model: Model, indices: Indices, var_name: str, use_binary: bool = False
+    model: Model,
+    indices: Indices,
+    var_name: str,
+    use_binary: bool = False,
+    active: bool = True,
 ) -> Variable:
     """
     Add Var[hour, year] to the model.
@@ -32,6 +36,8 @@ def add_h_y_variable(
         - indices (Indices): The indices used for mapping the variable across hours and years.
         - var_name (str): The name of the variable to be created.
         - use_binary (bool): If to use binary. Defaults to False.
+        - active (bool): If False, all entries of the variable are masked (variable is provably zero).
+          Defaults to True.
 
     Returns:
         - Variable: The newly created variable with dimensions for hours and years.
@@ -42,6 +48,7 @@ def add_h_y_variable(
             dims=["hour", "year"],
             name=var_name,
             binary=True,
+            mask=None if active else False,
         )
     return model.add_variables(
         lower=xr.DataArray(
@@ -50,4 +57,5 @@ def add_h_y_variable(
             coords=[indices.H.ii, indices.Y.ii],
         ),
         name=var_name,
+        mask=None if active else False,
     )
@@ -0,0 +1,196 @@
+# PyZefir
+# Copyright (C) 2024 Narodowe Centrum Badań Jądrowych
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+from __future__ import annotations
+
+import logging
+from dataclasses import dataclass, field
+
+import numpy as np
+import xarray as xr
+from linopy import Model
+
+from pyzefir.optimization.linopy.preprocessing.indices import Indices
+from pyzefir.optimization.linopy.preprocessing.opt_parameters import (
+    OptimizationParameters,
+)
+
+_logger = logging.getLogger(__name__)
+
+
+@dataclass
+class VariableReduction:
+    """
+    Variables which are provably equal to zero, detected from the parameters before the variables are created.
+
+    Such variables are created with masked entries (linopy label -1), so they are not passed to the solver
+    and their terms disappear from all expressions. Constraints which become trivial (0 = 0, 0 <= rhs)
+    are dropped with drop_trivial_constraints and the masked entries are reinstated with zeros by
+    reinstate_zeros after the optimization, so results and exports are unchanged.
+    Dump energy variables of generators with disable_dump_energy and binary variables of non MILP storages
+    are not created at all (see GeneratorVariables and StorageVariables).
+    """
+
+    zero_generators: set[int] = field(default_factory=set)
+    """ generators with zero base capacity and zero unit_max_capacity in all sampled years """
+    available_fractions: np.ndarray | None = None
+    """ (aggr, lbs) boolean mask of local balancing stacks available in aggregated consumers """
+
+    @classmethod
+    def from_parameters(
+        cls,
+        indices: Indices,
+        parameters: OptimizationParameters,
+        fixed_capacity: bool = False,
+    ) -> VariableReduction:
+        """
+        Detects structurally zero variables from model parameters.
+
+        Args:
+            - indices (Indices): indices of the model
+            - parameters (OptimizationParameters): parameters of the model
+            - fixed_capacity (bool): capacities are fixed (dispatch only mode), so base capacity
+                does not determine capacity in the first year and generators are not reduced
+
+        Returns:
+            - VariableReduction: detected reduction
+        """
+        zero_generators = {
+            gen_idx
+            for gen_idx in indices.GEN.mapping
+            if not fixed_capacity
+            and parameters.gen.base_cap.get(gen_idx, np.nan) == 0
+            and gen_idx in parameters.gen.unit_max_capacity
+            and np.all(np.asarray(parameters.gen.unit_max_capacity[gen_idx])[1:] == 0)
+        }
+        lbs_indicator = np.asarray(parameters.aggr.lbs_indicator, dtype=bool)
+        available_fractions = lbs_indicator if lbs_indicator.size else None
+        reduction = cls(
+            zero_generators=zero_generators, available_fractions=available_fractions
+        )
+        _logger.debug(
+            "Variable reduction: %d generators with zero capacity, %d unavailable fractions",
+            len(zero_generators),
+            (
+                int((~available_fractions).sum())
+                if available_fractions is not None
+                else 0
+            ),
+        )
+        return reduction
+
+    def generator_mask(self, indices: Indices) -> xr.DataArray | None:
+        """
+        Mask of the generators which are not reduced (gen dimension).
+
+        Args:
+            - indices (Indices): indices of the model
+
+        Returns:
+            - xr.DataArray | None: mask or None if no generator is reduced
+        """
+        if not self.zero_generators:
+            return None
+        return xr.DataArray(
+            [gen_idx not in self.zero_generators for gen_idx in indices.GEN.ord],
+            dims=["gen"],
+            coords=[indices.GEN.ii],
+        )
+
+    def fraction_mask(self, indices: Indices) -> xr.DataArray | None:
+        """
+        Mask of the fractions which are not reduced (aggr, lbs dimensions).
+
+        Args:
+            - indices (Indices): indices of the model
+
+        Returns:
+            - xr.DataArray | None: mask or None if no fraction is reduced
+        """
+        if self.available_fractions is None or self.available_fractions.all():
+            return None
+        return xr.DataArray(
+            self.available_fractions,
+            dims=["aggr", "lbs"],
+            coords=[indices.AGGR.ii, indices.LBS.ii],
+        )
+
+
+def drop_trivial_constraints(
+    model: Model, constraint_names: dict[str, list[str]] | None = None
+) -> int:
+    """
+    Drops rows of the constraints without any active variable which are satisfied by zero
+    (0 = 0, 0 <= rhs, 0 >= rhs). Constraints without any remaining row are removed from the model
+    (and from constraint_names, if given). Rows without variables which are violated are kept and
+    reported, since they make the model infeasible.
+
+    Args:
+        - model (Model): built linopy model
+        - constraint_names (dict[str, list[str]] | None): names of constraints created by each constraint builder
+
+    Returns:
+        - int: number of dropped rows
+    """
+    dropped_rows, removed = 0, []
+    for name in list(model.constraints):
+        constraint = model.constraints[name]
+        active_terms = (constraint.vars != -1) & (constraint.coeffs != 0)
+        empty_rows = ~active_terms.any(constraint.term_dim) & (constraint.labels != -1)
+        if not empty_rows.any():
+            continue
+        rhs, sign = constraint.rhs, constraint.sign
+        satisfied = ((sign == "=") & (rhs == 0)) | (
+            (sign == "<=") & (rhs >= 0) | (sign == ">=") & (rhs <= 0)
+        )
+        if (violated := empty_rows & ~satisfied).any():
+            _logger.warning(
+                "Constraint %s has %d rows without variables which cannot be satisfied",
+                name,
+                int(violated.sum()),
+            )
+        trivial = empty_rows & satisfied
+        dropped_rows += int(trivial.sum())
+        constraint.data["labels"] = constraint.labels.where(~trivial, -1)
+        if (constraint.labels == -1).all():
+            removed.append(name)
+    if removed:
+        model.remove_constraints(removed)
+        if constraint_names is not None:
+            removed_names = set(removed)
+            for builder, names in constraint_names.items():
+                constraint_names[builder] = [
+                    name for name in names if name not in removed_names
+                ]
+    _logger.debug(
+        "Dropped %d trivial constraint rows, %d constraints removed",
+        dropped_rows,
+        len(removed),
+    )
+    return dropped_rows
+
+
+def reinstate_zeros(model: Model) -> None:
+    """
+    Sets solution of masked entries of the variables to zero (linopy sets them to nan).
+
+    Args:
+        - model (Model): solved linopy model
+    """
+    for name in model.variables:
+        variable = model.variables[name]
+        if "solution" in variable.data and (variable.labels == -1).any():
+            variable.solution = variable.data["solution"].fillna(0.0)
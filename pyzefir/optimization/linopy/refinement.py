@@ -0,0 +1,233 @@
+# PyZefir
+# Copyright (C) 2024 Narodowe Centrum Badań Jądrowych
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import logging
+import time
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Sequence
+
+import numpy as np
+import pandas as pd
+
+from pyzefir.model.network import Network
+from pyzefir.optimization.input_data import OptimizationInputData
+from pyzefir.optimization.linopy.model import LinopyOptimizationModel
+from pyzefir.optimization.model import OptimizationStatus
+from pyzefir.optimization.opt_config import OptConfig
+
+_logger = logging.getLogger(__name__)
+
+
+class RefinementError(Exception):
+    pass
+
+
+@dataclass
+class RefinementLevel:
+    """Summary of the solve of a single refinement level."""
+
+    n_hours: int
+    """ number of hours in the hour sample of the level """
+    build_time: float
+    """ time of building the model [s] """
+    solve_time: float
+    """ time of solving the model [s] """
+    objective: float
+    """ objective value (nan if the model is not solved to optimality) """
+    status: str
+    """ optimization status """
+
+
+def coarse_hour_sample(hour_sample: np.ndarray, n_hours: int) -> np.ndarray:
+    """
+    Evenly spaced subsample of the hour sample with given number of hours.
+
+    Args:
+        - hour_sample (np.ndarray): hour sample of the target level
+        - n_hours (int): number of hours of the subsample
+
+    Returns:
+        - np.ndarray: subsample of the hour sample
+    """
+    positions = np.linspace(0, len(hour_sample), n_hours, endpoint=False).astype(int)
+    return hour_sample[positions]
+
+
+def _level_path(path: Path | None, n_hours: int) -> Path | None:
+    """Path with level suffix added to the file name, so levels do not overwrite each other."""
+    if path is None:
+        return None
+    return path.with_name(f"{path.stem}_{n_hours}h{path.suffix}")
+
+
+class RefinementRunner:
+    """
+    Solves the model with progressively refined hour resolution. Models of coarse hour samples
+    (evenly spaced subsamples of OptConfig.hour_sample, hourly scale is adjusted to each sample)
+    are solved first, capacities and fractions of each level are passed to the solver as a warm start
+    of the next level and the model of the target hour sample is solved last. The network is shared
+    by all levels.
+    """
+
+    def __init__(
+        self, network: Network, opt_config: OptConfig, levels: Sequence[int]
+    ) -> None:
+        """
+        Initializes a new instance of the class.
+
+        Args:
+            - network (Network): network to optimize
+            - opt_config (OptConfig): optimization config of the target level
+            - levels (Sequence[int]): increasing numbers of hours of coarse levels, all smaller than
+                the number of hours of the target hour sample
+
+        Raises:
+            - RefinementError: if levels are not valid or fixed investments are given
+        """
+        n_hours = len(opt_config.hour_sample)
+        if opt_config.fixed_investments is not None:
+            raise RefinementError(
+                "hour resolution refinement is not available in dispatch only mode"
+            )
+        if not all(0 < level < n_hours for level in levels) or not np.all(
+            np.diff(levels) > 0
+        ):
+            raise RefinementError(
+                f"refinement levels {list(levels)} must be increasing and between 1 and {n_hours - 1} "
+                f"(number of hours of the hour sample is {n_hours})"
+            )
+        self._network = network
+        self._opt_config = opt_config
+        self._levels = list(levels)
+        self.levels: list[RefinementLevel] = []
+        """ summaries of solved levels """
+
+    def level_configs(self) -> list[OptConfig]:
+        """
+        Optimization configs of all levels (coarse levels and the target level).
+
+        Returns:
+            - list[OptConfig]: configs of subsequent levels
+        """
+        configs = []
+        for n_hours in self._levels:
+            config = self._opt_config.with_hour_sample(
+                coarse_hour_sample(self._opt_config.hour_sample, n_hours)
+            )
+            config.sol_dump_path = _level_path(self._opt_config.sol_dump_path, n_hours)
+            config.opt_logs_dump_path = _level_path(
+                self._opt_config.opt_logs_dump_path, n_hours
+            )
+            configs.append(config)
+        return configs + [
+            self._opt_config.with_hour_sample(self._opt_config.hour_sample)
+        ]
+
+    def run(self) -> LinopyOptimizationModel:
+        """
+        Solves all levels, each level is warm started with investments of the previous one.
+
+        Returns:
+            - LinopyOptimizationModel: solved model of the target level
+
+        Raises:
+            - RefinementError: if a coarse level is not solved to optimality
+        """
+        self.levels = []
+        *coarse_configs, target_config = self.level_configs()
+        warm_start = self._opt_config.warm_start
+        for config in coarse_configs:
+            config.warm_start = warm_start
+            engine = self._solve_level(config)
+            if engine.status != OptimizationStatus.OPTIMAL:
+                raise RefinementError(
+                    f"Refinement level of {len(config.hour_sample)} hours cannot be solved, "
+                    f"optimization status is {engine.status.name}"
+                )
+            warm_start = engine.investments()
+            del engine  # model of the level is released before the next one is built
+        target_config.warm_start = warm_start
+        engine = self._solve_level(target_config)
+        for summary in self.levels:
+            _logger.info(
+                "Refinement level of %d hours: objective %s, objective gap %.4g",
+                summary.n_hours,
+                summary.objective,
+                self._gap(summary),
+            )
+        return engine
+
+    def _solve_level(self, config: OptConfig) -> LinopyOptimizationModel:
+        """Builds and solves the model of a single level and stores its summary."""
+        engine = LinopyOptimizationModel()
+        start = time.perf_counter()
+        engine.build(OptimizationInputData(self._network, config))
+        build_time = time.perf_counter() - start
+        engine.optimize()
+        solve_time = time.perf_counter() - start - build_time
+        self.levels.append(
+            RefinementLevel(
+                n_hours=len(config.hour_sample),
+                build_time=build_time,
+                solve_time=solve_time,
+                objective=(
+                    engine.model.objective.value
+                    if engine.status == OptimizationStatus.OPTIMAL
+                    else np.nan
+                ),
+                status=engine.status.name,
+            )
+        )
+        _logger.info(
+            "Refinement level %d/%d (%d hours): build %.1f s, solve %.1f s",
+            len(self.levels),
+            len(self._levels) + 1,
+            len(config.hour_sample),
+            build_time,
+            solve_time,
+        )
+        return engine
+
+    def _gap(self, summary: RefinementLevel) -> float:
+        """Relative difference between objective of the target level and given level."""
+        target = self.levels[-1].objective
+        return (target - summary.objective) / abs(target) if target else np.nan
+
+    @property
+    def report(self) -> pd.DataFrame:
+        """
+        Timing and objective values of solved levels, objective_gap is the relative difference between
+        objective value of the target level and objective value of the level.
+
+        Returns:
+            - pd.DataFrame: report with columns n_hours, build_time, solve_time, objective, status,
+                objective_gap
+        """
+        return pd.DataFrame(
+            [
+                asdict(summary) | {"objective_gap": self._gap(summary)}
+                for summary in self.levels
+            ],
+            columns=[
+                "n_hours",
+                "build_time",
+                "solve_time",
+                "objective",
+                "status",
+                "objective_gap",
+            ],
+        )
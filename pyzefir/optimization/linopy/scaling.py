@@ -0,0 +1,304 @@
+# PyZefir
+# Copyright (C) 2024 Narodowe Centrum Badań Jądrowych
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import logging
+import re
+from typing import Final
+
+import numpy as np
+import pandas as pd
+import xarray as xr
+from linopy import Constraint, Model
+from linopy.expressions import LinearExpression
+
+_logger = logging.getLogger(__name__)
+
+OBJECTIVE_FAMILY: Final[str] = "OBJECTIVE"
+DEFAULT_SCALING_PASSES: Final[int] = 2
+_FAMILY_PATTERN: Final = re.compile(r"[A-Z]{2,}(?:_[A-Z]{2,})*")
+
+
+def constraint_family(constraint_name: str) -> str:
+    """
+    Constraint family is the longest upper case part of the constraint name, e.g.
+    pp_coal_DISPATCHABLE_GEN_CAP_CONSTRAINT -> DISPATCHABLE_GEN_CAP_CONSTRAINT.
+    Constraints created without a name (con0, con1, ...) are gathered in a single family.
+
+    Args:
+        - constraint_name (str): name of the constraint in linopy model
+
+    Returns:
+        - str: name of the constraint family
+    """
+    matches = _FAMILY_PATTERN.findall(constraint_name)
+    if not matches:
+        return constraint_name.rstrip("0123456789")
+    return max(matches, key=len)
+
+
+def _power_of_two_factor(min_abs: np.ndarray, max_abs: np.ndarray) -> np.ndarray:
+    """
+    Geometric mean scaling factor rounded to the power of two (so scaling does not
+    introduce any rounding errors). If there are no coefficients (nan), factor is 1.
+    """
+    with np.errstate(invalid="ignore", divide="ignore"):
+        exponent = -np.round(0.5 * (np.log2(min_abs) + np.log2(max_abs)))
+    return np.exp2(np.nan_to_num(exponent, nan=0.0, posinf=0.0, neginf=0.0))
+
+
+def _row_coefficients(constraint: Constraint) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Returns coefficients and variable labels of given constraint as 2D arrays
+    (rows x terms), coefficients of inactive terms and rows are set to nan.
+    """
+    term_dim = constraint.term_dim
+    coeffs = constraint.coeffs.transpose(..., term_dim).values.astype(float)
+    coeffs = coeffs.reshape(constraint.labels.size, coeffs.shape[-1])
+    labels = constraint.vars.transpose(..., term_dim).values.reshape(coeffs.shape)
+    row_labels = constraint.labels.values.reshape(-1, 1)
+    abs_coeffs = np.where(
+        (labels != -1) & (row_labels != -1) & (coeffs != 0), np.abs(coeffs), np.nan
+    )
+    return abs_coeffs, labels
+
+
+class ModelScaler:
+    """
+    Automatic scaling of the linopy model built by LinopyOptimizationModel.
+
+    Scaling is performed in place on the model after it is built. In every pass the
+    columns are scaled first (one factor per variable, binary and integer variables are
+    not scaled), then every row of every constraint is scaled. Finally objective function
+    is scaled. All factors are powers of two computed from geometric mean of the smallest
+    and the largest absolute coefficient, so scaling is exact in floating point arithmetic.
+    After the optimization unscale_solution must be called to restore primal values,
+    duals and objective value of the original (not scaled) problem.
+    """
+
+    def __init__(
+        self,
+        model: Model,
+        constraint_names: dict[str, list[str]],
+        money_scale: float = 1.0,
+        passes: int = DEFAULT_SCALING_PASSES,
+    ) -> None:
+        """
+        Initializes a new instance of the class.
+
+        Args:
+            - model (Model): built linopy model
+            - constraint_names (dict[str, list[str]]): names of constraints created by each constraint builder
+            - money_scale (float): money scale used to build the model, default = 1.0
+            - passes (int): number of column and row scaling passes, default = 2
+        """
+        self._model = model
+        self._constraint_names = constraint_names
+        self._money_scale = money_scale
+        self._passes = passes
+        self.column_factors: dict[str, float] = {}
+        """ factor of each variable (original value = factor * scaled value) """
+        self.row_factors: dict[str, xr.DataArray] = {}
+        """ factor of each row of each constraint (scaled row = factor * original row) """
+        self.objective_factor: float = 1.0
+        """ scaled objective = objective_factor * original objective """
+        self._report_before: pd.DataFrame | None = None
+        self._report_after: pd.DataFrame | None = None
+
+    @property
+    def suggested_money_scale(self) -> float:
+        """Money scale giving the same objective scaling as the one found automatically."""
+        return max(1.0, self._money_scale / self.objective_factor)
+
+    @property
+    def report(self) -> pd.DataFrame:
+        """
+        Coefficient ranges before and after scaling per constraint builder and constraint family.
+
+        Returns:
+            - pd.DataFrame: report with columns builder, family, n_constraints, min_before,
+                max_before, min_after, max_after
+        """
+        if self._report_before is None or self._report_after is None:
+            raise ValueError("model is not scaled yet, please call the scale method")
+        return self._report_before.merge(
+            self._report_after, on=["builder", "family", "n_constraints"]
+        )
+
+    def scale(self) -> None:
+        """Computes scaling factors and scales the model in place."""
+        self._report_before = self._coefficient_ranges("before")
+        self.column_factors = {name: 1.0 for name in self._model.variables}
+        self.row_factors = {}
+        for _ in range(self._passes):
+            self._scale_columns()
+            self._scale_rows()
+        self._scale_objective()
+        self._report_after = self._coefficient_ranges("after")
+        _logger.info(
+            "Model scaled: objective factor %s, suggested money_scale %s",
+            self.objective_factor,
+            self.suggested_money_scale,
+        )
+        _logger.debug("Scaling report:\n%s", self.report.to_string())
+
+    def unscale_solution(self) -> None:
+        """Restores primal values, duals and objective value of the original model."""
+        for name, factor in self.column_factors.items():
+            variable = self._model.variables[name]
+            if factor != 1.0 and "solution" in variable.data:
+                variable.solution = variable.solution * factor
+        for name in self._model.constraints:
+            constraint = self._model.constraints[name]
+            if "dual" in constraint.data:
+                constraint.dual = (
+                    constraint.dual
+                    * self.row_factors.get(name, 1.0)
+                    / self.objective_factor
+                )
+        if self._model.objective.value is not None:
+            self._model.objective.set_value(
+                self._model.objective.value / self.objective_factor
+            )
+
+    def _label_factors(self, column_factors: dict[str, float]) -> np.ndarray:
+        """Array of given column factors indexed by variable label."""
+        factors = np.ones(self._model.shape[1])
+        for name, factor in column_factors.items():
+            labels = self._model.variables[name].labels.values
+            factors[labels[labels != -1]] = factor
+        return factors
+
+    def _scale_columns(self) -> None:
+        """Scales each not integral variable by geometric mean of its coefficients."""
+        label_owner = np.full(self._model.shape[1], -1)
+        names = list(self._model.variables)
+        for i, name in enumerate(names):
+            labels = self._model.variables[name].labels.values
+            label_owner[labels[labels != -1]] = i
+        blocks = []
+        for constraint_name in self._model.constraints:
+            abs_coeffs, labels = _row_coefficients(
+                self._model.constraints[constraint_name]
+            )
+            mask = ~np.isnan(abs_coeffs)
+            blocks.append(
+                pd.DataFrame(
+                    {"owner": label_owner[labels[mask]], "value": abs_coeffs[mask]}
+                )
+            )
+        if not blocks:
+            return
+        ranges = pd.concat(blocks).groupby("owner")["value"].agg(["min", "max"])
+        factors = _power_of_two_factor(ranges["min"].values, ranges["max"].values)
+        step: dict[str, float] = {}
+        for owner, factor in zip(ranges.index, factors):
+            variable = self._model.variables[names[owner]]
+            if factor == 1.0 or variable.attrs["binary"] or variable.attrs["integer"]:
+                continue
+            step[names[owner]] = float(factor)
+            variable.lower = variable.lower / factor
+            variable.upper = variable.upper / factor
+            self.column_factors[names[owner]] *= float(factor)
+        if not step:
+            return
+        label_factors = self._label_factors(step)
+        for constraint_name in self._model.constraints:
+            constraint = self._model.constraints[constraint_name]
+            labels = constraint.vars.values
+            constraint.coeffs = constraint.coeffs * constraint.vars.copy(
+                data=np.where(labels != -1, label_factors[labels], 1.0)
+            )
+
+    def _scale_rows(self) -> None:
+        """Scales each row of each constraint by geometric mean of its coefficients."""
+        for constraint_name in self._model.constraints:
+            constraint = self._model.constraints[constraint_name]
+            abs_coeffs, _ = _row_coefficients(constraint)
+            factors = _power_of_two_factor(
+                np.nanmin(abs_coeffs, axis=1, initial=np.inf),
+                np.nanmax(abs_coeffs, axis=1, initial=0.0),
+            )
+            if np.all(factors == 1.0):
+                continue
+            row_factor = xr.DataArray(
+                factors.reshape(constraint.labels.shape),
+                coords=constraint.labels.coords,
+                dims=constraint.labels.dims,
+            )
+            constraint.coeffs = constraint.coeffs * row_factor
+            constraint.data["rhs"] = constraint.rhs * row_factor
+            self.row_factors[constraint_name] = (
+                self.row_factors[constraint_name] * row_factor
+                if constraint_name in self.row_factors
+                else row_factor
+            )
+
+    def _scale_objective(self) -> None:
+        """Applies column factors to the objective and scales it by its coefficients range."""
+        expression = self._model.objective.expression
+        labels = expression.vars.values
+        label_factors = self._label_factors(self.column_factors)
+        coeffs = expression.coeffs.values * np.where(
+            labels != -1, label_factors[labels], 1.0
+        )
+        abs_coeffs = np.abs(coeffs[(labels != -1) & (coeffs != 0)])
+        if abs_coeffs.size:
+            self.objective_factor = float(
+                _power_of_two_factor(abs_coeffs.min(), abs_coeffs.max())
+            )
+        data = expression.data.assign(
+            coeffs=expression.coeffs.copy(data=coeffs * self.objective_factor),
+            const=expression.const * self.objective_factor,
+        )
+        self._model.objective.expression = LinearExpression(data, self._model)
+
+    def _coefficient_ranges(self, suffix: str) -> pd.DataFrame:
+        """
+        Min and max absolute coefficient per constraint builder and constraint family
+        (including objective function).
+        """
+        rows = []
+        for builder, names in self._constraint_names.items():
+            families: dict[str, list[str]] = {}
+            for name in names:
+                families.setdefault(constraint_family(name), []).append(name)
+            for family, family_names in families.items():
+                min_abs, max_abs = np.inf, 0.0
+                for name in family_names:
+                    abs_coeffs, _ = _row_coefficients(self._model.constraints[name])
+                    abs_coeffs = abs_coeffs[~np.isnan(abs_coeffs)]
+                    if abs_coeffs.size:
+                        min_abs = min(min_abs, abs_coeffs.min())
+                        max_abs = max(max_abs, abs_coeffs.max())
+                rows.append((builder, family, len(family_names), min_abs, max_abs))
+        expression = self._model.objective.expression
+        coeffs = np.abs(expression.coeffs.values)
+        coeffs = coeffs[(expression.vars.values != -1) & (coeffs != 0)]
+        rows.append(
+            (
+                OBJECTIVE_FAMILY,
+                OBJECTIVE_FAMILY,
+                1,
+                coeffs.min() if coeffs.size else np.inf,
+                coeffs.max() if coeffs.size else 0.0,
+            )
+        )
+        report = pd.DataFrame(
+            rows,
+            columns=["builder", "family", "n_constraints", "min", "max"],
+        )
+        report.loc[report["max"] == 0.0, ["min", "max"]] = np.nan
+        return report.rename(columns={"min": f"min_{suffix}", "max": f"max_{suffix}"})
@@ -0,0 +1,613 @@
+# PyZefir
+# Copyright (C) 2024 Narodowe Centrum Badań Jądrowych
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import logging
+from collections import defaultdict
+from dataclasses import dataclass, field
+from typing import Any, Final, Mapping
+
+import numpy as np
+import pandas as pd
+from linopy import Model, Variable
+
+from pyzefir.model.network import Network
+from pyzefir.model.network_elements import Generator, GeneratorType, Storage
+from pyzefir.model.utils import AllowedStorageGenerationLoadMethods
+from pyzefir.optimization.input_data import OptimizationInputData
+from pyzefir.optimization.linopy.model import LinopyOptimizationModel
+from pyzefir.optimization.linopy.preprocessing.indices import Indices
+from pyzefir.optimization.linopy.preprocessing.opt_parameters import (
+    OptimizationParameters,
+)
+from pyzefir.optimization.linopy.preprocessing.opt_variables import (
+    OptimizationVariables,
+)
+from pyzefir.optimization.opt_config import OptConfig
+
+_logger = logging.getLogger(__name__)
+
+BYTES_PER_VARIABLE: Final[int] = 24
+""" linopy keeps label (int64), lower and upper bound (float64) per variable """
+BYTES_PER_CONSTRAINT: Final[int] = 32
+""" linopy keeps label (int64), rhs (float64) and sign (<U2) per constraint row """
+BYTES_PER_NONZERO: Final[int] = 16
+""" linopy keeps coefficient (float64) and variable label (int64) per term """
+BUILD_OVERHEAD_FACTOR: Final[float] = 3.0
+""" intermediate xarray copies created by expression arithmetic during the build """
+SOLVER_BYTES_PER_NONZERO: Final[int] = 120
+""" solver side memory per nonzero (matrix copy, factorization fill-in, presolve) """
+SOLVER_BYTES_PER_ROW_OR_COLUMN: Final[int] = 200
+""" solver side memory per row / column (bounds, basis, names, work vectors) """
+ESTIMATE_ERROR_BAND: Final[float] = 0.25
+"""
+relative error band of the estimate; counts of hourly families are exact, while the
+yearly families (capacity evolution, scenario limits) are approximated - the band is
+checked against instrumented builds (see measure_model_size)
+"""
+
+
+@dataclass
+class ModelSizeEntry:
+    """
+    Number of variables, constraints and nonzero coefficients of a part of the model.
+    """
+
+    n_variables: int = 0
+    """ number of variables """
+    n_constraints: int = 0
+    """ number of constraint rows """
+    n_nonzeros: int = 0
+    """ number of nonzero coefficients in constraint rows """
+
+    def add_variables(self, count: int) -> None:
+        self.n_variables += int(count)
+
+    def add_constraints(self, rows: int, terms_per_row: float) -> None:
+        self.n_constraints += int(rows)
+        self.n_nonzeros += int(round(rows * terms_per_row))
+
+    def __add__(self, other: "ModelSizeEntry") -> "ModelSizeEntry":
+        return ModelSizeEntry(
+            n_variables=self.n_variables + other.n_variables,
+            n_constraints=self.n_constraints + other.n_constraints,
+            n_nonzeros=self.n_nonzeros + other.n_nonzeros,
+        )
+
+
+@dataclass
+class ModelSizeReport:
+    """
+    Size of the optimization model split into variable groups and constraint builders.
+    """
+
+    variables: dict[str, ModelSizeEntry] = field(default_factory=dict)
+    """ variable group name -> size of the group """
+    constraints: dict[str, ModelSizeEntry] = field(default_factory=dict)
+    """ constraint builder name -> size of constraints created by the builder """
+
+    @property
+    def total(self) -> ModelSizeEntry:
+        return sum(
+            [*self.variables.values(), *self.constraints.values()], ModelSizeEntry()
+        )
+
+    @property
+    def n_variables(self) -> int:
+        return self.total.n_variables
+
+    @property
+    def n_constraints(self) -> int:
+        return self.total.n_constraints
+
+    @property
+    def n_nonzeros(self) -> int:
+        return self.total.n_nonzeros
+
+    @property
+    def build_memory(self) -> int:
+        """Approximate peak memory (in bytes) needed to build the linopy model."""
+        total = self.total
+        return int(
+            BUILD_OVERHEAD_FACTOR
+            * (
+                total.n_variables * BYTES_PER_VARIABLE
+                + total.n_constraints * BYTES_PER_CONSTRAINT
+                + total.n_nonzeros * BYTES_PER_NONZERO
+            )
+        )
+
+    @property
+    def solve_memory(self) -> int:
+        """Approximate peak memory (in bytes) of the solve (model kept alive next to the solver copy)."""
+        total = self.total
+        return self.build_memory + int(
+            total.n_nonzeros * SOLVER_BYTES_PER_NONZERO
+            + (total.n_variables + total.n_constraints) * SOLVER_BYTES_PER_ROW_OR_COLUMN
+        )
+
+    def to_frame(self) -> pd.DataFrame:
+        """
+        Report as a data frame (one row per variable group / constraint builder and a total row).
+
+        Returns:
+            - pd.DataFrame: columns n_variables, n_constraints, n_nonzeros
+        """
+        rows = {**self.variables, **self.constraints, "TOTAL": self.total}
+        return pd.DataFrame(
+            {
+                name: [entry.n_variables, entry.n_constraints, entry.n_nonzeros]
+                for name, entry in rows.items()
+            },
+            index=["n_variables", "n_constraints", "n_nonzeros"],
+        ).T
+
+
+class ModelSizeEstimator:
+    """
+    Predicts the size of the linopy model built by LinopyOptimizationModel without
+    creating any linopy objects.
+
+    Only Indices and the Network are used, so the estimate is available right after
+    the network is parsed and before any of the memory heavy steps of the build
+    (OptimizationParameters, OptimizationVariables, constraint builders) are run.
+    """
+
+    def __init__(self, input_data: OptimizationInputData) -> None:
+        """
+        Initializes a new instance of the class.
+
+        Args:
+            - input_data (OptimizationInputData): network and optimization configuration
+        """
+        self.network: Network = input_data.network
+        self.config: OptConfig = input_data.config
+        self.indices = Indices(self.network, self.config)
+        self.n_h, self.n_y = len(self.indices.H), len(self.indices.Y)
+        self.n_hy = self.n_h * self.n_y
+
+    def estimate(self) -> ModelSizeReport:
+        """
+        Estimate the size of the model.
+
+        Returns:
+            - ModelSizeReport: estimated size per variable group and per constraint builder
+        """
+        report = ModelSizeReport(
+            variables={
+                "BusVariables": self._bus_variables(),
+                "FractionVariables": self._fraction_variables(),
+                "GeneratorVariables": self._generator_variables(),
+                "StorageVariables": self._storage_variables(),
+                "GeneratorTypeVariables": self._type_variables(
+                    self.indices.aggr_tgen_map
+                ),
+                "StorageTypeVariables": self._type_variables(
+                    self.indices.aggr_tstor_map
+                ),
+                "LineVariables": ModelSizeEntry(
+                    n_variables=len(self.indices.LINE) * self.n_hy
+                ),
+            },
+            constraints={
+                "ScenarioConstraintsBuilder": self._scenario_constraints(),
+                "BalancingConstraintsBuilder": self._balancing_constraints(),
+                "FractionConstraintsBuilder": self._fraction_constraints(),
+                "LineFlowConstraintsBuilder": self._line_flow_constraints(),
+                "GenerationConstraintsBuilder": self._generation_constraints(),
+                "StorageConstraintsBuilder": self._storage_constraints(),
+                "RampConstraintsBuilder": self._ramp_constraints(),
+                "CapacityEvolutionConstrBuilder": self._capacity_evolution_constraints(),
+                "CapacityBindingBuilder": self._capacity_binding_constraints(),
+                "CapacityBoundsConstraintsBuilder": self._capacity_bounds_constraints(),
+                "GenerationFractionConstraintsBuilder": self._generation_fraction_constraints(),
+            },
+        )
+        _logger.info(
+            "Estimated model size: %d variables, %d constraints, %d nonzeros",
+            report.n_variables,
+            report.n_constraints,
+            report.n_nonzeros,
+        )
+        return report
+
+    def _gen_type(self, gen: Generator) -> GeneratorType:
+        return self.network.generator_types[gen.energy_source_type]
+
+    def _sampled(self, series: pd.Series | None) -> np.ndarray:
+        if series is None:
+            return np.full(self.n_y, np.nan)
+        return np.asarray(series, dtype=float)[self.indices.Y.ii]
+
+    def _n_dch_sources(
+        self, sources: Mapping[str, Generator] | Mapping[str, Storage]
+    ) -> int:
+        return sum(
+            dch.tag in source.tags
+            for dch in self.network.demand_chunks.values()
+            for source in sources.values()
+        )
+
+    def _n_reserve(self, gen: Generator) -> int:
+        return sum(
+            tag in gen.tags
+            for reserve in self.network.constants.power_reserves.values()
+            for tag in reserve
+        )
+
+    def _lbs_buses(self) -> set[str]:
+        return {
+            bus_name
+            for lbs in self.network.local_balancing_stacks.values()
+            for bus_names in lbs.buses.values()
+            for bus_name in bus_names
+        }
+
+    def _non_aggr_units(self, aggr_map: dict[int, set]) -> int:
+        return len(set().union(*aggr_map.values())) if aggr_map else 0
+
+    def _bus_variables(self) -> ModelSizeEntry:
+        n_dsr = sum(bus.dsr_type is not None for bus in self.network.buses.values())
+        return ModelSizeEntry(
+            n_variables=(len(self.indices.BUS) + 2 * n_dsr) * self.n_hy
+        )
+
+    def _fraction_variables(self) -> ModelSizeEntry:
+        return ModelSizeEntry(
+            n_variables=len(self.indices.AGGR) * len(self.indices.LBS) * self.n_y
+        )
+
+    def _generator_variables(self) -> ModelSizeEntry:
+        result = ModelSizeEntry()
+        generators = self.network.generators
+        n_gen, n_y = len(generators), self.n_y
+        n_et = sum(len(self._gen_type(gen).energy_types) for gen in generators.values())
+        n_dump = sum(
+            len(self._gen_type(gen).energy_types)
+            for gen in generators.values()
+            if not self._gen_type(gen).disable_dump_energy
+        )
+        n_reserve = sum(
+            self._n_reserve(gen) * len(self._gen_type(gen).energy_types)
+            for gen in generators.values()
+        )
+        result.add_variables(
+            (n_gen + n_et + n_dump + n_reserve + self._n_dch_sources(generators))
+            * self.n_hy
+        )
+        n_non_aggr = n_gen - self._non_aggr_units(self.indices.aggr_gen_map)
+        result.add_variables(n_gen * n_y + n_non_aggr * (2 * n_y + n_y * n_y))
+        return result
+
+    def _storage_variables(self) -> ModelSizeEntry:
+        result = ModelSizeEntry()
+        storages = self.network.storages
+        n_stor, n_y = len(storages), self.n_y
+        n_milp = sum(
+            self.network.storage_types[stor.energy_source_type].generation_load_method
+            == AllowedStorageGenerationLoadMethods.milp
+            for stor in storages.values()
+        )
+        result.add_variables(
+            (3 * n_stor + n_milp + self._n_dch_sources(storages)) * self.n_hy
+        )
+        n_non_aggr = n_stor - self._non_aggr_units(self.indices.aggr_stor_map)
+        result.add_variables(n_stor * n_y + n_non_aggr * (2 * n_y + n_y * n_y))
+        return result
+
+    def _type_variables(self, aggr_type_map: dict[int, set]) -> ModelSizeEntry:
+        n_pairs = sum(len(type_idxs) for type_idxs in aggr_type_map.values())
+        return ModelSizeEntry(
+            n_variables=n_pairs * (3 * self.n_y + self.n_y * self.n_y)
+        )
+
+    def _scenario_constraints(self) -> ModelSizeEntry:
+        result, network = ModelSizeEntry(), self.network
+        fuel_gens: dict[str, int] = defaultdict(int)
+        for gen in network.generators.values():
+            if (fuel := self._gen_type(gen).fuel) is not None:
+                fuel_gens[fuel] += 1
+        for fuel_name, fuel in network.fuels.items():
+            if fuel_gens[fuel_name]:
+                n_rows = np.count_nonzero(~np.isnan(self._sampled(fuel.availability)))
+                result.add_constraints(n_rows, self.n_h * fuel_gens[fuel_name])
+        for units, types in (
+            (network.generators, network.generator_types),
+            (network.storages, network.storage_types),
+        ):
+            units_per_type: dict[str, int] = defaultdict(int)
+            for unit in units.values():
+                units_per_type[unit.energy_source_type] += 1
+                for attr, n_terms in (
+                    ("unit_min_capacity", 1),
+                    ("unit_max_capacity", 1),
+                    ("unit_min_capacity_increase", 2),
+                    ("unit_max_capacity_increase", 2),
+                ):
+                    values = self._sampled(getattr(unit, attr))[1:]
+                    result.add_constraints(np.count_nonzero(~np.isnan(values)), n_terms)
+            for type_name, n_units in units_per_type.items():
+                for attr, n_terms in (
+                    ("min_capacity", n_units),
+                    ("max_capacity", n_units),
+                    ("min_capacity_increase", 2 * n_units),
+                    ("max_capacity_increase", 2 * n_units),
+                ):
+                    values = self._sampled(getattr(types[type_name], attr))[1:]
+                    result.add_constraints(np.count_nonzero(~np.isnan(values)), n_terms)
+        for aggr in network.aggregated_consumers.values():
+            for attr, n_terms in (
+                ("min_fraction", 1),
+                ("max_fraction", 1),
+                ("max_fraction_increase", 2),
+                ("max_fraction_decrease", 2),
+            ):
+                for series in getattr(aggr, attr).values():
+                    n_rows = np.count_nonzero(~np.isnan(self._sampled(series)))
+                    result.add_constraints(n_rows, n_terms)
+        n_fuel_gens = sum(fuel_gens.values())
+        for et, limit in network.constants.relative_emission_limits.items():
+            if not np.isnan(network.constants.base_total_emission.get(et, np.nan)):
+                n_rows = np.count_nonzero(~np.isnan(self._sampled(limit)))
+                result.add_constraints(n_rows, self.n_h * n_fuel_gens)
+        for reserve in network.constants.power_reserves.values():
+            for tag in reserve:
+                n_gens = sum(tag in gen.tags for gen in network.generators.values())
+                result.add_constraints(self.n_hy, n_gens)
+        return result
+
+    def _balancing_constraints(self) -> ModelSizeEntry:
+        result, network = ModelSizeEntry(), self.network
+        lbs_buses = self._lbs_buses()
+        for bus in network.buses.values():
+            n_terms = 1 + len(bus.lines_in) + len(bus.lines_out)
+            n_terms += 2 * (bus.dsr_type is not None) + (bus.name in lbs_buses)
+            for gen_name in bus.generators:
+                gen_type = self._gen_type(network.generators[gen_name])
+                n_terms += bus.energy_type in gen_type.energy_types
+                n_terms += bus.energy_type in gen_type.conversion_rate
+            for stor_name in bus.storages:
+                n_terms += 2 + sum(
+                    dch.tag in network.storages[stor_name].tags
+                    for dch in network.demand_chunks.values()
+                )
+            result.add_constraints(self.n_hy, n_terms)
+            if bus.dsr_type is not None and bus.name in lbs_buses:
+                dsr = network.dsr[bus.dsr_type]
+                result.add_constraints(2 * self.n_hy, 2)
+                n_periods = int(np.ceil(self.n_h / dsr.balancing_period_len))
+                period_len = min(dsr.balancing_period_len, self.n_h)
+                n_limits = 1 + (dsr.relative_shift_limit is not None)
+                n_limits += dsr.abs_shift_limit is not None
+                result.add_constraints(n_limits * n_periods * self.n_y, 2 * period_len)
+        for dch in network.demand_chunks.values():
+            n_sources = sum(
+                dch.tag in unit.tags
+                for unit in [*network.generators.values(), *network.storages.values()]
+            )
+            if n_sources:
+                hours = self.indices.H.ii
+                for p_start, p_end in np.asarray(dch.periods):
+                    n_hours = np.count_nonzero((hours >= p_start) & (hours <= p_end))
+                    result.add_constraints(self.n_y, n_sources * n_hours)
+        return result
+
+    def _fraction_constraints(self) -> ModelSizeEntry:
+        result = ModelSizeEntry()
+        n_aggr, n_lbs = len(self.indices.AGGR), len(self.indices.LBS)
+        result.add_constraints(n_aggr * n_lbs, 1)
+        result.add_constraints(n_aggr * n_lbs * self.n_y, 1)
+        result.add_constraints(n_aggr * self.n_y, n_lbs)
+        return result
+
+    def _line_flow_constraints(self) -> ModelSizeEntry:
+        result = ModelSizeEntry()
+        for line in self.network.lines.values():
+            if np.isfinite(line.max_capacity):
+                result.add_constraints(self.n_hy, 1)
+        return result
+
+    def _generation_constraints(self) -> ModelSizeEntry:
+        result, network = ModelSizeEntry(), self.network
+        for gen in network.generators.values():
+            gen_type = self._gen_type(gen)
+            n_families = 1 if gen_type.capacity_factor is not None else 2
+            result.add_constraints(n_families * self.n_hy, 2)
+            for et in gen_type.energy_types:
+                n_terms = 2 + (not gen_type.disable_dump_energy) + self._n_reserve(gen)
+                n_terms += sum(
+                    dch.tag in gen.tags and dch.energy_type == et
+                    for dch in network.demand_chunks.values()
+                )
+                result.add_constraints(self.n_hy, n_terms)
+        return result
+
+    def _storage_constraints(self) -> ModelSizeEntry:
+        result, network = ModelSizeEntry(), self.network
+        n_stor, n_h, n_y = len(network.storages), self.n_h, self.n_y
+        result.add_constraints(2 * n_stor * self.n_hy, 2)
+        result.add_constraints(n_stor * self.n_hy, 3)
+        result.add_constraints(2 * n_stor, 1)
+        result.add_constraints(n_stor * ((n_h - 1) * n_y + n_y - 1), 4)
+        for stor in network.storages.values():
+            stor_type = network.storage_types[stor.energy_source_type]
+            if stor_type.cycle_length is not None:
+                result.add_constraints(-(-self.n_hy // stor_type.cycle_length), 1)
+            if (
+                stor_type.generation_load_method
+                == AllowedStorageGenerationLoadMethods.milp
+            ):
+                result.add_constraints(2 * self.n_hy, 2)
+        return result
+
+    def _ramp_constraints(self) -> ModelSizeEntry:
+        result = ModelSizeEntry()
+        for gen in self.network.generators.values():
+            gen_type = self._gen_type(gen)
+            n_ramps = (not np.isnan(gen_type.ramp_up)) + (
+                not np.isnan(gen_type.ramp_down)
+            )
+            result.add_constraints(n_ramps * (self.n_h - 1) * self.n_y, 3)
+        return result
+
+    def _evolution_terms(self, y: int, lt: int, bt: int) -> int:
+        s_range = range(max(0, y - lt - bt + 1), y - bt + 1)
+        n_terms = 1 + len(s_range) + (y if y < lt else 0)
+        return n_terms + sum(
+            len(range(s + bt, min(y, s + bt + lt - 1) + 1)) for s in s_range
+        )
+
+    def _capacity_evolution_constraints(self) -> ModelSizeEntry:
+        result, network, n_y = ModelSizeEntry(), self.network, self.n_y
+        for units, types, ii, type_ii, aggr_map, aggr_tmap in (
+            (
+                network.generators,
+                network.generator_types,
+                self.indices.GEN,
+                self.indices.TGEN,
+                self.indices.aggr_gen_map,
+                self.indices.aggr_tgen_map,
+            ),
+            (
+                network.storages,
+                network.storage_types,
+                self.indices.STOR,
+                self.indices.TSTOR,
+                self.indices.aggr_stor_map,
+                self.indices.aggr_tstor_map,
+            ),
+        ):
+            lbs_units = set().union(*aggr_map.values()) if aggr_map else set()
+            result.add_constraints(len(units), 1)
+            for unit_name, unit in units.items():
+                unit_type = types[unit.energy_source_type]
+                lt, bt = unit_type.life_time, unit_type.build_time
+                if ii.inverse[unit_name] not in lbs_units:
+                    for y in range(n_y):
+                        result.add_constraints(1, self._evolution_terms(y, lt, bt))
+                        result.add_constraints(1, len(range(y + bt, y + 1)))
+                        result.add_constraints(1, n_y + 1)
+            for aggr_idx, type_idxs in aggr_tmap.items():
+                for type_idx in type_idxs:
+                    unit_type = types[str(type_ii.mapping[type_idx])]
+                    lt, bt = unit_type.life_time, unit_type.build_time
+                    n_units = sum(
+                        units[str(ii.mapping[u_idx])].energy_source_type
+                        == unit_type.name
+                        for u_idx in aggr_map[aggr_idx]
+                    )
+                    for y in range(n_y):
+                        result.add_constraints(1, self._evolution_terms(y, lt, bt))
+                        result.add_constraints(len(range(y + bt, y + 1)), 1)
+                        result.add_constraints(1, n_y + 1)
+                        result.add_constraints(1, 1 + n_units)
+        lbs_buses = self._lbs_buses()
+        for unit in [*network.generators.values(), *network.storages.values()]:
+            buses = unit.buses if isinstance(unit, Generator) else {unit.bus}
+            if not buses.isdisjoint(lbs_buses):
+                n_bounds = (unit.min_device_nom_power is not None) + (
+                    unit.max_device_nom_power is not None
+                )
+                result.add_constraints(n_bounds * (n_y - 1), 2)
+        return result
+
+    def _capacity_binding_constraints(self) -> ModelSizeEntry:
+        result = ModelSizeEntry()
+        groups: dict[str, int] = defaultdict(int)
+        for gen in self.network.generators.values():
+            if gen.generator_binding is not None:
+                groups[gen.generator_binding] += 1
+        for n_gens in groups.values():
+            if n_gens >= 2:
+                result.add_constraints((n_gens - 1) * (self.n_y - 1), 2)
+        return result
+
+    def _capacity_bounds_constraints(self) -> ModelSizeEntry:
+        result = ModelSizeEntry()
+        result.add_constraints(len(self.network.capacity_bounds) * (self.n_y - 1), 2)
+        return result
+
+    def _generation_fraction_constraints(self) -> ModelSizeEntry:
+        result, network = ModelSizeEntry(), self.network
+
+        def _n_units(tag: str) -> int:
+            return sum(
+                tag in unit.tags or tag in self._unit_type_tags(unit)
+                for unit in [*network.generators.values(), *network.storages.values()]
+            )
+
+        for gf in network.generation_fractions.values():
+            n_terms = _n_units(gf.tag) + _n_units(gf.sub_tag)
+            for series in (gf.min_generation_fraction, gf.max_generation_fraction):
+                n_years = np.count_nonzero(~np.isnan(self._sampled(series)))
+                if gf.fraction_type == "yearly":
+                    result.add_constraints(n_years, n_terms * self.n_h)
+                else:
+                    result.add_constraints(n_years * self.n_h, n_terms)
+        return result
+
+    def _unit_type_tags(self, unit: Generator | Storage) -> list[str]:
+        if isinstance(unit, Generator):
+            return self.network.generator_types[unit.energy_source_type].tags
+        return self.network.storage_types[unit.energy_source_type].tags
+
+
+def _count_variable(variable: Any) -> int:
+    if isinstance(variable, Variable):
+        return int((variable.labels != -1).sum())
+    if isinstance(variable, dict):
+        return sum(_count_variable(value) for value in variable.values())
+    return 0
+
+
+def _measure_constraints(model: Model, names: list[str]) -> ModelSizeEntry:
+    result = ModelSizeEntry()
+    for name in names:
+        constraint = model.constraints[name]
+        result.n_constraints += int((constraint.labels != -1).sum())
+        result.n_nonzeros += int((constraint.vars != -1).sum())
+    return result
+
+
+def measure_model_size(input_data: OptimizationInputData) -> ModelSizeReport:
+    """
+    Instrumented build - builds the linopy model step by step the same way as
+    LinopyOptimizationModel.build does and measures the size of each variable group
+    and each constraint builder. Used to calibrate ModelSizeEstimator.
+
+    Args:
+        - input_data (OptimizationInputData): network and optimization configuration
+
+    Returns:
+        - ModelSizeReport: measured size per variable group and per constraint builder
+    """
+    indices = Indices(input_data.network, input_data.config)
+    model = Model()
+    parameters = OptimizationParameters(input_data.network, indices, input_data.config)
+    variables = OptimizationVariables(
+        model, input_data.network, indices, input_data.config
+    )
+    report = ModelSizeReport()
+    for group in vars(variables).values():
+        report.variables[type(group).__name__] = ModelSizeEntry(
+            n_variables=sum(_count_variable(var) for var in vars(group).values())
+        )
+    for builder in LinopyOptimizationModel._constraint_builders:
+        existing_names = set(model.constraints)
+        builder(indices, parameters, variables, model).build_constraints()
+        report.constraints[builder.__name__] = _measure_constraints(
+            model, [name for name in model.constraints if name not in existing_names]
+        )
+    return report
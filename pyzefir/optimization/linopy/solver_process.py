@@ -0,0 +1,392 @@
+# PyZefir
+# Copyright (C) 2024 Narodowe Centrum Badań Jądrowych
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import json
+import logging
+import os
+import subprocess
+import sys
+import threading
+import time
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any, Sequence
+
+import numpy as np
+import xarray as xr
+from linopy import Model, solvers
+
+_logger = logging.getLogger(__name__)
+
+_KILL_GRACE = 60.0
+""" time [s] given to the solver to stop after the time limit, before the process is killed """
+_TERMINATE_TIMEOUT = 10.0
+""" time [s] given to a terminated process to exit, before it is killed """
+_POLL_INTERVAL = 0.1
+""" interval [s] of checking the state of running processes """
+
+_LIMIT_OPTIONS = {
+    "gurobi": ("Threads", "TimeLimit"),
+    "highs": ("threads", "time_limit"),
+    "cplex": ("threads", "timelimit"),
+    "glpk": (None, "tmlim"),
+}
+""" solver -> names of the thread and time limit options (None if the limit is not supported) """
+
+
+class SolverProcessError(Exception):
+    pass
+
+
+def limit_options(
+    solver_name: str, threads: int | None, time_limit: float | None
+) -> dict[str, Any]:
+    """
+    Solver options setting number of threads and time limit of given solver.
+
+    Args:
+        - solver_name (str): name of the solver
+        - threads (int | None): number of threads used by the solver (no limit if not given)
+        - time_limit (float | None): time limit of the solve [s] (no limit if not given)
+
+    Returns:
+        - dict[str, Any]: options of the solver, limits not supported by the solver are skipped
+    """
+    threads_option, time_option = _LIMIT_OPTIONS.get(solver_name, (None, None))
+    options: dict[str, Any] = {}
+    for option, value in [(threads_option, threads), (time_option, time_limit)]:
+        if value is None:
+            continue
+        if option is None:
+            _logger.warning(
+                "Solver %s does not support given limit, it is ignored", solver_name
+            )
+            continue
+        options[option] = int(value) if solver_name == "glpk" else value
+    return options
+
+
+def run_path(path: Path | None, name: str) -> Path | None:
+    """Path with run name added to the file name, so concurrent runs do not overwrite each other."""
+    if path is None:
+        return None
+    return path.with_name(f"{path.stem}_{name}{path.suffix}")
+
+
+@dataclass
+class SolverRun:
+    """Configuration of the solver executed in a child process."""
+
+    name: str
+    """ name of the run used in logs (e.g. name of the solver settings section) """
+    solver_name: str
+    """ name of the solver """
+    options: dict[str, Any] = field(default_factory=dict)
+    """ options of the solver """
+    log_fn: Path | None = None
+    """ path of the solver log file """
+    solution_fn: Path | None = None
+    """ path of the solution file """
+    warmstart_fn: Path | None = None
+    """ path of the warm start file """
+
+
+class SolverProcessRunner:
+    """
+    Solves the linopy model in child processes. The model is written to a problem file (MPS written by HiGHS,
+    so columns keep the order of the direct interface, or LP if HiGHS is not installed), each child process
+    passes the file to the solver with given solver configuration and writes solution and duals indexed by
+    variable and constraint labels. Output of the children is forwarded to the logger, so solver logs appear in
+    the logs of the parent. Crash of the solver (or exceeded memory limit) does not stop the parent, the model
+    is left unsolved. If several runs are given, they are executed concurrently and the first optimal result
+    is kept (remaining runs are terminated).
+    """
+
+    def __init__(
+        self,
+        model: Model,
+        work_dir: Path,
+        memory_limit: float | None = None,
+        time_limit: float | None = None,
+    ) -> None:
+        """
+        Initializes a new instance of the class.
+
+        Args:
+            - model (Model): linopy model to solve
+            - work_dir (Path): directory of the problem and result files exchanged with child processes
+            - memory_limit (float | None): limit of the address space of each child process [MiB]
+                (no limit if not given)
+            - time_limit (float | None): time limit of the solver [s], child processes are killed if they
+                do not stop within a grace period after the limit (no limit if not given)
+        """
+        self._model = model
+        self._work_dir = work_dir
+        self._memory_limit = memory_limit
+        self._time_limit = time_limit
+
+    def solve(self, runs: Sequence[SolverRun]) -> SolverRun | None:
+        """
+        Solves the model with given runs and stores the kept result in the model (objective value, status,
+        termination condition, solutions and duals).
+
+        Args:
+            - runs (Sequence[SolverRun]): solver configurations executed concurrently
+
+        Returns:
+            - SolverRun | None: run which result is kept, None if no run returned a result
+
+        Raises:
+            - SolverProcessError: if no runs are given
+        """
+        if not runs:
+            raise SolverProcessError("at least one solver run must be given")
+        problem_fn = self._model.to_file(
+            self._work_dir
+            / ("model.mps" if "highs" in solvers.available_solvers else "model.lp")
+        )
+        processes = [self._start(run, i, problem_fn) for i, run in enumerate(runs)]
+        deadline = (
+            time.monotonic() + self._time_limit + _KILL_GRACE
+            if self._time_limit is not None
+            else None
+        )
+        results: list[tuple[SolverRun, dict[str, np.ndarray]]] = []
+        try:
+            self._wait(processes, results, deadline)
+        finally:
+            for _, process, reader, _ in processes:
+                _stop(process)
+                reader.join()
+        if not results:
+            self._set_failed(runs)
+            return None
+        run, result = next(
+            (item for item in results if item[1]["status"] == "ok"), results[0]
+        )
+        self._set_result(run, result)
+        return run
+
+    def _start(
+        self, run: SolverRun, number: int, problem_fn: Path
+    ) -> tuple[SolverRun, subprocess.Popen, threading.Thread, Path]:
+        """Starts the child process of the run and the thread forwarding its output."""
+        task_fn = self._work_dir / f"task_{number}.json"
+        result_fn = self._work_dir / f"result_{number}.npz"
+        task = {k: str(v) if isinstance(v, Path) else v for k, v in asdict(run).items()}
+        task |= dict(
+            problem_fn=str(problem_fn),
+            result_fn=str(result_fn),
+            memory_limit=self._memory_limit,
+            sense=self._model.objective.sense,
+            model_type=self._model.type,
+        )
+        task_fn.write_text(json.dumps(task))
+        process = subprocess.Popen(
+            [sys.executable, "-m", __name__, str(task_fn)],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            text=True,
+            errors="replace",
+            env=os.environ
+            | {"PYTHONUNBUFFERED": "1", "PYTHONPATH": os.pathsep.join(sys.path)},
+        )
+        reader = threading.Thread(
+            target=_forward_output, args=(process, run.name), daemon=True
+        )
+        reader.start()
+        _logger.info(
+            "Solver run %s (%s) started in process %d",
+            run.name,
+            run.solver_name,
+            process.pid,
+        )
+        return run, process, reader, result_fn
+
+    def _wait(
+        self,
+        processes: list[tuple[SolverRun, subprocess.Popen, threading.Thread, Path]],
+        results: list[tuple[SolverRun, dict[str, np.ndarray]]],
+        deadline: float | None,
+    ) -> None:
+        """Waits until the first optimal result is found, all processes exit or the deadline passes."""
+        running = list(processes)
+        while running:
+            for item in list(running):
+                run, process, _, result_fn = item
+                if (code := process.poll()) is None:
+                    continue
+                running.remove(item)
+                if code != 0 or not result_fn.is_file():
+                    _logger.error(
+                        "Solver run %s exited with code %d without result",
+                        run.name,
+                        code,
+                    )
+                    continue
+                with np.load(result_fn) as data:
+                    result = dict(data)
+                results.append((run, result))
+                _logger.info(
+                    "Solver run %s finished with status %s (%s)",
+                    run.name,
+                    result["status"],
+                    result["termination_condition"],
+                )
+                if result["status"] == "ok":
+                    return
+            if deadline is not None and time.monotonic() > deadline:
+                _logger.error(
+                    "Solver runs %s did not stop after the time limit, they are killed",
+                    [item[0].name for item in running],
+                )
+                return
+            time.sleep(_POLL_INTERVAL)
+
+    def _set_failed(self, runs: Sequence[SolverRun]) -> None:
+        """Marks the model as not solved."""
+        self._model.objective._value = np.nan
+        self._model.status = "error"
+        self._model.termination_condition = "internal_solver_error"
+        self._model.solver_name = runs[0].solver_name
+        self._model.solver_model = None
+
+    def _set_result(self, run: SolverRun, result: dict[str, np.ndarray]) -> None:
+        """
+        Stores the result of the run in the model, the same way as linopy Model.solve (values of variables
+        and duals of constraints not given in the solution are nan).
+        """
+        self._model.objective._value = float(result["objective"])
+        self._model.status = str(result["status"])
+        self._model.termination_condition = str(result["termination_condition"])
+        self._model.solver_name = run.solver_name
+        self._model.solver_model = None
+        if self._model.status != "ok":
+            return
+        primal = _dense(result["primal_labels"], result["primal"], self._model.shape[1])
+        for variable in self._model.variables.data.values():
+            variable.solution = xr.DataArray(
+                _by_labels(primal, variable.labels.values), variable.coords
+            )
+        if result["dual"].size:
+            dual = _dense(result["dual_labels"], result["dual"], self._model.shape[0])
+            for constraint in self._model.constraints.data.values():
+                constraint.dual = xr.DataArray(
+                    _by_labels(dual, constraint.labels.values),
+                    constraint.labels.coords,
+                )
+
+
+def _dense(labels: np.ndarray, values: np.ndarray, size: int) -> np.ndarray:
+    """Values indexed by labels as array of given size (nan for labels not given)."""
+    result = np.full(size, np.nan)
+    result[labels] = values
+    return result
+
+
+def _by_labels(values: np.ndarray, labels: np.ndarray) -> np.ndarray:
+    """Values indexed by labels, nan for masked labels (-1)."""
+    return np.where(labels != -1, values[labels], np.nan)
+
+
+def _forward_output(process: subprocess.Popen, name: str) -> None:
+    """Forwards lines written by the child process to the logger."""
+    assert process.stdout is not None
+    for line in process.stdout:
+        if line := line.rstrip():
+            _logger.info("[%s] %s", name, line)
+
+
+def _stop(process: subprocess.Popen) -> None:
+    """Terminates the process if it is still running (and kills it if it does not exit)."""
+    if process.poll() is not None:
+        return
+    process.terminate()
+    try:
+        process.wait(_TERMINATE_TIMEOUT)
+    except subprocess.TimeoutExpired:
+        process.kill()
+        process.wait()
+
+
+def _set_memory_limit(memory_limit: float) -> None:
+    """Limits the address space of the current process (available only on POSIX systems)."""
+    try:
+        import resource
+    except ImportError:
+        _logger.warning("Memory limit is not supported on this system, it is ignored")
+        return
+    limit = int(memory_limit * 2**20)
+    resource.setrlimit(resource.RLIMIT_AS, (limit, limit))
+
+
+class _ProblemFile:
+    """
+    Model stored in the problem file. Linopy solver functions reading the problem from a file use only
+    the following attributes of the model.
+    """
+
+    def __init__(self, path: Path, sense: str, model_type: str) -> None:
+        self.path = path
+        self.sense = sense
+        self.objective = SimpleNamespace(sense=sense)
+        self.type = model_type
+        self.solver_dir = path.parent
+
+    def to_file(self, fn: Path | None, io_api: str | None = None) -> Path:
+        """Problem is already written, so the path of the file is returned."""
+        return self.path
+
+
+def _path(path: str | None) -> Path | None:
+    """Path of the task (paths are stored as strings in the task file)."""
+    return Path(path) if path is not None else None
+
+
+def _solve_task(task: dict[str, Any]) -> None:
+    """Solves the problem of the task and writes solution and duals indexed by labels."""
+    if task["memory_limit"] is not None:
+        _set_memory_limit(task["memory_limit"])
+    problem_fn = Path(task["problem_fn"])
+    _logger.info("Solve problem using %s solver", task["solver_name"])
+    result = getattr(solvers, f"run_{task['solver_name']}")(
+        _ProblemFile(problem_fn, task["sense"], task["model_type"]),
+        io_api=problem_fn.suffix[1:],
+        problem_fn=problem_fn,
+        solution_fn=_path(task["solution_fn"]),
+        log_fn=_path(task["log_fn"]),
+        warmstart_fn=_path(task["warmstart_fn"]),
+        keep_files=True,
+        **task["options"],
+    )
+    result.info()
+    solution = result.solution
+    np.savez(
+        task["result_fn"],
+        objective=np.float64(solution.objective),
+        status=np.str_(result.status.status.value),
+        termination_condition=np.str_(result.status.termination_condition.value),
+        primal_labels=solution.primal.index.to_numpy(dtype=np.int64),
+        primal=solution.primal.to_numpy(dtype=float),
+        dual_labels=solution.dual.index.to_numpy(dtype=np.int64),
+        dual=solution.dual.to_numpy(dtype=float),
+    )
+
+
+if __name__ == "__main__":
+    logging.basicConfig(stream=sys.stdout, level=logging.INFO, format="%(message)s")
+    _solve_task(json.loads(Path(sys.argv[1]).read_text()))
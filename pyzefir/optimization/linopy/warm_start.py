@@ -0,0 +1,250 @@
+# PyZefir
+# Copyright (C) 2024 Narodowe Centrum Badań Jądrowych
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import logging
+from pathlib import Path
+from typing import TextIO
+
+import numpy as np
+import pandas as pd
+import xarray as xr
+from linopy import Model, Variable
+
+from pyzefir.optimization.fixed_investments import FixedInvestments
+from pyzefir.optimization.linopy.preprocessing.indices import IndexingSet, Indices
+from pyzefir.optimization.linopy.preprocessing.opt_variables import (
+    OptimizationVariables,
+)
+from pyzefir.optimization.solution_snapshot import SnapshotVariable, SolutionSnapshot
+
+_logger = logging.getLogger(__name__)
+
+
+def _frame_values(
+    df: pd.DataFrame, elements: IndexingSet, years: IndexingSet
+) -> np.ndarray:
+    """
+    Values of the frame (index - years, columns - element names) as array (elements x years), nan for
+    elements and years not found in the frame (elements of the frame not found in the indexing set are
+    ignored).
+    """
+    result = np.full((len(elements), len(years)), np.nan)
+    if df.empty:
+        return result
+    element_ords = elements.get_ords(df.columns, strict=False)
+    year_ords = years.get_ords(df.index, strict=False)
+    found_elements, found_years = element_ords >= 0, year_ords >= 0
+    result[np.ix_(element_ords[found_elements], year_ords[found_years])] = df.to_numpy(
+        dtype=float
+    )[np.ix_(found_years, found_elements)].T
+    return result
+
+
+def investments_start_values(
+    investments: FixedInvestments, indices: Indices, variables: OptimizationVariables
+) -> dict[str, np.ndarray]:
+    """
+    Starting values of capacity and fraction variables given by capacities and fractions of a previous run.
+    Values are mapped by element names, units and aggregated consumers which are not present in the
+    investments have no starting value and the ones not present in the model are ignored.
+
+    Args:
+        - investments (FixedInvestments): capacities and fractions of a previous run
+        - indices (Indices): indices of the model
+        - variables (OptimizationVariables): variables of the model
+
+    Returns:
+        - dict[str, np.ndarray]: variable name -> starting values (nan if not given)
+    """
+    fractions = np.full((len(indices.AGGR), len(indices.LBS), len(indices.Y)), np.nan)
+    aggr_ords = indices.AGGR.get_ords(list(investments.fractions), strict=False)
+    for aggr_ord, df in zip(aggr_ords, investments.fractions.values()):
+        if aggr_ord >= 0:
+            fractions[aggr_ord] = _frame_values(df, indices.LBS, indices.Y)
+    values = {
+        variables.gen.cap.name: _frame_values(
+            investments.generator_capacity, indices.GEN, indices.Y
+        ),
+        variables.stor.cap.name: _frame_values(
+            investments.storage_capacity, indices.STOR, indices.Y
+        ),
+        variables.frac.fraction.name: fractions,
+    }
+    _logger.info(
+        "Warm start found for %d of %d generators, %d of %d storages and %d of %d aggregated consumers",
+        (~np.isnan(values[variables.gen.cap.name]).all(axis=1)).sum(),
+        len(indices.GEN),
+        (~np.isnan(values[variables.stor.cap.name]).all(axis=1)).sum(),
+        len(indices.STOR),
+        (aggr_ords >= 0).sum(),
+        len(indices.AGGR),
+    )
+    return values
+
+
+def _aligned(solution: xr.DataArray, labels: xr.DataArray) -> np.ndarray | None:
+    """
+    Solution aligned with coordinates of the variable labels (nan for coordinates not found in the solution),
+    None if dimensions of the solution are different. Dimensions without coordinates of names or numbers
+    (e.g. stacked dimensions) are not aligned, they have to be the same in the solution and the variable.
+    """
+    if set(solution.dims) != set(labels.dims):
+        return None
+    values = np.asarray(solution.transpose(*labels.dims).values, dtype=float)
+    for axis, dim in enumerate(labels.dims):
+        if (
+            dim not in solution.coords
+            or dim not in labels.coords
+            or solution[dim].dtype.kind not in "iuOU"
+        ):
+            if solution.sizes[dim] != labels.sizes[dim] or not np.array_equal(
+                solution[dim].values, labels[dim].values
+            ):
+                return None
+            continue
+        if not solution.sizes[dim]:
+            return np.full(labels.shape, np.nan)
+        ords = IndexingSet(solution[dim].values).get_ords(
+            labels[dim].values, strict=False
+        )
+        values = np.take(values, ords.clip(min=0), axis=axis)
+        shape = [1] * values.ndim
+        shape[axis] = len(ords)
+        values = np.where((ords >= 0).reshape(shape), values, np.nan)
+    return values
+
+
+def snapshot_start_values(
+    snapshot: SolutionSnapshot, variables: OptimizationVariables
+) -> dict[str, np.ndarray]:
+    """
+    Starting values of the variables given by the solution snapshot of a previous run. Solutions are
+    mapped by coordinates (element names, hours and years), so elements added to the model have no
+    starting value and removed ones are ignored. Variables stored in nested dictionaries are skipped.
+
+    Args:
+        - snapshot (SolutionSnapshot): solution snapshot of a previous run
+        - variables (OptimizationVariables): variables of the model
+
+    Returns:
+        - dict[str, np.ndarray]: variable name -> starting values (nan if not given)
+    """
+    values = {}
+    for group_name, group in vars(variables).items():
+        stored_group = snapshot.variables.get(group_name, {})
+        for attr_name, variable in vars(group).items():
+            stored = stored_group.get(attr_name)
+            if not isinstance(variable, Variable) or not isinstance(
+                stored, SnapshotVariable
+            ):
+                continue
+            aligned = _aligned(stored.solution, variable.labels)
+            if aligned is not None:
+                values[variable.name] = aligned
+    _logger.info("Warm start found for %d variables of the snapshot", len(values))
+    return values
+
+
+def start_vector(
+    model: Model,
+    values: dict[str, np.ndarray],
+    column_factors: dict[str, float] | None = None,
+) -> np.ndarray:
+    """
+    Starting values of the model variables indexed by variable label (nan if not given). Values are
+    clipped to bounds of the variables and rounded for binary and integer variables.
+
+    Args:
+        - model (Model): linopy model
+        - values (dict[str, np.ndarray]): variable name -> starting values with the shape of the variable
+            (nan if not given)
+        - column_factors (dict[str, float] | None): column factors of the scaled model (see ModelScaler),
+            starting values are divided by the factors
+
+    Returns:
+        - np.ndarray: starting values of all variables of the model
+    """
+    result = np.full(model.shape[1], np.nan)
+    for name, value in values.items():
+        variable = model.variables[name]
+        labels = variable.labels.values
+        mask = labels != -1
+        factor = (column_factors or {}).get(name, 1.0)
+        value = np.clip(
+            np.asarray(value, dtype=float) / factor,
+            variable.lower.values,
+            variable.upper.values,
+        )
+        if variable.attrs["binary"] or variable.attrs["integer"]:
+            value = np.round(value)
+        result[labels[mask]] = value[mask]
+    return result
+
+
+def write_warm_start(
+    model: Model, start: np.ndarray, solver_name: str, path: Path
+) -> Path | None:
+    """
+    Writes starting values in the format read by the solver (linopy warmstart_fn). Gurobi reads
+    the start of given variables (.mst file) and completes it, HiGHS requires values of all columns
+    in the order of the columns of the direct interface (.sol file), so variables without starting
+    value are set to the bound closest to zero.
+
+    Args:
+        - model (Model): linopy model
+        - start (np.ndarray): starting values indexed by variable label, nan if not given (see start_vector)
+        - solver_name (str): name of the solver
+        - path (Path): path of the file, suffix is set according to the solver
+
+    Returns:
+        - Path | None: path of the written file, None if the solver does not accept starting values
+    """
+    if solver_name == "gurobi":
+        labels = np.flatnonzero(~np.isnan(start))
+        path = path.with_suffix(".mst")
+        with open(path, "w") as file:
+            file.write("# MIP start\n")
+            _write_columns(file, labels, start[labels])
+    elif solver_name == "highs":
+        labels = model.matrices.vlabels
+        values = np.clip(0.0, model.matrices.lb, model.matrices.ub)
+        known = labels != -1
+        known[known] = ~np.isnan(start[labels[known]])
+        values[known] = start[labels[known]]
+        path = path.with_suffix(".sol")
+        with open(path, "w") as file:
+            file.write("Model status\nUnknown\n\n# Primal solution values\nFeasible\n")
+            file.write(f"Objective 0\n# Columns {len(labels)}\n")
+            _write_columns(file, labels, values)
+            file.write("# Rows 0\n")
+    else:
+        _logger.warning(
+            "Solver %s does not accept warm start, it is ignored", solver_name
+        )
+        return None
+    _logger.info(
+        "Warm start of %d variables written to %s",
+        int((~np.isnan(start)).sum()),
+        path,
+    )
+    return path
+
+
+def _write_columns(file: TextIO, labels: np.ndarray, values: np.ndarray) -> None:
+    """Writes lines 'x<label> <value>' (names of the columns used by linopy)."""
+    pd.DataFrame(
+        {"name": "x" + labels.astype(str).astype(object), "value": values}
+    ).to_csv(file, sep=" ", header=False, index=False, float_format="%.17g")
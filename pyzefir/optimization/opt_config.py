@@ -1,11 +1,17 @@
+import copy
 import logging
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 import numpy as np
 from numpy import arange, diff, ndarray, zeros
 from numpy.random import choice
 
+from pyzefir.optimization.fixed_investments import FixedInvestments
+
+if TYPE_CHECKING:
+    from pyzefir.optimization.solution_snapshot import SolutionSnapshot
+
 _logger = logging.getLogger(__name__)
 
 
@@ -38,6 +44,19 @@ class OptConfig:
         solver_settings: dict[str, dict[str, Any]] | None = None,
         generator_capacity_cost: str = "brutto",
         year_aggregates: ndarray | None = None,
+        auto_scaling: bool = False,
+        variable_reduction: bool = False,
+        fixed_investments: FixedInvestments | None = None,
+        dual_families: tuple[str, ...] = (),
+        objective_breakdown: bool = False,
+        objective_breakdown_per_unit: bool = False,
+        float32_demand: bool = False,
+        warm_start: "FixedInvestments | SolutionSnapshot | None" = None,
+        solver_process: bool = False,
+        solver_memory_limit: float | None = None,
+        solver_threads: int | None = None,
+        solver_time_limit: float | None = None,
+        solver_race: tuple[str, ...] = (),
     ):
         self.hours: ndarray = hours if isinstance(hours, ndarray) else arange(hours)
         """ sequence of all hours in a year """
@@ -63,6 +82,8 @@ class OptConfig:
         """ numeric scale parameter """
         self.ens = ens
         """ use ens associated with buses if not balanced """
+        self.use_hourly_scale: bool = use_hourly_scale
+        """ if True, costs of sampled hours are scaled to the whole year """
         self.hourly_scale: float = (
             len(self.hours) / len(self.hour_sample) if use_hourly_scale else 1.0
         )
@@ -78,6 +99,36 @@ class OptConfig:
         """ generator capacity cost parameter, netto as default"""
         self.year_aggregates: ndarray | None = year_aggregates
         """ aggregation of years """
+        self.auto_scaling: bool = auto_scaling
+        """ scale rows, columns and objective of the model automatically before solving """
+        self.variable_reduction: bool = variable_reduction
+        """ do not pass provably zero variables and trivial constraints to the solver """
+        self.fixed_investments: FixedInvestments | None = fixed_investments
+        """ capacities and fractions of a previous run, if given only dispatch is optimized """
+        self.dual_families: tuple[str, ...] = dual_families
+        """ constraint families which duals are extracted after the solve (e.g. balancing, emissions) """
+        self.objective_breakdown: bool = (
+            objective_breakdown or objective_breakdown_per_unit
+        )
+        """ if True, objective components are evaluated per year after the solve """
+        self.objective_breakdown_per_unit: bool = objective_breakdown_per_unit
+        """ if True, objective components are evaluated per year and per unit after the solve """
+        self.float32_demand: bool = float32_demand
+        """ if True, demand of aggregated consumers is stored in single precision """
+        self.warm_start: FixedInvestments | SolutionSnapshot | None = warm_start
+        """ capacities and fractions or solution snapshot of a previous run passed to the solver as starting
+        values of the variables (MIP start), values are mapped by element names """
+        self.solver_process: bool = solver_process or bool(solver_race)
+        """ if True, the solver is executed in a child process """
+        self.solver_memory_limit: float | None = solver_memory_limit
+        """ memory limit of the solver process [MiB] (only if the solver is executed in a child process) """
+        self.solver_threads: int | None = solver_threads
+        """ number of threads used by the solver (by each solver if solvers are raced) """
+        self.solver_time_limit: float | None = solver_time_limit
+        """ time limit of the solver [s] """
+        self.solver_race: tuple[str, ...] = solver_race
+        """ names of solver settings (solver or solver.variant keys of solver_settings) solved concurrently in
+        child processes, the first optimal result is kept """
         self.validate()
 
     def validate(self) -> None:
@@ -88,6 +139,7 @@ class OptConfig:
             - validate ens type
             - validate if money_scale is >= 1
             - validate if year_sample is consecutive
+            - validate if solver limits are positive (memory limit only with the solver process)
         """
         exception_list: list[OptConfigError] = []
         if (
@@ -125,6 +177,26 @@ class OptConfig:
                 OptConfigError("generator capacity cost should be 'brutto' or 'netto'")
             )
 
+        if self.solver_memory_limit is not None and not self.solver_process:
+            exception_list.append(
+                OptConfigError(
+                    "solver memory limit can be set only if the solver is executed in a child process"
+                )
+            )
+        if any(
+            limit is not None and limit <= 0
+            for limit in [
+                self.solver_memory_limit,
+                self.solver_threads,
+                self.solver_time_limit,
+            ]
+        ):
+            exception_list.append(
+                OptConfigError(
+                    "solver memory, threads and time limits must be positive"
+                )
+            )
+
         if exception_list:
             _logger.exception(
                 "Got error in optimization configuration: %s", exception_list
@@ -132,6 +204,23 @@ class OptConfig:
             raise OptConfigErrorGroup("Errors in configuration: ", exception_list)
         _logger.info("Optimalization configuration validation: OK")
 
+    def with_hour_sample(self, hour_sample: ndarray) -> "OptConfig":
+        """
+        Copy of the config with given hour sample (hourly scale is adjusted to the sample).
+
+        Args:
+            - hour_sample (ndarray): sample of hours used in the model
+
+        Returns:
+            - OptConfig: config with given hour sample
+        """
+        config = copy.copy(self)
+        config.hour_sample = hour_sample
+        config.hourly_scale = (
+            len(self.hours) / len(hour_sample) if self.use_hourly_scale else 1.0
+        )
+        return config
+
     @staticmethod
     def get_sample(
         idx: ndarray, sample: int | ndarray | None, use_arange: bool = False
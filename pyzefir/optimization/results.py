@@ -15,8 +15,9 @@
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
 import abc
-from dataclasses import InitVar, dataclass, field
-from typing import Final, Literal
+from dataclasses import dataclass, field, fields
+from functools import cached_property
+from typing import Any, Callable, Collection, Final, Literal, get_type_hints
 
 import numpy as np
 import pandas as pd
@@ -24,15 +25,27 @@ import xarray as xr
 from bidict import bidict
 from linopy import Variable
 
+from pyzefir.optimization.export_selection import (
+    HOUR_LABEL,
+    ExportSelection,
+    empty_exportable_group,
+    empty_exportable_value,
+)
 from pyzefir.optimization.exportable_results import (
     ExportableBusResults,
+    ExportableDualResults,
+    ExportableFieldGetters,
     ExportableFractionsResults,
     ExportableGeneratorsResults,
     ExportableLinesResults,
+    ExportableObjectiveResults,
     ExportableResults,
     ExportableResultsGroup,
     ExportableStorageResults,
+    LazyExportableResults,
+    TExportableResultsGroup,
 )
+from pyzefir.optimization.linopy.duals import BALANCING_FAMILY, EMISSIONS_FAMILY
 from pyzefir.optimization.linopy.expression_handler import ExpressionHandler
 from pyzefir.optimization.linopy.objective_builder.capex_objective_builder import (
     CapexObjectiveBuilder,
@@ -89,12 +102,13 @@ from pyzefir.optimization.linopy.utils import (
 )
 from pyzefir.utils.functions import get_dict_vals
 
-HOUR_LABEL: Final[str] = "Hour"
 YEAR_LABEL: Final[str] = "Year"
 GENERATOR_LABEL: Final[str] = "Generator"
 LBS_LABEL: Final[str] = "Local Balancing Stack"
 STORAGE_LABEL: Final[str] = "Storage"
 ENERGY_TYPE_LABEL: Final[str] = "Energy Type"
+EMISSION_TYPE_LABEL: Final[str] = "Emission Type"
+COMPONENT_LABEL: Final[str] = "Component"
 
 
 class ResultsGroup(abc.ABC):
@@ -187,7 +201,7 @@ class ResultsGroup(abc.ABC):
         """
         Converts a dictionary of 2D Pandas DataFrames into a new dictionary with named axes.
 
-        This method ensures that each DataFrame in the dictionary has more than one column,
+        This method ensures that each DataFrame in the dictionary is 2D (years in columns),
         assigning the specified index and column names to the resulting DataFrames.
 
         Args:
@@ -207,7 +221,7 @@ class ResultsGroup(abc.ABC):
             >>> processed_data = self.dict_of_2d_array_to_pandas(data_dict)
         """
         for key in data:
-            if len(data[key].shape) != 2 or data[key].shape[1] == 1:
+            if len(data[key].shape) != 2:
                 raise ValueError(
                     f"Only 2d Pandas DataFrame can be used."
                     f" Please check value for {key}"
@@ -257,9 +271,45 @@ class ResultsGroup(abc.ABC):
         return ret
 
     @abc.abstractmethod
-    def to_exportable(self) -> ExportableResultsGroup:
+    def field_getters(self) -> dict[str, Callable[[], Any]]:
+        """Functions computing exportable fields of the group (field name -> function)."""
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def to_exportable(
+        self, fields: Collection[str] | None = None
+    ) -> ExportableResultsGroup:
         raise NotImplementedError
 
+    @staticmethod
+    def _exportable(
+        exportable_type: type[TExportableResultsGroup],
+        getters: dict[str, Callable[[], Any]],
+        selected_fields: Collection[str] | None,
+    ) -> TExportableResultsGroup:
+        """
+        Creates exportable results group computing only the selected fields, remaining fields are empty.
+
+        Args:
+            - exportable_type (type[TExportableResultsGroup]): type of the created group
+            - getters (dict[str, Callable[[], Any]]): field name -> function computing its value
+            - selected_fields (Collection[str] | None): names of computed fields, all if None
+
+        Returns:
+            - TExportableResultsGroup: exportable results group
+        """
+        return exportable_type(
+            **{
+                exportable_field.name: (
+                    getters[exportable_field.name]()
+                    if selected_fields is None
+                    or exportable_field.name in selected_fields
+                    else empty_exportable_value(exportable_field.type)
+                )
+                for exportable_field in fields(exportable_type)
+            }
+        )
+
     @staticmethod
     def global_capex_per_unit_per_year(
         capex: np.ndarray,
@@ -506,153 +556,158 @@ class GeneratorsResults(ResultsGroup):
     within energy system models.
     """
 
-    variable_group: InitVar[GeneratorVariables]
-    """Initial value hint for the GeneratorVariables object"""
-    tvariable_group: InitVar[GeneratorTypeVariables]
-    """Initial value hint for the GeneratorTypeVariables object"""
-    tparameters: InitVar[GeneratorTypeParameters]
-    """ Initial value hint for the GeneratorTypeParameters object """
-    parameters: InitVar[GeneratorParameters]
-    """ Initial value hint for the GeneratorParameters object """
-    bus_parameters: InitVar[BusParameters]
-    """ Initial value hint for the BusParameters object """
-    scenario_parameters: InitVar[ScenarioParameters]
-    """ Initial value hint for the ScenarioParameters object """
-    indices: InitVar[Indices]
-    """Initial value hint for the Indices object"""
-
-    gen: dict[str, pd.DataFrame] = field(init=False)
-    """ generation (exportable) """
-    gen_et: dict[str, dict[str, pd.DataFrame]] = field(init=False)
-    """ generation per energy type (exportable) """
-    gen_dch: dict[str, dict[str, pd.DataFrame]] = field(init=False)
-    """ generation per energy type for demand chunks (non-exportable) """
-    gen_reserve_et: dict[str, dict[str, dict[str, pd.DataFrame]]] = field(init=False)
-    """ generation for reserves """
-    dump_et: dict[str, dict[str, pd.DataFrame]] = field(init=False)
-    """ dumped energy per energy type (exportable) """
-    cap: dict[str, pd.DataFrame] = field(init=False)
-    """ capacity (exportable) """
-    cap_plus: dict[str, pd.DataFrame] = field(init=False)
-    """ capacity increase (non-exportable) """
-    cap_minus: dict[str, pd.DataFrame] = field(init=False)
-    """ capacity decrease (non-exportable) """
-    cap_base_minus: dict[str, pd.DataFrame] = field(init=False)
-    """ base capacity decrease (non-exportable) """
-    global_capex: dict[str, pd.DataFrame] = field(init=False)
-    """ capex of global technologies (exportable) """
-    local_capex: dict[str, pd.DataFrame] = field(init=False)
-    """ capex of local (in lbs) technologies (exportable) """
-
-    def __post_init__(
-        self,
-        variable_group: GeneratorVariables,
-        tvariable_group: GeneratorTypeVariables,
-        tparameters: GeneratorTypeParameters,
-        parameters: GeneratorParameters,
-        bus_parameters: BusParameters,
-        scenario_parameters: ScenarioParameters,
-        indices: Indices,
-    ) -> None:
-        self.gen = self.process_gen(variable_group)
-        self.gen_et = self.process_h_y_var(variable_group.gen_et, indices)
-        self.dump_et = self.process_h_y_var(variable_group.dump_et, indices)
-        self.gen_dch = process_gen_dch(variable_group.gen_dch, indices, "gen")
-        self.gen_reserve_et = process_gen_reserve_et(
-            variable_group.gen_reserve_et,
-            indices,
-        )
-        self.cap = self.process_cap(variable_group)
-        self.cap_plus = self.fetch_d_dataframe(
+    variable_group: GeneratorVariables = field(repr=False, compare=False)
+    """ GeneratorVariables object """
+    tvariable_group: GeneratorTypeVariables = field(repr=False, compare=False)
+    """ GeneratorTypeVariables object """
+    tparameters: GeneratorTypeParameters = field(repr=False, compare=False)
+    """ GeneratorTypeParameters object """
+    parameters: GeneratorParameters = field(repr=False, compare=False)
+    """ GeneratorParameters object """
+    bus_parameters: BusParameters = field(repr=False, compare=False)
+    """ BusParameters object """
+    scenario_parameters: ScenarioParameters = field(repr=False, compare=False)
+    """ ScenarioParameters object """
+    indices: Indices = field(repr=False, compare=False)
+    """ Indices object """
+
+    @cached_property
+    def gen(self) -> dict[str, pd.DataFrame]:
+        """generation (exportable)"""
+        return self.process_gen(self.variable_group)
+
+    @cached_property
+    def gen_et(self) -> dict[str, dict[str, pd.DataFrame]]:
+        """generation per energy type (exportable)"""
+        return self.process_h_y_var(self.variable_group.gen_et, self.indices)
+
+    @cached_property
+    def dump_et(self) -> dict[str, dict[str, pd.DataFrame]]:
+        """dumped energy per energy type (exportable)"""
+        return self.process_h_y_var(self.variable_group.dump_et, self.indices)
+
+    @cached_property
+    def gen_dch(self) -> dict[str, dict[str, pd.DataFrame]]:
+        """generation per energy type for demand chunks (non-exportable)"""
+        return process_gen_dch(self.variable_group.gen_dch, self.indices, "gen")
+
+    @cached_property
+    def gen_reserve_et(self) -> dict[str, dict[str, dict[str, pd.DataFrame]]]:
+        """generation for reserves"""
+        return process_gen_reserve_et(self.variable_group.gen_reserve_et, self.indices)
+
+    @cached_property
+    def cap(self) -> dict[str, pd.DataFrame]:
+        """capacity (exportable)"""
+        return self.process_cap(self.variable_group)
+
+    @cached_property
+    def cap_plus(self) -> dict[str, pd.DataFrame]:
+        """capacity increase (non-exportable)"""
+        return self.fetch_d_dataframe(
             dimension=1,
-            index=indices.GEN,
-            variable=variable_group.cap_plus.solution.to_dataframe(),
-            row_index=indices.Y,
-            column_index=indices.Y,
-            filter_map=indices.aggr_gen_map,
-        )
-        self.cap_minus = self.fetch_d_dataframe(
-            dimension=2,
-            index=indices.GEN,
-            variable=variable_group.cap_minus.solution.to_dataframe(),
-            row_index=indices.Y,
-            column_index=indices.Y,
-            filter_map=indices.aggr_gen_map,
+            index=self.indices.GEN,
+            variable=self.variable_group.cap_plus.solution.to_dataframe(),
+            row_index=self.indices.Y,
+            column_index=self.indices.Y,
+            filter_map=self.indices.aggr_gen_map,
         )
-        self.tcap_plus = self.fetch_d_tvariable(
-            dimension=1,
-            aggr_index=indices.AGGR,
-            t_index=indices.TGEN,
-            variable=tvariable_group.tcap_plus.solution.to_dataframe(),
-            row_index=indices.Y,
-            column_index=indices.Y,
-            index_map=indices.aggr_tgen_map,
-        )
-        self.tcap_minus = self.fetch_d_tvariable(
+
+    @cached_property
+    def cap_minus(self) -> dict[str, pd.DataFrame]:
+        """capacity decrease (non-exportable)"""
+        return self.fetch_d_dataframe(
             dimension=2,
-            aggr_index=indices.AGGR,
-            t_index=indices.TGEN,
-            variable=tvariable_group.tcap_minus.solution.to_dataframe(),
-            row_index=indices.Y,
-            index_map=indices.aggr_tgen_map,
-            column_index=indices.Y,
+            index=self.indices.GEN,
+            variable=self.variable_group.cap_minus.solution.to_dataframe(),
+            row_index=self.indices.Y,
+            column_index=self.indices.Y,
+            filter_map=self.indices.aggr_gen_map,
         )
-        self.cap_base_minus = self.fetch_d_dataframe(
-            dimension=1,
-            index=indices.GEN,
-            variable=variable_group.cap_base_minus.solution.to_dataframe(),
-            row_index=indices.Y,
-            filter_map=indices.aggr_gen_map,
-            column_index=indices.Y,
-        )
-        self.tcap = self.fetch_d_tvariable(
-            dimension=1,
-            aggr_index=indices.AGGR,
-            t_index=indices.TGEN,
-            variable=tvariable_group.tcap.solution.to_dataframe(),
-            row_index=indices.Y,
-            index_map=indices.aggr_tgen_map,
-            column_index=indices.Y,
-        )
-        self.tcap_base_minus = self.fetch_d_tvariable(
+
+    @cached_property
+    def cap_base_minus(self) -> dict[str, pd.DataFrame]:
+        """base capacity decrease (non-exportable)"""
+        return self.fetch_d_dataframe(
             dimension=1,
-            aggr_index=indices.AGGR,
-            t_index=indices.TGEN,
-            variable=tvariable_group.tcap_base_minus.solution.to_dataframe(),
-            row_index=indices.Y,
-            index_map=indices.aggr_tgen_map,
-            column_index=indices.Y,
+            index=self.indices.GEN,
+            variable=self.variable_group.cap_base_minus.solution.to_dataframe(),
+            row_index=self.indices.Y,
+            filter_map=self.indices.aggr_gen_map,
+            column_index=self.indices.Y,
         )
-        self.global_capex = self.calculate_global_capex(
-            indices=indices,
-            unit_index=indices.GEN,
-            unit_type_param=tparameters,
-            unit_type_map=parameters.tgen,
-            bus_unit_mapping=bus_parameters.generators,
-            aggr_unit_map=indices.aggr_gen_map,
-            discount_rate=scenario_parameters.discount_rate,
-            cap_plus=variable_group.cap_plus,
-            money_scale=scenario_parameters.money_scale,
+
+    @cached_property
+    def tcap(self) -> dict[str, dict[str, pd.DataFrame]]:
+        """capacity of generator types in aggregated consumers (non-exportable)"""
+        return self._fetch_tvariable(self.tvariable_group.tcap, dimension=1)
+
+    @cached_property
+    def tcap_plus(self) -> dict[str, dict[str, pd.DataFrame]]:
+        """capacity increase of generator types in aggregated consumers (non-exportable)"""
+        return self._fetch_tvariable(self.tvariable_group.tcap_plus, dimension=1)
+
+    @cached_property
+    def tcap_minus(self) -> dict[str, dict[str, pd.DataFrame]]:
+        """capacity decrease of generator types in aggregated consumers (non-exportable)"""
+        return self._fetch_tvariable(self.tvariable_group.tcap_minus, dimension=2)
+
+    @cached_property
+    def tcap_base_minus(self) -> dict[str, dict[str, pd.DataFrame]]:
+        """base capacity decrease of generator types in aggregated consumers (non-exportable)"""
+        return self._fetch_tvariable(self.tvariable_group.tcap_base_minus, dimension=1)
+
+    @cached_property
+    def global_capex(self) -> dict[str, pd.DataFrame]:
+        """capex of global technologies (exportable)"""
+        return self.calculate_global_capex(
+            indices=self.indices,
+            unit_index=self.indices.GEN,
+            unit_type_param=self.tparameters,
+            unit_type_map=self.parameters.tgen,
+            bus_unit_mapping=self.bus_parameters.generators,
+            aggr_unit_map=self.indices.aggr_gen_map,
+            discount_rate=self.scenario_parameters.discount_rate,
+            cap_plus=self.variable_group.cap_plus,
+            money_scale=self.scenario_parameters.money_scale,
             multipliers=get_generator_types_capacity_multipliers(
-                scenario_parameters.generator_capacity_cost,
-                tparameters,
+                self.scenario_parameters.generator_capacity_cost,
+                self.tparameters,
             ),
         )
-        self.local_capex = self.calculate_local_capex(
-            indices=indices,
-            unit_type_param=tparameters,
-            unit_type_map=parameters.tgen,
-            aggr_unit_map=indices.aggr_gen_map,
-            discount_rate=scenario_parameters.discount_rate,
-            tcap_plus=tvariable_group.tcap_plus,
-            money_scale=scenario_parameters.money_scale,
-            gen_mapping=indices.TGEN.mapping,
+
+    @cached_property
+    def local_capex(self) -> dict[str, pd.DataFrame]:
+        """capex of local (in lbs) technologies (exportable)"""
+        return self.calculate_local_capex(
+            indices=self.indices,
+            unit_type_param=self.tparameters,
+            unit_type_map=self.parameters.tgen,
+            aggr_unit_map=self.indices.aggr_gen_map,
+            discount_rate=self.scenario_parameters.discount_rate,
+            tcap_plus=self.tvariable_group.tcap_plus,
+            money_scale=self.scenario_parameters.money_scale,
+            gen_mapping=self.indices.TGEN.mapping,
             multipliers=get_generator_types_capacity_multipliers(
-                scenario_parameters.generator_capacity_cost,
-                tparameters,
+                self.scenario_parameters.generator_capacity_cost,
+                self.tparameters,
             ),
         )
 
+    def _fetch_tvariable(
+        self, variable: Variable, dimension: int
+    ) -> dict[str, dict[str, pd.DataFrame]]:
+        """Fetches generator type variable indexed by aggregated consumers."""
+        return self.fetch_d_tvariable(
+            dimension=dimension,
+            aggr_index=self.indices.AGGR,
+            t_index=self.indices.TGEN,
+            variable=variable.solution.to_dataframe(),
+            row_index=self.indices.Y,
+            index_map=self.indices.aggr_tgen_map,
+            column_index=self.indices.Y,
+        )
+
     @staticmethod
     def process_gen(variable_group: GeneratorVariables) -> dict[str, pd.DataFrame]:
         """
@@ -837,32 +892,42 @@ class GeneratorsResults(ResultsGroup):
                 result_dict[aggr_name][t_name] = df
         return result_dict
 
-    def to_exportable(self) -> ExportableGeneratorsResults:
+    def field_getters(self) -> dict[str, Callable[[], Any]]:
+        return dict(
+            generation=lambda: self.dict_of_2d_array_to_pandas(self.gen),
+            # dump_energy=lambda: self.dict_of_2d_array_to_pandas(self.dump),
+            capacity=lambda: self.dict_of_1d_array_to_pandas(
+                self.cap, column_name=GENERATOR_LABEL
+            ),
+            generation_per_energy_type=lambda: self.dict_of_dicts_of_arrays_to_pandas(
+                self.gen_et
+            ),
+            dump_energy_per_energy_type=lambda: self.dict_of_dicts_of_arrays_to_pandas(
+                self.dump_et
+            ),
+            global_capex=lambda: self.dict_of_1d_array_to_pandas(
+                self.global_capex, column_name=GENERATOR_LABEL
+            ),
+            local_capex=lambda: self.local_capex,
+        )
+
+    def to_exportable(
+        self, fields: Collection[str] | None = None
+    ) -> ExportableGeneratorsResults:
         """
         Converts processed generator results into a format suitable for export.
 
         This method organizes the internal data structures into a coherent format, specifically
         an instance of ExportableGeneratorsResults, for reporting or further analysis.
 
+        Args:
+            - fields (Collection[str] | None): names of exported fields, all if None
+
         Returns:
             - ExportableGeneratorsResults: An object containing organized generator results ready for export.
         """
-        return ExportableGeneratorsResults(
-            generation=self.dict_of_2d_array_to_pandas(self.gen),
-            # dump_energy=self.dict_of_2d_array_to_pandas(self.dump),
-            capacity=self.dict_of_1d_array_to_pandas(
-                self.cap, column_name=GENERATOR_LABEL
-            ),
-            generation_per_energy_type=self.dict_of_dicts_of_arrays_to_pandas(
-                self.gen_et
-            ),
-            dump_energy_per_energy_type=self.dict_of_dicts_of_arrays_to_pandas(
-                self.dump_et
-            ),
-            global_capex=self.dict_of_1d_array_to_pandas(
-                self.global_capex, column_name=GENERATOR_LABEL
-            ),
-            local_capex=self.local_capex,
+        return self._exportable(
+            ExportableGeneratorsResults, self.field_getters(), fields
         )
 
 
@@ -877,133 +942,165 @@ class StoragesResults(ResultsGroup):
     analysis and reporting.
     """
 
-    variable_group: InitVar[StorageVariables]
-    """Initial value hint for the StorageVariables object"""
-    tvariable_group: InitVar[StorageTypeVariables]
-    """Initial value hint for the StorageTypeVariables object"""
-    tparameters: InitVar[StorageTypeParameters]
-    """ Initial value hint for the StorageTypeParameters object """
-    parameters: InitVar[StorageParameters]
-    """ Initial value hint for the StorageParameters object """
-    bus_parameters: InitVar[BusParameters]
-    """ Initial value hint for the BusParameters object """
-    scenario_parameters: InitVar[ScenarioParameters]
-    """ Initial value hint for the ScenarioParameters object """
-    indices: InitVar[Indices]
-    """Initial value hint for the Indices object"""
-
-    gen: dict[str, pd.DataFrame] = field(init=False)
-    """ generation (exportable) """
-    gen_dch: dict[str, dict[str, pd.DataFrame]] = field(init=False)
-    """ generation for demand chunks (non-exportable) """
-    load: dict[str, pd.DataFrame] = field(init=False)
-    """ load (exportable) """
-    soc: dict[str, pd.DataFrame] = field(init=False)
-    """ state of charge (exportable) """
-    cap: dict[str, pd.DataFrame] = field(init=False)
-    """ capacity (exportable) """
-    cap_plus: dict[str, pd.DataFrame] = field(init=False)
-    """ capacity increase (non-exportable) """
-    cap_minus: dict[str, pd.DataFrame] = field(init=False)
-    """ capacity decrease (non-exportable) """
-    cap_base_minus: dict[str, pd.DataFrame] = field(init=False)
-    """ base capacity decrease (non-exportable) """
-    global_capex: dict[str, pd.DataFrame] = field(init=False)
-    """ capex of global technologies (exportable) """
-    local_capex: dict[str, pd.DataFrame] = field(init=False)
-    """ capex of local (in lbs) technologies (exportable) """
-
-    def __post_init__(
-        self,
-        variable_group: StorageVariables,
-        tvariable_group: StorageTypeVariables,
-        tparameters: StorageTypeParameters,
-        parameters: StorageParameters,
-        bus_parameters: BusParameters,
-        scenario_parameters: ScenarioParameters,
-        indices: Indices,
-    ) -> None:
-        self.gen = calculate_storage_adjusted_generation(
-            generation_result_df=variable_group.gen.solution.to_dataframe(),
-            storages_generation_efficiency=parameters.gen_eff,
-            storages_idxs=indices.STOR.mapping,
+    variable_group: StorageVariables = field(repr=False, compare=False)
+    """ StorageVariables object """
+    tvariable_group: StorageTypeVariables = field(repr=False, compare=False)
+    """ StorageTypeVariables object """
+    tparameters: StorageTypeParameters = field(repr=False, compare=False)
+    """ StorageTypeParameters object """
+    parameters: StorageParameters = field(repr=False, compare=False)
+    """ StorageParameters object """
+    bus_parameters: BusParameters = field(repr=False, compare=False)
+    """ BusParameters object """
+    scenario_parameters: ScenarioParameters = field(repr=False, compare=False)
+    """ ScenarioParameters object """
+    indices: Indices = field(repr=False, compare=False)
+    """ Indices object """
+
+    @cached_property
+    def gen(self) -> dict[str, pd.DataFrame]:
+        """generation (exportable)"""
+        return calculate_storage_adjusted_generation(
+            generation_result_df=self.variable_group.gen.solution.to_dataframe(),
+            storages_generation_efficiency=self.parameters.gen_eff,
+            storages_idxs=self.indices.STOR.mapping,
         )
-        self.gen_dch = process_gen_dch(variable_group.gen_dch, indices, "stor")
-        self.load = {
+
+    @cached_property
+    def gen_dch(self) -> dict[str, dict[str, pd.DataFrame]]:
+        """generation for demand chunks (non-exportable)"""
+        return process_gen_dch(self.variable_group.gen_dch, self.indices, "stor")
+
+    @cached_property
+    def load(self) -> dict[str, pd.DataFrame]:
+        """load (exportable)"""
+        return {
             stor_name: df.reset_index(["stor"], drop=True)
             .unstack()
             .droplevel(0, axis=1)
-            for stor_name, df in variable_group.load.solution.to_dataframe().groupby(
+            for stor_name, df in self.variable_group.load.solution.to_dataframe().groupby(
                 "stor"
             )
         }
-        self.soc = {
+
+    @cached_property
+    def soc(self) -> dict[str, pd.DataFrame]:
+        """state of charge (exportable)"""
+        return {
             stor_name: df.reset_index(["stor"], drop=True)
             .unstack()
             .droplevel(0, axis=1)
-            for stor_name, df in variable_group.soc.solution.to_dataframe().groupby(
+            for stor_name, df in self.variable_group.soc.solution.to_dataframe().groupby(
                 "stor"
             )
         }
-        self.cap = {
+
+    @cached_property
+    def cap(self) -> dict[str, pd.DataFrame]:
+        """capacity (exportable)"""
+        return {
             stor_name: cap_df.reset_index(["stor"], drop=True).rename(
                 columns={"solution": "cap"}
             )
-            for stor_name, cap_df in variable_group.cap.solution.to_dataframe().groupby(
+            for stor_name, cap_df in self.variable_group.cap.solution.to_dataframe().groupby(
                 "stor"
             )
         }
-        self.tcap = tvariable_group.tcap.solution.to_dataframe()
-        self.tcap_plus = tvariable_group.tcap_plus.solution.to_dataframe()
-        self.cap_plus = variable_group.cap_plus.solution.to_dataframe()
-        self.cap_minus = variable_group.cap_minus.solution.to_dataframe()
-        self.tcap_minus = tvariable_group.tcap_minus.solution.to_dataframe()
-        self.cap_base_minus = variable_group.cap_base_minus.solution.to_dataframe()
-        self.tcap_base_minus = tvariable_group.tcap_base_minus.solution.to_dataframe()
-        self.global_capex = self.calculate_global_capex(
-            indices=indices,
-            unit_index=indices.STOR,
-            unit_type_param=tparameters,
-            unit_type_map=parameters.tstor,
-            bus_unit_mapping=bus_parameters.storages,
-            aggr_unit_map=indices.aggr_stor_map,
-            discount_rate=scenario_parameters.discount_rate,
-            cap_plus=variable_group.cap_plus,
-            money_scale=scenario_parameters.money_scale,
+
+    @cached_property
+    def tcap(self) -> pd.DataFrame:
+        """capacity of storage types in aggregated consumers (non-exportable)"""
+        return self.tvariable_group.tcap.solution.to_dataframe()
+
+    @cached_property
+    def tcap_plus(self) -> pd.DataFrame:
+        """capacity increase of storage types in aggregated consumers (non-exportable)"""
+        return self.tvariable_group.tcap_plus.solution.to_dataframe()
+
+    @cached_property
+    def tcap_minus(self) -> pd.DataFrame:
+        """capacity decrease of storage types in aggregated consumers (non-exportable)"""
+        return self.tvariable_group.tcap_minus.solution.to_dataframe()
+
+    @cached_property
+    def tcap_base_minus(self) -> pd.DataFrame:
+        """base capacity decrease of storage types in aggregated consumers (non-exportable)"""
+        return self.tvariable_group.tcap_base_minus.solution.to_dataframe()
+
+    @cached_property
+    def cap_plus(self) -> pd.DataFrame:
+        """capacity increase (non-exportable)"""
+        return self.variable_group.cap_plus.solution.to_dataframe()
+
+    @cached_property
+    def cap_minus(self) -> pd.DataFrame:
+        """capacity decrease (non-exportable)"""
+        return self.variable_group.cap_minus.solution.to_dataframe()
+
+    @cached_property
+    def cap_base_minus(self) -> pd.DataFrame:
+        """base capacity decrease (non-exportable)"""
+        return self.variable_group.cap_base_minus.solution.to_dataframe()
+
+    @cached_property
+    def global_capex(self) -> dict[str, pd.DataFrame]:
+        """capex of global technologies (exportable)"""
+        return self.calculate_global_capex(
+            indices=self.indices,
+            unit_index=self.indices.STOR,
+            unit_type_param=self.tparameters,
+            unit_type_map=self.parameters.tstor,
+            bus_unit_mapping=self.bus_parameters.storages,
+            aggr_unit_map=self.indices.aggr_stor_map,
+            discount_rate=self.scenario_parameters.discount_rate,
+            cap_plus=self.variable_group.cap_plus,
+            money_scale=self.scenario_parameters.money_scale,
         )
-        self.local_capex = self.calculate_local_capex(
-            indices=indices,
-            unit_type_param=tparameters,
-            unit_type_map=parameters.tstor,
-            aggr_unit_map=indices.aggr_stor_map,
-            discount_rate=scenario_parameters.discount_rate,
-            tcap_plus=tvariable_group.tcap_plus,
-            money_scale=scenario_parameters.money_scale,
-            gen_mapping=indices.TSTOR.mapping,
+
+    @cached_property
+    def local_capex(self) -> dict[str, pd.DataFrame]:
+        """capex of local (in lbs) technologies (exportable)"""
+        return self.calculate_local_capex(
+            indices=self.indices,
+            unit_type_param=self.tparameters,
+            unit_type_map=self.parameters.tstor,
+            aggr_unit_map=self.indices.aggr_stor_map,
+            discount_rate=self.scenario_parameters.discount_rate,
+            tcap_plus=self.tvariable_group.tcap_plus,
+            money_scale=self.scenario_parameters.money_scale,
+            gen_mapping=self.indices.TSTOR.mapping,
         )
 
-    def to_exportable(self) -> ExportableStorageResults:
+    def field_getters(self) -> dict[str, Callable[[], Any]]:
+        return dict(
+            generation=lambda: self.dict_of_2d_array_to_pandas(self.gen),
+            load=lambda: self.dict_of_2d_array_to_pandas(self.load),
+            state_of_charge=lambda: self.dict_of_2d_array_to_pandas(self.soc),
+            capacity=lambda: self.dict_of_1d_array_to_pandas(
+                self.cap, column_name=STORAGE_LABEL
+            ),
+            global_capex=lambda: self.dict_of_1d_array_to_pandas(
+                self.global_capex, column_name=GENERATOR_LABEL
+            ),
+            local_capex=lambda: self.local_capex,
+        )
+
+    def to_exportable(
+        self, fields: Collection[str] | None = None
+    ) -> ExportableStorageResults:
         """
         Converts processed storage results into a format suitable for export.
 
         This method organizes the internal data structures into a coherent format, specifically
         an instance of ExportableStorageResults, for reporting or further analysis.
 
+        Args:
+            - fields (Collection[str] | None): names of exported fields, all if None
+
         Returns:
             - ExportableStorageResults: An object containing organized storage results ready for export.
         """
-        return ExportableStorageResults(
-            generation=self.dict_of_2d_array_to_pandas(self.gen),
-            load=self.dict_of_2d_array_to_pandas(self.load),
-            state_of_charge=self.dict_of_2d_array_to_pandas(self.soc),
-            capacity=self.dict_of_1d_array_to_pandas(
-                self.cap, column_name=STORAGE_LABEL
-            ),
-            global_capex=self.dict_of_1d_array_to_pandas(
-                self.global_capex, column_name=GENERATOR_LABEL
-            ),
-            local_capex=self.local_capex,
-        )
+        return self._exportable(ExportableStorageResults, self.field_getters(), fields)
 
 
 @dataclass
@@ -1016,36 +1113,43 @@ class LinesResults(ResultsGroup):
     analysis and reporting of optimal line flow results.
     """
 
-    variable_group: InitVar[LineVariables]
-    """Initial value hint for the LineVariable object"""
-    indices: InitVar[Indices]
-    """Initial value hint for the Indices object"""
-
-    flow: dict[str, pd.DataFrame] = field(init=False)
-    """ optimal line flows (exportable) """
+    variable_group: LineVariables = field(repr=False, compare=False)
+    """ LineVariables object """
+    indices: Indices = field(repr=False, compare=False)
+    """ Indices object """
 
-    def __post_init__(self, variable_group: LineVariables, indices: Indices) -> None:
-        self.flow = {
+    @cached_property
+    def flow(self) -> dict[str, pd.DataFrame]:
+        """optimal line flows (exportable)"""
+        return {
             line_name: df.reset_index(["line"], drop=True)
             .unstack()
             .droplevel(0, axis=1)
-            for line_name, df in variable_group.flow.solution.to_dataframe().groupby(
+            for line_name, df in self.variable_group.flow.solution.to_dataframe().groupby(
                 "line"
             )
         }
 
-    def to_exportable(self) -> ExportableLinesResults:
+    def field_getters(self) -> dict[str, Callable[[], Any]]:
+        return dict(
+            flow=lambda: self.dict_of_2d_array_to_pandas(
+                self.flow, index_name=HOUR_LABEL, column_name=YEAR_LABEL
+            )
+        )
+
+    def to_exportable(
+        self, fields: Collection[str] | None = None
+    ) -> ExportableLinesResults:
         """
         Converts processed line results into a format suitable for export.
 
+        Args:
+            - fields (Collection[str] | None): names of exported fields, all if None
+
         Returns:
             - ExportableLinesResults: An object containing organized line flow results ready for export.
         """
-        return ExportableLinesResults(
-            flow=self.dict_of_2d_array_to_pandas(
-                self.flow, index_name=HOUR_LABEL, column_name=YEAR_LABEL
-            )
-        )
+        return self._exportable(ExportableLinesResults, self.field_getters(), fields)
 
 
 @dataclass
@@ -1058,43 +1162,50 @@ class FractionsResults(ResultsGroup):
     facilitate analysis and reporting of fraction results across different consumer categories.
     """
 
-    variable_group: InitVar[FractionVariables]
-    """Initial value hint for the FractionVariables object"""
-    indices: InitVar[Indices]
-    """Initial value hint for the Indices object"""
-
-    frac: dict[str, dict[str, pd.DataFrame]] = field(init=False)
-    """ fraction of local balancing stack in a given aggregated consumer (exportable) """
+    variable_group: FractionVariables = field(repr=False, compare=False)
+    """ FractionVariables object """
+    indices: Indices = field(repr=False, compare=False)
+    """ Indices object """
 
-    def __post_init__(
-        self, variable_group: FractionVariables, indices: Indices
-    ) -> None:
-        self.frac = {
+    @cached_property
+    def frac(self) -> dict[str, dict[str, pd.DataFrame]]:
+        """fraction of local balancing stack in a given aggregated consumer (exportable)"""
+        return {
             aggr_name: {
                 consumer_name: df.reset_index(["aggr", "lbs"], drop=True).rename(
                     columns={"solution": "frac"}
                 )
                 for consumer_name, df in aggr_df.groupby("lbs")
             }
-            for aggr_name, aggr_df in variable_group.fraction.solution.to_dataframe().groupby(
+            for aggr_name, aggr_df in self.variable_group.fraction.solution.to_dataframe().groupby(
                 "aggr"
             )
         }
 
-    def to_exportable(self) -> ExportableFractionsResults:
+    def field_getters(self) -> dict[str, Callable[[], Any]]:
+        return dict(
+            fraction=lambda: {
+                aggr: self.dict_of_1d_array_to_pandas(
+                    self.frac[aggr], index_name=YEAR_LABEL, column_name=LBS_LABEL
+                )
+                for aggr in self.frac
+            }
+        )
+
+    def to_exportable(
+        self, fields: Collection[str] | None = None
+    ) -> ExportableFractionsResults:
         """
         Converts processed fraction results into a format suitable for export.
 
+        Args:
+            - fields (Collection[str] | None): names of exported fields, all if None
+
         Returns:
             - ExportableFractionsResults: An object containing organized fraction results ready for export.
         """
-        return ExportableFractionsResults(
-            fraction={
-                aggr: self.dict_of_1d_array_to_pandas(
-                    self.frac[aggr], index_name=YEAR_LABEL, column_name=LBS_LABEL
-                )
-                for aggr in self.frac
-            }
+        return self._exportable(
+            ExportableFractionsResults, self.field_getters(), fields
         )
 
 
@@ -1108,25 +1219,31 @@ class BusResults(ResultsGroup):
     analysis and reporting of bus-related results across various components of the energy system.
     """
 
-    variable_group: InitVar[BusVariables]
-    """Initial value hint for the GeneratorVariables object"""
-    indices: InitVar[Indices]
-    """Initial value hint for the Indices object"""
-    bus_ens: dict[str, pd.DataFrame] = field(init=False)
-    """ ens generator per bus """
+    variable_group: BusVariables = field(repr=False, compare=False)
+    """ BusVariables object """
+    indices: Indices = field(repr=False, compare=False)
+    """ Indices object """
 
-    def __post_init__(self, variable_group: BusVariables, indices: Indices) -> None:
-        self.bus_ens = {
+    @cached_property
+    def bus_ens(self) -> dict[str, pd.DataFrame]:
+        """ens generator per bus"""
+        return {
             bus_name: df.reset_index(["bus"], drop=True).unstack().droplevel(0, axis=1)
-            for bus_name, df in variable_group.bus_ens.solution.to_dataframe().groupby(
+            for bus_name, df in self.variable_group.bus_ens.solution.to_dataframe().groupby(
                 "bus"
             )
         }
-        self.shift_plus = self.process_shift_variable(
-            variable_group.shift_plus, indices
-        )
-        self.shift_minus = self.process_shift_variable(
-            variable_group.shift_minus, indices
+
+    @cached_property
+    def shift_plus(self) -> dict[str, pd.DataFrame]:
+        """demand shifted to given hour per bus"""
+        return self.process_shift_variable(self.variable_group.shift_plus, self.indices)
+
+    @cached_property
+    def shift_minus(self) -> dict[str, pd.DataFrame]:
+        """demand shifted from given hour per bus"""
+        return self.process_shift_variable(
+            self.variable_group.shift_minus, self.indices
         )
 
     @staticmethod
@@ -1156,17 +1273,151 @@ class BusResults(ResultsGroup):
             result[bus_name] = df
         return result
 
-    def to_exportable(self) -> ExportableBusResults:
+    def field_getters(self) -> dict[str, Callable[[], Any]]:
+        return dict(
+            generation_ens=lambda: self.dict_of_2d_array_to_pandas(self.bus_ens),
+            shift_plus=lambda: self.dict_of_2d_array_to_pandas(self.shift_plus),
+            shift_minus=lambda: self.dict_of_2d_array_to_pandas(self.shift_minus),
+        )
+
+    def to_exportable(
+        self, fields: Collection[str] | None = None
+    ) -> ExportableBusResults:
         """
         Converts processed bus results into a format suitable for export.
 
+        Args:
+            - fields (Collection[str] | None): names of exported fields, all if None
+
         Returns:
             - ExportableBusResults: An object containing organized bus results ready for export.
         """
-        return ExportableBusResults(
-            generation_ens=self.dict_of_2d_array_to_pandas(self.bus_ens),
-            shift_plus=self.dict_of_2d_array_to_pandas(self.shift_plus),
-            shift_minus=self.dict_of_2d_array_to_pandas(self.shift_minus),
+        return self._exportable(ExportableBusResults, self.field_getters(), fields)
+
+
+@dataclass
+class DualResults(ResultsGroup):
+    """
+    A class for organizing duals of constraint families extracted after the solve.
+
+    Duals of bus balancing constraints are marginal prices of energy at each bus and hour,
+    duals of emission limits are prices of emissions of each type in each year. Both are in
+    units of the objective function (money_scale and hourly_scale are not removed).
+    """
+
+    duals: dict[str, xr.DataArray] = field(repr=False, compare=False)
+    """ constraint family name -> duals of the family """
+
+    @cached_property
+    def marginal_price(self) -> dict[str, pd.DataFrame]:
+        """duals of balancing constraints per bus (exportable)"""
+        if (duals := self.duals.get(BALANCING_FAMILY)) is None:
+            return {}
+        values = duals.transpose("bus", "hour", "year").values
+        return {
+            bus_name: pd.DataFrame(
+                values[bus_idx],
+                index=duals["hour"].values,
+                columns=duals["year"].values,
+            )
+            for bus_idx, bus_name in enumerate(duals["bus"].values)
+        }
+
+    @cached_property
+    def emission_price(self) -> pd.DataFrame:
+        """duals of emission limits per emission type (exportable)"""
+        if (duals := self.duals.get(EMISSIONS_FAMILY)) is None:
+            return pd.DataFrame()
+        df = duals.transpose("year", "emission_type").to_pandas()
+        df.index.name = YEAR_LABEL
+        df.columns.name = EMISSION_TYPE_LABEL
+        return df
+
+    def field_getters(self) -> dict[str, Callable[[], Any]]:
+        return dict(
+            marginal_price=lambda: self.dict_of_2d_array_to_pandas(self.marginal_price),
+            emission_price=lambda: self.emission_price,
+        )
+
+    def to_exportable(
+        self, fields: Collection[str] | None = None
+    ) -> ExportableDualResults:
+        """
+        Converts duals into a format suitable for export.
+
+        Args:
+            - fields (Collection[str] | None): names of exported fields, all if None
+
+        Returns:
+            - ExportableDualResults: An object containing marginal prices and emission prices ready for export.
+        """
+        return self._exportable(ExportableDualResults, self.field_getters(), fields)
+
+
+@dataclass
+class ObjectiveResults(ResultsGroup):
+    """
+    A class for organizing values of the objective function components evaluated at the solution.
+
+    Components are named after objective builders (e.g. capex, var_cost, ens_penalty_cost). Terms are
+    attributed to the year of the variable they multiply and, if evaluated per unit, to the unit
+    (generator, storage, line, bus or aggregated consumer) of the variable.
+    """
+
+    breakdown: dict[str, xr.DataArray] = field(repr=False, compare=False)
+    """ component name -> value with dimensions (year) or (element, year) """
+
+    @cached_property
+    def cost_per_year(self) -> pd.DataFrame:
+        """value of each component in each year (exportable)"""
+        if not self.breakdown:
+            return pd.DataFrame()
+        df = pd.DataFrame(
+            {
+                name: (
+                    value.sum("element") if "element" in value.dims else value
+                ).to_pandas()
+                for name, value in self.breakdown.items()
+            }
+        )
+        df.index.name = YEAR_LABEL
+        df.columns.name = COMPONENT_LABEL
+        return df
+
+    @cached_property
+    def cost_per_unit(self) -> dict[str, pd.DataFrame]:
+        """value of each component per unit in each year, units with zero value are skipped (exportable)"""
+        result = {}
+        for name, value in self.breakdown.items():
+            if "element" not in value.dims:
+                continue
+            df = value.transpose("year", "element").to_pandas()
+            df = df.loc[:, (df.columns != "") & (df != 0).any()]
+            df.index.name = YEAR_LABEL
+            df.columns.name = None
+            result[name] = df
+        return result
+
+    def field_getters(self) -> dict[str, Callable[[], Any]]:
+        return dict(
+            cost_per_year=lambda: self.cost_per_year,
+            cost_per_unit=lambda: self.cost_per_unit,
+        )
+
+    def to_exportable(
+        self, fields: Collection[str] | None = None
+    ) -> ExportableObjectiveResults:
+        """
+        Converts objective breakdown into a format suitable for export.
+
+        Args:
+            - fields (Collection[str] | None): names of exported fields, all if None
+
+        Returns:
+            - ExportableObjectiveResults: An object containing values of objective components ready for export.
+        """
+        return self._exportable(
+            ExportableObjectiveResults, self.field_getters(), fields
         )
 
 
@@ -1181,75 +1432,198 @@ class Results:
     for reporting and analysis.
     """
 
-    variables: InitVar[OptimizationVariables]
-    """Initial value hint for the OptimizationVariables object"""
-    indices: InitVar[Indices]
-    """Initial value hint for the Indices object"""
-    parameters: InitVar[OptimizationParameters]
-    """ Initial value hint for the OptimizationVariables object """
+    variables: OptimizationVariables = field(repr=False, compare=False)
+    """ OptimizationVariables object """
+    indices: Indices = field(repr=False, compare=False)
+    """ Indices object """
+    parameters: OptimizationParameters = field(repr=False, compare=False)
+    """ OptimizationParameters object """
 
     objective_value: float
     """ optimal objective function value (exportable) """
-    generators_results: GeneratorsResults = field(init=False)
-    """ generators variables optimal values (exportable) """
-    storages_results: StoragesResults = field(init=False)
-    """ storage variables optimal values (exportable) """
-    lines_results: LinesResults = field(init=False)
-    """ lines variables optimal values (exportable) """
-    fractions_results: FractionsResults = field(init=False)
-    """ fraction variables optimal values (exportable) """
-    bus_results: BusResults = field(init=False)
-    """ bus variables optimal values (exportable) """
-
-    def to_exportable(self) -> ExportableResults:
+    duals: dict[str, xr.DataArray] = field(
+        default_factory=dict, repr=False, compare=False
+    )
+    """ constraint family name -> duals of the family (only families selected in OptConfig) """
+    objective_breakdown: dict[str, xr.DataArray] = field(
+        default_factory=dict, repr=False, compare=False
+    )
+    """ objective component name -> value of the component (only if enabled in OptConfig) """
+
+    @cached_property
+    def generators_results(self) -> GeneratorsResults:
+        """generators variables optimal values (exportable)"""
+        return GeneratorsResults(
+            variable_group=self.variables.gen,
+            tvariable_group=self.variables.tgen,
+            indices=self.indices,
+            parameters=self.parameters.gen,
+            tparameters=self.parameters.tgen,
+            bus_parameters=self.parameters.bus,
+            scenario_parameters=self.parameters.scenario_parameters,
+        )
+
+    @cached_property
+    def storages_results(self) -> StoragesResults:
+        """storage variables optimal values (exportable)"""
+        return StoragesResults(
+            variable_group=self.variables.stor,
+            tvariable_group=self.variables.tstor,
+            indices=self.indices,
+            parameters=self.parameters.stor,
+            tparameters=self.parameters.tstor,
+            bus_parameters=self.parameters.bus,
+            scenario_parameters=self.parameters.scenario_parameters,
+        )
+
+    @cached_property
+    def lines_results(self) -> LinesResults:
+        """lines variables optimal values (exportable)"""
+        return LinesResults(variable_group=self.variables.line, indices=self.indices)
+
+    @cached_property
+    def fractions_results(self) -> FractionsResults:
+        """fraction variables optimal values (exportable)"""
+        return FractionsResults(
+            variable_group=self.variables.frac, indices=self.indices
+        )
+
+    @cached_property
+    def bus_results(self) -> BusResults:
+        """bus variables optimal values (exportable)"""
+        return BusResults(variable_group=self.variables.bus, indices=self.indices)
+
+    @cached_property
+    def dual_results(self) -> DualResults:
+        """duals of constraint families (exportable)"""
+        return DualResults(duals=self.duals)
+
+    @cached_property
+    def objective_results(self) -> ObjectiveResults:
+        """values of objective function components (exportable)"""
+        return ObjectiveResults(breakdown=self.objective_breakdown)
+
+    def to_exportable(
+        self, release: bool = False, selection: ExportSelection | None = None
+    ) -> ExportableResults:
         """
         Converts processed optimization results into a format suitable for export.
 
+        Results groups are computed group by group on first access. If release is set, every group
+        is dropped right after its conversion, so at most one group of not converted results is kept
+        in memory (the group is computed again if accessed later). Groups and fields not included
+        in the selection are neither computed nor converted (they are empty in returned results).
+
+        Args:
+            - release (bool): drop computed results groups after conversion, default = False
+            - selection (ExportSelection | None): exported groups and fields, all if None
+
         Returns:
             - ExportableResults: An object containing organized optimization results ready for export.
         """
+        selection = selection or ExportSelection()
         return ExportableResults(
             objective_value=pd.Series(
                 self.objective_value, name="Objective_func_value"
             ),
-            generators_results=self.generators_results.to_exportable(),
-            storages_results=self.storages_results.to_exportable(),
-            lines_results=self.lines_results.to_exportable(),
-            fractions_results=self.fractions_results.to_exportable(),
-            bus_results=self.bus_results.to_exportable(),
+            generators_results=self._exportable_group(
+                "generators_results", ExportableGeneratorsResults, selection, release
+            ),
+            storages_results=self._exportable_group(
+                "storages_results", ExportableStorageResults, selection, release
+            ),
+            lines_results=self._exportable_group(
+                "lines_results", ExportableLinesResults, selection, release
+            ),
+            fractions_results=self._exportable_group(
+                "fractions_results", ExportableFractionsResults, selection, release
+            ),
+            bus_results=self._exportable_group(
+                "bus_results", ExportableBusResults, selection, release
+            ),
+            dual_results=self._exportable_group(
+                "dual_results", ExportableDualResults, selection, release
+            ),
+            objective_results=self._exportable_group(
+                "objective_results", ExportableObjectiveResults, selection, release
+            ),
+        )
+
+    def to_lazy_exportable(
+        self, release: bool = False, selection: ExportSelection | None = None
+    ) -> LazyExportableResults:
+        """
+        Converts processed optimization results into exportable results with fields computed one by one
+        when they are exported (see to_exportable). Selected elements of every field are taken right
+        after it is computed. If release is set, every group is dropped after its last selected field
+        is computed.
+
+        Args:
+            - release (bool): drop computed results groups after conversion, default = False
+            - selection (ExportSelection | None): exported groups, fields and elements, all if None
+
+        Returns:
+            - LazyExportableResults: results computing their fields when exported
+        """
+        selection = selection or ExportSelection()
+        field_getters: ExportableFieldGetters = {}
+        group_types = get_type_hints(ExportableResults)
+        del group_types["objective_value"]
+        for group_name, group_type in group_types.items():
+            if not selection.includes_group(group_name):
+                continue
+            field_names = [
+                exportable_field.name
+                for exportable_field in fields(group_type)
+                if selection.includes_field(exportable_field.name)
+            ]
+            field_getters[group_name] = {
+                field_name: self._lazy_field_getter(
+                    group_name,
+                    field_name,
+                    selection,
+                    release and field_name == field_names[-1],
+                )
+                for field_name in field_names
+            }
+        return LazyExportableResults(
+            objective_value=pd.Series(
+                self.objective_value, name="Objective_func_value"
+            ),
+            field_getters=field_getters,
         )
 
-    def __post_init__(
+    def _lazy_field_getter(
         self,
-        variables: OptimizationVariables,
-        indices: Indices,
-        parameters: OptimizationParameters,
-    ) -> None:
-        self.generators_results = GeneratorsResults(
-            variable_group=variables.gen,
-            tvariable_group=variables.tgen,
-            indices=indices,
-            parameters=parameters.gen,
-            tparameters=parameters.tgen,
-            bus_parameters=parameters.bus,
-            scenario_parameters=parameters.scenario_parameters,
-        )
-        self.storages_results = StoragesResults(
-            variable_group=variables.stor,
-            tvariable_group=variables.tstor,
-            indices=indices,
-            parameters=parameters.stor,
-            tparameters=parameters.tstor,
-            bus_parameters=parameters.bus,
-            scenario_parameters=parameters.scenario_parameters,
-        )
-        self.lines_results = LinesResults(
-            variable_group=variables.line, indices=indices
-        )
-        self.fractions_results = FractionsResults(
-            variable_group=variables.frac, indices=indices
-        )
-        self.bus_results = BusResults(variable_group=variables.bus, indices=indices)
+        group_name: str,
+        field_name: str,
+        selection: ExportSelection,
+        release: bool,
+    ) -> Callable[[], pd.DataFrame | dict]:
+        """Function computing selected elements of the field (see to_lazy_exportable)."""
+
+        def get_field_value() -> pd.DataFrame | dict:
+            value = getattr(self, group_name).field_getters()[field_name]()
+            if release:
+                self.__dict__.pop(group_name, None)
+            return selection.select_elements(value)
+
+        return get_field_value
+
+    def _exportable_group(
+        self,
+        group_name: str,
+        group_type: type[TExportableResultsGroup],
+        selection: ExportSelection,
+        release: bool,
+    ) -> TExportableResultsGroup:
+        """Converts results group to exportable group (see to_exportable)."""
+        if not selection.includes_group(group_name):
+            return empty_exportable_group(group_type)
+        exportable_group = getattr(self, group_name).to_exportable(selection.fields)
+        if release:
+            self.__dict__.pop(group_name, None)
+        return exportable_group
 
 
 def process_gen_dch(
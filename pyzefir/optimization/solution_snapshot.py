@@ -0,0 +1,356 @@
+import copy
+import logging
+import pickle
+from dataclasses import dataclass, field, replace
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any, Callable, ClassVar
+
+import numpy as np
+import pyarrow as pa
+import xarray as xr
+from linopy import Model, Variable
+
+from pyzefir.optimization.export_selection import TimeAggregation
+from pyzefir.optimization.linopy.duals import BALANCING_FAMILY, extract_duals
+from pyzefir.optimization.linopy.preprocessing.indices import IndexingSet, Indices
+from pyzefir.optimization.linopy.preprocessing.opt_parameters import (
+    OptimizationParameters,
+)
+from pyzefir.optimization.linopy.preprocessing.opt_variables import (
+    OptimizationVariables,
+)
+from pyzefir.optimization.results import Results
+
+_logger = logging.getLogger(__name__)
+
+
+class SolutionSnapshotError(Exception):
+    pass
+
+
+@dataclass(frozen=True)
+class SnapshotVariable:
+    """
+    Solution of a variable restored from the snapshot, used by Results in place of linopy Variable.
+    """
+
+    solution: xr.DataArray
+    """ optimal values of the variable """
+
+
+@dataclass(frozen=True)
+class _ArraySlot:
+    """Position and layout of a single array stored in the flat values column."""
+
+    offset: int
+    shape: tuple[int, ...]
+    dims: tuple[str, ...]
+    coords: dict[str, tuple[tuple[str, ...], np.ndarray]]
+    name: str | None
+
+    @classmethod
+    def from_array(cls, array: xr.DataArray, offset: int) -> "_ArraySlot":
+        return cls(
+            offset=offset,
+            shape=array.shape,
+            dims=tuple(str(dim) for dim in array.dims),
+            coords={
+                str(name): (tuple(str(dim) for dim in coord.dims), coord.values)
+                for name, coord in array.coords.items()
+            },
+            name=None if array.name is None else str(array.name),
+        )
+
+    def restore(self, values: np.ndarray) -> xr.DataArray:
+        start, stop = self.offset, self.offset + int(np.prod(self.shape, dtype=int))
+        return xr.DataArray(
+            values[start:stop].reshape(self.shape),
+            dims=self.dims,
+            coords=self.coords,
+            name=self.name,
+        )
+
+
+@dataclass
+class SolutionSnapshot:
+    """
+    Solution of the optimization model (optimal values of all variables and duals of chosen constraints)
+    together with Indices and OptimizationParameters, so Results can be rebuilt without the solver
+    and without building the model.
+
+    The snapshot directory contains values of all arrays stored in a single Arrow IPC column
+    (solution.arrow, read with memory mapping) and pickled metadata (snapshot.pkl) - layout of the
+    arrays, structure of variable groups, indices, parameters and objective value.
+    """
+
+    VALUES_FILE: ClassVar[str] = "solution.arrow"
+    """ file with values of all arrays """
+    METADATA_FILE: ClassVar[str] = "snapshot.pkl"
+    """ file with pickled metadata """
+    DEFAULT_DUAL_FAMILIES: ClassVar[tuple[str, ...]] = (BALANCING_FAMILY,)
+    """ constraint families which duals are stored by default """
+
+    objective_value: float
+    """ optimal objective function value """
+    variables: dict[str, Any]
+    """ variable group name -> attribute name -> variable solution (possibly in nested dictionaries) """
+    indices: Indices
+    """ indices of the model """
+    parameters: OptimizationParameters
+    """ parameters of the model """
+    duals: dict[str, xr.DataArray] = field(default_factory=dict)
+    """ constraint family name -> duals of the family """
+    objective_breakdown: dict[str, xr.DataArray] = field(default_factory=dict)
+    """ objective component name -> value of the component """
+    extras: dict[str, Any] = field(default_factory=dict)
+    """ additional picklable objects needed by postprocessing (e.g. network reducer) """
+
+    @classmethod
+    def from_model(
+        cls,
+        model: Model,
+        variables: OptimizationVariables,
+        indices: Indices,
+        parameters: OptimizationParameters,
+        dual_families: tuple[str, ...] = DEFAULT_DUAL_FAMILIES,
+        extras: dict[str, Any] | None = None,
+        objective_breakdown: dict[str, xr.DataArray] | None = None,
+    ) -> "SolutionSnapshot":
+        """
+        Creates snapshot of the solved model.
+
+        Args:
+            - model (Model): solved linopy model
+            - variables (OptimizationVariables): variables of the model
+            - indices (Indices): indices of the model
+            - parameters (OptimizationParameters): parameters of the model
+            - dual_families (tuple[str, ...]): constraint families which duals are stored (if the solver
+                provided duals)
+            - extras (dict[str, Any] | None): additional picklable objects stored in the snapshot
+            - objective_breakdown (dict[str, xr.DataArray] | None): values of objective components
+                evaluated after the solve (see Results.objective_breakdown)
+
+        Returns:
+            - SolutionSnapshot: snapshot of the solution
+        """
+        return cls(
+            objective_value=model.objective.value,
+            variables={
+                group_name: {
+                    attr_name: cls._solutions(value)
+                    for attr_name, value in vars(group).items()
+                    if cls._has_variables(value)
+                }
+                for group_name, group in vars(variables).items()
+            },
+            indices=indices,
+            parameters=parameters,
+            duals=extract_duals(model, indices, dual_families),
+            objective_breakdown=objective_breakdown or {},
+            extras=extras or {},
+        )
+
+    @classmethod
+    def from_results(cls, results: Results) -> "SolutionSnapshot":
+        """
+        Creates snapshot of the solution and duals used by given results.
+
+        Args:
+            - results (Results): results of the optimization
+
+        Returns:
+            - SolutionSnapshot: snapshot of the solution
+        """
+        return cls(
+            objective_value=results.objective_value,
+            variables={
+                group_name: {
+                    attr_name: cls._solutions(value)
+                    for attr_name, value in vars(group).items()
+                    if cls._has_variables(value)
+                }
+                for group_name, group in vars(results.variables).items()
+            },
+            indices=results.indices,
+            parameters=results.parameters,
+            duals=results.duals,
+            objective_breakdown=results.objective_breakdown,
+        )
+
+    def aggregated(self, time_aggregation: TimeAggregation) -> "SolutionSnapshot":
+        """
+        Snapshot with hourly solutions and duals aggregated over periods. Hour index of the returned
+        snapshot contains periods, so results rebuilt from it contain one row per period.
+
+        Args:
+            - time_aggregation (TimeAggregation): aggregation of hourly values
+
+        Returns:
+            - SolutionSnapshot: aggregated snapshot
+        """
+        indices = copy.copy(self.indices)
+        indices.H = IndexingSet(
+            np.unique(time_aggregation.periods(self.indices.H.ii)), self.indices.H.name
+        )
+        return replace(
+            self,
+            variables=self._map_tree(
+                self.variables,
+                lambda variable: SnapshotVariable(
+                    time_aggregation.aggregate(variable.solution)
+                ),
+            ),
+            indices=indices,
+            duals={
+                name: time_aggregation.aggregate(dual)
+                for name, dual in self.duals.items()
+            },
+        )
+
+    def dump(self, path: Path) -> None:
+        """
+        Saves the snapshot into given directory.
+
+        Args:
+            - path (Path): snapshot directory (created if it does not exist)
+        """
+        path.mkdir(parents=True, exist_ok=True)
+        arrays: list[np.ndarray] = []
+        offset = 0
+
+        def to_slot(array: xr.DataArray) -> _ArraySlot:
+            nonlocal offset
+            slot = _ArraySlot.from_array(array, offset)
+            arrays.append(np.asarray(array.values, dtype=np.float64).reshape(-1))
+            offset += array.size
+            return slot
+
+        metadata = {
+            "objective_value": self.objective_value,
+            "variables": self._map_tree(
+                self.variables, lambda variable: to_slot(variable.solution)
+            ),
+            "duals": {name: to_slot(dual) for name, dual in self.duals.items()},
+            "objective_breakdown": {
+                name: to_slot(value) for name, value in self.objective_breakdown.items()
+            },
+            "indices": self.indices,
+            "parameters": self.parameters,
+            "extras": self.extras,
+        }
+        values = np.concatenate(arrays) if arrays else np.zeros(0)
+        table = pa.table({"value": values})
+        with pa.OSFile(str(path / self.VALUES_FILE), "wb") as sink:
+            with pa.ipc.new_file(sink, table.schema) as writer:
+                writer.write_table(table)
+        with open(path / self.METADATA_FILE, "wb") as file:
+            pickle.dump(metadata, file, protocol=pickle.HIGHEST_PROTOCOL)
+        _logger.info("Solution snapshot saved to %s", path)
+
+    @classmethod
+    def load(cls, path: Path) -> "SolutionSnapshot":
+        """
+        Loads the snapshot from given directory, values are memory mapped.
+
+        Args:
+            - path (Path): snapshot directory
+
+        Returns:
+            - SolutionSnapshot: loaded snapshot
+
+        Raises:
+            - SolutionSnapshotError: if the directory does not contain a snapshot
+        """
+        if (
+            not (path / cls.VALUES_FILE).is_file()
+            or not (path / cls.METADATA_FILE).is_file()
+        ):
+            raise SolutionSnapshotError(f"Solution snapshot not found in {path}")
+        with open(path / cls.METADATA_FILE, "rb") as file:
+            metadata = pickle.load(file)
+        reader = pa.ipc.open_file(pa.memory_map(str(path / cls.VALUES_FILE)))
+        values = (
+            reader.get_batch(0).column(0).to_numpy()
+            if reader.num_record_batches
+            else np.zeros(0)
+        )
+        return cls(
+            objective_value=metadata["objective_value"],
+            variables=cls._map_tree(
+                metadata["variables"],
+                lambda slot: SnapshotVariable(slot.restore(values)),
+            ),
+            indices=metadata["indices"],
+            parameters=metadata["parameters"],
+            duals={
+                name: slot.restore(values) for name, slot in metadata["duals"].items()
+            },
+            objective_breakdown={
+                name: slot.restore(values)
+                for name, slot in metadata.get("objective_breakdown", {}).items()
+            },
+            extras=metadata["extras"],
+        )
+
+    def to_results(self, dual_families: tuple[str, ...] | None = None) -> Results:
+        """
+        Rebuilds results of the optimization from the snapshot.
+
+        Args:
+            - dual_families (tuple[str, ...] | None): constraint families which duals are passed to
+                the results (if stored in the snapshot), all stored duals if None
+
+        Returns:
+            - Results: results computed from stored solution
+        """
+        return Results(
+            objective_value=self.objective_value,
+            variables=SimpleNamespace(  # type: ignore[arg-type]
+                **{
+                    group_name: SimpleNamespace(**group)
+                    for group_name, group in self.variables.items()
+                }
+            ),
+            indices=self.indices,
+            parameters=self.parameters,
+            duals=(
+                self.duals
+                if dual_families is None
+                else {
+                    family: self.duals[family]
+                    for family in dual_families
+                    if family in self.duals
+                }
+            ),
+            objective_breakdown=self.objective_breakdown,
+        )
+
+    @classmethod
+    def _solutions(cls, value: Any) -> Any:
+        """Replaces linopy variables with their solutions (nested dictionaries are preserved)."""
+        if isinstance(value, dict):
+            return {
+                key: cls._solutions(item)
+                for key, item in value.items()
+                if cls._has_variables(item)
+            }
+        return (
+            value
+            if isinstance(value, SnapshotVariable)
+            else SnapshotVariable(value.solution)
+        )
+
+    @classmethod
+    def _has_variables(cls, value: Any) -> bool:
+        """True for variables (or their solutions) and (possibly empty) dictionaries of variables."""
+        if isinstance(value, dict):
+            return all(cls._has_variables(item) for item in value.values())
+        return isinstance(value, (Variable, SnapshotVariable))
+
+    @classmethod
+    def _map_tree(cls, tree: Any, func: Callable[[Any], Any]) -> Any:
+        """Applies function to the leaves of nested dictionaries."""
+        if isinstance(tree, dict):
+            return {key: cls._map_tree(item, func) for key, item in tree.items()}
+        return func(tree)
@@ -3,6 +3,7 @@ from pathlib import Path
 
 import pandas as pd
 
+from pyzefir.parser.profile_cache import ProfileCache
 from pyzefir.parser.utils import TRUE_VALUES
 from pyzefir.parser.validator.dataframe_validator import DataFrameValidator
 from pyzefir.parser.validator.valid_structure import (
@@ -33,14 +34,19 @@ class CsvParser:
     exceptions if required files are missing or the data is invalid.
     """
 
-    def __init__(self, path_manager: CsvPathManager) -> None:
+    def __init__(
+        self, path_manager: CsvPathManager, profile_cache: ProfileCache | None = None
+    ) -> None:
         """
         Initializes a new instance of the class.
 
         Args:
             - path_manager (CsvPathManager): Manages the paths to the CSV files.
+            - profile_cache (ProfileCache | None): If given, hourly datasets are read from memory mapped
+              cache files (created from the CSV files when needed). Defaults to None.
         """
         self._path_manager = path_manager
+        self._profile_cache = profile_cache
 
     def load_dfs(self) -> dict[str, dict[str, pd.DataFrame]]:
         """
@@ -74,7 +80,7 @@ class CsvParser:
         if category in DataCategories.get_dynamic_categories():
             for csv_path in self._path_manager.get_path(category).glob("*.csv"):
                 dataset_name = csv_path.stem
-                df = self._read_and_validate_csv_file(
+                df = self._read_dataset(
                     category=category, dataset_name=dataset_name, csv_path=csv_path
                 )
                 df.columns = df.columns.astype(str)
@@ -84,7 +90,7 @@ class CsvParser:
                 csv_path = self._path_manager.get_path(
                     data_category=category, dataset_name=dataset_name
                 )
-                df = self._read_and_validate_csv_file(
+                df = self._read_dataset(
                     category=category, dataset_name=dataset_name, csv_path=csv_path
                 )
                 df.columns = df.columns.astype(str)
@@ -92,6 +98,38 @@ class CsvParser:
 
         return category_dict
 
+    def _read_dataset(
+        self, category: str, dataset_name: str, csv_path: Path
+    ) -> pd.DataFrame:
+        """
+        Reads the dataset from the CSV file, or from the profile cache for hourly datasets
+        (if the cache is configured and the CSV file exists).
+
+        Args:
+            - category (str): The category of the dataset.
+            - dataset_name (str): The name of the dataset.
+            - csv_path (Path): The path to the CSV file.
+
+        Returns:
+            - pd.DataFrame: A DataFrame containing the loaded data.
+        """
+        if (
+            self._profile_cache is not None
+            and csv_path.is_file()
+            and ProfileCache.is_hourly_dataset(category, dataset_name)
+        ):
+            return self._profile_cache.read(
+                category,
+                dataset_name,
+                csv_path,
+                lambda: self._read_and_validate_csv_file(
+                    category=category, dataset_name=dataset_name, csv_path=csv_path
+                ),
+            )
+        return self._read_and_validate_csv_file(
+            category=category, dataset_name=dataset_name, csv_path=csv_path
+        )
+
     @staticmethod
     def _read_and_validate_csv_file(
         category: str, dataset_name: str, csv_path: Path
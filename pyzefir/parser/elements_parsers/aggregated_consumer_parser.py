@@ -1,10 +1,12 @@
 from collections import defaultdict
+from typing import Any
 
 import numpy as np
 import pandas as pd
 
 from pyzefir.model.network_elements import AggregatedConsumer
 from pyzefir.parser.elements_parsers.element_parser import AbstractElementParser
+from pyzefir.parser.elements_parsers.utils import YearlyValues
 from pyzefir.parser.utils import sanitize_dataset_name
 
 
@@ -69,19 +71,17 @@ class AggregatedConsumerParser(AbstractElementParser):
         yearly_energy_usage = self._create_yearly_energy_usage(
             self.yearly_energy_usage_df
         )
-        aggregated_consumers = self.aggregated_consumer_df.apply(
-            self._create_aggregated_consumer,
-            axis=1,
-            args=(
+        return tuple(
+            self._create_aggregated_consumer(
+                df_row,
                 stack_base_fractions,
                 yearly_energy_usage,
                 fraction,
                 n_consumers,
                 self._years,
-            ),
-            result_type="reduce",
+            )
+            for df_row in self.aggregated_consumer_df.to_dict("records")
         )
-        return tuple(aggregated_consumers)
 
     @staticmethod
     def _create_consumers(
@@ -119,27 +119,34 @@ class AggregatedConsumerParser(AbstractElementParser):
         """
         fractions_df = stack_df.merge(fraction_df, how="left")
         fractions_dict: dict[str, dict[str, dict[str, pd.Series]]] = dict()
-        grouped = fractions_df.groupby(["technology_stack", "aggregate"])
+        key_columns = ["technology_stack", "aggregate"]
         fraction_attributes = [
             "min_fraction",
             "max_fraction",
             "max_fraction_decrease",
             "max_fraction_increase",
         ]
+        yearly_fractions = YearlyValues(
+            fractions_df,
+            key_columns,
+            "year",
+            [attr for attr in fraction_attributes if attr in fraction_df.columns],
+            years,
+        )
+        keys = sorted(
+            fractions_df[key_columns].dropna().drop_duplicates().itertuples(index=False)
+        )
         for fraction_attr in fraction_attributes:
             fractions_attr_dict: dict[str, dict[str, pd.Series]] = dict()
             if fraction_attr not in fraction_df.columns:
                 fractions_dict[fraction_attr] = dict()
                 continue
-            for (tech_stack, aggregate), group_data in grouped:
-                year_series = group_data.set_index("year")[fraction_attr]
-                fraction_series = pd.Series(index=range(years), dtype=float)
-                if not all(pd.isna(year_series.index)):
-                    fraction_series.loc[year_series.index] = year_series
-                if aggregate in fractions_attr_dict:
-                    fractions_attr_dict[aggregate][tech_stack] = fraction_series
-                else:
-                    fractions_attr_dict[aggregate] = {tech_stack: fraction_series}
+            for tech_stack, aggregate in keys:
+                fractions_attr_dict.setdefault(aggregate, {})[tech_stack] = pd.Series(
+                    yearly_fractions.values((tech_stack, aggregate), fraction_attr),
+                    index=range(years),
+                    dtype=float,
+                )
             fractions_dict[fraction_attr] = fractions_attr_dict
         return fractions_dict
 
@@ -200,7 +207,7 @@ class AggregatedConsumerParser(AbstractElementParser):
 
     @staticmethod
     def _create_aggregated_consumer(
-        df_row: pd.Series,
+        df_row: dict[str, Any],
         stack_base_fractions: dict[str, dict[str, float]],
         yearly_energy_usage: dict[str, dict[str, pd.Series]],
         fraction: dict[str, dict[str, dict[str, pd.Series]]],
@@ -211,7 +218,7 @@ class AggregatedConsumerParser(AbstractElementParser):
         Creates an AggregatedConsumer instance from the provided data.
 
         Args:
-            - df_row (pd.Series): The row of data representing a consumer.
+            - df_row (dict[str, Any]): The row of data representing a consumer.
             - stack_base_fractions (dict[str, dict[str, float]]): Dictionary of base fractions
                 for each technology stack.
             - yearly_energy_usage (dict[str, dict[str, pd.Series]]): Dictionary of yearly energy usage by
@@ -25,7 +25,7 @@ class CapacityFactorParser(AbstractElementParser):
             - capacity_factors_df (pd.DataFrame): DataFrame containing capacity factor profiles
               for various technologies.
         """
-        self.capacity_factors_df = capacity_factors_df.copy(deep=True)
+        self.capacity_factors_df = capacity_factors_df.copy(deep=False)
 
     def create(self) -> tuple[CapacityFactor, ...]:
         """
@@ -40,9 +40,11 @@ class DemandProfileParser(AbstractElementParser):
         """
         demand_profiles: list[DemandProfile] = list()
         for name, demand_df in self.demand_dict.items():
+            profile_df = demand_df.copy(deep=False)
+            profile_df.set_index("hour_idx", inplace=True)
             demand_profile = DemandProfile(
                 name=str(name),
-                normalized_profile=demand_df.set_index("hour_idx").to_dict("series"),
+                normalized_profile=profile_df.to_dict("series"),
             )
             demand_profiles.append(demand_profile)
 
@@ -1,7 +1,10 @@
 from abc import ABC, abstractmethod
+from typing import Any, Callable, TypeVar
 
 from pyzefir.model.network_element import NetworkElement
 
+T = TypeVar("T")
+
 
 class AbstractElementParser(ABC):
     """
@@ -12,8 +15,30 @@ class AbstractElementParser(ABC):
     the `create` method, which should return a tuple of NetworkElement instances.
     """
 
+    def __init__(self) -> None:
+        self._indexed_cache: dict[str, tuple[Any, Any]] = {}
+        """ attribute name -> (input frame, lookup structure built from it), see _indexed """
+
     @abstractmethod
     def create(
         self,
     ) -> tuple[NetworkElement, ...] | tuple[tuple[NetworkElement, ...], ...]:
         raise NotImplementedError
+
+    def _indexed(self, attr_name: str, build: Callable[[Any], T]) -> T:
+        """
+        Lookup structure built once from the input frame stored in given attribute (and built again
+        only if the attribute is replaced), so data of single elements is not filtered from the frame.
+
+        Args:
+            - attr_name (str): name of the attribute with the input frame
+            - build (Callable[[Any], T]): function building the structure from the frame
+
+        Returns:
+            - T: structure built from the current value of the attribute
+        """
+        source = getattr(self, attr_name)
+        cached = self._indexed_cache.get(attr_name)
+        if cached is None or cached[0] is not source:
+            cached = self._indexed_cache[attr_name] = (source, build(source))
+        return cached[1]
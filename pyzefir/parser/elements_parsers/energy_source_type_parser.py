@@ -68,6 +68,7 @@ class EnergySourceTypeParser(AbstractElementParser):
             - generators_minimal_power_utilization (pd.DataFrame): DataFrame detailing minimal
               power utilization metrics.
         """
+        super().__init__()
         self.generators_energy_type = generators_energy_type.copy(deep=True).set_index(
             "generator_type"
         )
@@ -107,15 +108,23 @@ class EnergySourceTypeParser(AbstractElementParser):
             - dict[str, pd.DataFrame]: A dictionary with energy source types as keys
               and their respective DataFrames of parameters as values.
         """
-        energy_source_types = self.cost_parameters_df["technology_type"].unique()
+        cost_groups = dict(
+            tuple(self.cost_parameters_df.groupby("technology_type", sort=False))
+        )
+        evolution_limits_groups = dict(
+            tuple(
+                self.energy_mix_evolution_limits_df.groupby(
+                    "technology_type", sort=False
+                )
+            )
+        )
+        no_evolution_limits = self.energy_mix_evolution_limits_df.iloc[:0]
         result_dict = dict()
-        for en_source_type in energy_source_types:
-            cost_df = self.cost_parameters_df[
-                self.cost_parameters_df["technology_type"] == en_source_type
-            ].set_index("year_idx", drop=True)
-            evolution_limits_df = self.energy_mix_evolution_limits_df[
-                self.energy_mix_evolution_limits_df["technology_type"] == en_source_type
-            ].set_index("year_idx", drop=True)
+        for en_source_type in self.cost_parameters_df["technology_type"].unique():
+            cost_df = cost_groups[en_source_type].set_index("year_idx", drop=True)
+            evolution_limits_df = evolution_limits_groups.get(
+                en_source_type, no_evolution_limits
+            ).set_index("year_idx", drop=True)
             result_dict[en_source_type] = pd.concat(
                 [cost_df, evolution_limits_df], axis=1
             )
@@ -145,12 +154,18 @@ class EnergySourceTypeParser(AbstractElementParser):
         emission_dict: dict[str, dict[str, list[float]]] = defaultdict(dict)
         if not df_yer.empty:
             for emission_type, group in df_yer.groupby("emission_type"):
-                for col in group.columns[2:]:
-                    emission_dict[col][emission_type] = group[col].dropna().tolist()
-        for generator in df_er.index:
-            for emission_type in df_er.columns:
-                first_value = df_er.loc[generator, emission_type]
-                remaining_values = emission_dict.get(generator, {}).get(emission_type)
+                values = group.iloc[:, 2:]
+                not_na = values.notna().to_numpy()
+                for col_idx, col in enumerate(values.columns):
+                    emission_dict[col][emission_type] = (
+                        values.iloc[:, col_idx].to_numpy()[not_na[:, col_idx]].tolist()
+                    )
+        er_values = df_er.to_numpy()
+        for gen_idx, generator in enumerate(df_er.index):
+            generator_emissions = emission_dict.get(generator, {})
+            for et_idx, emission_type in enumerate(df_er.columns):
+                first_value = er_values[gen_idx, et_idx]
+                remaining_values = generator_emissions.get(emission_type)
                 if not remaining_values:
                     result_dict[generator][emission_type] = pd.Series(
                         [first_value] * n_years
@@ -206,13 +221,17 @@ class EnergySourceTypeParser(AbstractElementParser):
         """
         name = df_row["name"]
         energy_source_df = energy_source_type_df[name]
-        fuel_row = self.generators_fuel_type[
-            self.generators_fuel_type["generator_type"] == name
-        ]
-        energy_types = self.generators_energy_type.loc[name]
-        if isinstance(energy_types, pd.DataFrame):
-            energy_types = energy_types.squeeze()
-        energy_types = set(energy_types)
+        fuel_row = self._indexed(
+            "generators_fuel_type",
+            lambda df: dict(tuple(df.groupby("generator_type", sort=False))),
+        ).get(name, self.generators_fuel_type.iloc[:0])
+        energy_types = self._indexed(
+            "generators_energy_type",
+            lambda df: {
+                gen_type: set(group.to_numpy().ravel())
+                for gen_type, group in df.groupby(level=0, sort=False)
+            },
+        )[name]
         gen_type = GeneratorType(
             name=name,
             life_time=int(df_row["life_time"]),
@@ -290,11 +309,10 @@ class EnergySourceTypeParser(AbstractElementParser):
 
         energy_loss = self.storage_type_df.loc[name]["energy_loss"]
         energy_loss = 0.0 if np.isnan(energy_loss) else float(energy_loss)
-        generation_load_method: str | None = (
-            self.storage_calculation_settings.set_index("storage_type")[
-                "generation_load_method"
-            ].get(name, None)
-        )
+        generation_load_method: str | None = self._indexed(
+            "storage_calculation_settings",
+            lambda df: df.set_index("storage_type")["generation_load_method"],
+        ).get(name, None)
         return StorageType(
             name=name,
             life_time=int(df_row["life_time"]),
@@ -5,7 +5,11 @@ from pyzefir.parser.elements_parsers.aggregated_consumer_parser import (
     AggregatedConsumerParser,
 )
 from pyzefir.parser.elements_parsers.element_parser import AbstractElementParser
-from pyzefir.parser.elements_parsers.utils import convert_to_float, create_tags_list
+from pyzefir.parser.elements_parsers.utils import (
+    YearlyValues,
+    convert_to_float,
+    create_tags_list,
+)
 
 
 class EnergySourceUnitParser(AbstractElementParser):
@@ -15,8 +19,16 @@ class EnergySourceUnitParser(AbstractElementParser):
 
     It manages various aspects of energy source modeling, including technology evolution and binding information.
     The class encapsulates the logic for retrieving data and constructing objects required for energy simulations.
+    Input frames are grouped once, so data of a single unit is sliced instead of filtered from the whole frame.
     """
 
+    _EVOLUTION_COLUMNS = [
+        "min_capacity",
+        "max_capacity",
+        "min_capacity_increase",
+        "max_capacity_increase",
+    ]
+
     def __init__(
         self,
         df_generators: pd.DataFrame,
@@ -51,6 +63,7 @@ class EnergySourceUnitParser(AbstractElementParser):
             - n_consumers (pd.DataFrame): DataFrame with consumer-related data.
             - df_binding (pd.DataFrame): DataFrame mapping generators to their bindings.
         """
+        super().__init__()
         self.df_technology_bus = df_technology_bus.copy(deep=True)
         self.df_generators = df_generators.copy(deep=True)
         self.df_storages = df_storages.copy(deep=True)
@@ -80,10 +93,25 @@ class EnergySourceUnitParser(AbstractElementParser):
         Returns:
             - set[str]: A set of bus names associated with the specified technology.
         """
-        df_technology_bus = self.df_technology_bus.loc[
-            self.df_technology_bus["technology"] == name
-        ]
-        return set(df_technology_bus["bus"].to_list())
+        return set(self._technology_buses.get(name, []))
+
+    @property
+    def _technology_buses(self) -> dict[str, list[str]]:
+        """technology name -> names of its buses"""
+        return self._indexed(
+            "df_technology_bus",
+            lambda df: df.groupby("technology", sort=False)["bus"].agg(list).to_dict(),
+        )
+
+    @property
+    def _evolution(self) -> YearlyValues:
+        """yearly capacity bounds of all units"""
+        return self._indexed(
+            "df_element_energy_evolution",
+            lambda df: YearlyValues(
+                df, "technology_name", "year_idx", self._EVOLUTION_COLUMNS, self.n_years
+            ),
+        )
 
     def _get_bus_from_dataframe(self, name: str) -> str:
         """
@@ -95,10 +123,22 @@ class EnergySourceUnitParser(AbstractElementParser):
         Returns:
             - str: The name of the bus associated with the specified technology.
         """
-        df_technology_bus = self.df_technology_bus.loc[
-            self.df_technology_bus["technology"] == name
-        ]
-        return df_technology_bus["bus"].iloc[0]
+        return self._technology_buses.get(name, [])[0]
+
+    def _capacity_evolution(self, name: str) -> dict[str, pd.Series]:
+        """
+        Yearly capacity bounds of the unit.
+
+        Args:
+            - name (str): The name of the unit.
+
+        Returns:
+            - dict[str, pd.Series]: Unit capacity bounds keyed by Generator / Storage parameter name.
+        """
+        return {
+            f"unit_{column}": self._evolution.series(name, column)
+            for column in self._EVOLUTION_COLUMNS
+        }
 
     def _create_generator(self, df_row: pd.Series) -> Generator:
         """
@@ -111,9 +151,6 @@ class EnergySourceUnitParser(AbstractElementParser):
             - Generator: An instance of the Generator class populated with the row data.
         """
         name = str(df_row["name"])
-        technology_evolution_df = self.df_element_energy_evolution[
-            self.df_element_energy_evolution["technology_name"] == name
-        ].set_index("year_idx")
         return Generator(
             name=name,
             generator_binding=(
@@ -121,19 +158,8 @@ class EnergySourceUnitParser(AbstractElementParser):
             ),
             bus=self._get_set_of_buses_from_dataframe(name),
             energy_source_type=str(df_row["generator_type"]),
-            unit_base_cap=float(self.df_base_cap.loc[name]["unit_base_capacity"]),
-            unit_min_capacity=technology_evolution_df["min_capacity"].reindex(
-                range(self.n_years)
-            ),
-            unit_max_capacity=technology_evolution_df["max_capacity"].reindex(
-                range(self.n_years)
-            ),
-            unit_min_capacity_increase=technology_evolution_df[
-                "min_capacity_increase"
-            ].reindex(range(self.n_years)),
-            unit_max_capacity_increase=technology_evolution_df[
-                "max_capacity_increase"
-            ].reindex(range(self.n_years)),
+            unit_base_cap=float(self.df_base_cap.at[name, "unit_base_capacity"]),
+            **self._capacity_evolution(name),
             min_device_nom_power=convert_to_float(df_row["min_device_nom_power"]),
             max_device_nom_power=convert_to_float(df_row["max_device_nom_power"]),
             emission_fee=(
@@ -155,26 +181,12 @@ class EnergySourceUnitParser(AbstractElementParser):
             - Storage: An instance of the Storage class populated with the row data.
         """
         name = str(df_row["name"])
-        technology_evolution_df = self.df_element_energy_evolution[
-            self.df_element_energy_evolution["technology_name"] == name
-        ].set_index("year_idx")
         return Storage(
             name=name,
             bus=self._get_bus_from_dataframe(name),
             energy_source_type=str(df_row["storage_type"]),
-            unit_base_cap=float(self.df_base_cap.loc[name]["unit_base_capacity"]),
-            unit_min_capacity=technology_evolution_df["min_capacity"].reindex(
-                range(self.n_years)
-            ),
-            unit_max_capacity=technology_evolution_df["max_capacity"].reindex(
-                range(self.n_years)
-            ),
-            unit_min_capacity_increase=technology_evolution_df[
-                "min_capacity_increase"
-            ].reindex(range(self.n_years)),
-            unit_max_capacity_increase=technology_evolution_df[
-                "max_capacity_increase"
-            ].reindex(range(self.n_years)),
+            unit_base_cap=float(self.df_base_cap.at[name, "unit_base_capacity"]),
+            **self._capacity_evolution(name),
             min_device_nom_power=convert_to_float(df_row["min_device_nom_power"]),
             max_device_nom_power=convert_to_float(df_row["max_device_nom_power"]),
             tags=create_tags_list(df_row[4:]),
@@ -238,11 +250,18 @@ class EnergySourceUnitParser(AbstractElementParser):
         n_consumer_dict = AggregatedConsumerParser._create_consumers(
             n_consumer, n_years=1
         )
-        for aggr, n_consumer_series in n_consumer_dict.items():
-            if 0 in n_consumer_series:
-                energy_sources.loc[
-                    energy_sources["aggregate"] == aggr, "n_consumers_base"
-                ] = n_consumer_series[0]
+        n_consumers_base = pd.Series(
+            {
+                aggr: n_consumer_series[0]
+                for aggr, n_consumer_series in n_consumer_dict.items()
+                if 0 in n_consumer_series
+            },
+            dtype=float,
+        )
+        has_base = energy_sources["aggregate"].isin(n_consumers_base.index)
+        energy_sources.loc[has_base, "n_consumers_base"] = energy_sources.loc[
+            has_base, "aggregate"
+        ].map(n_consumers_base)
 
         # update missing base capacity values
         energy_sources["unit_base_capacity"] = energy_sources["base_capacity"]
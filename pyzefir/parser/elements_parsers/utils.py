@@ -1,3 +1,4 @@
+import numpy as np
 import pandas as pd
 
 
@@ -52,3 +53,84 @@ def create_tags_list(tags: pd.Series) -> list[str]:
         - list[str]: A list of tags corresponding to the truthy values in the provided Series.
     """
     return tags[tags].index.to_list()
+
+
+class YearlyValues:
+    """
+    Yearly columns of a frame with rows (key, year) arranged into arrays of shape (keys, years), so
+    values of a single key are sliced instead of filtering the whole frame for every key.
+
+    series(key, column) is equal to
+    df[df[key_column] == key].set_index(year_column)[column].reindex(range(n_years)).
+    """
+
+    def __init__(
+        self,
+        df: pd.DataFrame,
+        key_columns: str | list[str],
+        year_column: str,
+        value_columns: list[str],
+        n_years: int,
+    ) -> None:
+        """
+        Args:
+            - df (pd.DataFrame): frame with key, year and value columns
+            - key_columns (str | list[str]): column (or columns) identifying the element
+            - year_column (str): column with year indices
+            - value_columns (list[str]): yearly columns to arrange
+            - n_years (int): number of years
+
+        Raises:
+            - ValueError: if a key has duplicated years
+        """
+        self.n_years = n_years
+        self._year_column = year_column
+        keys = (
+            pd.Index(df[key_columns])
+            if isinstance(key_columns, str)
+            else pd.MultiIndex.from_frame(df[key_columns])
+        )
+        codes, uniques = keys.factorize()
+        self._positions = {key: pos for pos, key in enumerate(uniques)}
+        years = pd.to_numeric(df[year_column]).to_numpy(dtype=float)
+        valid = (codes != -1) & (years >= 0) & (years < n_years)
+        codes, years = codes[valid], years[valid].astype(int)
+        cells = codes * n_years + years
+        if len(np.unique(cells)) != len(cells):
+            raise ValueError("cannot reindex on an axis with duplicate labels")
+        self._complete = np.bincount(codes, minlength=len(uniques)) == n_years
+        self._dtypes = {column: df[column].dtype for column in value_columns}
+        self._values = {}
+        for column in value_columns:
+            values = np.full(
+                (len(uniques), n_years),
+                np.nan,
+                dtype=object if self._dtypes[column].kind == "O" else float,
+            )
+            values[codes, years] = df[column].to_numpy()[valid]
+            self._values[column] = values
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._positions
+
+    def values(self, key: object, column: str) -> np.ndarray:
+        """Values of the column for given key in subsequent years (nan if missing)."""
+        if (pos := self._positions.get(key)) is None:
+            return np.full(self.n_years, np.nan, dtype=self._values[column].dtype)
+        return self._values[column][pos]
+
+    def series(self, key: object, column: str) -> pd.Series:
+        """Values of the column for given key as a series indexed by years."""
+        values = self.values(key, column)
+        dtype = self._dtypes[column]
+        if (
+            dtype.kind in "iub"
+            and (pos := self._positions.get(key)) is not None
+            and self._complete[pos]
+        ):
+            values = values.astype(dtype)
+        return pd.Series(
+            values,
+            index=pd.RangeIndex(self.n_years, name=self._year_column),
+            name=column,
+        )
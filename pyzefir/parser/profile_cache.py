@@ -0,0 +1,115 @@
+import logging
+from pathlib import Path
+from typing import Callable
+
+import pandas as pd
+import pyarrow as pa
+
+from pyzefir.parser.validator.valid_structure import get_dataset_config_from_categories
+
+logger = logging.getLogger(__name__)
+
+
+class ProfileCache:
+    """
+    Cache of hourly datasets (hour_idx column and one float column per profile, e.g. capacity factors,
+    demand profiles, power utilization) stored as Arrow IPC files read with memory mapping.
+
+    A dataset is read from the csv file (and validated) only if its cache file does not exist or was
+    created from a different version of the csv file, otherwise columns of the returned DataFrame are
+    read only views of the memory mapped cache file. Pages of the file are loaded when they are used,
+    so resident memory of the profiles scales with the hours actually used by the model.
+    """
+
+    SOURCE_MTIME_KEY: bytes = b"pyzefir.source_mtime_ns"
+    """ schema metadata key with modification time of the csv file """
+    SOURCE_SIZE_KEY: bytes = b"pyzefir.source_size"
+    """ schema metadata key with size of the csv file """
+
+    def __init__(self, path: Path) -> None:
+        """
+        Initializes a new instance of the class.
+
+        Args:
+            - path (Path): cache directory (created if it does not exist)
+        """
+        self.path = path
+
+    @staticmethod
+    def is_hourly_dataset(category: str, dataset_name: str) -> bool:
+        """
+        Checks if the dataset contains hourly profiles (hour_idx column and float profile columns).
+
+        Args:
+            - category (str): data category of the dataset
+            - dataset_name (str): name of the dataset
+
+        Returns:
+            - bool: True if the dataset can be cached
+        """
+        config = get_dataset_config_from_categories(category, dataset_name)
+        return config.columns == {"hour_idx": int} and config.default_type == {float}
+
+    def read(
+        self,
+        category: str,
+        dataset_name: str,
+        csv_path: Path,
+        read_csv: Callable[[], pd.DataFrame],
+    ) -> pd.DataFrame:
+        """
+        Reads the dataset from the cache, the cache file is (re)created from the csv file if needed.
+
+        Args:
+            - category (str): data category of the dataset
+            - dataset_name (str): name of the dataset
+            - csv_path (Path): path of the csv file of the dataset
+            - read_csv (Callable[[], pd.DataFrame]): reads and validates the csv file
+
+        Returns:
+            - pd.DataFrame: dataset with columns memory mapped from the cache file
+        """
+        cache_path = self.path / category / f"{dataset_name}.arrow"
+        stat = csv_path.stat()
+        metadata = {
+            self.SOURCE_MTIME_KEY: str(stat.st_mtime_ns).encode(),
+            self.SOURCE_SIZE_KEY: str(stat.st_size).encode(),
+        }
+        if not self._is_fresh(cache_path, metadata):
+            df = read_csv()
+            if df.empty:
+                return df
+            self._write(cache_path, df, metadata)
+            logger.debug("Hourly dataset %s cached in %s", dataset_name, cache_path)
+        return self._read(cache_path)
+
+    @staticmethod
+    def _is_fresh(cache_path: Path, metadata: dict[bytes, bytes]) -> bool:
+        """True if the cache file was created from the csv file with given metadata."""
+        if not cache_path.is_file():
+            return False
+        try:
+            schema = pa.ipc.open_file(pa.memory_map(str(cache_path))).schema
+        except pa.ArrowInvalid:
+            return False
+        return all(
+            (schema.metadata or {}).get(key) == value for key, value in metadata.items()
+        )
+
+    @staticmethod
+    def _write(
+        cache_path: Path, df: pd.DataFrame, metadata: dict[bytes, bytes]
+    ) -> None:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        table = pa.Table.from_pandas(df, preserve_index=False)
+        table = table.replace_schema_metadata(metadata)
+        tmp_path = cache_path.with_suffix(".tmp")
+        with pa.OSFile(str(tmp_path), "wb") as sink:
+            with pa.ipc.new_file(sink, table.schema) as writer:
+                writer.write_table(table)
+        tmp_path.replace(cache_path)
+
+    @staticmethod
+    def _read(cache_path: Path) -> pd.DataFrame:
+        table = pa.ipc.open_file(pa.memory_map(str(cache_path))).read_all()
+        return table.to_pandas(split_blocks=True)
@@ -1,15 +1,41 @@
 import logging
+from functools import reduce
 from pathlib import Path
+from typing import Any, Final
 
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
+import xlsxwriter
+from pandas.api.types import is_numeric_dtype
 from sanitize_filename import sanitize
+from xlsxwriter.worksheet import Worksheet
 
-from pyzefir.optimization.exportable_results import ExportableResultsGroup
+from pyzefir.optimization.results import ENERGY_TYPE_LABEL, HOUR_LABEL, YEAR_LABEL
 from pyzefir.postprocessing.results_handler import Exporter
 
 _logger = logging.getLogger(__name__)
 
 
+def _blocks(length: int, block_size: int) -> list[tuple[int, int]]:
+    """Bounds (start, stop) of subsequent blocks of given size, at least one (possibly empty) block."""
+    return [
+        (start, min(start + block_size, length))
+        for start in range(0, max(length, 1), block_size)
+    ]
+
+
+def _cell(value: Any) -> Any:
+    """Value written to xlsx cell (numpy scalars converted to python types, NaN left blank)."""
+    if isinstance(value, np.generic):
+        value = value.item()
+    if isinstance(value, float) and not np.isfinite(value):
+        return None
+    return value
+
+
 class CsvExporter(Exporter):
     """
     Class for exporting data to CSV format.
@@ -20,34 +46,33 @@ class CsvExporter(Exporter):
     """
 
     @staticmethod
-    def export_group_results(root_path: Path, result: ExportableResultsGroup) -> None:
+    def export_field_results(
+        root_path: Path, field_name: str, field_value: pd.DataFrame | dict
+    ) -> None:
         """
-        Export exportable group results to CSV files.
+        Export a single field of exportable group results to CSV files.
 
-        This method iterates over the fields of the provided results group and exports
-        each field's data into CSV format. It handles both individual DataFrames and
-        dictionaries of DataFrames, creating directories as needed for organized storage.
+        This method exports the field's data into CSV format. It handles both individual
+        DataFrames and dictionaries of DataFrames, creating directories as needed for organized storage.
 
         Args:
             - root_path (Path): The root path for exporting the results.
-            - result (ExportableResultsGroup): The exportable results to be parsed and exported.
+            - field_name (str): The name of the field.
+            - field_value (pd.DataFrame | dict): The field value (DataFrame or dictionary of DataFrames).
         """
-        if Exporter.is_results_group_empty(result):
-            return
-        for field_name, field_value in result.__dict__.items():
-            output_path = root_path / field_name
-            output_path.mkdir(parents=True, exist_ok=True)
-            if isinstance(field_value, dict):
-                for df_name, df in field_value.items():
-                    df.to_csv(output_path / f"{sanitize(df_name)}.csv")
-                    _logger.debug(
-                        f"Data {df_name} saved under the path: {output_path / f'{sanitize(df_name)}.csv'}"
-                    )
-            else:
-                field_value.to_csv(output_path / f"{field_name}.csv")
+        output_path = root_path / field_name
+        output_path.mkdir(parents=True, exist_ok=True)
+        if isinstance(field_value, dict):
+            for df_name, df in field_value.items():
+                df.to_csv(output_path / f"{sanitize(df_name)}.csv")
                 _logger.debug(
-                    f"Data {field_name} saved under the path: {output_path / f'{field_name}.csv'}"
+                    f"Data {df_name} saved under the path: {output_path / f'{sanitize(df_name)}.csv'}"
                 )
+        else:
+            field_value.to_csv(output_path / f"{field_name}.csv")
+            _logger.debug(
+                f"Data {field_name} saved under the path: {output_path / f'{field_name}.csv'}"
+            )
 
     @staticmethod
     def export_objective_result(
@@ -73,42 +98,239 @@ class XlsxExporter(Exporter):
     This class provides methods to export various data structures into XLSX files.
     It ensures that data from groups and individual results are properly organized
     into separate sheets, facilitating easy access and analysis.
+
+    In streaming mode frames of a field are not concatenated, the units are written in column
+    blocks row by row with XlsxWriter constant_memory mode, so only a single row is kept in memory
+    by the writer. When Excel row or column limits are reached the data is split into subsequent
+    sheets and, after max_sheets_per_workbook sheets, into subsequent workbooks
+    (<field>.xlsx, <field>_2.xlsx, ...). Optionally hourly results are replaced with their annual sums.
     """
 
-    @staticmethod
-    def export_group_results(root_path: Path, result: ExportableResultsGroup) -> None:
+    MAX_ROWS: Final[int] = 1_048_576
+    """ maximal number of rows of Excel sheet """
+    MAX_COLUMNS: Final[int] = 16_384
+    """ maximal number of columns of Excel sheet """
+    _MAX_SHEET_NAME_LENGTH: Final[int] = 31
+    _ROWS_CHUNK: Final[int] = 1024
+
+    def __init__(
+        self,
+        streaming: bool = False,
+        annual_sums: bool = False,
+        max_sheets_per_workbook: int = 16,
+        max_rows: int = MAX_ROWS,
+        max_columns: int = MAX_COLUMNS,
+    ) -> None:
         """
-        Export exportable group results to XLSX files.
+        Initializes a new instance of the class.
 
-        This method iterates over the fields of the provided results group and exports
-        each field's data into XLSX format. It handles both individual DataFrames and
-        dictionaries of DataFrames, creating an XLSX file for each field with appropriate data.
+        Args:
+            - streaming (bool): write frames in column blocks with constant memory, default = False
+            - annual_sums (bool): export annual sums of hourly results instead of hourly data,
+                default = False
+            - max_sheets_per_workbook (int): number of sheets after which streamed field is continued
+                in the next workbook, default = 16
+            - max_rows (int): maximal number of rows of a streamed sheet, default = MAX_ROWS
+            - max_columns (int): maximal number of columns of a streamed sheet, default = MAX_COLUMNS
+        """
+        if not 0 < max_rows <= self.MAX_ROWS or not 0 < max_columns <= self.MAX_COLUMNS:
+            raise ValueError(
+                f"Sheet size must be positive and not greater than {self.MAX_ROWS} rows "
+                f"and {self.MAX_COLUMNS} columns, given {max_rows} rows and {max_columns} columns"
+            )
+        if max_sheets_per_workbook < 1:
+            raise ValueError(
+                f"max_sheets_per_workbook must be positive, given {max_sheets_per_workbook}"
+            )
+        self._streaming = streaming
+        self._annual_sums = annual_sums
+        self._max_sheets_per_workbook = max_sheets_per_workbook
+        self._max_rows = max_rows
+        self._max_columns = max_columns
+
+    def export_field_results(
+        self, root_path: Path, field_name: str, field_value: pd.DataFrame | dict
+    ) -> None:
+        """
+        Export a single field of exportable group results to XLSX file.
+
+        This method exports the field's data into XLSX format. It handles both individual
+        DataFrames and dictionaries of DataFrames, creating an XLSX file for the field with appropriate data.
 
         Args:
             - root_path (Path): The root path for exporting the results.
-            - result (ExportableResultsGroup): The exportable results to be parsed and exported.
+            - field_name (str): The name of the field.
+            - field_value (pd.DataFrame | dict): The field value (DataFrame or dictionary of DataFrames).
         """
-        if Exporter.is_results_group_empty(result):
-            return
         root_path.mkdir(parents=True, exist_ok=True)
-        for field_name, field_value in result.__dict__.items():
-            with pd.ExcelWriter(
-                (root_path / field_name).with_suffix(".xlsx"), engine="xlsxwriter"
-            ) as writer:
-                if isinstance(field_value, dict):
-                    if not field_value:
-                        _logger.info(
-                            f"No results found for: {field_name} when saving results to xlsx."
-                        )
-                        continue
-                    df = pd.concat(field_value, axis=1).sort_index(axis=1)
-                else:
-                    df = field_value
-                df.to_excel(writer, sheet_name=field_name)
-                _logger.debug(
-                    f"Data {field_name} saved under the path: {(root_path / field_name).with_suffix('.xlsx')}"
+        if self._annual_sums:
+            field_value = self.annual_sums(field_value)
+        if self._streaming:
+            if isinstance(field_value, dict) and not field_value:
+                _logger.info(
+                    f"No results found for: {field_name} when saving results to xlsx."
+                )
+                return
+            self._write_streaming(root_path, field_name, field_value)
+            return
+        with pd.ExcelWriter(
+            (root_path / field_name).with_suffix(".xlsx"), engine="xlsxwriter"
+        ) as writer:
+            if isinstance(field_value, dict):
+                if not field_value:
+                    _logger.info(
+                        f"No results found for: {field_name} when saving results to xlsx."
+                    )
+                    return
+                df = pd.concat(field_value, axis=1).sort_index(axis=1)
+            else:
+                df = field_value
+            df.to_excel(writer, sheet_name=field_name)
+            _logger.debug(
+                f"Data {field_name} saved under the path: {(root_path / field_name).with_suffix('.xlsx')}"
+            )
+
+    @staticmethod
+    def annual_sums(field_value: pd.DataFrame | dict) -> pd.DataFrame | dict:
+        """
+        Replaces hourly results (frames with years in columns) with their annual sums. Dictionary of
+        hourly frames is replaced with a single frame (index - name [and energy type], columns - years),
+        yearly results are returned unchanged.
+
+        Args:
+            - field_value (pd.DataFrame | dict): The field value (DataFrame or dictionary of DataFrames).
+
+        Returns:
+            - pd.DataFrame | dict: annual sums of hourly results or unchanged field value
+        """
+        if isinstance(field_value, pd.DataFrame):
+            return field_value
+        if not field_value or any(
+            df.columns.name != YEAR_LABEL for df in field_value.values()
+        ):
+            return field_value
+        key_columns = {
+            name: [column for column in df.columns if not is_numeric_dtype(df[column])]
+            for name, df in field_value.items()
+        }
+        if not any(key_columns.values()):
+            return pd.DataFrame(
+                {name: df.sum() for name, df in field_value.items()}
+            ).T.rename_axis(index="Name")
+        return pd.concat(
+            {
+                name: df.groupby(key_columns[name]).sum(numeric_only=True)
+                for name, df in field_value.items()
+            },
+            names=["Name"],
+        )
+
+    def _write_streaming(
+        self, root_path: Path, field_name: str, field_value: pd.DataFrame | dict
+    ) -> None:
+        """
+        Writes field value in column blocks with XlsxWriter constant_memory mode. Layout of the sheets
+        is the same as the one of pandas (two header rows with names and columns of the frames and row
+        with index names in case of dictionary of frames).
+        """
+        frames = (
+            {
+                name: self._with_keys_in_index(df)
+                for name, df in sorted(field_value.items())
+            }
+            if isinstance(field_value, dict)
+            else {None: field_value}
+        )
+        index = reduce(pd.Index.union, (df.index for df in frames.values()))
+        if not all(df.index.equals(index) for df in frames.values()):
+            frames = {name: df.reindex(index) for name, df in frames.items()}
+        columns = [
+            (name, column) for name, df in frames.items() for column in df.columns
+        ]
+        multi_header = isinstance(field_value, dict)
+        header_rows = 3 if multi_header else 1
+        n_rows = self._max_rows - header_rows
+        n_columns = self._max_columns - index.nlevels
+        sheets = [
+            (rows, columns[col_start:col_stop])
+            for col_start, col_stop in _blocks(len(columns), n_columns)
+            for rows in (range(*bounds) for bounds in _blocks(len(index), n_rows))
+        ]
+        for book_idx, book_start in enumerate(
+            range(0, len(sheets), self._max_sheets_per_workbook)
+        ):
+            book_path = root_path / (
+                f"{field_name}.xlsx"
+                if not book_idx
+                else f"{field_name}_{book_idx + 1}.xlsx"
+            )
+            with xlsxwriter.Workbook(book_path, {"constant_memory": True}) as workbook:
+                for sheet_idx in range(
+                    book_start,
+                    min(book_start + self._max_sheets_per_workbook, len(sheets)),
+                ):
+                    rows, block = sheets[sheet_idx]
+                    worksheet = workbook.add_worksheet(
+                        self._sheet_name(field_name, sheet_idx)
+                    )
+                    self._write_sheet(
+                        worksheet, frames, index, rows, block, multi_header
+                    )
+            _logger.debug(f"Data {field_name} saved under the path: {book_path}")
+
+    def _write_sheet(
+        self,
+        worksheet: Worksheet,
+        frames: dict[str | None, pd.DataFrame],
+        index: pd.Index,
+        rows: range,
+        block: list[tuple[str | None, Any]],
+        multi_header: bool,
+    ) -> None:
+        """Writes given rows and columns of the frames to the sheet, row by row."""
+        n_index = index.nlevels
+        index_names = [_cell(name) for name in index.names]
+        if multi_header:
+            worksheet.write_row(0, n_index, [_cell(name) for name, _ in block])
+            worksheet.write_row(1, n_index, [_cell(column) for _, column in block])
+            worksheet.write_row(2, 0, index_names)
+            row_offset = 3
+        else:
+            worksheet.write_row(0, 0, index_names)
+            worksheet.write_row(0, n_index, [_cell(column) for _, column in block])
+            row_offset = 1
+        arrays = [frames[name][column].to_numpy() for name, column in block]
+        index_values = index.to_frame(index=False).to_numpy()
+        for chunk_start in range(rows.start, rows.stop, self._ROWS_CHUNK):
+            chunk_stop = min(chunk_start + self._ROWS_CHUNK, rows.stop)
+            values = [array[chunk_start:chunk_stop].tolist() for array in arrays]
+            for row in range(chunk_start, chunk_stop):
+                sheet_row = row - rows.start + row_offset
+                worksheet.write_row(
+                    sheet_row, 0, [_cell(value) for value in index_values[row]]
+                )
+                worksheet.write_row(
+                    sheet_row,
+                    n_index,
+                    [_cell(column[row - chunk_start]) for column in values],
                 )
 
+    @classmethod
+    def _sheet_name(cls, field_name: str, sheet_idx: int) -> str:
+        """Name of subsequent sheet of the field, shortened to Excel limit."""
+        if not sheet_idx:
+            return field_name[: cls._MAX_SHEET_NAME_LENGTH]
+        suffix = f"_{sheet_idx + 1}"
+        return field_name[: cls._MAX_SHEET_NAME_LENGTH - len(suffix)] + suffix
+
+    @staticmethod
+    def _with_keys_in_index(df: pd.DataFrame) -> pd.DataFrame:
+        """Moves not numeric columns (e.g. energy type) into the index, so the index is unique."""
+        key_columns = [
+            column for column in df.columns if not is_numeric_dtype(df[column])
+        ]
+        return df.set_index(key_columns, append=True) if key_columns else df
+
     @staticmethod
     def export_objective_result(
         root_path: Path, objective_value_series: pd.Series
@@ -143,41 +365,40 @@ class FeatherExporter(Exporter):
     """
 
     @staticmethod
-    def export_group_results(root_path: Path, result: ExportableResultsGroup) -> None:
+    def export_field_results(
+        root_path: Path, field_name: str, field_value: pd.DataFrame | dict
+    ) -> None:
         """
-        Export exportable group results to Feather files.
+        Export a single field of exportable group results to Feather files.
 
-        This method processes the fields of the provided results group, exporting each field's
-        data into Feather format. It supports both individual DataFrames and dictionaries of
-        DataFrames, ensuring each dataset is saved with appropriate naming conventions.
+        This method exports the field's data into Feather format. It supports both individual
+        DataFrames and dictionaries of DataFrames, ensuring each dataset is saved with appropriate
+        naming conventions.
 
         Args:
             - root_path (Path): The root path for exporting the results.
-            - result (ExportableResultsGroup): The exportable results to be parsed and exported.
+            - field_name (str): The name of the field.
+            - field_value (pd.DataFrame | dict): The field value (DataFrame or dictionary of DataFrames).
         """
-        if Exporter.is_results_group_empty(result):
-            return
-        for field_name, field_value in result.__dict__.items():
-            output_path = root_path / field_name
-            output_path.mkdir(parents=True, exist_ok=True)
-            if isinstance(field_value, dict):
-                for df_name, df in field_value.items():
-                    df.columns = df.columns.astype(str)
-                    df = df.reset_index()
-                    df.to_feather(
-                        output_path / f"{sanitize(df_name)}.feather", compression="lz4"
-                    )
-                    _logger.debug(
-                        f"Data {df_name} saved under the path: {output_path / f'{sanitize(df_name)}.feather'}"
-                    )
-            else:
-                field_value_df = field_value.reset_index()
-                field_value_df.to_feather(
-                    output_path / f"{field_name}.feather", compression="lz4"
+        output_path = root_path / field_name
+        output_path.mkdir(parents=True, exist_ok=True)
+        if isinstance(field_value, dict):
+            for df_name, df in field_value.items():
+                df = df.set_axis(df.columns.astype(str), axis=1).reset_index()
+                df.to_feather(
+                    output_path / f"{sanitize(df_name)}.feather", compression="lz4"
                 )
                 _logger.debug(
-                    f"Data {field_name} saved under the path: {output_path / f'{field_name}.feather'}"
+                    f"Data {df_name} saved under the path: {output_path / f'{sanitize(df_name)}.feather'}"
                 )
+        else:
+            field_value_df = field_value.reset_index()
+            field_value_df.to_feather(
+                output_path / f"{field_name}.feather", compression="lz4"
+            )
+            _logger.debug(
+                f"Data {field_name} saved under the path: {output_path / f'{field_name}.feather'}"
+            )
 
     @staticmethod
     def export_objective_result(
@@ -195,3 +416,153 @@ class FeatherExporter(Exporter):
         """
         df = objective_value_series.to_frame().reset_index()
         df.to_feather(root_path / f"{objective_value_series.name}.feather")
+
+
+class ParquetExporter(Exporter):
+    """
+    Class for exporting data to a partitioned Parquet dataset.
+
+    Instead of one file per element, every field of the results group is saved as a single
+    long format table (name, [energy type], [element], year, [hour], value), written with pyarrow
+    dataset writer into the field directory. Names are dictionary encoded and files are compressed
+    with zstd. Optionally the tables are partitioned by year (hive partitioning, year=<year>).
+    """
+
+    NAME_COLUMN: Final[str] = "name"
+    """ name of the element (dictionary key or column of not hourly frame) """
+    ELEMENT_COLUMN: Final[str] = "element"
+    """ column of yearly frame stored in a dictionary (e.g. local balancing stack of aggregate) """
+    VALUE_COLUMN: Final[str] = "value"
+    _column_names: Final[dict[str, str]] = {
+        YEAR_LABEL: "year",
+        HOUR_LABEL: "hour",
+        ENERGY_TYPE_LABEL: "energy_type",
+    }
+
+    def __init__(self, partition_by_year: bool = False) -> None:
+        """
+        Initializes a new instance of the class.
+
+        Args:
+            - partition_by_year (bool): partition tables by year, default = False
+        """
+        self._partition_by_year = partition_by_year
+
+    def export_field_results(
+        self, root_path: Path, field_name: str, field_value: pd.DataFrame | dict
+    ) -> None:
+        """
+        Export a single field of exportable group results to Parquet dataset.
+
+        Args:
+            - root_path (Path): The root path for exporting the results.
+            - field_name (str): The name of the field.
+            - field_value (pd.DataFrame | dict): The field value (DataFrame or dictionary of DataFrames).
+        """
+        if isinstance(field_value, dict):
+            frames = [
+                self._to_long_format(df, name, hourly_columns=True)
+                for name, df in field_value.items()
+            ]
+        else:
+            frames = [self._to_long_format(field_value)]
+        frames = [df for df in frames if not df.empty]
+        if not frames:
+            _logger.info(
+                f"No results found for: {field_name} when saving results to parquet."
+            )
+            return
+        self._write_dataset(root_path / field_name, pd.concat(frames))
+        _logger.debug(
+            f"Data {field_name} saved under the path: {root_path / field_name}"
+        )
+
+    def export_objective_result(
+        self, root_path: Path, objective_value_series: pd.Series
+    ) -> None:
+        """
+        Exports the given objective value series to a Parquet file.
+
+        Args:
+            - root_path (Path): The root path where the Parquet file will be saved.
+            - objective_value_series (pd.Series): A Pandas Series containing objective values.
+        """
+        root_path.mkdir(parents=True, exist_ok=True)
+        pq.write_table(
+            pa.Table.from_pandas(objective_value_series.to_frame().reset_index()),
+            root_path / f"{objective_value_series.name}.parquet",
+            compression="zstd",
+        )
+
+    @staticmethod
+    def read_field(field_path: Path) -> pd.DataFrame:
+        """
+        Reads long format table of a single field saved by the exporter.
+
+        Args:
+            - field_path (Path): path to the field directory (root_path / group / field)
+
+        Returns:
+            - pd.DataFrame: long format table of the field
+        """
+        return (
+            ds.dataset(field_path, format="parquet", partitioning="hive")
+            .to_table()
+            .to_pandas()
+        )
+
+    def _to_long_format(
+        self, df: pd.DataFrame, name: str | None = None, hourly_columns: bool = False
+    ) -> pd.DataFrame:
+        """
+        Converts wide frame into long format. Frames stored in dictionaries have years in columns
+        (hourly results) unless columns are not named as years (yearly results of aggregates), frames
+        not stored in dictionaries have years in index and element names in columns.
+        """
+        if df.empty:
+            return pd.DataFrame()
+        key_columns = [
+            column for column in df.columns if not is_numeric_dtype(df[column])
+        ]
+        hourly = hourly_columns and (df.columns.name == YEAR_LABEL or bool(key_columns))
+        index_name = df.index.name or (HOUR_LABEL if hourly else YEAR_LABEL)
+        columns_name = (
+            YEAR_LABEL
+            if hourly
+            else (self.ELEMENT_COLUMN if name is not None else self.NAME_COLUMN)
+        )
+        long_df = (
+            df.rename_axis(index=index_name, columns=columns_name)
+            .set_index(key_columns, append=True)
+            .stack()
+            .rename(self.VALUE_COLUMN)
+            .reset_index()
+            .rename(columns=self._column_names)
+        )
+        if name is not None:
+            long_df.insert(0, self.NAME_COLUMN, name)
+        return long_df
+
+    def _write_dataset(self, path: Path, df: pd.DataFrame) -> None:
+        """Writes long format table as Parquet dataset (zstd compression, dictionary encoded names)."""
+        for column in df.columns:
+            if not is_numeric_dtype(df[column]):
+                df[column] = df[column].astype(str).astype("category")
+        partitioning = (
+            ds.partitioning(pa.schema([("year", pa.int64())]), flavor="hive")
+            if self._partition_by_year and "year" in df.columns
+            else None
+        )
+        if partitioning is not None:
+            df["year"] = df["year"].astype("int64")
+        file_format = ds.ParquetFileFormat()
+        ds.write_dataset(
+            pa.Table.from_pandas(df, preserve_index=False),
+            path,
+            format=file_format,
+            partitioning=partitioning,
+            file_options=file_format.make_write_options(
+                compression="zstd", use_dictionary=True
+            ),
+            existing_data_behavior="delete_matching",
+        )
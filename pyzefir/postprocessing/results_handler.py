@@ -1,12 +1,16 @@
+import os
 from abc import ABC, abstractmethod
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from enum import StrEnum, auto
 from pathlib import Path
+from typing import Callable, Iterator
 
 import pandas as pd
 
 from pyzefir.optimization.exportable_results import (
     ExportableResults,
     ExportableResultsGroup,
+    LazyExportableResults,
 )
 
 
@@ -16,6 +20,8 @@ class GeneralResultDirectory(StrEnum):
     LINES_RESULTS = auto()
     FRACTIONS_RESULTS = auto()
     BUS_RESULTS = auto()
+    DUAL_RESULTS = auto()
+    OBJECTIVE_RESULTS = auto()
 
 
 class Exporter(ABC):
@@ -29,22 +35,42 @@ class Exporter(ABC):
 
     @staticmethod
     def is_results_group_empty(result: ExportableResultsGroup) -> bool:
-        for field_value in result.__dict__.values():
-            if isinstance(field_value, dict) and field_value:
-                return False
-            if isinstance(field_value, pd.DataFrame) and not field_value.empty:
-                return False
-        return True
+        return all(
+            Exporter.is_field_empty(field_value)
+            for field_value in result.__dict__.values()
+        )
 
     @staticmethod
+    def is_field_empty(field_value: pd.DataFrame | dict) -> bool:
+        """True for empty dictionaries and frames."""
+        if isinstance(field_value, dict):
+            return not field_value
+        return isinstance(field_value, pd.DataFrame) and field_value.empty
+
+    def export_group_results(
+        self, root_path: Path, result: ExportableResultsGroup
+    ) -> None:
+        """
+        Export exportable group results field by field.
+
+        Args:
+            - root_path (Path): The root path for exporting the results.
+            - result (ExportableResultsGroup): The exportable group results.
+        """
+        if self.is_results_group_empty(result):
+            return
+        for field_name, field_value in result.__dict__.items():
+            self.export_field_results(root_path, field_name, field_value)
+
     @abstractmethod
-    def export_group_results(root_path: Path, result: ExportableResultsGroup) -> None:
+    def export_field_results(
+        self, root_path: Path, field_name: str, field_value: pd.DataFrame | dict
+    ) -> None:
         raise NotImplementedError
 
-    @staticmethod
     @abstractmethod
     def export_objective_result(
-        root_path: Path, objective_value_series: pd.Series
+        self, root_path: Path, objective_value_series: pd.Series
     ) -> None:
         raise NotImplementedError
 
@@ -58,22 +84,28 @@ class ResultsHandler:
     switch between different export formats by changing the exporter.
     """
 
-    def __init__(self, exporter: Exporter) -> None:
+    def __init__(
+        self, exporter: Exporter | None = None, max_workers: int | None = 1
+    ) -> None:
         """
         Initializes a new instance of the class.
 
         Args:
-            - exporter (Exporter): An instance of a class that implements the Exporter interface.
+            - exporter (Exporter | None): An instance of a class that implements the Exporter interface,
+                used by export_results (not needed if results are exported with export_results_to_many)
+            - max_workers (int | None): maximal number of threads writing the results, if None
+                the default of ThreadPoolExecutor is used, if 1 results are written sequentially
         """
         self._exporter = exporter
+        self._max_workers = max_workers
 
     @property
-    def exporter(self) -> Exporter:
+    def exporter(self) -> Exporter | None:
         """
         Gets the current exporter.
 
         Returns:
-            - Exporter: The current exporter instance.
+            - Exporter | None: The current exporter instance.
         """
         return self._exporter
 
@@ -100,9 +132,100 @@ class ResultsHandler:
         Args:
             - export_root_path (Path): The root path for exporting the results.
             - results (ExportableResults): The results object containing the data to export.
+
+        Raises:
+            - ValueError: If the exporter is not given.
+        """
+        if self.exporter is None:
+            raise ValueError("exporter is not given")
+        self.export_results_to_many([(self.exporter, export_root_path)], results)
+
+    def export_results_to_many(
+        self,
+        targets: list[tuple[Exporter, Path]],
+        results: ExportableResults | LazyExportableResults,
+        skip_empty_fields: bool = False,
+    ) -> None:
         """
+        Exports the results with many exporters in a single pass over the results.
+
+        Exporter of the handler is not used. Every field of every result group is written by all
+        exporters before moving to the next field, fields of lazy results are computed right before
+        they are written and dropped once all exporters have written them. If max_workers is not 1,
+        the writes are executed in a thread pool (serialization and compression release the GIL for
+        the most part) and the number of pending writes is bounded, so the results are not buffered
+        in memory by the pool.
+
+        Args:
+            - targets (list[tuple[Exporter, Path]]): exporters and root paths of their results
+            - results (ExportableResults | LazyExportableResults): The results object containing
+                the data to export.
+            - skip_empty_fields (bool): do not write empty fields (e.g. fields not included in export
+                selection), default = False
+        """
+        tasks = self._export_tasks(targets, results, skip_empty_fields)
+        if self._max_workers == 1:
+            for func, args in tasks:
+                func(*args)
+                del args  # written field is not kept while the next one is computed
+            return
+        max_pending = 2 * (self._max_workers or os.cpu_count() or 1)
+        with ThreadPoolExecutor(max_workers=self._max_workers) as executor:
+            pending: set[Future] = set()
+            for func, args in tasks:
+                if len(pending) >= max_pending:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        future.result()
+                pending.add(executor.submit(func, *args))
+                del args
+            for future in pending:
+                future.result()
+
+    @staticmethod
+    def _export_tasks(
+        targets: list[tuple[Exporter, Path]],
+        results: ExportableResults | LazyExportableResults,
+        skip_empty_fields: bool,
+    ) -> Iterator[tuple[Callable, tuple]]:
+        """
+        Generates write tasks (function and its arguments) of all fields and exporters. Fields are
+        taken from their getters one by one and are not referenced after their tasks are generated.
+        Empty fields are held back until a not empty field of the group is found, so groups without
+        results are not written.
+        """
+        field_getters = results.field_getters
         for group in GeneralResultDirectory:
-            self.exporter.export_group_results(
-                export_root_path / group, getattr(results, group)
+            fields_to_write: list[tuple[str, pd.DataFrame | dict]] = []
+            group_has_results = False
+            for field_name, get_field_value in field_getters.get(group, {}).items():
+                field_value = get_field_value()
+                is_empty = Exporter.is_field_empty(field_value)
+                group_has_results |= not is_empty
+                if not (is_empty and skip_empty_fields):
+                    fields_to_write.append((field_name, field_value))
+                del field_value
+                while group_has_results and fields_to_write:
+                    yield from ResultsHandler._field_tasks(
+                        targets, group, *fields_to_write.pop(0)
+                    )
+        for exporter, root_path in targets:
+            yield exporter.export_objective_result, (
+                root_path,
+                results.objective_value,
+            )
+
+    @staticmethod
+    def _field_tasks(
+        targets: list[tuple[Exporter, Path]],
+        group: str,
+        field_name: str,
+        field_value: pd.DataFrame | dict,
+    ) -> Iterator[tuple[Callable, tuple]]:
+        """Generates write tasks of the field for all exporters."""
+        for exporter, root_path in targets:
+            yield exporter.export_field_results, (
+                root_path / group,
+                field_name,
+                field_value,
             )
-        self.exporter.export_objective_result(export_root_path, results.objective_value)
@@ -9,6 +9,8 @@ import numpy as np
 import pandas as pd
 
 from pyzefir.cli.logger import DEFAULT_LOG_LEVEL, LOG_LEVEL_MAPPING
+from pyzefir.optimization.export_selection import ExportSelection, TimeAggregation
+from pyzefir.optimization.linopy.duals import DUAL_FAMILIES
 
 
 class ConfigException(Exception):
@@ -76,10 +78,66 @@ class ConfigParams:
     """ dump results into additional xlsx files (outside the default CSV files)"""
     feather_results: bool = True
     """ dump results into additional feather files (outside the default CSV files)"""
+    xlsx_streaming: bool = False
+    """ write xlsx results in column blocks with constant memory (split into sheets and workbooks at Excel limits) """
+    xlsx_annual_sums: bool = False
+    """ write annual sums of hourly results into xlsx files instead of hourly data """
+    parquet_results: bool = False
+    """ dump results into additional partitioned parquet dataset (one long format table per field) """
+    parquet_partition_by_year: bool = False
+    """ partition parquet results by year """
+    solution_snapshot: bool = False
+    """ dump solution, indices and parameters of the model, so results can be postprocessed again without solving """
+    export_workers: int | None = None
+    """ number of threads writing the results [if not provided, default number of threads is used] """
+    dual_results: tuple[str, ...] = ()
+    """ constraint families which duals are exported (balancing - marginal prices, emissions - emission prices) """
+    objective_breakdown: bool = False
+    """ export values of objective function components per year """
+    objective_breakdown_per_unit: bool = False
+    """ export values of objective function components per year and per unit """
+    export_selection: ExportSelection | None = None
+    """ exported result groups, fields and elements and time aggregation of hourly results [all if not provided] """
     gurobi_parameters_path: Path | None = None
     """ path where gurobi parameters are stored (only when gurobi solver is used)"""
     network_validation_raise_exceptions: bool = True
     """ raise exception when network object is validated"""
+    auto_scaling: bool = False
+    """ scale the model automatically before solving """
+    variable_reduction: bool = False
+    """ do not pass provably zero variables and trivial constraints to the solver """
+    float32_demand: bool = False
+    """ store demand of aggregated consumers in single precision (halves memory of the demand) """
+    network_reduction: bool = False
+    """ merge buses joined by free lines and aggregate identical units before building the model """
+    network_snapshot_path: Path | None = None
+    """ directory of the network snapshot, loaded instead of the input data if newer than the inputs
+    (and created otherwise) [if not provided, network is always created from the input data] """
+    profile_cache_path: Path | None = None
+    """ directory where hourly datasets are cached as memory mapped Arrow files [if not provided, hourly
+    datasets are read from csv files into memory] """
+    fixed_investments_path: Path | None = None
+    """ path to csv results of a previous run, if given capacities and fractions are fixed and only dispatch
+    is optimized (separately for each year) """
+    warm_start_path: Path | None = None
+    """ path to csv results or solution snapshot of a previous run, capacities and fractions (or all variables
+    stored in the snapshot) are passed to the solver as starting values [if not provided, no warm start is used] """
+    dispatch_workers: int | None = None
+    """ number of parallel processes solving dispatch of years [if not provided, number of processors is used] """
+    refinement_levels: tuple[int, ...] = ()
+    """ numbers of hours of coarse hour samples solved before the hour sample, each level is warm started with
+    capacities and fractions of the previous one [if not provided, only the hour sample is solved] """
+    solver_process: bool = False
+    """ execute the solver in a child process, so a crash of the solver does not stop the run """
+    solver_memory_limit: float | None = None
+    """ memory limit of the solver process [MiB] [if not provided, memory is not limited] """
+    solver_threads: int | None = None
+    """ number of threads used by the solver [if not provided, the solver default is used] """
+    solver_time_limit: float | None = None
+    """ time limit of the solver [s] [if not provided, time is not limited] """
+    solver_race: tuple[str, ...] = ()
+    """ solver settings sections (solver or solver.variant) solved concurrently in child processes, the first
+    optimal result is kept [if not provided, only the solver is executed] """
 
     def __post_init__(self) -> None:
         """Validate parameters."""
@@ -100,6 +158,41 @@ class ConfigParams:
         validate_optional_path_to_file(
             self.gurobi_parameters_path, ".csv", "gurobi_parameters_path"
         )
+        if self.fixed_investments_path is not None:
+            validate_dir_path(self.fixed_investments_path, "fixed_investments_path")
+            if self.refinement_levels:
+                raise ConfigException(
+                    "refinement_levels cannot be used together with fixed_investments_path"
+                )
+            if self.warm_start_path is not None:
+                raise ConfigException(
+                    "warm_start_path cannot be used together with fixed_investments_path"
+                )
+        if self.warm_start_path is not None:
+            validate_dir_path(self.warm_start_path, "warm_start_path")
+        validate_solver_process(
+            self.solver_process or bool(self.solver_race),
+            self.solver_memory_limit,
+            self.solver_threads,
+            self.solver_time_limit,
+        )
+        for name in self.solver_race:
+            validate_solver_name(name.split(".")[0])
+            if name not in self.solver_settings and "." in name:
+                raise ConfigException(
+                    f"solver_race entry {name} has no section of solver settings"
+                )
+        if (
+            self.solver_process or self.solver_race
+        ) and self.gurobi_parameters_path is not None:
+            raise ConfigException(
+                "gurobi_parameters_path cannot be used when the solver is executed in a child process"
+            )
+        if unknown_families := set(self.dual_results) - set(DUAL_FAMILIES):
+            raise ConfigException(
+                f"unknown dual_results families {sorted(unknown_families)}, "
+                f"available families are {list(DUAL_FAMILIES)}"
+            )
 
 
 def validate_network_config(network_config: dict[str, Any]) -> None:
@@ -347,6 +440,38 @@ def validate_solver_name(solver_name: str | None) -> None:
         )
 
 
+def validate_solver_process(
+    solver_process: bool,
+    memory_limit: float | None,
+    threads: int | None,
+    time_limit: float | None,
+) -> None:
+    """
+    Validate limits of the solver.
+
+    Args:
+        - solver_process (bool): whether the solver is executed in a child process
+        - memory_limit (float | None): memory limit of the solver process [MiB]
+        - threads (int | None): number of threads used by the solver
+        - time_limit (float | None): time limit of the solver [s]
+
+    Raises:
+        - ConfigException: If any limit is not positive or the memory limit is given and the solver
+            is not executed in a child process.
+    """
+    if memory_limit is not None and not solver_process:
+        raise ConfigException(
+            "solver_memory_limit can be set only if solver_process is enabled"
+        )
+    for name, value in [
+        ("solver_memory_limit", memory_limit),
+        ("solver_threads", threads),
+        ("solver_time_limit", time_limit),
+    ]:
+        if value is not None and value <= 0:
+            raise ConfigException(f"{name} must be positive, but given: {value}")
+
+
 def validate_n_years_aggregation(n_years_aggregation: int) -> None:
     """
     Validate if the number of years for aggregation is a positive integer.
@@ -402,7 +527,15 @@ class ConfigLoader:
     _req, _opt, _any = "required", "optional", {"any"}
     _configurable_solvers = {"gurobi", "cplex", "highs", "glpk"}
     _mandatory_sections = {
-        "input": {"input_path": _req, "scenario": _req, "input_format": _req},
+        "input": {
+            "input_path": _req,
+            "scenario": _req,
+            "input_format": _req,
+            "fixed_investments_path": _opt,
+            "network_snapshot_path": _opt,
+            "profile_cache_path": _opt,
+            "warm_start_path": _opt,
+        },
         "output": {
             "output_path": _req,
             "sol_dump_path": _opt,
@@ -410,6 +543,21 @@ class ConfigLoader:
             "csv_dump_path": _opt,
             "xlsx_results": _opt,
             "feather_results": _opt,
+            "xlsx_streaming": _opt,
+            "xlsx_annual_sums": _opt,
+            "parquet_results": _opt,
+            "parquet_partition_by_year": _opt,
+            "solution_snapshot": _opt,
+            "export_workers": _opt,
+            "dual_results": _opt,
+            "objective_breakdown": _opt,
+            "objective_breakdown_per_unit": _opt,
+            "result_groups": _opt,
+            "result_fields": _opt,
+            "result_elements": _opt,
+            "time_aggregation": _opt,
+            "time_aggregation_function": _opt,
+            "time_aggregation_period_length": _opt,
             "gurobi_parameters_path": _opt,
         },
     }
@@ -425,6 +573,17 @@ class ConfigLoader:
             "n_years_aggregation": _opt,
             "aggregation_method": _opt,
             "network_validation_raise_exceptions": _opt,
+            "auto_scaling": _opt,
+            "variable_reduction": _opt,
+            "float32_demand": _opt,
+            "network_reduction": _opt,
+            "dispatch_workers": _opt,
+            "refinement_levels": _opt,
+            "solver_process": _opt,
+            "solver_memory_limit": _opt,
+            "solver_threads": _opt,
+            "solver_time_limit": _opt,
+            "solver_race": _opt,
         },
         "create": {"n_years": _opt, "n_hours": _opt, "input_path": _opt},
         "debug": {
@@ -456,9 +615,10 @@ class ConfigLoader:
 
     def _validate_config_file_structure(self) -> None:
         """Validate sections and parameters in the loaded .ini file."""
-        if set(self._mandatory_sections) - set(self.config.sections()) or not set(
-            self.config.sections()
-        ).issubset(self._sections):
+        if set(self._mandatory_sections) - set(self.config.sections()) or not all(
+            section in self._sections or self._is_solver_section(section)
+            for section in self.config.sections()
+        ):
             raise ConfigException(
                 f"incorrect *.ini file: required sections: {set(self._sections)}, given: {set(self.config.sections())}"
             )
@@ -476,16 +636,17 @@ class ConfigLoader:
     def _validate_section_structure(self) -> None:
         """Validate the structure of each section in the configuration file."""
         for section in self.config.sections():
+            section_keys = (
+                self._any
+                if self._is_solver_section(section)
+                else self._sections[section]
+            )
             given_keys, allowed_keys = (
                 set(self.config[section]),
-                set(self._sections[section]),
+                set(section_keys),
             )
             required_keys = set(
-                [
-                    key
-                    for key in self._sections[section]
-                    if self._sections[section] == self._req
-                ]
+                [key for key in section_keys if section_keys == self._req]
             )
             if not required_keys.issubset(given_keys):
                 raise ConfigException(
@@ -498,6 +659,10 @@ class ConfigLoader:
                     f"{given_keys}"
                 )
 
+    def _is_solver_section(self, section: str) -> bool:
+        """Section of solver settings: solver name or solver.variant (variant of solver settings, see solver_race)."""
+        return section.split(".")[0] in self._configurable_solvers
+
     @staticmethod
     def try_parse_config_option(string: str) -> float | int | bool | str:
         """
@@ -588,12 +753,45 @@ class ConfigLoader:
                     key: self.try_parse_config_option(value)
                     for key, value in self.config.items(section)
                 }
-                for section in self._configurable_solvers
-                if section in self.config.sections()
+                for section in self.config.sections()
+                if self._is_solver_section(section)
             },
             xlsx_results=self.config.getboolean(
                 "output", "xlsx_results", fallback=False
             ),
+            xlsx_streaming=self.config.getboolean(
+                "output", "xlsx_streaming", fallback=False
+            ),
+            xlsx_annual_sums=self.config.getboolean(
+                "output", "xlsx_annual_sums", fallback=False
+            ),
+            parquet_results=self.config.getboolean(
+                "output", "parquet_results", fallback=False
+            ),
+            parquet_partition_by_year=self.config.getboolean(
+                "output", "parquet_partition_by_year", fallback=False
+            ),
+            solution_snapshot=self.config.getboolean(
+                "output", "solution_snapshot", fallback=False
+            ),
+            export_workers=(
+                int(export_workers)
+                if (
+                    export_workers := self.config.get(
+                        "output", "export_workers", fallback=None
+                    )
+                )
+                is not None
+                else None
+            ),
+            dual_results=self._get_list("output", "dual_results") or (),
+            objective_breakdown=self.config.getboolean(
+                "output", "objective_breakdown", fallback=False
+            ),
+            objective_breakdown_per_unit=self.config.getboolean(
+                "output", "objective_breakdown_per_unit", fallback=False
+            ),
+            export_selection=self._load_export_selection(),
             n_years_aggregation=(
                 int(n_years_aggregation)
                 if (
@@ -615,6 +813,49 @@ class ConfigLoader:
             network_validation_raise_exceptions=self.config.getboolean(
                 "optimization", "network_validation_raise_exceptions", fallback=True
             ),
+            auto_scaling=self.config.getboolean(
+                "optimization", "auto_scaling", fallback=False
+            ),
+            variable_reduction=self.config.getboolean(
+                "optimization", "variable_reduction", fallback=False
+            ),
+            float32_demand=self.config.getboolean(
+                "optimization", "float32_demand", fallback=False
+            ),
+            network_reduction=self.config.getboolean(
+                "optimization", "network_reduction", fallback=False
+            ),
+            fixed_investments_path=self._get_path("input", "fixed_investments_path"),
+            network_snapshot_path=self._get_path("input", "network_snapshot_path"),
+            profile_cache_path=self._get_path("input", "profile_cache_path"),
+            warm_start_path=self._get_path("input", "warm_start_path"),
+            dispatch_workers=(
+                int(dispatch_workers)
+                if (
+                    dispatch_workers := self.config.get(
+                        "optimization", "dispatch_workers", fallback=None
+                    )
+                )
+                is not None
+                else None
+            ),
+            refinement_levels=tuple(
+                int(n_hours)
+                for n_hours in self._get_list("optimization", "refinement_levels") or ()
+            ),
+            solver_process=self.config.getboolean(
+                "optimization", "solver_process", fallback=False
+            ),
+            solver_memory_limit=self.config.getfloat(
+                "optimization", "solver_memory_limit", fallback=None
+            ),
+            solver_threads=self.config.getint(
+                "optimization", "solver_threads", fallback=None
+            ),
+            solver_time_limit=self.config.getfloat(
+                "optimization", "solver_time_limit", fallback=None
+            ),
+            solver_race=self._get_list("optimization", "solver_race") or (),
         )
 
     def _get_log_level(self) -> int:
@@ -668,6 +909,58 @@ class ConfigLoader:
             else None
         )
 
+    def _get_list(self, section: str, key: str) -> tuple[str, ...] | None:
+        """
+        Retrieve a comma separated list from the specified section and key in the configuration.
+
+        Args:
+            - section (str): The section of the configuration to query.
+            - key (str): The key in the section to retrieve the value for.
+
+        Returns:
+            - tuple[str, ...] | None: The retrieved items, or None if not found or empty.
+        """
+        items = tuple(
+            item.strip()
+            for item in self.config[section].get(key, "").split(",")
+            if item.strip()
+        )
+        return items or None
+
+    def _load_export_selection(self) -> ExportSelection | None:
+        """
+        Load selection of exported results and time aggregation from the output section.
+
+        Returns:
+            - ExportSelection | None: The selection, or None if all results are exported without aggregation.
+
+        Raises:
+            - ConfigException: If the selection or time aggregation is not valid.
+        """
+        try:
+            period = self.config.get("output", "time_aggregation", fallback=None)
+            selection = ExportSelection(
+                groups=self._get_list("output", "result_groups"),
+                fields=self._get_list("output", "result_fields"),
+                elements=self._get_list("output", "result_elements"),
+                time_aggregation=(
+                    TimeAggregation(
+                        period=period,
+                        function=self.config.get(
+                            "output", "time_aggregation_function", fallback="sum"
+                        ),
+                        period_length=self.config.getint(
+                            "output", "time_aggregation_period_length", fallback=24
+                        ),
+                    )
+                    if period
+                    else None
+                ),
+            )
+        except ValueError as error:
+            raise ConfigException(f"invalid export selection: {error}") from error
+        return None if selection.is_empty else selection
+
     @overload
     def _get_path(self, section: str, key: str, default: Path) -> Path:
         pass
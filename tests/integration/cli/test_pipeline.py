@@ -2,6 +2,7 @@ import configparser
 from pathlib import Path
 from typing import Any
 
+import pandas as pd
 import pytest
 from click.testing import CliRunner
 from linopy import Model, solvers
@@ -134,6 +135,39 @@ def test_simple_run_with_sol_file(
     assert Path(config["output"]["sol_dump_path"]).exists()
 
 
+def test_postprocess_from_solution_snapshot(
+    config_ini_path: Path,
+    config_parser: configparser.ConfigParser,
+    output_path: Path,
+) -> None:
+    config_parser["output"]["solution_snapshot"] = "true"
+    set_up_config_ini(config_ini_path, config_parser)
+    runner = CliRunner()
+    runner.invoke(cli_run, ["--config", str(config_ini_path)], catch_exceptions=False)
+    assert (output_path / "solution").is_dir()
+
+    postprocess_path = output_path / "postprocess"
+    postprocess_path.mkdir()
+    config_parser["output"]["output_path"] = str(postprocess_path)
+    set_up_config_ini(config_ini_path, config_parser)
+    result = runner.invoke(
+        cli_run,
+        [
+            "postprocess",
+            "--config",
+            str(config_ini_path),
+            "--solution",
+            str(output_path / "solution"),
+        ],
+        catch_exceptions=False,
+    )
+
+    assert result.exit_code == 0
+    for path in (output_path / "csv").rglob("*.csv"):
+        postprocessed = postprocess_path / path.relative_to(output_path)
+        assert postprocessed.read_text() == path.read_text()
+
+
 def test_simple_run_gurobi_parameters_export(
     config_ini_path: Path,
     config_parser: configparser.ConfigParser,
@@ -349,3 +383,33 @@ def test_simple_run_with_dump_git_info(
         )
         assert not (output_path / "git_info.txt").exists()
         assert not (output_path / "git_info.txt").is_file()
+
+
+@pytest.mark.parametrize("warm_start", ["solution", "csv"])
+def test_simple_run_with_warm_start(
+    config_ini_path: Path,
+    config_parser: configparser.ConfigParser,
+    output_path: Path,
+    warm_start: str,
+) -> None:
+    config_parser["output"]["solution_snapshot"] = "true"
+    set_up_config_ini(config_ini_path, config_parser)
+    runner = CliRunner()
+    runner.invoke(cli_run, ["--config", str(config_ini_path)], catch_exceptions=False)
+    objective = pd.read_csv(output_path / "csv" / "Objective_func_value.csv")
+
+    warm_output_path = output_path / "warm_start"
+    warm_output_path.mkdir()
+    config_parser["output"]["output_path"] = str(warm_output_path)
+    config_parser["output"]["solution_snapshot"] = "false"
+    config_parser["input"]["warm_start_path"] = str(output_path / warm_start)
+    set_up_config_ini(config_ini_path, config_parser)
+    result = runner.invoke(
+        cli_run, ["--config", str(config_ini_path)], catch_exceptions=False
+    )
+
+    assert result.exit_code == 0
+    assert "Warm start" in (warm_output_path / "cli.log").read_text()
+    assert (
+        warm_output_path / "csv" / "Objective_func_value.csv"
+    ).read_text() == objective
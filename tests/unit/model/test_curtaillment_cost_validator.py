@@ -18,9 +18,10 @@ import numpy as np
 import pandas as pd
 import pytest
 
-from pyzefir.model.exceptions import NetworkValidatorExceptionGroup
+from pyzefir.model.exceptions import NetworkValidatorException
 from pyzefir.model.network import Network
 from pyzefir.model.network_elements import GeneratorType
+from pyzefir.model.network_validator import CurtailmentCostValidator
 
 
 @pytest.mark.parametrize(
@@ -48,11 +49,10 @@ def test_network_curtailment_cost_validation(
     element_params: dict,
     exception_msg: str,
 ) -> None:
-    network.generator_types = element_params
-    exception_list: list[NetworkValidatorExceptionGroup] = []
+    exception_list: list[NetworkValidatorException] = []
 
     for name, curt_cost in element_params.items():
-        gen_type = GeneratorType(
+        network.generator_types[name] = GeneratorType(
             name=name,
             build_time=0,
             life_time=9,
@@ -68,10 +68,9 @@ def test_network_curtailment_cost_validation(
             ramp_down=9,
             power_utilization=pd.Series([0.9] * network.constants.n_hours),
             minimal_power_utilization=pd.Series([0.2] * network.constants.n_hours),
+            energy_curtailment_cost=curt_cost["energy_curtailment_cost"],
         )
-        gen_type.validate_curtailment_cost(
-            network, name, curt_cost["energy_curtailment_cost"], exception_list
-        )
+    CurtailmentCostValidator.validate(network, exception_list)
 
     assert len(exception_list)
     assert str(exception_list[0]) == exception_msg
@@ -567,3 +567,11 @@ def test_network_validator_not_raise_exceptions(
     mock_logger.error.assert_called_with(
         "Stack LKT2 is connected to more than one aggregated consumer"
     )
+
+
+def test_network_validator_without_elements_validation(network: Network) -> None:
+    with mock.patch.object(
+        NetworkElementsValidation, "validate"
+    ) as mock_element_validate:
+        NetworkValidator(network, validate_elements=False).validate()
+    mock_element_validate.assert_not_called()
@@ -0,0 +1,50 @@
+import numpy as np
+import pytest
+
+from pyzefir.model.profile_registry import ProfileRegistry
+
+
+def test_register_deduplicates_profiles() -> None:
+    registry = ProfileRegistry()
+    ids = registry.register_all(
+        [
+            np.array([0.1, 0.5, 0.2]),
+            np.array([1.0, 1.0, 1.0]),
+            np.array([0.1, 0.5, 0.2]),
+            np.array([np.nan, 1.0, 2.0]),
+            np.array([np.nan, 1.0, 2.0]),
+        ]
+    )
+
+    assert ids.tolist() == [0, 1, 0, 2, 2]
+    assert len(registry) == 3
+    assert registry.values.shape == (3, 3)
+    assert np.array_equal(registry.values[0], [0.1, 0.5, 0.2])
+    assert registry.register(np.array([1.0, 1.0, 1.0])) == 1
+
+
+def test_register_after_values() -> None:
+    registry = ProfileRegistry()
+    registry.register(np.array([1.0, 2.0]))
+    assert registry.values.shape == (1, 2)
+
+    assert registry.register(np.array([3.0, 4.0])) == 1
+    assert np.array_equal(registry.values, [[1.0, 2.0], [3.0, 4.0]])
+
+
+def test_register_shape_mismatch() -> None:
+    registry = ProfileRegistry()
+    registry.register(np.array([1.0, 2.0]))
+
+    with pytest.raises(ValueError, match="cannot be registered"):
+        registry.register(np.array([1.0, 2.0, 3.0]))
+
+
+def test_constants() -> None:
+    registry = ProfileRegistry()
+    registry.register_all(
+        [np.array([0.5, 0.5]), np.array([0.0, 1.0]), np.array([np.nan, np.nan])]
+    )
+
+    assert np.array_equal(registry.constants(), [0.5, np.nan, np.nan], equal_nan=True)
+    assert ProfileRegistry().constants().shape == (0,)
@@ -71,3 +71,36 @@ def test_create_from_network_elements_dict_empty() -> None:
     assert len(idx) == 0
     assert idx.ord.shape == (0,)
     assert idx.ii.shape == (0,)
+
+
+def test_batch_lookups() -> None:
+    ii = IndexingSet(np.array(["a", "xyz", "Joe", "Leokadia"]))
+    ords = ii.get_ords(["Joe", "a", "Joe"])
+    assert ords.tolist() == [ii.inverse["Joe"], ii.inverse["a"], ii.inverse["Joe"]]
+    assert ii.get_elements(ords).tolist() == ["Joe", "a", "Joe"]
+    assert ii.get_ords(["a", "missing"], strict=False).tolist() == [0, -1]
+    with pytest.raises(KeyError):
+        ii.get_ords(["a", "missing"])
+    with pytest.raises(KeyError):
+        ii.get_elements([4])
+
+
+def test_batch_lookups_after_remove() -> None:
+    ii = IndexingSet(np.array(["a", "b", "c", "d"]))
+    ii.remove("b")
+    ii.remove("c")
+    assert ii.ii.tolist() == ["a", "d"]
+    assert ii.get_ords(["d", "a"]).tolist() == [ii.inverse["d"], ii.inverse["a"]]
+    assert ii.get_elements([3]).tolist() == ["d"]
+
+
+def test_membership() -> None:
+    gens = IndexingSet(np.array(["g1", "g2", "g3"]))
+    buses = IndexingSet(np.array(["b1", "b2"]))
+    membership = gens.membership(buses, {"g1": {"b2"}, "g3": ["b1", "b2"]})
+    assert membership.shape == (3, 2)
+    assert membership.toarray().tolist() == [
+        [False, True],
+        [False, False],
+        [True, True],
+    ]
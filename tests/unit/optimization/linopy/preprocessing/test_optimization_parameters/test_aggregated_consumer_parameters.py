@@ -1,6 +1,19 @@
 import pandas as pd
 import pytest
-from numpy import all, arange, array, array_equal, linspace, nan, ndarray, ones
+from numpy import (
+    all,
+    allclose,
+    arange,
+    array,
+    array_equal,
+    float32,
+    float64,
+    linspace,
+    nan,
+    ndarray,
+    ones,
+    shares_memory,
+)
 from pandas import Series
 
 from pyzefir.model.network import Network, NetworkElementsDict
@@ -257,6 +270,50 @@ def test_create(complete_network: Network, opt_config: OptConfig) -> None:
         assert compare_vectors_dict(result.dem[aggr_id], dem_parameters[aggr_id])
 
 
+@pytest.mark.parametrize(
+    ("hour_sample", "year_sample", "float32_demand"),
+    [
+        (arange(100), arange(5), False),
+        (arange(0, 100, 9), array([1, 2, 4]), False),
+        (arange(0, 100, 9), array([1, 2, 4]), True),
+    ],
+)
+def test_dem_tensor(
+    hour_sample: ndarray,
+    year_sample: ndarray,
+    float32_demand: bool,
+    complete_network: Network,
+    opt_config: OptConfig,
+) -> None:
+    opt_config.hour_sample, opt_config.year_sample = hour_sample, year_sample
+    opt_config.float32_demand = float32_demand
+    indices = Indices(complete_network, opt_config)
+    result = OptimizationParameters(complete_network, indices, opt_config).aggr
+
+    assert result.dem_tensor.shape == (
+        len(indices.AGGR),
+        len(indices.ET),
+        len(hour_sample),
+        len(year_sample),
+    )
+    assert result.dem_tensor.dtype == (float32 if float32_demand else float64)
+    for aggr_id, aggr_name in indices.AGGR.mapping.items():
+        aggr = complete_network.aggregated_consumers[aggr_name]
+        profile = complete_network.demand_profiles[aggr.demand_profile]
+        for et_id, et in indices.ET.mapping.items():
+            dem = result.dem_tensor[aggr_id, et_id]
+            if et not in profile.normalized_profile:
+                assert not dem.any() and et not in result.dem[aggr_id]
+                continue
+            expected = (
+                profile.normalized_profile[et].values.reshape(-1, 1)
+                * aggr.yearly_energy_usage[et].values.reshape(1, -1)
+                * aggr.n_consumers.values.reshape(1, -1)
+            )[hour_sample][:, year_sample]
+            assert allclose(dem, expected, rtol=1e-6 if float32_demand else 1e-12)
+            assert shares_memory(result.dem[aggr_id][et], result.dem_tensor)
+
+
 @pytest.mark.parametrize(
     (
         "aggr_names",
@@ -1,12 +1,16 @@
 import pytest
-from numpy import all, arange, array, ndarray
+from numpy import all, arange, array, ndarray, shares_memory
+from pandas import Series
 
-from pyzefir.model.network import Network
+from pyzefir.model.network import Network, NetworkElementsDict
 from pyzefir.model.network_elements import CapacityFactor
-from pyzefir.optimization.linopy.preprocessing.indices import Indices
+from pyzefir.optimization.linopy.preprocessing.indices import IndexingSet, Indices
 from pyzefir.optimization.linopy.preprocessing.opt_parameters import (
     OptimizationParameters,
 )
+from pyzefir.optimization.linopy.preprocessing.parameters.capacity_factor_parameters import (
+    CapacityFactorParameters,
+)
 from pyzefir.optimization.opt_config import OptConfig
 from tests.unit.optimization.linopy.conftest import N_HOURS
 
@@ -27,3 +31,25 @@ def test_create(
     for cf_id, cf_name in indices.CF.mapping.items():
         capacity_factor = complete_network.capacity_factors[cf_name]
         assert all(params.profile[cf_id] == capacity_factor.profile[sample])
+
+
+def test_fetch_element_profiles() -> None:
+    capacity_factors = NetworkElementsDict(
+        {
+            name: CapacityFactor(name=name, profile=Series(profile))
+            for name, profile in [
+                ("cf_a", [0.1, 0.5, 0.2, 0.4]),
+                ("cf_b", [0.3, 0.3, 0.3, 0.3]),
+                ("cf_c", [0.1, 0.5, 0.2, 0.4]),
+            ]
+        }
+    )
+    cf_idx, sample = IndexingSet(array(["cf_c", "cf_b", "cf_a"])), array([0, 3])
+    profiles, profile_ids = CapacityFactorParameters.fetch_element_profiles(
+        capacity_factors, cf_idx, "profile", sample=sample
+    )
+
+    assert profile_ids == {0: 0, 1: 1, 2: 0}
+    assert profiles[0].tolist() == profiles[2].tolist() == [0.1, 0.4]
+    assert profiles[1].tolist() == [0.3, 0.3]
+    assert shares_memory(profiles[0], profiles[2])
@@ -0,0 +1,92 @@
+import pickle
+
+import numpy as np
+import pytest
+import xarray as xr
+from numpy import arange
+
+from pyzefir.model.network import Network
+from pyzefir.optimization.linopy.preprocessing.indices import Indices
+from pyzefir.optimization.linopy.preprocessing.opt_parameters import (
+    OptimizationParameters,
+)
+from pyzefir.optimization.linopy.preprocessing.parameters.parameters_dataset import (
+    select_by_ords,
+)
+from pyzefir.optimization.opt_config import OptConfig
+
+
+@pytest.mark.parametrize("hour_sample", [arange(100), arange(0, 100, 7)])
+def test_dataset_matches_parameters(
+    hour_sample: np.ndarray, complete_network: Network, opt_config: OptConfig
+) -> None:
+    opt_config.hour_sample = hour_sample
+    indices = Indices(complete_network, opt_config)
+    params = OptimizationParameters(complete_network, indices, opt_config)
+    ds = params.dataset
+
+    assert np.array_equal(ds.hour.values, indices.H.ii)
+    assert np.array_equal(ds.gen.values, indices.GEN.ii)
+    for gen_idx in indices.GEN.mapping:
+        tgen_idx = params.gen.tgen[gen_idx]
+        assert ds.gen_tgen[gen_idx] == tgen_idx
+        cf_idx = params.gen.capacity_factors[gen_idx]
+        assert ds.gen_cf[gen_idx] == (-1 if cf_idx is None else cf_idx)
+    for tgen_idx in indices.TGEN.mapping:
+        assert np.array_equal(
+            ds.tgen_power_utilization[tgen_idx], params.tgen.power_utilization[tgen_idx]
+        )
+        for et, eff in params.tgen.eff[tgen_idx].items():
+            assert ds.tgen_eff_mask[tgen_idx].sel(et=et)
+            assert np.array_equal(ds.tgen_eff[tgen_idx].sel(et=et), eff)
+    for aggr_idx in indices.AGGR.mapping:
+        for et in indices.ET.ii:
+            dem = params.aggr.dem[aggr_idx].get(et)
+            assert bool(ds.aggr_dem_mask[aggr_idx].sel(et=et)) == (dem is not None)
+            if dem is not None:
+                assert np.array_equal(ds.aggr_dem[aggr_idx].sel(et=et), dem)
+    for bus_idx in indices.BUS.mapping:
+        lbs_idx = params.bus.lbs_mapping.get(bus_idx)
+        assert ds.bus_lbs[bus_idx] == (-1 if lbs_idx is None else lbs_idx)
+        assert ds.bus_et[bus_idx] == params.bus.et[bus_idx]
+
+
+def test_dataset_not_pickled(complete_network: Network, opt_config: OptConfig) -> None:
+    indices = Indices(complete_network, opt_config)
+    params = OptimizationParameters(complete_network, indices, opt_config)
+    restored = pickle.loads(pickle.dumps(params))
+
+    assert restored.__dict__["_dataset"] is None
+    xr.testing.assert_identical(restored.dataset, params.dataset)
+
+
+@pytest.mark.parametrize(
+    ("ords", "expected"),
+    [
+        ([1, 0, 1], [[3.0, 4.0, 5.0], [0.0, 1.0, 2.0], [3.0, 4.0, 5.0]]),
+        ([-1, 0, -1], [[np.nan] * 3, [0.0, 1.0, 2.0], [np.nan] * 3]),
+    ],
+)
+def test_select_by_ords(ords: list[int], expected: list[list[float]]) -> None:
+    array = xr.DataArray(
+        arange(6.0).reshape(2, 3),
+        dims=("tgen", "hour"),
+        coords={"tgen": ["t1", "t2"], "hour": [0, 5, 10]},
+    )
+    ords_array = xr.DataArray(ords, dims="gen", coords={"gen": ["g1", "g2", "g3"]})
+    result = select_by_ords(array, "tgen", ords_array)
+
+    assert result.dims == ("gen", "hour")
+    assert "tgen" not in result.coords
+    np.testing.assert_array_equal(result.values, expected)
+
+
+def test_select_by_ords_empty_dimension() -> None:
+    array = xr.DataArray(
+        np.zeros((0, 2)), dims=("cf", "hour"), coords={"cf": [], "hour": [0, 1]}
+    )
+    ords = xr.DataArray([-1, -1], dims="gen", coords={"gen": ["g1", "g2"]})
+    result = select_by_ords(array, "cf", ords)
+
+    assert result.dims == ("gen", "hour")
+    assert np.isnan(result.values).all()
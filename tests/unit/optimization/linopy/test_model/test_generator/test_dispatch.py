@@ -0,0 +1,72 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from pyzefir.model.network import Network
+from pyzefir.optimization.fixed_investments import (
+    FixedInvestments,
+    FixedInvestmentsError,
+)
+from pyzefir.optimization.linopy.dispatch import DispatchRunner
+from pyzefir.optimization.opt_config import OptConfig
+from tests.unit.optimization.linopy.constants import N_YEARS
+from tests.unit.optimization.linopy.test_model.utils import (
+    create_default_opt_config,
+    run_opt_engine,
+)
+
+
+def _with_fixed_investments(
+    opt_config: OptConfig, fixed_investments: FixedInvestments
+) -> OptConfig:
+    opt_config.fixed_investments = fixed_investments
+    return opt_config
+
+
+@pytest.mark.parametrize("max_workers", [1, 2])
+def test_dispatch_with_investments_of_full_run(
+    network: Network, max_workers: int
+) -> None:
+    full_results = run_opt_engine(
+        network, create_default_opt_config(np.arange(50), np.arange(N_YEARS))
+    ).results.to_exportable()
+    opt_config = _with_fixed_investments(
+        create_default_opt_config(np.arange(50), np.arange(N_YEARS)),
+        FixedInvestments.from_exportable(full_results),
+    )
+    results = DispatchRunner(network, opt_config, max_workers=max_workers).run()
+
+    gen_results, full_gen_results = (
+        results.generators_results,
+        full_results.generators_results,
+    )
+    pd.testing.assert_frame_equal(
+        gen_results.capacity, full_gen_results.capacity, check_dtype=False
+    )
+    pd.testing.assert_frame_equal(
+        results.storages_results.capacity,
+        full_results.storages_results.capacity,
+        check_dtype=False,
+    )
+    assert list(gen_results.generation) == list(full_gen_results.generation)
+    for name, generation in gen_results.generation.items():
+        assert list(generation.columns) == list(np.arange(N_YEARS))
+        assert np.allclose(
+            generation.sum(), full_gen_results.generation[name].sum(), rtol=1e-4
+        )
+    for name, fraction in results.fractions_results.fraction.items():
+        assert np.allclose(fraction, full_results.fractions_results.fraction[name])
+    assert list(results.lines_results.flow) == list(full_results.lines_results.flow)
+    assert results.objective_value.name == full_results.objective_value.name
+    assert results.objective_value.sum() <= full_results.objective_value.sum() + 1e-6
+
+
+def test_missing_fixed_capacity(network: Network) -> None:
+    opt_config = _with_fixed_investments(
+        create_default_opt_config(np.arange(50), np.arange(N_YEARS)),
+        FixedInvestments(
+            generator_capacity=pd.DataFrame(), storage_capacity=pd.DataFrame()
+        ),
+    )
+    with pytest.raises(FixedInvestmentsError):
+        DispatchRunner(network, opt_config, max_workers=1).run()
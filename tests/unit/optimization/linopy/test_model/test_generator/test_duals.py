@@ -0,0 +1,60 @@
+import numpy as np
+import pandas as pd
+
+from pyzefir.model.network import Network
+from pyzefir.model.utils import NetworkConstants
+from pyzefir.optimization.linopy.duals import BALANCING_FAMILY, EMISSIONS_FAMILY
+from pyzefir.optimization.results import EMISSION_TYPE_LABEL, HOUR_LABEL, YEAR_LABEL
+from tests.unit.optimization.linopy.constants import N_HOURS, N_YEARS
+from tests.unit.optimization.linopy.names import CO2, PM10
+from tests.unit.optimization.linopy.test_model.utils import (
+    create_default_opt_config,
+    run_opt_engine,
+)
+
+
+def test_marginal_prices_of_buses(network: Network) -> None:
+    opt_config = create_default_opt_config(np.arange(50), np.arange(N_YEARS))
+    opt_config.dual_families = (BALANCING_FAMILY,)
+    engine = run_opt_engine(network, opt_config)
+    dual_results = engine.results.to_exportable().dual_results
+
+    assert list(dual_results.marginal_price) == list(engine.indices.BUS.ii)
+    for bus_name, df in dual_results.marginal_price.items():
+        assert df.shape == (50, N_YEARS)
+        assert df.index.name == HOUR_LABEL and df.columns.name == YEAR_LABEL
+        np.testing.assert_allclose(
+            df.values,
+            engine.model.constraints[f"{bus_name}_BALANCING_CONSTRAINT"]
+            .dual.transpose("hour", "year")
+            .values,
+        )
+    assert dual_results.emission_price.empty
+
+
+def test_emission_prices(network: Network) -> None:
+    network.constants = NetworkConstants(
+        n_years=N_YEARS,
+        n_hours=N_HOURS,
+        relative_emission_limits={
+            CO2: pd.Series([np.nan, 1.0, 0.95, 0.9, 0.85]),
+            PM10: pd.Series([np.nan] * N_YEARS),
+        },
+        base_total_emission={CO2: 1.0, PM10: 1.0},
+        power_reserves={},
+    )
+    opt_config = create_default_opt_config(np.arange(10), np.arange(N_YEARS))
+    opt_config.dual_families = (EMISSIONS_FAMILY,)
+    engine = run_opt_engine(network, opt_config)
+    dual_results = engine.results.to_exportable().dual_results
+
+    emission_price = dual_results.emission_price
+    assert list(emission_price.columns) == [CO2]
+    assert emission_price.columns.name == EMISSION_TYPE_LABEL
+    assert emission_price.index.name == YEAR_LABEL
+    assert np.isnan(emission_price[CO2].iloc[0])
+    for y_idx in range(1, N_YEARS):
+        assert emission_price[CO2].iloc[y_idx] == float(
+            engine.model.constraints[f"{CO2}_{y_idx}_EMISSIONS_CONSTRAINT"].dual
+        )
+    assert dual_results.marginal_price == {}
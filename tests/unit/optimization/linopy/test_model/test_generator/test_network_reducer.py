@@ -0,0 +1,110 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from pyzefir.model.network import Network
+from pyzefir.model.network_elements import Bus, Generator, Line
+from pyzefir.model.network_reducer import NetworkReducer
+from tests.unit.optimization.linopy.constants import N_YEARS
+from tests.unit.optimization.linopy.names import EE, GRID
+from tests.unit.optimization.linopy.test_model.utils import (
+    create_default_opt_config,
+    run_opt_engine,
+)
+
+GRID2 = f"{GRID}_2"
+COAL_GEN_NAME = f"pp_coal_{GRID}"
+COAL_GEN2_NAME = f"pp_coal_{GRID2}"
+
+
+@pytest.fixture
+def network_with_duplicates(network: Network) -> Network:
+    """
+    Network with additional grid bus connected to the grid by free lines in both directions
+    and coal power plant identical to the one attached to the grid.
+    """
+    network.add_bus(Bus(name=GRID2, energy_type=EE))
+    for fr, to in [(GRID, GRID2), (GRID2, GRID)]:
+        network.add_line(
+            Line(
+                name=f"{fr}->{to}",
+                energy_type=EE,
+                fr=fr,
+                to=to,
+                transmission_loss=0,
+                max_capacity=np.inf,
+            )
+        )
+    network.add_generator(
+        Generator(
+            name=COAL_GEN2_NAME,
+            energy_source_type="pp_coal",
+            bus=GRID2,
+            unit_base_cap=40,
+            unit_min_capacity=pd.Series([np.nan] * N_YEARS),
+            unit_max_capacity=pd.Series([np.nan] * N_YEARS),
+            unit_min_capacity_increase=pd.Series([np.nan] * N_YEARS),
+            unit_max_capacity_increase=pd.Series([np.nan] * N_YEARS),
+        )
+    )
+    return network
+
+
+def test_reduce(network_with_duplicates: Network) -> None:
+    reducer = NetworkReducer(network_with_duplicates)
+    reduced = reducer.reduce()
+
+    assert reducer.bus_mapping[GRID2] == GRID
+    assert set(reducer.removed_lines) == {f"{GRID}->{GRID2}", f"{GRID2}->{GRID}"}
+    assert reducer.generator_groups[COAL_GEN_NAME] == [COAL_GEN_NAME, COAL_GEN2_NAME]
+    assert GRID2 not in reduced.buses
+    assert set(reduced.lines) == set(network_with_duplicates.lines) - set(
+        reducer.removed_lines
+    )
+    assert set(reduced.generators) == set(network_with_duplicates.generators) - {
+        COAL_GEN2_NAME
+    }
+    assert reduced.generators[COAL_GEN_NAME].unit_base_cap == 80
+    assert reduced.buses[GRID].generators == {COAL_GEN_NAME}
+    assert len(network_with_duplicates.buses) == len(reduced.buses) + 1
+
+
+def test_reduced_network_gives_the_same_solution(
+    network_with_duplicates: Network,
+) -> None:
+    opt_config = create_default_opt_config(np.arange(50), np.arange(N_YEARS))
+    full_engine = run_opt_engine(network_with_duplicates, opt_config)
+    reducer = NetworkReducer(network_with_duplicates)
+    engine = run_opt_engine(reducer.reduce(), opt_config)
+
+    assert engine.model.ncons < full_engine.model.ncons
+    assert engine.results.objective_value == pytest.approx(
+        full_engine.results.objective_value
+    )
+
+    results = reducer.disaggregate(engine.results.to_exportable())
+    full_results = full_engine.results.to_exportable()
+    gen_results = results.generators_results
+    assert list(gen_results.generation) == list(
+        full_results.generators_results.generation
+    )
+    assert list(gen_results.capacity.columns) == list(
+        full_results.generators_results.capacity.columns
+    )
+    assert np.allclose(
+        gen_results.capacity[COAL_GEN_NAME], gen_results.capacity[COAL_GEN2_NAME]
+    )
+    assert np.allclose(
+        gen_results.capacity.sum(axis=1),
+        full_results.generators_results.capacity.sum(axis=1),
+    )
+    assert np.allclose(
+        gen_results.generation[COAL_GEN_NAME] + gen_results.generation[COAL_GEN2_NAME],
+        full_results.generators_results.generation[COAL_GEN_NAME]
+        + full_results.generators_results.generation[COAL_GEN2_NAME],
+    )
+    assert list(results.lines_results.flow) == list(full_results.lines_results.flow)
+    assert np.all(results.lines_results.flow[f"{GRID}->{GRID2}"] == 0)
+    assert list(results.bus_results.generation_ens) == list(
+        full_results.bus_results.generation_ens
+    )
@@ -0,0 +1,64 @@
+import os
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from pyzefir.model.network import Network
+from pyzefir.model.network_snapshot import NetworkSnapshot, NetworkSnapshotError
+from tests.unit.optimization.linopy.constants import N_YEARS
+from tests.unit.optimization.linopy.test_model.utils import (
+    create_default_opt_config,
+    run_opt_engine,
+)
+
+
+def test_network_restored_from_snapshot(network: Network, tmp_path: Path) -> None:
+    fingerprint = NetworkSnapshot.make_fingerprint("scenario", [0, 1, 2])
+    NetworkSnapshot(network, fingerprint, extras={"year_sample": None}).dump(tmp_path)
+
+    snapshot = NetworkSnapshot.load(tmp_path)
+    restored = snapshot.network
+
+    assert snapshot.fingerprint == fingerprint
+    assert snapshot.extras == {"year_sample": None}
+    assert list(restored.generators) == list(network.generators)
+    for name, profile in network.demand_profiles.items():
+        for energy_type, values in profile.normalized_profile.items():
+            pd.testing.assert_series_equal(
+                restored.demand_profiles[name].normalized_profile[energy_type], values
+            )
+    for name, gen_type in network.generator_types.items():
+        pd.testing.assert_series_equal(
+            restored.generator_types[name].capex, gen_type.capex
+        )
+
+    opt_config = create_default_opt_config(np.arange(50), np.arange(N_YEARS))
+    expected = run_opt_engine(network, opt_config).results.objective_value
+    assert run_opt_engine(
+        restored, opt_config
+    ).results.objective_value == pytest.approx(expected)
+
+
+def test_snapshot_freshness(network: Network, tmp_path: Path) -> None:
+    input_path, snapshot_path = tmp_path / "input", tmp_path / "snapshot"
+    input_path.mkdir()
+    input_file = input_path / "data.csv"
+    input_file.write_text("a;b")
+    os.utime(input_file, (0, 0))
+    fingerprint = NetworkSnapshot.make_fingerprint("scenario")
+
+    assert not NetworkSnapshot.is_fresh(snapshot_path, fingerprint, [input_path])
+    NetworkSnapshot(network, fingerprint).dump(snapshot_path)
+    assert NetworkSnapshot.is_fresh(snapshot_path, fingerprint, [input_path])
+    assert not NetworkSnapshot.is_fresh(
+        snapshot_path, NetworkSnapshot.make_fingerprint("other"), [input_path]
+    )
+    input_file.touch()
+    assert not NetworkSnapshot.is_fresh(snapshot_path, fingerprint, [input_path])
+
+
+def test_load_missing_snapshot(tmp_path: Path) -> None:
+    with pytest.raises(NetworkSnapshotError, match="not found"):
+        NetworkSnapshot.load(tmp_path)
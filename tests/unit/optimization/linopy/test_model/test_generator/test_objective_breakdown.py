@@ -0,0 +1,57 @@
+import numpy as np
+import pytest
+
+from pyzefir.model.network import Network
+from pyzefir.optimization.linopy.objective_breakdown import component_name
+from pyzefir.optimization.linopy.objective_builder.ens_penalty_builder import (
+    EnsPenaltyCostObjectiveBuilder,
+)
+from pyzefir.optimization.results import COMPONENT_LABEL, YEAR_LABEL
+from tests.unit.optimization.linopy.constants import N_YEARS
+from tests.unit.optimization.linopy.test_model.utils import (
+    create_default_opt_config,
+    run_opt_engine,
+)
+
+
+def test_component_name() -> None:
+    assert component_name(EnsPenaltyCostObjectiveBuilder) == "ens_penalty_cost"
+
+
+@pytest.mark.parametrize("per_unit", [False, True])
+def test_objective_breakdown_sums_to_objective_value(
+    network: Network, per_unit: bool
+) -> None:
+    opt_config = create_default_opt_config(np.arange(50), np.arange(N_YEARS))
+    opt_config.objective_breakdown = True
+    opt_config.objective_breakdown_per_unit = per_unit
+    engine = run_opt_engine(network, opt_config)
+    objective_results = engine.results.to_exportable().objective_results
+
+    cost_per_year = objective_results.cost_per_year
+    assert cost_per_year.index.name == YEAR_LABEL
+    assert cost_per_year.columns.name == COMPONENT_LABEL
+    assert list(cost_per_year.columns) == [
+        component_name(builder) for builder in engine._objective_builders
+    ]
+    assert cost_per_year.shape == (N_YEARS, len(engine._objective_builders))
+    assert cost_per_year.to_numpy().sum() == pytest.approx(
+        engine.results.objective_value, rel=1e-6
+    )
+    assert not engine._objective_components
+    if not per_unit:
+        assert objective_results.cost_per_unit == {}
+        return
+    var_cost = objective_results.cost_per_unit["var_cost"]
+    assert set(var_cost.columns) <= set(engine.indices.GEN.ii)
+    np.testing.assert_allclose(
+        var_cost.sum(axis=1).to_numpy(), cost_per_year["var_cost"].to_numpy()
+    )
+
+
+def test_objective_breakdown_disabled(network: Network) -> None:
+    opt_config = create_default_opt_config(np.arange(10), np.arange(N_YEARS))
+    engine = run_opt_engine(network, opt_config)
+
+    assert engine.results.objective_breakdown == {}
+    assert engine.results.to_exportable().objective_results.cost_per_year.empty
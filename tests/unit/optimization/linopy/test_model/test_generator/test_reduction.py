@@ -0,0 +1,97 @@
+import numpy as np
+import pandas as pd
+import pytest
+import xarray as xr
+from linopy import Model
+
+from pyzefir.model.network import Network
+from pyzefir.model.network_elements import Generator
+from pyzefir.optimization.linopy.reduction import (
+    drop_trivial_constraints,
+    reinstate_zeros,
+)
+from tests.unit.optimization.linopy.constants import N_YEARS
+from tests.unit.optimization.linopy.names import GRID
+from tests.unit.optimization.linopy.test_model.utils import (
+    create_default_opt_config,
+    run_opt_engine,
+)
+
+ZERO_GEN_NAME = f"pp_coal_zero_{GRID}"
+
+
+@pytest.fixture
+def network_with_zero_generator(network: Network) -> Network:
+    network.add_generator(
+        Generator(
+            name=ZERO_GEN_NAME,
+            energy_source_type="pp_coal",
+            bus=GRID,
+            unit_base_cap=0,
+            unit_min_capacity=pd.Series([np.nan] * N_YEARS),
+            unit_max_capacity=pd.Series([np.nan] + [0.0] * (N_YEARS - 1)),
+            unit_min_capacity_increase=pd.Series([np.nan] * N_YEARS),
+            unit_max_capacity_increase=pd.Series([np.nan] * N_YEARS),
+        )
+    )
+    return network
+
+
+def test_drop_trivial_constraints() -> None:
+    model = Model()
+    x = model.add_variables(
+        lower=0,
+        coords=[pd.RangeIndex(3, name="i")],
+        name="x",
+        mask=xr.DataArray([True, False, False], dims=["i"]),
+    )
+    model.add_constraints(x <= 5, name="UPPER")
+    model.add_constraints(x >= xr.DataArray([1, 0, 2], dims=["i"]), name="LOWER")
+    model.add_constraints(x.isel(i=slice(1, 3)) == 0, name="EMPTY")
+
+    assert drop_trivial_constraints(model) == 5
+    assert "EMPTY" not in model.constraints
+    assert (model.constraints["UPPER"].labels != -1).values.tolist() == [
+        True,
+        False,
+        False,
+    ]
+    assert (model.constraints["LOWER"].labels != -1).values.tolist() == [
+        True,
+        False,
+        True,
+    ]
+
+
+def test_reinstate_zeros() -> None:
+    model = Model()
+    x = model.add_variables(
+        lower=0,
+        coords=[pd.RangeIndex(2, name="i")],
+        name="x",
+        mask=xr.DataArray([True, False], dims=["i"]),
+    )
+    x.solution = xr.DataArray([3.0, np.nan], dims=["i"])
+    reinstate_zeros(model)
+    assert x.data["solution"].values.tolist() == [3.0, 0.0]
+
+
+def test_zero_generator_is_reduced(network_with_zero_generator: Network) -> None:
+    opt_config = create_default_opt_config(np.arange(50), np.arange(5))
+    full_engine = run_opt_engine(network_with_zero_generator, opt_config)
+    opt_config.variable_reduction = True
+    engine = run_opt_engine(network_with_zero_generator, opt_config)
+
+    gen_labels = engine.model.variables["G_GEN"].labels.sel(gen=ZERO_GEN_NAME)
+    assert (gen_labels == -1).all()
+    assert engine.model.nvars < full_engine.model.nvars
+    assert engine.model.ncons < full_engine.model.ncons
+    assert engine.results.objective_value == pytest.approx(
+        full_engine.results.objective_value
+    )
+    results = engine.results.generators_results
+    assert np.all(results.gen[ZERO_GEN_NAME].values == 0)
+    for et_gen in results.gen_et[ZERO_GEN_NAME].values():
+        assert np.all(et_gen.values == 0)
+    for gen_name, gen in full_engine.results.generators_results.gen.items():
+        assert np.allclose(results.gen[gen_name], gen)
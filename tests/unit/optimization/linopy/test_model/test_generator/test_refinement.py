@@ -0,0 +1,93 @@
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from pyzefir.model.network import Network
+from pyzefir.optimization.linopy.refinement import (
+    RefinementError,
+    RefinementRunner,
+    coarse_hour_sample,
+)
+from pyzefir.optimization.linopy.warm_start import start_vector, write_warm_start
+from pyzefir.optimization.model import OptimizationStatus
+from tests.unit.optimization.linopy.constants import N_YEARS
+from tests.unit.optimization.linopy.test_model.utils import (
+    create_default_opt_config,
+    load_ens_directly_to_network_for_tests,
+    run_opt_engine,
+)
+
+
+def test_coarse_hour_sample() -> None:
+    hour_sample = np.arange(10, 30)
+
+    assert coarse_hour_sample(hour_sample, 5).tolist() == [10, 14, 18, 22, 26]
+    assert coarse_hour_sample(hour_sample, 20).tolist() == hour_sample.tolist()
+
+
+def test_refinement_levels(network: Network) -> None:
+    opt_config = create_default_opt_config(np.arange(50), np.arange(N_YEARS))
+    expected = run_opt_engine(network, opt_config)
+    runner = RefinementRunner(network, opt_config, [10, 25])
+    configs = runner.level_configs()
+    engine = runner.run()
+
+    assert [len(config.hour_sample) for config in configs] == [10, 25, 50]
+    assert [config.hourly_scale for config in configs] == [
+        opt_config.hourly_scale * 5,
+        opt_config.hourly_scale * 2,
+        opt_config.hourly_scale,
+    ]
+    assert engine.status == OptimizationStatus.OPTIMAL
+    assert np.isclose(engine.results.objective_value, expected.results.objective_value)
+    report = runner.report
+    assert report["n_hours"].tolist() == [10, 25, 50]
+    assert (report["status"] == OptimizationStatus.OPTIMAL.name).all()
+    assert report["objective_gap"].iloc[-1] == 0.0
+    assert (report[["build_time", "solve_time"]] >= 0).all().all()
+
+
+@pytest.mark.parametrize("levels", [[0, 10], [25, 10], [10, 50]])
+def test_invalid_refinement_levels(network: Network, levels: list[int]) -> None:
+    opt_config = create_default_opt_config(np.arange(50), np.arange(N_YEARS))
+    with pytest.raises(RefinementError):
+        RefinementRunner(network, opt_config, levels)
+
+
+def test_warm_start_of_investments(network: Network, tmp_path: Path) -> None:
+    load_ens_directly_to_network_for_tests(network)
+    opt_config = create_default_opt_config(np.arange(50), np.arange(N_YEARS))
+    engine = run_opt_engine(network, opt_config)
+    investments = engine.investments()
+
+    gen_cap = engine.variables.gen.cap
+    assert list(investments.generator_capacity.columns) == list(engine.indices.GEN.ii)
+    np.testing.assert_allclose(investments.generator_capacity, gen_cap.solution.T)
+    assert set(investments.fractions) == set(engine.indices.AGGR.ii)
+
+    start = start_vector(engine.model, {gen_cap.name: gen_cap.solution.values})
+    labels = gen_cap.labels.values
+    np.testing.assert_allclose(start[labels], gen_cap.solution.values)
+    assert np.isnan(np.delete(start, labels.ravel())).all()
+
+    highs_path = write_warm_start(engine.model, start, "highs", tmp_path / "start")
+    assert highs_path.suffix == ".sol"
+    lines = highs_path.read_text().splitlines()
+    n_columns = len(engine.model.matrices.vlabels)
+    assert lines[6] == f"# Columns {n_columns}"
+    assert lines[7 + n_columns] == "# Rows 0"
+    column_lines = lines[7:][:n_columns]
+    values = dict(line.split() for line in column_lines)
+    for label, value in zip(labels.ravel(), gen_cap.solution.values.ravel()):
+        assert np.isclose(float(values[f"x{label}"]), value)
+    gurobi_path = write_warm_start(engine.model, start, "gurobi", tmp_path / "start")
+    assert gurobi_path.suffix == ".mst"
+    assert len(gurobi_path.read_text().splitlines()) == labels.size + 1
+    assert write_warm_start(engine.model, start, "glpk", tmp_path / "start") is None
+
+    opt_config.warm_start = investments
+    warm_engine = run_opt_engine(network, opt_config)
+    assert np.isclose(
+        warm_engine.results.objective_value, engine.results.objective_value
+    )
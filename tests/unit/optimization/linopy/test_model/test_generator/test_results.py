@@ -4,6 +4,7 @@ import pytest
 
 from pyzefir.model.network import Network
 from pyzefir.model.network_elements import Storage
+from pyzefir.optimization.export_selection import ExportSelection
 from pyzefir.optimization.exportable_results import ExportableResults
 from pyzefir.optimization.results import Results
 from tests.unit.optimization.linopy.constants import N_YEARS
@@ -119,3 +120,49 @@ def test_exportable_storage_results(
 def test_objective_function(prepare_results: tuple[Results, ExportableResults]) -> None:
     results, exportable_results = prepare_results
     assert results.objective_value == exportable_results.objective_value[0]
+
+
+def test_results_groups_are_computed_on_demand(network: Network) -> None:
+    engine = run_opt_engine(
+        network, create_default_opt_config(np.arange(50), np.arange(N_YEARS))
+    )
+    results = engine.results
+
+    assert results.objective_value == engine.model.objective.value
+    assert "generators_results" not in results.__dict__
+    capacity = results.generators_results.cap
+    assert results.generators_results.cap is capacity
+    assert set(results.generators_results.__dict__) & {"gen", "gen_et"} == set()
+    assert set(results.__dict__) & {"storages_results", "bus_results"} == set()
+
+    exportable = results.to_exportable()
+    released = results.to_exportable(release=True)
+    assert "generators_results" not in results.__dict__
+    pd.testing.assert_frame_equal(
+        released.generators_results.capacity, exportable.generators_results.capacity
+    )
+    for name, flow in exportable.lines_results.flow.items():
+        pd.testing.assert_frame_equal(released.lines_results.flow[name], flow)
+
+
+def test_lazy_exportable_results(network: Network) -> None:
+    engine = run_opt_engine(
+        network, create_default_opt_config(np.arange(50), np.arange(N_YEARS))
+    )
+    results = engine.results
+    selection = ExportSelection(fields=("generation", "capacity", "flow"))
+    expected = selection.apply(results.to_exportable(release=True, selection=selection))
+
+    lazy = results.to_lazy_exportable(release=True, selection=selection)
+    assert set(results.__dict__) & {"generators_results", "lines_results"} == set()
+    assert set(lazy.field_getters["generators_results"]) == {"generation", "capacity"}
+    assert lazy.field_getters["fractions_results"] == {}
+
+    generators_getters = lazy.field_getters["generators_results"]
+    for name, df in generators_getters["generation"]().items():
+        pd.testing.assert_frame_equal(df, expected.generators_results.generation[name])
+    assert "generators_results" in results.__dict__
+    pd.testing.assert_frame_equal(
+        generators_getters["capacity"](), expected.generators_results.capacity
+    )
+    assert "generators_results" not in results.__dict__
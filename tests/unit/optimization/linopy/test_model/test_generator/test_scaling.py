@@ -0,0 +1,91 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from pyzefir.model.network import Network
+from pyzefir.model.network_elements import Storage
+from pyzefir.optimization.linopy.scaling import OBJECTIVE_FAMILY, constraint_family
+from tests.unit.optimization.linopy.constants import N_YEARS
+from tests.unit.optimization.linopy.names import HS
+from tests.unit.optimization.linopy.preprocessing.utils import create_storage_type
+from tests.unit.optimization.linopy.test_model.utils import (
+    create_default_opt_config,
+    run_opt_engine,
+)
+
+
+@pytest.fixture
+def network_with_storage(network: Network) -> Network:
+    network.add_storage_type(
+        create_storage_type(name="test_storage_type", energy_type="heat")
+    )
+    network.add_storage(
+        Storage(
+            name=f"heat_storage_{HS}",
+            energy_source_type="test_storage_type",
+            unit_base_cap=15,
+            bus=HS,
+            unit_min_capacity=pd.Series([np.nan] * N_YEARS),
+            unit_max_capacity=pd.Series([np.nan] * N_YEARS),
+            unit_min_capacity_increase=pd.Series([np.nan] * N_YEARS),
+            unit_max_capacity_increase=pd.Series([np.nan] * N_YEARS),
+        )
+    )
+    return network
+
+
+@pytest.mark.parametrize(
+    ("constraint_name", "expected_family"),
+    [
+        ("pp_coal_DISPATCHABLE_GEN_CAP_CONSTRAINT", "DISPATCHABLE_GEN_CAP_CONSTRAINT"),
+        ("grid_BALANCING_CONSTRAINT", "BALANCING_CONSTRAINT"),
+        ("MAX_FUEL_0_AVAILABILITY_CONSTRAINT_2", "AVAILABILITY_CONSTRAINT"),
+        ("con12", "con"),
+    ],
+)
+def test_constraint_family(constraint_name: str, expected_family: str) -> None:
+    assert constraint_family(constraint_name) == expected_family
+
+
+def test_scaled_model_gives_the_same_solution(network_with_storage: Network) -> None:
+    opt_config = create_default_opt_config(np.arange(50), np.arange(5))
+    engine = run_opt_engine(network_with_storage, opt_config)
+    opt_config.auto_scaling = True
+    scaled_engine = run_opt_engine(network_with_storage, opt_config)
+
+    assert engine.scaler is None
+    assert scaled_engine.scaler is not None
+    assert scaled_engine.results.objective_value == pytest.approx(
+        engine.results.objective_value, rel=1e-6
+    )
+    results, scaled_results = (
+        engine.results.generators_results,
+        scaled_engine.results.generators_results,
+    )
+    for gen_name, cap in results.cap.items():
+        assert np.allclose(scaled_results.cap[gen_name], cap, rtol=1e-5, atol=1e-5)
+    for gen_name, gen in results.gen.items():
+        assert np.allclose(scaled_results.gen[gen_name], gen, rtol=1e-5, atol=1e-4)
+
+
+def test_scaling_report(network_with_storage: Network) -> None:
+    opt_config = create_default_opt_config(np.arange(50), np.arange(5))
+    opt_config.auto_scaling = True
+    engine = run_opt_engine(network_with_storage, opt_config)
+    report = engine.scaler.report
+
+    assert set(report.columns) == {
+        "builder",
+        "family",
+        "n_constraints",
+        "min_before",
+        "max_before",
+        "min_after",
+        "max_after",
+    }
+    assert OBJECTIVE_FAMILY in report["family"].values
+    assert report["n_constraints"].sum() - 1 == len(engine.model.constraints)
+    spread_before = np.log2(report["max_before"] / report["min_before"]).max()
+    spread_after = np.log2(report["max_after"] / report["min_after"]).max()
+    assert spread_after <= spread_before
+    assert engine.scaler.suggested_money_scale >= 1.0
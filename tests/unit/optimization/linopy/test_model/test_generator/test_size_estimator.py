@@ -0,0 +1,56 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from pyzefir.model.network import Network
+from pyzefir.model.network_elements import Storage
+from pyzefir.optimization.input_data import OptimizationInputData
+from pyzefir.optimization.linopy.size_estimator import (
+    ESTIMATE_ERROR_BAND,
+    ModelSizeEstimator,
+    measure_model_size,
+)
+from tests.unit.optimization.linopy.constants import N_YEARS
+from tests.unit.optimization.linopy.names import HS
+from tests.unit.optimization.linopy.preprocessing.utils import create_storage_type
+from tests.unit.optimization.linopy.test_model.utils import create_default_opt_config
+
+
+@pytest.fixture
+def input_data(network: Network) -> OptimizationInputData:
+    network.add_storage_type(
+        create_storage_type(name="test_storage_type", energy_type="heat")
+    )
+    network.add_storage(
+        Storage(
+            name=f"heat_storage_{HS}",
+            energy_source_type="test_storage_type",
+            unit_base_cap=15,
+            bus=HS,
+            unit_min_capacity=pd.Series([np.nan] * N_YEARS),
+            unit_max_capacity=pd.Series([np.nan] * N_YEARS),
+            unit_min_capacity_increase=pd.Series([np.nan] * N_YEARS),
+            unit_max_capacity_increase=pd.Series([np.nan] * N_YEARS),
+        )
+    )
+    opt_config = create_default_opt_config(np.arange(50), np.arange(5))
+    return OptimizationInputData(network, opt_config)
+
+
+def test_estimated_variables_are_exact(input_data: OptimizationInputData) -> None:
+    estimate = ModelSizeEstimator(input_data).estimate()
+    measured = measure_model_size(input_data)
+    for group, entry in measured.variables.items():
+        assert estimate.variables[group].n_variables == entry.n_variables
+
+
+def test_estimate_within_error_band(input_data: OptimizationInputData) -> None:
+    estimate = ModelSizeEstimator(input_data).estimate()
+    measured = measure_model_size(input_data)
+    assert estimate.n_constraints == pytest.approx(
+        measured.n_constraints, rel=ESTIMATE_ERROR_BAND
+    )
+    assert estimate.n_nonzeros == pytest.approx(
+        measured.n_nonzeros, rel=ESTIMATE_ERROR_BAND
+    )
+    assert 0 < estimate.build_memory < estimate.solve_memory
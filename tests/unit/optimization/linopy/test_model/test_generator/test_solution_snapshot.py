@@ -0,0 +1,108 @@
+from dataclasses import fields
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from pyzefir.model.network import Network
+from pyzefir.optimization.export_selection import TimeAggregation
+from pyzefir.optimization.linopy.duals import BALANCING_FAMILY
+from pyzefir.optimization.solution_snapshot import (
+    SolutionSnapshot,
+    SolutionSnapshotError,
+)
+from tests.unit.optimization.linopy.constants import N_YEARS
+from tests.unit.optimization.linopy.test_model.utils import (
+    create_default_opt_config,
+    run_opt_engine,
+)
+
+
+def test_results_rebuilt_from_snapshot(network: Network, tmp_path: Path) -> None:
+    opt_config = create_default_opt_config(np.arange(50), np.arange(N_YEARS))
+    opt_config.dual_families = (BALANCING_FAMILY,)
+    engine = run_opt_engine(network, opt_config)
+    SolutionSnapshot.from_model(
+        engine.model,
+        engine.variables,
+        engine.indices,
+        engine.parameters,
+        extras={"note": "test"},
+    ).dump(tmp_path)
+
+    snapshot = SolutionSnapshot.load(tmp_path)
+    results = snapshot.to_results().to_exportable()
+    expected = engine.results.to_exportable()
+
+    assert snapshot.extras == {"note": "test"}
+    pd.testing.assert_series_equal(results.objective_value, expected.objective_value)
+    for group_field in fields(expected):
+        if group_field.name == "objective_value":
+            continue
+        group, expected_group = (
+            getattr(results, group_field.name),
+            getattr(expected, group_field.name),
+        )
+        for value_field in fields(expected_group):
+            value = getattr(group, value_field.name)
+            expected_value = getattr(expected_group, value_field.name)
+            if isinstance(expected_value, dict):
+                assert list(value) == list(expected_value)
+                for key, df in expected_value.items():
+                    pd.testing.assert_frame_equal(value[key], df)
+            else:
+                pd.testing.assert_frame_equal(value, expected_value)
+    assert list(snapshot.duals) == list(SolutionSnapshot.DEFAULT_DUAL_FAMILIES)
+    balancing = snapshot.duals[BALANCING_FAMILY]
+    for bus_name in engine.indices.BUS.ii:
+        np.testing.assert_array_equal(
+            balancing.sel(bus=bus_name).transpose("hour", "year").values,
+            engine.model.constraints[f"{bus_name}_BALANCING_CONSTRAINT"]
+            .dual.transpose("hour", "year")
+            .values,
+        )
+
+
+def test_missing_snapshot(tmp_path: Path) -> None:
+    with pytest.raises(SolutionSnapshotError):
+        SolutionSnapshot.load(tmp_path)
+
+
+@pytest.mark.parametrize(
+    "time_aggregation",
+    [
+        TimeAggregation("annual"),
+        TimeAggregation("monthly"),
+        TimeAggregation("period", "mean", period_length=10),
+    ],
+)
+def test_results_aggregated_over_periods(
+    network: Network, time_aggregation: TimeAggregation
+) -> None:
+    hour_sample = np.arange(50)
+    engine = run_opt_engine(
+        network, create_default_opt_config(hour_sample, np.arange(N_YEARS))
+    )
+    expected = engine.results.to_exportable().generators_results.generation
+    aggregated = (
+        SolutionSnapshot.from_results(engine.results)
+        .aggregated(time_aggregation)
+        .to_results()
+        .to_exportable()
+    )
+    periods = time_aggregation.periods(hour_sample)
+
+    generation = aggregated.generators_results.generation
+    assert list(generation) == list(expected)
+    for name, df in generation.items():
+        hourly = expected[name].groupby(periods)
+        pd.testing.assert_frame_equal(
+            df,
+            hourly.sum() if time_aggregation.function == "sum" else hourly.mean(),
+            check_names=False,
+        )
+    pd.testing.assert_frame_equal(
+        aggregated.generators_results.capacity,
+        engine.results.to_exportable().generators_results.capacity,
+    )
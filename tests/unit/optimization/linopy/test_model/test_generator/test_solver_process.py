@@ -0,0 +1,172 @@
+import inspect
+import logging
+import re
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+import pandas as pd
+import pytest
+from linopy import Model, solvers
+
+from pyzefir.model.network import Network
+from pyzefir.optimization.linopy import solver_process
+from pyzefir.optimization.linopy.solver_process import (
+    SolverProcessRunner,
+    SolverRun,
+    limit_options,
+)
+from pyzefir.optimization.model import OptimizationStatus
+from tests.unit.optimization.linopy.constants import N_YEARS
+from tests.unit.optimization.linopy.test_model.utils import (
+    create_default_opt_config,
+    run_opt_engine,
+)
+
+
+@pytest.mark.parametrize(
+    ("solver_name", "threads", "time_limit", "expected"),
+    [
+        ("gurobi", 4, 60.0, {"Threads": 4, "TimeLimit": 60.0}),
+        ("highs", 2, None, {"threads": 2}),
+        ("cplex", None, 10.0, {"timelimit": 10.0}),
+        ("glpk", 2, 10.5, {"tmlim": 10}),
+        ("highs", None, None, {}),
+    ],
+)
+def test_limit_options(
+    solver_name: str,
+    threads: int | None,
+    time_limit: float | None,
+    expected: dict[str, Any],
+) -> None:
+    assert limit_options(solver_name, threads, time_limit) == expected
+
+
+def test_solve_in_child_process(network: Network, tmp_path: Path) -> None:
+    opt_config = create_default_opt_config(np.arange(50), np.arange(N_YEARS))
+    opt_config.solver_name = "highs"
+    expected = run_opt_engine(network, opt_config)
+    opt_config.solver_process = True
+    opt_config.solver_threads = 1
+    opt_config.sol_dump_path = tmp_path / "results.sol"
+    engine = run_opt_engine(network, opt_config)
+
+    assert engine.status == OptimizationStatus.OPTIMAL
+    assert engine.model.solver_name == "highs"
+    assert opt_config.sol_dump_path.is_file()
+    assert np.isclose(engine.results.objective_value, expected.results.objective_value)
+    np.testing.assert_allclose(
+        engine.variables.gen.cap.solution, expected.variables.gen.cap.solution
+    )
+    for name, constraint in engine.model.constraints.items():
+        dual = constraint.dual.values
+        expected_dual = expected.model.constraints[name].dual.values
+        # free rows are dropped from the problem file, so they have no duals (as in Model.solve with a file)
+        free_rows = np.isinf(constraint.rhs.values)
+        assert np.isnan(dual[free_rows]).all()
+        np.testing.assert_allclose(
+            dual[~free_rows], expected_dual[~free_rows], atol=1e-6
+        )
+
+
+def test_solver_race(network: Network, tmp_path: Path) -> None:
+    opt_config = create_default_opt_config(np.arange(50), np.arange(N_YEARS))
+    expected = run_opt_engine(network, opt_config)
+    opt_config.solver_settings = {
+        "highs.simplex": {"solver": "simplex"},
+        "highs.ipm": {"solver": "ipm"},
+    }
+    opt_config.solver_race = ("highs.simplex", "highs.ipm")
+    opt_config.solver_process = True
+    opt_config.sol_dump_path = tmp_path / "results.sol"
+    engine = run_opt_engine(network, opt_config)
+
+    assert engine.status == OptimizationStatus.OPTIMAL
+    assert np.isclose(engine.results.objective_value, expected.results.objective_value)
+    assert {path.name for path in tmp_path.glob("results_highs.*.sol")} <= {
+        "results_highs.simplex.sol",
+        "results_highs.ipm.sol",
+    }
+    assert not (tmp_path / "results.sol").exists()
+
+
+def test_solver_process_crash(network: Network) -> None:
+    opt_config = create_default_opt_config(np.arange(50), np.arange(N_YEARS))
+    opt_config.solver_name = "highs"
+    opt_config.solver_process = True
+    opt_config.solver_memory_limit = 1.0
+    engine = run_opt_engine(network, opt_config)
+
+    assert engine.status == OptimizationStatus.NOT_COMPUTED
+    assert engine.model.termination_condition == "internal_solver_error"
+
+
+def test_warm_start_in_child_process(
+    network: Network, caplog: pytest.LogCaptureFixture
+) -> None:
+    opt_config = create_default_opt_config(np.arange(50), np.arange(N_YEARS))
+    expected = run_opt_engine(network, opt_config)
+    opt_config.warm_start = expected.investments()
+    opt_config.solver_name = "highs"
+    opt_config.solver_process = True
+    with caplog.at_level(logging.INFO, logger=solver_process.__name__):
+        engine = run_opt_engine(network, opt_config)
+
+    assert engine.status == OptimizationStatus.OPTIMAL
+    assert np.isclose(engine.results.objective_value, expected.results.objective_value)
+    solver_logs = [
+        record.getMessage()
+        for record in caplog.records
+        if record.name == solver_process.__name__
+    ]
+    assert any("[highs]" in message for message in solver_logs)
+
+
+def test_linopy_internals_used_by_solver_process() -> None:
+    """Solver process relies on linopy internals, this test fails if they change."""
+    for solver_name in solver_process._LIMIT_OPTIONS:
+        parameters = inspect.signature(
+            getattr(solvers, f"run_{solver_name}")
+        ).parameters
+        assert {
+            "io_api",
+            "problem_fn",
+            "solution_fn",
+            "log_fn",
+            "warmstart_fn",
+            "keep_files",
+        } <= set(parameters)
+    model_attributes = set(re.findall(r"model\.(\w+)", inspect.getsource(solvers)))
+    assert model_attributes <= {
+        "matrices",
+        "objective",
+        "sense",
+        "solver_dir",
+        "to_file",
+        "to_gurobipy",
+        "to_highspy",
+        "to_mosek",
+        "type",
+    }
+    model = Model()
+    assert model.objective._value is None
+
+
+def test_solver_process_runner(tmp_path: Path) -> None:
+    model = Model()
+    x = model.add_variables(
+        lower=0, coords=[pd.Index(["a", "b"], name="unit")], name="x"
+    )
+    model.add_constraints(x.sum() >= 2.5, name="demand")
+    model.add_objective((x * pd.Series([2.0, 1.0], index=["a", "b"])).sum())
+
+    run = SolverProcessRunner(model, tmp_path).solve(
+        [SolverRun(name="highs", solver_name="highs")]
+    )
+
+    assert run is not None and run.name == "highs"
+    assert model.status == "ok"
+    assert model.objective.value == pytest.approx(2.5)
+    np.testing.assert_allclose(model.variables["x"].solution, [0.0, 2.5])
+    np.testing.assert_allclose(model.constraints["demand"].dual, 1.0)
@@ -0,0 +1,71 @@
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from pyzefir.model.network import Network
+from pyzefir.optimization.fixed_investments import FixedInvestments
+from pyzefir.optimization.linopy.warm_start import (
+    investments_start_values,
+    snapshot_start_values,
+    start_vector,
+)
+from pyzefir.optimization.solution_snapshot import SolutionSnapshot
+from tests.unit.optimization.linopy.constants import N_YEARS
+from tests.unit.optimization.linopy.test_model.utils import (
+    create_default_opt_config,
+    run_opt_engine,
+)
+
+
+def test_investments_start_values_by_names(network: Network) -> None:
+    opt_config = create_default_opt_config(np.arange(50), np.arange(N_YEARS))
+    engine = run_opt_engine(network, opt_config)
+    investments = engine.investments()
+    gen_names = list(engine.indices.GEN.ii)
+    removed, kept = gen_names[0], gen_names[1:]
+    capacity = investments.generator_capacity
+    investments = FixedInvestments(
+        generator_capacity=capacity[kept[::-1]].assign(removed_unit=1.0),
+        storage_capacity=investments.storage_capacity,
+        fractions=investments.fractions | {"removed_aggr": pd.DataFrame()},
+    )
+
+    values = investments_start_values(investments, engine.indices, engine.variables)
+
+    gen_cap = values[engine.variables.gen.cap.name]
+    assert gen_cap.shape == engine.variables.gen.cap.shape
+    assert np.isnan(gen_cap[engine.indices.GEN.inverse[removed]]).all()
+    kept_ords = engine.indices.GEN.get_ords(kept)
+    np.testing.assert_allclose(gen_cap[kept_ords], capacity[kept].to_numpy().T)
+    np.testing.assert_allclose(
+        values[engine.variables.frac.fraction.name],
+        engine.variables.frac.fraction.solution,
+    )
+
+
+def test_snapshot_start_values(network: Network, tmp_path: Path) -> None:
+    opt_config = create_default_opt_config(np.arange(50), np.arange(N_YEARS))
+    engine = run_opt_engine(network, opt_config)
+    SolutionSnapshot.from_model(
+        engine.model, engine.variables, engine.indices, engine.parameters
+    ).dump(tmp_path)
+    snapshot = SolutionSnapshot.load(tmp_path)
+
+    refined_config = create_default_opt_config(np.arange(60), np.arange(N_YEARS))
+    refined_config.warm_start = snapshot
+    refined = run_opt_engine(network, refined_config)
+    values = snapshot_start_values(snapshot, refined.variables)
+
+    gen = refined.variables.gen.gen
+    assert gen.name in values
+    assert values[gen.name].shape == gen.shape
+    hour_axis = gen.dims.index("hour")
+    np.testing.assert_allclose(
+        np.take(values[gen.name], np.arange(50), axis=hour_axis),
+        engine.variables.gen.gen.solution.transpose(*gen.dims),
+    )
+    assert np.isnan(np.take(values[gen.name], np.arange(50, 60), axis=hour_axis)).all()
+    start = start_vector(refined.model, values)
+    assert not np.isnan(start[refined.variables.gen.cap.labels.values]).any()
+    assert refined.results.objective_value > 0
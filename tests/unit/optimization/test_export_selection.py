@@ -0,0 +1,138 @@
+import numpy as np
+import pandas as pd
+import pytest
+import xarray as xr
+
+from pyzefir.optimization.export_selection import (
+    PERIOD_LABEL,
+    ExportSelection,
+    TimeAggregation,
+)
+from pyzefir.optimization.exportable_results import (
+    ExportableBusResults,
+    ExportableFractionsResults,
+    ExportableGeneratorsResults,
+    ExportableLinesResults,
+    ExportableResults,
+    ExportableStorageResults,
+)
+from pyzefir.optimization.results import HOUR_LABEL, YEAR_LABEL
+
+
+@pytest.fixture()
+def exportable_results() -> ExportableResults:
+    hourly = pd.DataFrame(
+        np.ones((3, 2)),
+        index=pd.Index(range(3), name=HOUR_LABEL),
+        columns=pd.Index([0, 1], name=YEAR_LABEL),
+    )
+    capacity = pd.DataFrame(
+        {"pp_coal": [1.0, 2.0], "pp_gas": [3.0, 4.0], "heat_pump": [5.0, 6.0]},
+        index=pd.Index([0, 1], name=YEAR_LABEL),
+    )
+    return ExportableResults(
+        objective_value=pd.Series(1.0, name="Objective_func_value"),
+        generators_results=ExportableGeneratorsResults(
+            generation={"pp_coal": hourly, "pp_gas": hourly, "heat_pump": hourly},
+            capacity=capacity,
+            generation_per_energy_type={},
+            dump_energy_per_energy_type={},
+            global_capex=capacity,
+            local_capex={},
+        ),
+        storages_results=ExportableStorageResults(
+            generation={"ee_storage": hourly},
+            load={},
+            state_of_charge={},
+            capacity=pd.DataFrame(),
+            global_capex=pd.DataFrame(),
+            local_capex={},
+        ),
+        lines_results=ExportableLinesResults(flow={"line": hourly}),
+        fractions_results=ExportableFractionsResults(fraction={}),
+        bus_results=ExportableBusResults(
+            generation_ens={}, shift_minus={}, shift_plus={}
+        ),
+    )
+
+
+def test_export_selection_apply(exportable_results: ExportableResults) -> None:
+    selection = ExportSelection(
+        groups=("generators_results", "storages_results"),
+        fields=("generation", "capacity"),
+        elements=("pp_*",),
+        time_aggregation=TimeAggregation("annual"),
+    )
+    results = selection.apply(exportable_results)
+
+    gen_results = results.generators_results
+    assert list(gen_results.generation) == ["pp_coal", "pp_gas"]
+    assert gen_results.generation["pp_coal"].index.name == PERIOD_LABEL
+    assert list(gen_results.capacity.columns) == ["pp_coal", "pp_gas"]
+    assert gen_results.global_capex.empty
+    assert results.storages_results.generation == {}
+    assert results.lines_results.flow == {}
+    assert results.objective_value is exportable_results.objective_value
+
+
+def test_empty_export_selection(exportable_results: ExportableResults) -> None:
+    selection = ExportSelection()
+    results = selection.apply(exportable_results)
+
+    assert selection.is_empty
+    assert list(results.generators_results.generation) == [
+        "pp_coal",
+        "pp_gas",
+        "heat_pump",
+    ]
+    assert results.generators_results.generation["pp_coal"].index.name == HOUR_LABEL
+
+
+def test_time_aggregation_keeps_yearly_frames() -> None:
+    fraction = pd.DataFrame(
+        np.ones((2, 2)),
+        index=pd.Index([0, 1], name=YEAR_LABEL),
+        columns=pd.Index(["lbs_1", "lbs_2"], name="Local Balancing Stack"),
+    )
+    selected = ExportSelection(time_aggregation=TimeAggregation()).select_elements(
+        {"aggr": fraction}
+    )
+
+    assert selected["aggr"].index.name == YEAR_LABEL
+
+
+@pytest.mark.parametrize(
+    ("time_aggregation", "hours", "expected"),
+    [
+        (TimeAggregation("annual"), [0, 5, 8759], [0, 0, 0]),
+        (TimeAggregation("monthly"), [0, 743, 744, 8759], [1, 1, 2, 12]),
+        (TimeAggregation("period", period_length=24), [0, 23, 24, 50], [0, 0, 1, 2]),
+    ],
+)
+def test_time_aggregation_periods(
+    time_aggregation: TimeAggregation, hours: list[int], expected: list[int]
+) -> None:
+    assert time_aggregation.periods(np.array(hours)).tolist() == expected
+
+
+@pytest.mark.parametrize("function", ["sum", "mean"])
+def test_time_aggregation_aggregate(function: str) -> None:
+    values = xr.DataArray(
+        np.arange(12.0).reshape(6, 2),
+        dims=("hour", "year"),
+        coords={"hour": [0, 1, 2, 3, 4, 5], "year": [0, 1]},
+    )
+    aggregated = TimeAggregation("period", function, period_length=3).aggregate(
+        values.transpose("year", "hour")
+    )
+
+    assert aggregated.dims == ("year", "hour")
+    assert aggregated["hour"].values.tolist() == [0, 1]
+    expected = values.values.reshape(2, 3, 2)
+    expected = expected.sum(axis=1) if function == "sum" else expected.mean(axis=1)
+    np.testing.assert_allclose(aggregated.transpose("hour", "year").values, expected)
+
+
+def test_invalid_time_aggregation() -> None:
+    with pytest.raises(ValueError, match="period length must be positive"):
+        TimeAggregation("period", period_length=0)
@@ -0,0 +1,52 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from pyzefir.parser.elements_parsers.utils import YearlyValues
+
+
+@pytest.fixture
+def yearly_df() -> pd.DataFrame:
+    return pd.DataFrame(
+        {
+            "name": ["a", "a", "b", "a", "b"],
+            "year_idx": [2, 0, 1, 1, 5],
+            "value": [3.0, 1.0, 7.0, 2.0, 9.0],
+            "count": [30, 10, 70, 20, 90],
+        }
+    )
+
+
+@pytest.mark.parametrize("key", ["a", "b", "c"])
+@pytest.mark.parametrize("column", ["value", "count"])
+def test_yearly_values_series_equal_to_filtering(
+    yearly_df: pd.DataFrame, key: str, column: str
+) -> None:
+    n_years = 3
+    yearly_values = YearlyValues(
+        yearly_df, "name", "year_idx", ["value", "count"], n_years
+    )
+    expected = (
+        yearly_df[yearly_df["name"] == key]
+        .set_index("year_idx")[column]
+        .reindex(range(n_years))
+    )
+    result = yearly_values.series(key, column)
+    assert (key in yearly_values) == (key in yearly_df["name"].values)
+    assert result.dtype == expected.dtype
+    assert np.array_equal(result.to_numpy(), expected.to_numpy(), equal_nan=True)
+
+
+def test_yearly_values_multiple_keys(yearly_df: pd.DataFrame) -> None:
+    yearly_df["group"] = ["x", "y", "x", "x", "x"]
+    yearly_values = YearlyValues(yearly_df, ["name", "group"], "year_idx", ["value"], 3)
+    assert np.array_equal(
+        yearly_values.values(("a", "x"), "value"), [np.nan, 2.0, 3.0], equal_nan=True
+    )
+    assert ("a", "z") not in yearly_values
+
+
+def test_yearly_values_duplicated_years(yearly_df: pd.DataFrame) -> None:
+    yearly_df.loc[0, "year_idx"] = 0
+    with pytest.raises(ValueError, match="duplicate labels"):
+        YearlyValues(yearly_df, "name", "year_idx", ["value"], 3)
@@ -0,0 +1,84 @@
+import os
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from pyzefir.parser.csv_parser import CsvParser
+from pyzefir.parser.profile_cache import ProfileCache
+from pyzefir.utils.path_manager import CsvPathManager, DataCategories, DataSubCategories
+
+
+@pytest.fixture
+def csv_path(tmp_path: Path) -> Path:
+    path = tmp_path / "Profiles.csv"
+    pd.DataFrame(
+        {"hour_idx": np.arange(5), "SUN": np.linspace(0, 1, 5), "WIND": np.ones(5)}
+    ).to_csv(path, index=False)
+    return path
+
+
+def _reader(path: Path, calls: list[Path]) -> pd.DataFrame:
+    calls.append(path)
+    return pd.read_csv(path)
+
+
+@pytest.mark.parametrize(
+    ("category", "dataset_name", "expected"),
+    [
+        (DataCategories.CAPACITY_FACTORS, DataSubCategories.PROFILES, True),
+        (DataCategories.GENERATOR, DataSubCategories.POWER_UTILIZATION, True),
+        (DataCategories.GENERATOR, DataSubCategories.GENERATOR_TYPES, False),
+    ],
+)
+def test_is_hourly_dataset(category: str, dataset_name: str, expected: bool) -> None:
+    assert ProfileCache.is_hourly_dataset(category, dataset_name) == expected
+
+
+def test_read_creates_and_reuses_cache(tmp_path: Path, csv_path: Path) -> None:
+    cache = ProfileCache(tmp_path / "cache")
+    calls: list[Path] = []
+    args = (DataCategories.CAPACITY_FACTORS, DataSubCategories.PROFILES, csv_path)
+
+    first = cache.read(*args, lambda: _reader(csv_path, calls))
+    second = cache.read(*args, lambda: _reader(csv_path, calls))
+
+    assert calls == [csv_path]
+    assert (tmp_path / "cache" / "capacity_factors" / "Profiles.arrow").is_file()
+    pd.testing.assert_frame_equal(first, pd.read_csv(csv_path))
+    pd.testing.assert_frame_equal(second, pd.read_csv(csv_path))
+    assert not second["SUN"].to_numpy().flags.writeable
+
+
+def test_read_recreates_stale_cache(tmp_path: Path, csv_path: Path) -> None:
+    cache = ProfileCache(tmp_path / "cache")
+    calls: list[Path] = []
+    args = (DataCategories.CAPACITY_FACTORS, DataSubCategories.PROFILES, csv_path)
+    cache.read(*args, lambda: _reader(csv_path, calls))
+
+    pd.DataFrame({"hour_idx": np.arange(3), "SUN": np.zeros(3)}).to_csv(
+        csv_path, index=False
+    )
+    stat = csv_path.stat()
+    os.utime(csv_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    df = cache.read(*args, lambda: _reader(csv_path, calls))
+
+    assert calls == [csv_path, csv_path]
+    assert list(df.columns) == ["hour_idx", "SUN"]
+    assert np.array_equal(df["SUN"], np.zeros(3))
+
+
+def test_csv_parser_with_profile_cache(csv_root_path: Path, tmp_path: Path) -> None:
+    path_manager = CsvPathManager(csv_root_path, scenario_name="scenario_1")
+    expected = CsvParser(path_manager=path_manager).load_dfs()
+    data = CsvParser(
+        path_manager=path_manager, profile_cache=ProfileCache(tmp_path)
+    ).load_dfs()
+
+    profiles = data[DataCategories.CAPACITY_FACTORS][DataSubCategories.PROFILES]
+    pd.testing.assert_frame_equal(
+        profiles,
+        expected[DataCategories.CAPACITY_FACTORS][DataSubCategories.PROFILES],
+    )
+    assert (tmp_path / DataCategories.CAPACITY_FACTORS / "Profiles.arrow").is_file()
@@ -3,9 +3,11 @@ import pytest
 
 from pyzefir.optimization.exportable_results import (
     ExportableBusResults,
+    ExportableDualResults,
     ExportableFractionsResults,
     ExportableGeneratorsResults,
     ExportableLinesResults,
+    ExportableObjectiveResults,
     ExportableResults,
     ExportableStorageResults,
 )
@@ -161,6 +163,31 @@ def bus_results() -> ExportableBusResults:
     )
 
 
+@pytest.fixture()
+def dual_results() -> ExportableDualResults:
+    return ExportableDualResults(
+        marginal_price={
+            "data1": pd.DataFrame(
+                {"sample_1": [15, 30, 45, 60], "sample_2": [0.75, 0.15, 0.045, 0.006]}
+            ),
+            "data2": pd.DataFrame(
+                {"sample_1": [0.9, 0.18, 0.054, 0.0072], "sample_2": [18, 36, 54, 72]}
+            ),
+        },
+        emission_price=pd.DataFrame({"CO2": [0.0, 12.5], "PM10": [3.0, 0.0]}),
+    )
+
+
+@pytest.fixture()
+def objective_results() -> ExportableObjectiveResults:
+    return ExportableObjectiveResults(
+        cost_per_year=pd.DataFrame({"capex": [10.0, 20.0], "var_cost": [5.0, 7.5]}),
+        cost_per_unit={
+            "data1": pd.DataFrame({"gen_1": [4.0, 8.0], "gen_2": [6.0, 12.0]}),
+        },
+    )
+
+
 @pytest.fixture()
 def objective_result() -> pd.Series:
     return pd.Series(
@@ -177,6 +204,8 @@ def exportable_results(
     lines_results: ExportableLinesResults,
     frac_results: ExportableFractionsResults,
     bus_results: ExportableBusResults,
+    dual_results: ExportableDualResults,
+    objective_results: ExportableObjectiveResults,
     objective_result: pd.Series,
 ) -> ExportableResults:
     return ExportableResults(
@@ -186,4 +215,6 @@ def exportable_results(
         fractions_results=frac_results,
         objective_value=objective_result,
         bus_results=bus_results,
+        dual_results=dual_results,
+        objective_results=objective_results,
     )
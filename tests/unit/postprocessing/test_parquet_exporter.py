@@ -0,0 +1,137 @@
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from pyzefir.optimization.exportable_results import (
+    ExportableGeneratorsResults,
+    ExportableResultsGroup,
+)
+from pyzefir.optimization.results import ENERGY_TYPE_LABEL, HOUR_LABEL, YEAR_LABEL
+from pyzefir.postprocessing.results_exporters import ParquetExporter
+from pyzefir.postprocessing.results_handler import GeneralResultDirectory
+
+
+@pytest.fixture()
+def hourly_generators_results() -> ExportableGeneratorsResults:
+    generation = pd.DataFrame(
+        np.arange(6.0).reshape(3, 2),
+        index=pd.Index(range(3), name=HOUR_LABEL),
+        columns=pd.Index([0, 1], name=YEAR_LABEL),
+    )
+    generation_per_et = pd.concat({"ee": generation, "heat": 2 * generation})
+    generation_per_et = generation_per_et.reset_index(
+        level=0, names=[ENERGY_TYPE_LABEL, HOUR_LABEL]
+    )
+    generation_per_et.columns.name = YEAR_LABEL
+    capacity = pd.DataFrame(
+        {"gen_1": [1.0, 2.0], "gen_2": [3.0, 4.0]},
+        index=pd.Index([0, 1], name=YEAR_LABEL),
+    )
+    return ExportableGeneratorsResults(
+        generation={"gen_1": generation, "gen_2": 3 * generation},
+        capacity=capacity,
+        generation_per_energy_type={"gen_1": generation_per_et},
+        dump_energy_per_energy_type={},
+        global_capex=capacity,
+        local_capex={"aggr": pd.DataFrame({"boiler": [5.0, 6.0]}, index=[0, 1])},
+    )
+
+
+def test_parquet_exporter_export_objective_result(
+    temporary_directory: Path, objective_result: pd.Series
+) -> None:
+    ParquetExporter().export_objective_result(temporary_directory, objective_result)
+
+    file_path = temporary_directory / f"{objective_result.name}.parquet"
+    assert file_path.is_file()
+    exported_series = pd.read_parquet(file_path).set_index("index").squeeze()
+    pd.testing.assert_series_equal(exported_series, objective_result, check_names=False)
+
+
+@pytest.mark.parametrize(
+    "results, category",
+    [
+        (
+            pytest.lazy_fixture("generators_results"),
+            GeneralResultDirectory.GENERATORS_RESULTS,
+        ),
+        (
+            pytest.lazy_fixture("storages_results"),
+            GeneralResultDirectory.STORAGES_RESULTS,
+        ),
+        (pytest.lazy_fixture("lines_results"), GeneralResultDirectory.LINES_RESULTS),
+        (pytest.lazy_fixture("frac_results"), GeneralResultDirectory.FRACTIONS_RESULTS),
+    ],
+)
+def test_parquet_exporter_writes_single_dataset_per_field(
+    temporary_directory: Path,
+    results: ExportableResultsGroup,
+    category: GeneralResultDirectory,
+) -> None:
+    root_path = temporary_directory / category
+    ParquetExporter().export_group_results(root_path=root_path, result=results)
+
+    for field_name, field_value in results.__dict__.items():
+        if isinstance(field_value, dict) and not field_value:
+            assert not (root_path / field_name).exists()
+            continue
+        files = list((root_path / field_name).rglob("*.parquet"))
+        assert len(files) == 1
+        exported = ParquetExporter.read_field(root_path / field_name)
+        n_values = (
+            sum(df.size for df in field_value.values())
+            if isinstance(field_value, dict)
+            else field_value.size
+        )
+        assert len(exported) == n_values
+        assert exported["value"].sum() == pytest.approx(
+            sum(df.to_numpy().sum() for df in field_value.values())
+            if isinstance(field_value, dict)
+            else field_value.to_numpy().sum()
+        )
+
+
+@pytest.mark.parametrize("partition_by_year", [False, True])
+def test_parquet_exporter_long_format(
+    temporary_directory: Path,
+    hourly_generators_results: ExportableGeneratorsResults,
+    partition_by_year: bool,
+) -> None:
+    ParquetExporter(partition_by_year=partition_by_year).export_group_results(
+        temporary_directory, hourly_generators_results
+    )
+
+    generation = ParquetExporter.read_field(temporary_directory / "generation")
+    assert set(generation.columns) == {"name", "hour", "year", "value"}
+    assert isinstance(generation["name"].dtype, pd.CategoricalDtype)
+    gen_2 = generation[generation["name"] == "gen_2"].pivot(
+        index="hour", columns="year", values="value"
+    )
+    assert np.allclose(gen_2, hourly_generators_results.generation["gen_2"])
+
+    generation_per_et = ParquetExporter.read_field(
+        temporary_directory / "generation_per_energy_type"
+    )
+    assert set(generation_per_et.columns) == {
+        "name",
+        "hour",
+        "energy_type",
+        "year",
+        "value",
+    }
+    heat = generation_per_et[generation_per_et["energy_type"] == "heat"]
+    assert heat["value"].sum() == pytest.approx(30.0)
+
+    capacity = ParquetExporter.read_field(temporary_directory / "capacity")
+    assert set(capacity.columns) == {"name", "year", "value"}
+    local_capex = ParquetExporter.read_field(temporary_directory / "local_capex")
+    assert set(local_capex.columns) == {"name", "element", "year", "value"}
+
+    year_dirs = sorted(
+        path.name for path in (temporary_directory / "generation").iterdir()
+    )
+    assert year_dirs == (
+        ["year=0", "year=1"] if partition_by_year else ["part-0.parquet"]
+    )
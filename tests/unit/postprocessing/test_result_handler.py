@@ -1,9 +1,20 @@
+import weakref
+from dataclasses import replace
 from pathlib import Path
+from typing import Callable
 
+import pandas as pd
 import pytest
 
-from pyzefir.optimization.exportable_results import ExportableResults
-from pyzefir.postprocessing.results_exporters import CsvExporter, XlsxExporter
+from pyzefir.optimization.exportable_results import (
+    ExportableResults,
+    LazyExportableResults,
+)
+from pyzefir.postprocessing.results_exporters import (
+    CsvExporter,
+    FeatherExporter,
+    XlsxExporter,
+)
 from pyzefir.postprocessing.results_handler import (
     GeneralResultDirectory,
     ResultsHandler,
@@ -34,6 +45,14 @@ def category_structure() -> CategoryStructure:
         GeneralResultDirectory.BUS_RESULTS: {
             "generation_ens": ["data1", "data2"],
         },
+        GeneralResultDirectory.DUAL_RESULTS: {
+            "marginal_price": ["data1", "data2"],
+            "emission_price": ["emission_price"],
+        },
+        GeneralResultDirectory.OBJECTIVE_RESULTS: {
+            "cost_per_year": ["cost_per_year"],
+            "cost_per_unit": ["data1"],
+        },
     }
 
 
@@ -55,6 +74,13 @@ def test_result_handler_export_csv(
         )
 
 
+def test_result_handler_export_without_exporter(
+    temporary_directory: Path, exportable_results: ExportableResults
+) -> None:
+    with pytest.raises(ValueError, match="exporter is not given"):
+        ResultsHandler().export_results(temporary_directory, exportable_results)
+
+
 def test_result_export_many_types_at_once(
     temporary_directory: Path,
     exportable_results: ExportableResults,
@@ -77,6 +103,133 @@ def test_result_export_many_types_at_once(
         )
 
 
+@pytest.mark.parametrize("max_workers", [1, 4, None])
+def test_result_handler_export_to_many_in_single_pass(
+    temporary_directory: Path,
+    exportable_results: ExportableResults,
+    category_structure: CategoryStructure,
+    max_workers: int | None,
+) -> None:
+    handler = ResultsHandler(max_workers=max_workers)
+
+    handler.export_results_to_many(
+        [
+            (CsvExporter(), temporary_directory / "csv"),
+            (FeatherExporter(), temporary_directory / "feather"),
+        ],
+        exportable_results,
+    )
+
+    assert (temporary_directory / "csv" / "Objective_value.csv").is_file()
+    assert (temporary_directory / "feather" / "Objective_value.feather").is_file()
+    for category in [cat.value for cat in GeneralResultDirectory]:
+        check_for_subcat_filenames(
+            root_path=temporary_directory / "csv" / category,
+            subcat_structure=category_structure[category],
+        )
+        for subcat, files in category_structure[category].items():
+            for file_name in files:
+                assert (
+                    temporary_directory
+                    / "feather"
+                    / category
+                    / subcat
+                    / f"{file_name}.feather"
+                ).is_file()
+
+
+@pytest.mark.parametrize("skip_empty_fields", [False, True])
+def test_result_handler_skip_empty_fields(
+    temporary_directory: Path,
+    exportable_results: ExportableResults,
+    skip_empty_fields: bool,
+) -> None:
+    results = replace(
+        exportable_results,
+        generators_results=replace(
+            exportable_results.generators_results, capacity=pd.DataFrame()
+        ),
+    )
+    ResultsHandler().export_results_to_many(
+        [(CsvExporter(), temporary_directory)],
+        results,
+        skip_empty_fields=skip_empty_fields,
+    )
+
+    capacity_path = (
+        temporary_directory
+        / GeneralResultDirectory.GENERATORS_RESULTS
+        / "capacity"
+        / "capacity.csv"
+    )
+    assert capacity_path.is_file() is not skip_empty_fields
+    assert (
+        temporary_directory / GeneralResultDirectory.GENERATORS_RESULTS / "generation"
+    ).is_dir()
+
+
+def test_result_handler_export_lazy_results(
+    temporary_directory: Path,
+    exportable_results: ExportableResults,
+    category_structure: CategoryStructure,
+) -> None:
+    computed: list[tuple[str, str]] = []
+    written_frames: list[weakref.ref] = []
+
+    def getter(group: str, field_name: str, value: pd.DataFrame | dict) -> Callable:
+        def get_field_value() -> pd.DataFrame | dict:
+            assert all(frame_ref() is None for frame_ref in written_frames)
+            computed.append((group, field_name))
+            if isinstance(value, pd.DataFrame):
+                frame = value.copy()
+                written_frames.append(weakref.ref(frame))
+                return frame
+            return value
+
+        return get_field_value
+
+    field_getters = {
+        group: {
+            field_name: getter(group, field_name, get_field_value())
+            for field_name, get_field_value in group_getters.items()
+        }
+        for group, group_getters in exportable_results.field_getters.items()
+    }
+    field_getters[GeneralResultDirectory.DUAL_RESULTS] = {
+        "marginal_price": getter(
+            GeneralResultDirectory.DUAL_RESULTS, "marginal_price", {}
+        )
+    }
+    lazy_results = LazyExportableResults(
+        objective_value=exportable_results.objective_value,
+        field_getters=field_getters,
+    )
+
+    ResultsHandler().export_results_to_many(
+        [
+            (CsvExporter(), temporary_directory / "csv"),
+            (FeatherExporter(), temporary_directory / "feather"),
+        ],
+        lazy_results,
+    )
+
+    assert len(computed) == len(set(computed))
+    assert set(computed) == {
+        (group, field_name)
+        for group, group_getters in field_getters.items()
+        for field_name in group_getters
+    }
+    assert not (
+        temporary_directory / "csv" / GeneralResultDirectory.DUAL_RESULTS
+    ).exists()
+    for category in [cat.value for cat in GeneralResultDirectory]:
+        if category != GeneralResultDirectory.DUAL_RESULTS:
+            check_for_subcat_filenames(
+                root_path=temporary_directory / "csv" / category,
+                subcat_structure=category_structure[category],
+            )
+
+
 def check_for_subcat_filenames(
     root_path: Path, subcat_structure: dict[str, list[str]]
 ) -> None:
@@ -1,11 +1,13 @@
 from dataclasses import asdict
 from pathlib import Path
 
+import numpy as np
 import pandas as pd
 import pytest
 from pandas.testing import assert_frame_equal, assert_series_equal
 
 from pyzefir.optimization.exportable_results import ExportableResultsGroup
+from pyzefir.optimization.results import HOUR_LABEL, YEAR_LABEL
 from pyzefir.postprocessing.results_exporters import XlsxExporter
 from pyzefir.postprocessing.results_handler import GeneralResultDirectory
 
@@ -68,3 +70,81 @@ def test_csv_exporter_export_group_results(
         ):
             assert key1 == key2
             assert_frame_equal(value1, value2)
+
+
+@pytest.mark.parametrize(
+    "result",
+    [
+        pytest.lazy_fixture("generators_results"),
+        pytest.lazy_fixture("lines_results"),
+        pytest.lazy_fixture("frac_results"),
+    ],
+)
+def test_xlsx_exporter_streaming_gives_the_same_sheets(
+    temporary_directory: Path, result: ExportableResultsGroup
+) -> None:
+    XlsxExporter().export_group_results(temporary_directory / "pandas", result)
+    XlsxExporter(streaming=True).export_group_results(
+        temporary_directory / "streaming", result
+    )
+
+    for field_name, field_value in asdict(result).items():
+        if isinstance(field_value, dict) and not field_value:
+            continue
+        header = [0, 1] if isinstance(field_value, dict) else 0
+        expected, exported = (
+            pd.read_excel(
+                temporary_directory / subdir / f"{field_name}.xlsx",
+                index_col=0,
+                header=header,
+            )
+            for subdir in ["pandas", "streaming"]
+        )
+        assert_frame_equal(exported, expected)
+
+
+def test_xlsx_exporter_streaming_splits_sheets_and_workbooks(
+    temporary_directory: Path,
+) -> None:
+    frames = {
+        f"unit_{i}": pd.DataFrame(
+            np.arange(20.0).reshape(10, 2) + i,
+            index=pd.Index(range(10), name=HOUR_LABEL),
+            columns=pd.Index([0, 1], name=YEAR_LABEL),
+        )
+        for i in range(3)
+    }
+    XlsxExporter(
+        streaming=True, max_sheets_per_workbook=3, max_rows=7, max_columns=5
+    ).export_field_results(temporary_directory, "generation", frames)
+
+    sheets = pd.read_excel(
+        temporary_directory / "generation.xlsx", sheet_name=None, header=None
+    ) | pd.read_excel(
+        temporary_directory / "generation_2.xlsx", sheet_name=None, header=None
+    )
+    assert list(sheets) == [
+        f"generation{suffix}" for suffix in ["", "_2", "_3", "_4", "_5", "_6"]
+    ]
+    assert all(df.shape[0] <= 7 and df.shape[1] <= 5 for df in sheets.values())
+    values = sum(df.iloc[3:, 1:].to_numpy(dtype=float).sum() for df in sheets.values())
+    assert values == pytest.approx(sum(df.to_numpy().sum() for df in frames.values()))
+
+
+def test_xlsx_exporter_annual_sums(temporary_directory: Path) -> None:
+    generation = pd.DataFrame(
+        [[1.0, 2.0], [3.0, 4.0]],
+        index=pd.Index(range(2), name=HOUR_LABEL),
+        columns=pd.Index([0, 1], name=YEAR_LABEL),
+    )
+    frames = {"gen_1": generation, "gen_2": 2 * generation}
+
+    annual = XlsxExporter.annual_sums(frames)
+
+    assert annual.loc["gen_1"].tolist() == [4.0, 6.0]
+    assert annual.loc["gen_2"].tolist() == [8.0, 12.0]
+    XlsxExporter(streaming=True, annual_sums=True).export_field_results(
+        temporary_directory, "generation", frames
+    )
+    exported = pd.read_excel(temporary_directory / "generation.xlsx", index_col=0)
+    assert exported.to_numpy().tolist() == annual.to_numpy().tolist()
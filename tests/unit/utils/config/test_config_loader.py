@@ -376,3 +376,263 @@ def test_load_generator_capacity_cost_parameter(
 def test_try_parse_config_option(value: str, expected_value: str | float) -> None:
     parsed_value = ConfigLoader.try_parse_config_option(value)
     assert parsed_value == expected_value and type(parsed_value) is type(expected_value)
+
+
+def test_export_selection(
+    tmp_path: Path, mock_input_directory: Path, mock_output_directory: Path
+) -> None:
+    config_file = create_test_config_file(
+        input_dict={
+            "input_path": str(mock_input_directory),
+            "scenario": "scenario",
+            "input_format": "csv",
+        },
+        output_dict={
+            "output_path": str(mock_output_directory),
+            "result_groups": "generators_results, bus_results",
+            "result_fields": "generation,capacity",
+            "result_elements": "pp_*",
+            "time_aggregation": "period",
+            "time_aggregation_function": "mean",
+            "time_aggregation_period_length": "168",
+        },
+    )
+    dump_test_config_file(config_file, tmp_path / "config.ini")
+    selection = ConfigLoader(tmp_path / "config.ini").load().export_selection
+
+    assert selection.groups == ("generators_results", "bus_results")
+    assert selection.fields == ("generation", "capacity")
+    assert selection.elements == ("pp_*",)
+    assert selection.time_aggregation.period == "period"
+    assert selection.time_aggregation.function == "mean"
+    assert selection.time_aggregation.period_length == 168
+
+
+@pytest.mark.parametrize(
+    ("output_dict", "error_msg"),
+    [
+        ({"result_groups": "generator_results"}, "unknown result groups"),
+        ({"result_fields": "gen"}, "unknown result fields"),
+        ({"time_aggregation": "weekly"}, "time aggregation period must be one of"),
+        (
+            {"time_aggregation": "annual", "time_aggregation_function": "max"},
+            "time aggregation function must be one of",
+        ),
+    ],
+)
+def test_invalid_export_selection(
+    output_dict: dict[str, str],
+    error_msg: str,
+    tmp_path: Path,
+    mock_input_directory: Path,
+    mock_output_directory: Path,
+) -> None:
+    config_file = create_test_config_file(
+        input_dict={
+            "input_path": str(mock_input_directory),
+            "scenario": "scenario",
+            "input_format": "csv",
+        },
+        output_dict={"output_path": str(mock_output_directory)} | output_dict,
+    )
+    dump_test_config_file(config_file, tmp_path / "config.ini")
+    with pytest.raises(ConfigException, match=error_msg):
+        ConfigLoader(tmp_path / "config.ini").load()
+
+
+@pytest.mark.parametrize(
+    ("dual_results", "expected"),
+    [
+        ("", ()),
+        ("balancing", ("balancing",)),
+        ("balancing, emissions", ("balancing", "emissions")),
+    ],
+)
+def test_dual_results(
+    dual_results: str,
+    expected: tuple[str, ...],
+    tmp_path: Path,
+    mock_input_directory: Path,
+    mock_output_directory: Path,
+) -> None:
+    config_file = create_test_config_file(
+        input_dict={
+            "input_path": str(mock_input_directory),
+            "scenario": "scenario",
+            "input_format": "csv",
+        },
+        output_dict={
+            "output_path": str(mock_output_directory),
+            "dual_results": dual_results,
+        },
+    )
+    dump_test_config_file(config_file, tmp_path / "config.ini")
+    assert ConfigLoader(tmp_path / "config.ini").load().dual_results == expected
+
+
+def test_invalid_dual_results(
+    tmp_path: Path, mock_input_directory: Path, mock_output_directory: Path
+) -> None:
+    config_file = create_test_config_file(
+        input_dict={
+            "input_path": str(mock_input_directory),
+            "scenario": "scenario",
+            "input_format": "csv",
+        },
+        output_dict={
+            "output_path": str(mock_output_directory),
+            "dual_results": "balancing, reserves",
+        },
+    )
+    dump_test_config_file(config_file, tmp_path / "config.ini")
+    with pytest.raises(ConfigException, match="unknown dual_results families"):
+        ConfigLoader(tmp_path / "config.ini").load()
+
+
+@pytest.mark.parametrize(
+    ("output_dict", "expected"),
+    [
+        ({}, (False, False)),
+        ({"objective_breakdown": "true"}, (True, False)),
+        ({"objective_breakdown_per_unit": "true"}, (False, True)),
+    ],
+)
+def test_objective_breakdown(
+    output_dict: dict[str, str],
+    expected: tuple[bool, bool],
+    tmp_path: Path,
+    mock_input_directory: Path,
+    mock_output_directory: Path,
+) -> None:
+    config_file = create_test_config_file(
+        input_dict={
+            "input_path": str(mock_input_directory),
+            "scenario": "scenario",
+            "input_format": "csv",
+        },
+        output_dict={"output_path": str(mock_output_directory)} | output_dict,
+    )
+    dump_test_config_file(config_file, tmp_path / "config.ini")
+    config_params = ConfigLoader(tmp_path / "config.ini").load()
+    assert (
+        config_params.objective_breakdown,
+        config_params.objective_breakdown_per_unit,
+    ) == expected
+
+
+@pytest.mark.parametrize(
+    ("refinement_levels", "expected"),
+    [("", ()), ("168", (168,)), ("168, 672", (168, 672))],
+)
+def test_refinement_levels(
+    refinement_levels: str,
+    expected: tuple[int, ...],
+    tmp_path: Path,
+    mock_input_directory: Path,
+    mock_output_directory: Path,
+) -> None:
+    config_file = create_test_config_file(
+        input_dict={
+            "input_path": str(mock_input_directory),
+            "scenario": "scenario",
+            "input_format": "csv",
+        },
+        output_dict={"output_path": str(mock_output_directory)},
+    )
+    config_file.read_dict({"optimization": {"refinement_levels": refinement_levels}})
+    dump_test_config_file(config_file, tmp_path / "config.ini")
+    assert ConfigLoader(tmp_path / "config.ini").load().refinement_levels == expected
+
+
+def test_warm_start_path(
+    tmp_path: Path, mock_input_directory: Path, mock_output_directory: Path
+) -> None:
+    input_dict = {
+        "input_path": str(mock_input_directory),
+        "scenario": "scenario",
+        "input_format": "csv",
+        "warm_start_path": str(mock_output_directory),
+    }
+    config_file = create_test_config_file(
+        input_dict=input_dict,
+        output_dict={"output_path": str(mock_output_directory)},
+    )
+    dump_test_config_file(config_file, tmp_path / "config.ini")
+    config_params = ConfigLoader(tmp_path / "config.ini").load()
+    assert config_params.warm_start_path == mock_output_directory
+
+    config_file = create_test_config_file(
+        input_dict=input_dict | {"fixed_investments_path": str(mock_output_directory)},
+        output_dict={"output_path": str(mock_output_directory)},
+    )
+    dump_test_config_file(config_file, tmp_path / "config.ini")
+    with pytest.raises(ConfigException, match="warm_start_path cannot be used"):
+        ConfigLoader(tmp_path / "config.ini").load()
+
+
+def test_solver_process(
+    tmp_path: Path, mock_input_directory: Path, mock_output_directory: Path
+) -> None:
+    config_file = create_test_config_file(
+        input_dict={
+            "input_path": str(mock_input_directory),
+            "scenario": "scenario",
+            "input_format": "csv",
+        },
+        output_dict={"output_path": str(mock_output_directory)},
+    )
+    config_file.read_dict(
+        {
+            "optimization": {
+                "solver_memory_limit": "2048",
+                "solver_threads": "2",
+                "solver_time_limit": "600",
+                "solver_race": "highs, highs.ipm",
+            },
+            "highs": {"presolve": "on"},
+            "highs.ipm": {"solver": "ipm"},
+        }
+    )
+    dump_test_config_file(config_file, tmp_path / "config.ini")
+    config_params = ConfigLoader(tmp_path / "config.ini").load()
+
+    assert not config_params.solver_process
+    assert config_params.solver_memory_limit == 2048.0
+    assert config_params.solver_threads == 2
+    assert config_params.solver_time_limit == 600.0
+    assert config_params.solver_race == ("highs", "highs.ipm")
+    assert config_params.solver_settings == {
+        "highs": {"presolve": "on"},
+        "highs.ipm": {"solver": "ipm"},
+    }
+
+
+@pytest.mark.parametrize(
+    ("optimization", "match"),
+    [
+        ({"solver_memory_limit": "2048"}, "only if solver_process"),
+        ({"solver_process": "true", "solver_threads": "0"}, "must be positive"),
+        ({"solver_time_limit": "-1"}, "must be positive"),
+        ({"solver_race": "highs, highs.ipm"}, "has no section"),
+        ({"solver_race": "unknown_solver"}, "valid solvers"),
+    ],
+)
+def test_invalid_solver_process(
+    optimization: dict[str, str],
+    match: str,
+    tmp_path: Path,
+    mock_input_directory: Path,
+    mock_output_directory: Path,
+) -> None:
+    config_file = create_test_config_file(
+        input_dict={
+            "input_path": str(mock_input_directory),
+            "scenario": "scenario",
+            "input_format": "csv",
+        },
+        output_dict={"output_path": str(mock_output_directory)},
+    )
+    config_file.read_dict({"optimization": optimization})
+    dump_test_config_file(config_file, tmp_path / "config.ini")
+    with pytest.raises(ConfigException, match=match):
+        ConfigLoader(tmp_path / "config.ini").load()